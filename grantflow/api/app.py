@@ -6,10 +6,12 @@ from typing import AsyncIterator, Literal
 
 from fastapi import FastAPI
 
+from grantflow.api.blocking_executor import create_blocking_executor_from_env
 from grantflow.api.compat_exports import (  # noqa: F401
     _append_runtime_grounded_quality_gate_finding,
     _attach_export_contract_gate,
     _build_generate_request_from_preset,
+    _build_job_change_notifier,
     _build_job_runner,
     _comment_sla_hours,
     _configuration_warnings,
@@ -61,6 +63,7 @@ from grantflow.api.compat_exports import (  # noqa: F401
     _state_runtime_grounded_quality_gate,
     _tenant_authz_configuration_status,
     _uses_inmemory_queue_runner,
+    _uses_process_pool_runner,
     _uses_queue_runner,
     _uses_redis_queue_runner,
     _utcnow_iso,
@@ -98,6 +101,7 @@ from grantflow.api.export_helpers import _resolve_export_inputs  # noqa: F401
 from grantflow.api.idempotency_store_facade import (  # noqa: F401
     _append_job_event_records,
     _get_job,
+    _get_job_with_revision,
     _global_idempotency_record_key,
     _global_idempotency_replay_response,
     _idempotency_fingerprint,
@@ -107,15 +111,19 @@ from grantflow.api.idempotency_store_facade import (  # noqa: F401
     _ingest_inventory,
     _list_ingest_events,
     _list_jobs,
+    _list_portfolio_jobs,
     _normalize_request_id,
+    _portfolio_metrics_payload,
     _record_ingest_event,
     _record_job_event,
     _resolve_request_id,
+    _retry_on_job_revision_conflict,
     _set_job,
     _store_global_idempotency_response,
     _store_idempotency_response,
     _update_job,
 )
+from grantflow.api.job_index import job_index_fields
 from grantflow.api.orchestrator_service import (  # noqa: F401
     _build_generate_preflight,
     _build_preflight_grounding_policy,
@@ -145,14 +153,19 @@ from grantflow.api.orchestrator_service import (  # noqa: F401
     _runtime_grounded_quality_gate_thresholds,
     _xlsx_contract_validation_context,
 )
+from grantflow.api.portfolio_aggregates import PortfolioMetricsAggregate
 from grantflow.api.routers import include_api_routers
 from grantflow.api.schemas import ExportRequest  # noqa: F401
 from grantflow.api.security import install_openapi_api_key_security
-from grantflow.api.webhooks import send_job_webhook_event  # noqa: F401
+from grantflow.api.webhooks import WebhookDeliveryWorker, send_job_webhook_event  # noqa: F401
 from grantflow.core.config import config
-from grantflow.core.stores import create_ingest_audit_store_from_env, create_job_store_from_env
+from grantflow.core.stores import (
+    create_ingest_audit_store_from_env,
+    create_job_store_from_env,
+    create_webhook_outbox_store_from_env,
+)
 from grantflow.core.version import __version__
-from grantflow.exporters.excel_builder import build_xlsx_from_logframe  # noqa: F401
+from grantflow.exporters.excel_builder import build_xlsx_from_logframe, build_xlsx_with_manifest  # noqa: F401
 from grantflow.exporters.word_builder import build_docx_from_toc  # noqa: F401
 from grantflow.memory_bank.ingest import ingest_pdf_to_namespace  # noqa: F401
 from grantflow.memory_bank.vector_store import vector_store  # noqa: F401
@@ -160,10 +173,15 @@ from grantflow.swarm.graph import grantflow_graph  # noqa: F401
 from grantflow.swarm.hitl import hitl_manager  # noqa: F401
 from grantflow.swarm.state_contract import normalize_state_contract  # noqa: F401
 
-JOB_STORE = create_job_store_from_env()
+JOB_STORE = create_job_store_from_env(index_fields_fn=job_index_fields)
 INGEST_AUDIT_STORE = create_ingest_audit_store_from_env()
+PORTFOLIO_METRICS_AGGREGATE = PortfolioMetricsAggregate()
+WEBHOOK_OUTBOX = create_webhook_outbox_store_from_env()
+WEBHOOK_DELIVERY_WORKER = WebhookDeliveryWorker(WEBHOOK_OUTBOX)
+BLOCKING_EXECUTOR = create_blocking_executor_from_env()
 HITLStartAt = Literal["start", "architect", "mel", "critic"]
 JOB_RUNNER = _build_job_runner()
+JOB_CHANGE_NOTIFIER = _build_job_change_notifier()
 
 
 @asynccontextmanager
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import os
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from fastapi import BackgroundTasks, HTTPException, Request
+
+from grantflow.api.blocking_executor import run_blocking
+from grantflow.api.constants import TERMINAL_JOB_STATUSES
+from grantflow.api.idempotency_store_facade import _list_batch_jobs
+from grantflow.api.preflight_service import _preflight_architect_state, _preflight_retrieval_namespace
+from grantflow.api.presets_service import _build_generate_request_from_preset
+from grantflow.api.schemas import GenerateFromPresetBatchRequest, GenerateRequest
+from grantflow.api.tenant import (
+    _filter_jobs_by_tenant,
+    _job_tenant_id,
+    _resolve_tenant_id,
+    _tenant_authz_enabled,
+)
+from grantflow.core.strategies.factory import DonorFactory
+from grantflow.swarm.nodes.architect_retrieval import prefetch_architect_evidence
+
+DEFAULT_GENERATE_BATCH_MAX_ITEMS = 200
+
+
+def _generate_batch_max_items() -> int:
+    raw = os.getenv("GRANTFLOW_GENERATE_BATCH_MAX_ITEMS")
+    try:
+        value = int(raw) if raw is not None else DEFAULT_GENERATE_BATCH_MAX_ITEMS
+    except ValueError:
+        value = DEFAULT_GENERATE_BATCH_MAX_ITEMS
+    return max(1, value)
+
+
+def _generate_batch_id(request_id_prefix: str) -> str:
+    # A retried batch with the same request_id maps to the same handle; its items replay idempotently.
+    if request_id_prefix:
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"grantflow:generate-batch:{request_id_prefix}"))
+    return str(uuid.uuid4())
+
+
+def _prepare_generate_batch(req: GenerateFromPresetBatchRequest, request: Request) -> list[Dict[str, Any]]:
+    """Resolve every preset, donor strategy and retrieval namespace once, before any job is accepted."""
+    strategies: Dict[str, Any] = {}
+    prepared: list[Dict[str, Any]] = []
+    for idx, item in enumerate(req.items or []):
+        row: Dict[str, Any] = {
+            "index": idx,
+            "preset_key": str(item.preset_key or "").strip(),
+            "generate_req": None,
+            "preset_source": None,
+            "error": None,
+            "group": ("", ""),
+        }
+        prepared.append(row)
+        try:
+            generate_req, source_kind = _build_generate_request_from_preset(item)
+        except HTTPException as exc:
+            row["error"] = exc
+            continue
+        row["generate_req"] = generate_req
+        row["preset_source"] = source_kind
+        donor = generate_req.donor_id.strip()
+        if donor not in strategies:
+            try:
+                strategies[donor] = DonorFactory.get_strategy(donor) if donor else None
+            except ValueError:
+                strategies[donor] = None
+        strategy = strategies[donor]
+        row["donor_id"] = donor
+        row["strategy"] = strategy
+        if strategy is None:
+            # The per-item accept path reports the donor error with its usual status code.
+            row["group"] = (donor, "")
+            continue
+        try:
+            tenant_id = _batch_item_tenant_id(generate_req, request)
+        except HTTPException:
+            tenant_id = None
+        namespace = _preflight_retrieval_namespace(strategy, tenant_id) or ""
+        row["tenant_id"] = tenant_id
+        row["namespace"] = namespace
+        row["group"] = (donor, namespace)
+    return prepared
+
+
+def _batch_item_tenant_id(generate_req: GenerateRequest, request: Request) -> Optional[str]:
+    metadata = dict(generate_req.client_metadata) if isinstance(generate_req.client_metadata, dict) else {}
+    return _resolve_tenant_id(
+        request,
+        explicit_tenant=generate_req.tenant_id,
+        client_metadata=metadata,
+        require_if_enabled=True,
+    )
+
+
+def _warm_generate_batch(prepared: list[Dict[str, Any]]) -> Dict[str, Any]:
+    """Prefetch preflight architect retrieval for the whole batch with one query call per namespace."""
+    retrievals: list[tuple[Dict[str, Any], str]] = []
+    for row in prepared:
+        generate_req = row.get("generate_req")
+        if generate_req is None or row.get("strategy") is None or not row.get("namespace"):
+            continue
+        input_context = generate_req.input_context or {}
+        if not bool(generate_req.architect_rag_enabled) or not isinstance(input_context, dict) or not input_context:
+            continue
+        state = _preflight_architect_state(
+            donor_id=row["donor_id"],
+            strategy=row["strategy"],
+            namespace=row["namespace"],
+            input_context=dict(input_context),
+            tenant_id=row.get("tenant_id"),
+            architect_rag_enabled=True,
+        )
+        state["stage_cache_source"] = "batch"
+        retrievals.append((state, row["namespace"]))
+    stats = prefetch_architect_evidence(retrievals)
+    stats["groups"] = len({row["group"] for row in prepared if row.get("generate_req") is not None})
+    return stats
+
+
+def _fair_dispatch_order(prepared: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
+    """Round-robin across (donor, namespace) groups so one large group cannot delay every other donor."""
+    groups: "OrderedDict[tuple[str, str], list[Dict[str, Any]]]" = OrderedDict()
+    for row in prepared:
+        groups.setdefault(row["group"], []).append(row)
+    ordered: list[Dict[str, Any]] = []
+    queues = [list(rows) for rows in groups.values()]
+    while queues:
+        for rows in queues:
+            ordered.append(rows.pop(0))
+        queues = [rows for rows in queues if rows]
+    return ordered
+
+
+def _batch_error_row(row: Dict[str, Any], exc: HTTPException) -> Dict[str, Any]:
+    return {
+        "index": row["index"],
+        "preset_key": row["preset_key"],
+        "status": "error",
+        "http_status": int(exc.status_code),
+        "error": exc.detail,
+    }
+
+
+async def _dispatch_generate_batch(
+    req: GenerateFromPresetBatchRequest,
+    background_tasks: BackgroundTasks,
+    request: Request,
+    *,
+    request_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    from grantflow.api.routes.jobs import _accept_generate_request
+
+    items = list(req.items or [])
+    if not items:
+        raise HTTPException(status_code=400, detail="items must be non-empty")
+    max_items = _generate_batch_max_items()
+    if len(items) > max_items:
+        raise HTTPException(status_code=400, detail=f"items limit exceeded (max {max_items})")
+
+    request_id_prefix = str(request_id or "").strip()
+    batch_id = _generate_batch_id(request_id_prefix)
+    prepared = await run_blocking("generate", _prepare_generate_batch, req, request)
+    warmup = await run_blocking("generate", _warm_generate_batch, prepared)
+    # Stop-on-error keeps index order so "everything before the failing item" stays well defined.
+    order = _fair_dispatch_order(prepared) if req.continue_on_error else prepared
+
+    results: list[Dict[str, Any]] = []
+    accepted_count = 0
+    error_count = 0
+    for row in order:
+        idx = row["index"]
+        try:
+            if row["error"] is not None:
+                raise row["error"]
+            generate_req = row["generate_req"]
+            if request_id_prefix:
+                item_request_id: Optional[str] = f"{request_id_prefix}:{idx}"[:120]
+            else:
+                item_request_id = generate_req.request_id
+            accepted = await run_blocking(
+                "generate",
+                _accept_generate_request,
+                generate_req,
+                background_tasks,
+                request,
+                item_request_id,
+                batch={"batch_id": batch_id, "index": idx, "size": len(items)},
+            )
+            result = dict(accepted) if isinstance(accepted, dict) else {"result": accepted}
+            result["preset_key"] = row["preset_key"]
+            result["preset_source"] = row["preset_source"]
+            result["index"] = idx
+            results.append(result)
+            accepted_count += 1
+        except HTTPException as exc:
+            error_count += 1
+            results.append(_batch_error_row(row, exc))
+            if not req.continue_on_error:
+                raise HTTPException(
+                    status_code=exc.status_code,
+                    detail={
+                        "reason": "generate_from_preset_batch_item_failed",
+                        "batch_id": batch_id,
+                        "index": idx,
+                        "preset_key": row["preset_key"],
+                        "item_error": exc.detail,
+                        "results": results,
+                    },
+                ) from exc
+
+    results.sort(key=lambda result: int(result.get("index") or 0))
+    return {
+        "status": "accepted" if error_count == 0 else "partial_error",
+        "batch_id": batch_id,
+        "total": len(items),
+        "accepted_count": accepted_count,
+        "error_count": error_count,
+        "warmup": warmup,
+        "results": results,
+    }
+
+
+def _generate_batch_status_payload(batch_id: str, request: Request) -> Dict[str, Any]:
+    jobs = _list_batch_jobs(batch_id)
+    if _tenant_authz_enabled():
+        request_tenant = _resolve_tenant_id(request, require_if_enabled=True)
+        jobs = _filter_jobs_by_tenant(jobs, request_tenant)
+    if not jobs:
+        raise HTTPException(status_code=404, detail="Batch not found")
+
+    rows: list[Dict[str, Any]] = []
+    status_counts: Dict[str, int] = {}
+    size = 0
+    for job_id, job in jobs.items():
+        batch = job.get("batch") if isinstance(job.get("batch"), dict) else {}
+        state = job.get("state") if isinstance(job.get("state"), dict) else {}
+        client_metadata = job.get("client_metadata") if isinstance(job.get("client_metadata"), dict) else {}
+        status = str(job.get("status") or "unknown")
+        status_counts[status] = status_counts.get(status, 0) + 1
+        size = max(size, int(batch.get("size") or 0))
+        rows.append(
+            {
+                "job_id": job_id,
+                "index": int(batch.get("index") or 0),
+                "status": status,
+                "donor_id": str(state.get("donor_id") or ""),
+                "tenant_id": _job_tenant_id(job),
+                "preset_key": client_metadata.get("demo_generate_preset_key"),
+            }
+        )
+    rows.sort(key=lambda row: row["index"])
+    terminal_count = sum(count for status, count in status_counts.items() if status in TERMINAL_JOB_STATUSES)
+    job_count = len(rows)
+    return {
+        "batch_id": batch_id,
+        "total": max(size, job_count),
+        "job_count": job_count,
+        "terminal_count": terminal_count,
+        "progress": round(terminal_count / job_count, 4) if job_count else 0.0,
+        "complete": terminal_count == job_count,
+        "status_counts": dict(sorted(status_counts.items())),
+        "jobs": rows,
+    }
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from fastapi import HTTPException
+
+T = TypeVar("T")
+
+# Endpoint pools and their default worker counts; override with GRANTFLOW_<POOL>_CONCURRENCY.
+BLOCKING_POOL_DEFAULTS: Dict[str, int] = {"generate": 4, "ingest": 2}
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+class BlockingPoolSaturated(RuntimeError):
+    def __init__(self, pool: str, queue_limit: int) -> None:
+        super().__init__(f"Blocking pool '{pool}' queue is full (limit={queue_limit})")
+        self.pool = pool
+        self.queue_limit = queue_limit
+
+
+class _PoolStats:
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.active = 0
+        self.queued = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.run_seconds_total = 0.0
+        self.run_seconds_max = 0.0
+
+
+class BlockingWorkExecutor:
+    """Runs blocking request work (preflight, SQLite writes, PDF parsing) off the event loop.
+
+    Each endpoint pool is its own bounded thread pool, so a burst of ingests cannot take the threads a
+    `/generate` preflight needs, and neither competes with the threadpool serving sync read endpoints.
+    Work beyond `queue_limit` waiting items is rejected instead of piling up behind slow requests.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, *, queue_limit: int = 32) -> None:
+        self.limits = {name: max(1, int(value)) for name, value in (limits or BLOCKING_POOL_DEFAULTS).items()}
+        self.queue_limit = max(0, int(queue_limit))
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._stats: Dict[str, _PoolStats] = {name: _PoolStats() for name in self.limits}
+        self._lock = threading.Lock()
+
+    def _pool(self, name: str) -> ThreadPoolExecutor:
+        # Pools start lazily and are rebuilt after shutdown so app lifespans can be restarted.
+        pool = self._pools.get(name)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=self.limits[name], thread_name_prefix=f"grantflow-{name}")
+            self._pools[name] = pool
+        return pool
+
+    def submit(self, pool: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        if pool not in self.limits:
+            raise KeyError(f"Unknown blocking pool: {pool}")
+        context = contextvars.copy_context()
+        enqueued_at = time.perf_counter()
+        with self._lock:
+            stats = self._stats[pool]
+            if stats.queued >= self.queue_limit and stats.active >= self.limits[pool]:
+                stats.rejected += 1
+                raise BlockingPoolSaturated(pool, self.queue_limit)
+            stats.submitted += 1
+            stats.queued += 1
+            executor = self._pool(pool)
+
+        def _call() -> T:
+            started_at = time.perf_counter()
+            waited = started_at - enqueued_at
+            with self._lock:
+                stats.queued -= 1
+                stats.active += 1
+                stats.wait_seconds_total += waited
+                stats.wait_seconds_max = max(stats.wait_seconds_max, waited)
+            failed = False
+            try:
+                return context.run(fn, *args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                elapsed = time.perf_counter() - started_at
+                with self._lock:
+                    stats.active -= 1
+                    stats.run_seconds_total += elapsed
+                    stats.run_seconds_max = max(stats.run_seconds_max, elapsed)
+                    if failed:
+                        stats.failed += 1
+                    else:
+                        stats.completed += 1
+
+        try:
+            return executor.submit(_call)
+        except RuntimeError:
+            with self._lock:
+                stats.queued -= 1
+                stats.submitted -= 1
+            raise
+
+    async def run(self, pool: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await asyncio.wrap_future(self.submit(pool, fn, *args, **kwargs))
+
+    def stats(self) -> Dict[str, Any]:
+        pools: Dict[str, Any] = {}
+        with self._lock:
+            for name, stats in self._stats.items():
+                finished = stats.completed + stats.failed
+                started = finished + stats.active
+                pools[name] = {
+                    "max_workers": self.limits[name],
+                    "running": name in self._pools,
+                    "active": stats.active,
+                    "queue_depth": stats.queued,
+                    "submitted_count": stats.submitted,
+                    "completed_count": stats.completed,
+                    "failed_count": stats.failed,
+                    "rejected_count": stats.rejected,
+                    "wait_ms_avg": round(stats.wait_seconds_total * 1000.0 / started, 3) if started else 0.0,
+                    "wait_ms_max": round(stats.wait_seconds_max * 1000.0, 3),
+                    "run_ms_avg": round(stats.run_seconds_total * 1000.0 / finished, 3) if finished else 0.0,
+                    "run_ms_max": round(stats.run_seconds_max * 1000.0, 3),
+                }
+        return {"queue_limit": self.queue_limit, "pools": pools}
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools = {}
+        for pool in pools:
+            pool.shutdown(wait=wait)
+
+
+def create_blocking_executor_from_env() -> BlockingWorkExecutor:
+    limits = {
+        name: max(1, _env_int(f"GRANTFLOW_{name.upper()}_CONCURRENCY", default))
+        for name, default in BLOCKING_POOL_DEFAULTS.items()
+    }
+    return BlockingWorkExecutor(limits, queue_limit=max(0, _env_int("GRANTFLOW_BLOCKING_QUEUE_LIMIT", 32)))
+
+
+def _blocking_executor() -> BlockingWorkExecutor:
+    from grantflow.api import app as api_app_module
+
+    return api_app_module.BLOCKING_EXECUTOR
+
+
+async def run_blocking(pool: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Await `fn` on the named endpoint pool; a saturated pool maps to 503 like a full job queue."""
+    try:
+        future = _blocking_executor().submit(pool, fn, *args, **kwargs)
+    except BlockingPoolSaturated as exc:
+        raise HTTPException(status_code=503, detail=f"Server is busy ({exc.pool}). Retry shortly.") from exc
+    return await asyncio.wrap_future(future)
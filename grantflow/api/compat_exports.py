@@ -28,6 +28,12 @@ def _uses_redis_queue_runner() -> bool:
     return _impl()
 
 
+def _uses_process_pool_runner() -> bool:
+    from grantflow.api.runtime_service import _uses_process_pool_runner as _impl
+
+    return _impl()
+
+
 def _uses_queue_runner() -> bool:
     from grantflow.api.runtime_service import _uses_queue_runner as _impl
 
@@ -58,6 +64,12 @@ def _build_job_runner():
     return _impl()
 
 
+def _build_job_change_notifier():
+    from grantflow.api.runtime_service import _build_job_change_notifier as _impl
+
+    return _impl()
+
+
 def _job_store_mode() -> str:
     from grantflow.api.runtime_service import _job_store_mode as _impl
 
@@ -19,10 +19,16 @@ from grantflow.api.orchestrator_service import (
 )
 from grantflow.api.security import api_key_configured, read_auth_required
 from grantflow.api.tenant import _allowed_tenant_tokens, _default_tenant_token, _tenant_authz_enabled
+from grantflow.api.webhooks import webhook_delivery_mode
 from grantflow.core.config import config
+from grantflow.core.stores import sqlite_pool_stats
+from grantflow.core.strategies.factory import donor_registry
+from grantflow.exporters.artifact_cache import export_artifact_cache
 from grantflow.memory_bank.vector_store import vector_store
+from grantflow.swarm.fanout import node_fanout_executor
+from grantflow.swarm.stage_cache import stage_result_cache
 
-_JOB_RUNNER_MODES = {"background_tasks", "inmemory_queue", "redis_queue"}
+_JOB_RUNNER_MODES = {"background_tasks", "inmemory_queue", "redis_queue", "process_pool"}
 _PRODUCTION_ENV_TOKENS = {"prod", "production"}
 
 
@@ -48,6 +54,22 @@ def _ingest_audit_store():
     return _app_module().INGEST_AUDIT_STORE
 
 
+def _portfolio_metrics_aggregate():
+    return _app_module().PORTFOLIO_METRICS_AGGREGATE
+
+
+def _webhook_delivery_worker():
+    return _app_module().WEBHOOK_DELIVERY_WORKER
+
+
+def _blocking_executor():
+    return _app_module().BLOCKING_EXECUTOR
+
+
+def _job_change_notifier():
+    return _app_module().JOB_CHANGE_NOTIFIER
+
+
 def _hitl_manager():
     return _app_module().hitl_manager
 
@@ -60,7 +82,7 @@ def _job_runner_mode() -> str:
 
 
 def _uses_queue_runner() -> bool:
-    return _job_runner_mode() in {"inmemory_queue", "redis_queue"}
+    return _job_runner_mode() in {"inmemory_queue", "redis_queue", "process_pool"}
 
 
 def _normalize_grounding_policy_mode(raw_mode: Any) -> str:
@@ -295,9 +317,22 @@ def _health_diagnostics() -> dict[str, Any]:
         job_runner_diag.get("worker_heartbeat") if isinstance(job_runner_diag.get("worker_heartbeat"), dict) else None
     )
     diagnostics: dict[str, Any] = {
-        "job_store": {"mode": job_store_mode},
+        "job_store": {
+            "mode": job_store_mode,
+            "portfolio_aggregates": _portfolio_metrics_aggregate().stats(),
+        },
         "hitl_store": {"mode": hitl_store_mode},
         "ingest_store": {"mode": ingest_store_mode},
+        "webhooks": {
+            "delivery_mode": webhook_delivery_mode(),
+            "delivery": _webhook_delivery_worker().diagnostics(),
+        },
+        "blocking_executor": _blocking_executor().stats(),
+        "stage_cache": stage_result_cache.stats(),
+        "export_artifact_cache": export_artifact_cache.stats(),
+        "node_fanout": node_fanout_executor.stats(),
+        "donor_registry": donor_registry.stats(),
+        "status_waiters": _job_change_notifier().stats(),
         "job_runner": {
             "mode": _job_runner_mode(),
             "queue_enabled": _uses_queue_runner(),
@@ -350,7 +385,7 @@ def _health_diagnostics() -> dict[str, Any]:
         "configuration_warnings": _configuration_warnings(),
     }
     if sqlite_path and (job_store_mode == "sqlite" or hitl_store_mode == "sqlite" or ingest_store_mode == "sqlite"):
-        diagnostics["sqlite"] = {"path": str(sqlite_path)}
+        diagnostics["sqlite"] = {"path": str(sqlite_path), "connection_pools": sqlite_pool_stats()}
     client_init_error = getattr(vector_store, "_client_init_error", None)
     if client_init_error:
         diagnostics["vector_store"]["client_init_error"] = str(client_init_error)
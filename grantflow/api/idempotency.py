@@ -104,26 +104,30 @@ def _store_idempotency_response(
     token = _normalize_request_id(request_id)
     if not token:
         return
-    job = _app_module()._get_job(job_id)
-    if not job:
-        return
-    records = _idempotency_records(job)
-    key = _idempotency_record_key(scope, token)
     stored_response = dict(response)
     stored_response.pop("idempotent_replay", None)
     stored_response["request_id"] = token
-    records[key] = {
-        "scope": scope,
-        "request_id": token,
-        "fingerprint": fingerprint,
-        "persisted": bool(persisted),
-        "ts": _app_module()._utcnow_iso(),
-        "response": stored_response,
-    }
-    while len(records) > MAX_IDEMPOTENCY_RECORDS:
-        oldest_key = next(iter(records))
-        records.pop(oldest_key, None)
-    _app_module()._update_job(job_id, idempotency_records=records)
+
+    def _write() -> None:
+        job, revision = _app_module()._get_job_with_revision(job_id)
+        if not job:
+            return
+        records = _idempotency_records(job)
+        key = _idempotency_record_key(scope, token)
+        records[key] = {
+            "scope": scope,
+            "request_id": token,
+            "fingerprint": fingerprint,
+            "persisted": bool(persisted),
+            "ts": _app_module()._utcnow_iso(),
+            "response": stored_response,
+        }
+        while len(records) > MAX_IDEMPOTENCY_RECORDS:
+            oldest_key = next(iter(records))
+            records.pop(oldest_key, None)
+        _app_module()._update_job(job_id, expected_revision=revision, idempotency_records=records)
+
+    _app_module()._retry_on_job_revision_conflict(_write)
 
 
 def _global_idempotency_record_key(scope: str, request_id: str) -> str:
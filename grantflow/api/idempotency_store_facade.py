@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
 
 
 def _normalize_request_id(value: Any) -> Optional[str]:
@@ -117,6 +119,19 @@ def _record_job_event(job_id: str, event_type: str, **fields: Any) -> None:
     _impl(job_id, event_type, **fields)
 
 
+def _append_job_rows(
+    job_id: str,
+    collection: str,
+    rows: list[Dict[str, Any]],
+    *,
+    keep_last: int,
+    expected_revision: Optional[int] = None,
+) -> bool:
+    from grantflow.api.job_store_service import _append_job_rows as _impl
+
+    return _impl(job_id, collection, rows, keep_last=keep_last, expected_revision=expected_revision)
+
+
 def _record_ingest_event(
     *,
     donor_id: str,
@@ -155,10 +170,10 @@ def _ingest_inventory(*, donor_id: Optional[str] = None, tenant_id: Optional[str
     return _impl(donor_id=donor_id, tenant_id=tenant_id)
 
 
-def _set_job(job_id: str, payload: Dict[str, Any]) -> None:
+def _set_job(job_id: str, payload: Dict[str, Any], expected_revision: Optional[int] = None) -> None:
     from grantflow.api.job_store_service import _set_job as _impl
 
-    _impl(job_id, payload)
+    _impl(job_id, payload, expected_revision=expected_revision)
 
 
 def _update_job(job_id: str, **patch: Any) -> Dict[str, Any]:
@@ -173,7 +188,131 @@ def _get_job(job_id: str) -> Optional[Dict[str, Any]]:
     return _impl(job_id)
 
 
+def _get_job_with_revision(job_id: str) -> tuple[Optional[Dict[str, Any]], Optional[int]]:
+    from grantflow.api.job_store_service import _get_job_with_revision as _impl
+
+    return _impl(job_id)
+
+
+def _retry_on_job_revision_conflict(fn: Callable[[], T]) -> T:
+    from grantflow.api.job_store_service import _retry_on_job_revision_conflict as _impl
+
+    return _impl(fn)
+
+
 def _list_jobs() -> Dict[str, Dict[str, Any]]:
     from grantflow.api.job_store_service import _list_jobs as _impl
 
     return _impl()
+
+
+def _list_batch_jobs(batch_id: str) -> Dict[str, Dict[str, Any]]:
+    from grantflow.api.job_store_service import _list_batch_jobs as _impl
+
+    return _impl(batch_id)
+
+
+def _list_portfolio_jobs(
+    *,
+    tenant_id: Optional[str] = None,
+    donor_id: Optional[str] = None,
+    status: Optional[str] = None,
+    hitl_enabled: Optional[bool] = None,
+    warning_level: Optional[str] = None,
+    grounding_risk_level: Optional[str] = None,
+) -> Dict[str, Dict[str, Any]]:
+    from grantflow.api.job_store_service import _list_portfolio_jobs as _impl
+
+    return _impl(
+        tenant_id=tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
+
+
+def _portfolio_metrics_payload(
+    *,
+    tenant_id: Optional[str] = None,
+    donor_id: Optional[str] = None,
+    status: Optional[str] = None,
+    hitl_enabled: Optional[bool] = None,
+    warning_level: Optional[str] = None,
+    grounding_risk_level: Optional[str] = None,
+    toc_text_risk_level: Optional[str] = None,
+    mel_risk_level: Optional[str] = None,
+) -> Dict[str, Any]:
+    from grantflow.api.job_store_service import _portfolio_metrics_payload as _impl
+
+    return _impl(
+        tenant_id=tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+        toc_text_risk_level=toc_text_risk_level,
+        mel_risk_level=mel_risk_level,
+    )
+
+
+def _portfolio_quality_payload(
+    *,
+    tenant_id: Optional[str] = None,
+    donor_id: Optional[str] = None,
+    status: Optional[str] = None,
+    hitl_enabled: Optional[bool] = None,
+    warning_level: Optional[str] = None,
+    grounding_risk_level: Optional[str] = None,
+    finding_status: Optional[str] = None,
+    finding_severity: Optional[str] = None,
+    toc_text_risk_level: Optional[str] = None,
+    mel_risk_level: Optional[str] = None,
+) -> Dict[str, Any]:
+    from grantflow.api.job_store_service import _portfolio_quality_payload as _impl
+
+    return _impl(
+        tenant_id=tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+        finding_status=finding_status,
+        finding_severity=finding_severity,
+        toc_text_risk_level=toc_text_risk_level,
+        mel_risk_level=mel_risk_level,
+    )
+
+
+def _check_portfolio_aggregates(
+    *,
+    tenant_id: Optional[str] = None,
+    donor_id: Optional[str] = None,
+    status: Optional[str] = None,
+    hitl_enabled: Optional[bool] = None,
+    warning_level: Optional[str] = None,
+    grounding_risk_level: Optional[str] = None,
+    toc_text_risk_level: Optional[str] = None,
+    mel_risk_level: Optional[str] = None,
+) -> Dict[str, Any]:
+    from grantflow.api.job_store_service import _check_portfolio_aggregates as _impl
+
+    return _impl(
+        tenant_id=tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+        toc_text_risk_level=toc_text_risk_level,
+        mel_risk_level=mel_risk_level,
+    )
+
+
+def _rebuild_portfolio_aggregates() -> Dict[str, Any]:
+    from grantflow.api.job_store_service import _rebuild_portfolio_aggregates as _impl
+
+    return _impl()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from grantflow.api.public_views import (
+    _job_donor_id,
+    _job_grounding_risk_level,
+    _job_warning_level,
+    _normalize_grounding_risk_filter,
+    _normalize_warning_level_filter,
+)
+from grantflow.api.tenant import _job_tenant_id, _normalize_tenant_candidate
+from grantflow.core.stores import default_job_index_fields
+
+
+def job_index_fields(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Denormalized job index row; values must match the portfolio payload filters exactly."""
+    fields = default_job_index_fields(payload)
+    fields.update(
+        {
+            "tenant_id": _job_tenant_id(payload) or "",
+            "donor_id": _job_donor_id(payload),
+            "warning_level": _job_warning_level(payload),
+            "grounding_risk_level": _job_grounding_risk_level(payload),
+        }
+    )
+    return fields
+
+
+def portfolio_index_filters(
+    *,
+    tenant_id: Optional[str] = None,
+    donor_id: Optional[str] = None,
+    status: Optional[str] = None,
+    hitl_enabled: Optional[bool] = None,
+    warning_level: Optional[str] = None,
+    grounding_risk_level: Optional[str] = None,
+) -> Dict[str, Any]:
+    filters: Dict[str, Any] = {
+        "tenant_id": _normalize_tenant_candidate(tenant_id),
+        "donor_id": donor_id or None,
+        "status": status or None,
+        "hitl_enabled": hitl_enabled,
+        "warning_level": _normalize_warning_level_filter(warning_level),
+        "grounding_risk_level": _normalize_grounding_risk_filter(grounding_risk_level),
+    }
+    return {key: value for key, value in filters.items() if value is not None}
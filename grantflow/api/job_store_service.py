@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+import logging
+import random
+import time
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 from grantflow.api.idempotency import _normalize_request_id
 from grantflow.api.review_runtime_helpers import _utcnow_iso
+from grantflow.core.stores import JobRevisionConflict
 from grantflow.swarm.state_contract import normalize_state_contract
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+JOB_REVISION_RETRY_ATTEMPTS = 8
+JOB_EVENTS_KEEP_LAST = 200
+
+
+class JobWriteContention(RuntimeError):
+    """A job read-modify-write kept losing compare-and-swap races and gave up."""
+
 
 def _job_store():
     from grantflow.api import app as api_app_module
@@ -20,6 +35,46 @@ def _ingest_audit_store():
     return api_app_module.INGEST_AUDIT_STORE
 
 
+def _portfolio_metrics_aggregate():
+    from grantflow.api import app as api_app_module
+
+    return api_app_module.PORTFOLIO_METRICS_AGGREGATE
+
+
+def _job_change_notifier():
+    from grantflow.api import app as api_app_module
+
+    return api_app_module.JOB_CHANGE_NOTIFIER
+
+
+def _publish_job_change(job_id: str) -> None:
+    try:
+        _job_change_notifier().publish(job_id)
+    except Exception:
+        # Status waiters fall back to rechecking the store; a lost signal must not fail the write.
+        logger.exception("Job change notification failed for job %s", job_id)
+
+
+def _record_portfolio_aggregate_write(
+    job_id: str, current: Optional[Dict[str, Any]], write_seq: Optional[int] = None
+) -> None:
+    from grantflow.api.portfolio_aggregates import portfolio_aggregate_mode
+
+    aggregate = _portfolio_metrics_aggregate()
+    if portfolio_aggregate_mode() == "off":
+        aggregate.invalidate()
+        return
+    if write_seq is None:
+        # Without the store write sequence the payload cannot be ordered; the next read catches up instead.
+        return
+    try:
+        aggregate.apply(job_id, current, write_seq=write_seq)
+    except Exception:
+        # A broken contribution must not fail the job write; the next read rebuilds from the store.
+        logger.exception("Portfolio aggregate update failed for job %s", job_id)
+        aggregate.invalidate()
+
+
 def _dispatch_status_webhook(
     job_id: str, previous: Optional[Dict[str, Any]], current: Optional[Dict[str, Any]]
 ) -> None:
@@ -28,6 +83,21 @@ def _dispatch_status_webhook(
     _dispatch_job_webhook_for_status_change(job_id, previous, current)
 
 
+def _status_change_event(previous: Optional[Dict[str, Any]], next_payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    prev_status = (previous or {}).get("status")
+    next_status = next_payload.get("status")
+    if prev_status == next_status or next_status is None:
+        return None
+    return {
+        "event_id": str(uuid.uuid4()),
+        "ts": _utcnow_iso(),
+        "type": "status_changed",
+        "from_status": None if prev_status is None else str(prev_status),
+        "to_status": str(next_status),
+        "status": str(next_status),
+    }
+
+
 def _append_job_event_records(
     previous: Optional[Dict[str, Any]],
     next_payload: Dict[str, Any],
@@ -40,53 +110,100 @@ def _append_job_event_records(
     if isinstance(next_payload.get("job_events"), list):
         events = [e for e in next_payload["job_events"] if isinstance(e, dict)]
 
-    prev_status = (previous or {}).get("status")
-    next_status = next_payload.get("status")
-    if prev_status != next_status and next_status is not None:
+    status_event = _status_change_event(previous, next_payload)
+    if status_event is not None:
         events = list(events)
-        events.append(
-            {
-                "event_id": str(uuid.uuid4()),
-                "ts": _utcnow_iso(),
-                "type": "status_changed",
-                "from_status": None if prev_status is None else str(prev_status),
-                "to_status": str(next_status),
-                "status": str(next_status),
-            }
-        )
+        events.append(status_event)
 
     if events:
-        next_payload["job_events"] = events[-200:]
+        next_payload["job_events"] = events[-JOB_EVENTS_KEEP_LAST:]
     return next_payload
 
 
+def _get_job_with_revision(job_id: str) -> tuple[Optional[Dict[str, Any]], Optional[int]]:
+    """Read a job together with the revision a conditional write must match (None if unsupported)."""
+    store = _job_store()
+    get_with_revision = getattr(store, "get_with_revision", None)
+    if callable(get_with_revision):
+        payload, revision = get_with_revision(job_id)
+        return payload, int(revision)
+    return store.get(job_id), None
+
+
+def _revision_guard(revision: Optional[int]) -> Dict[str, Any]:
+    return {} if revision is None else {"expected_revision": revision}
+
+
+def _retry_on_job_revision_conflict(fn: Callable[[], T], *, attempts: Optional[int] = None) -> T:
+    """Re-run a read-modify-write job mutation until its conditional write lands.
+
+    `fn` must read the job (with its revision) and write with `expected_revision` each time it is called,
+    so a retry recomputes from the winner's state instead of overwriting it.
+    """
+    attempts = max(1, int(attempts if attempts is not None else JOB_REVISION_RETRY_ATTEMPTS))
+    for attempt in range(1, attempts + 1):
+        try:
+            return fn()
+        except JobRevisionConflict as exc:
+            if attempt >= attempts:
+                raise JobWriteContention(f"Job {exc.job_id} kept changing during update ({attempts} attempts)") from exc
+            time.sleep(random.uniform(0.0, 0.002 * (2**attempt)))
+    raise AssertionError("unreachable")
+
+
 def _record_job_event(job_id: str, event_type: str, **fields: Any) -> None:
+    """Append one job event without reading or rewriting the stored event list.
+
+    The append is unconditional, so it never loses a revision race; a `request_id` makes it idempotent.
+    """
     store = _job_store()
-    job = store.get(job_id)
-    if not job:
+    index_row = store.get_index(job_id)
+    if not index_row:
         return
-    existing = job.get("job_events")
-    events = [e for e in existing if isinstance(e, dict)] if isinstance(existing, list) else []
-    request_id = _normalize_request_id(fields.get("request_id"))
-    if request_id:
-        for row in reversed(events):
-            if not isinstance(row, dict):
-                continue
-            if str(row.get("type") or "") != event_type:
-                continue
-            if str(row.get("request_id") or "") != request_id:
-                continue
-            return
     event: Dict[str, Any] = {
         "event_id": str(uuid.uuid4()),
         "ts": _utcnow_iso(),
         "type": event_type,
-        "status": str(job.get("status") or ""),
+        "status": str(index_row.get("status") or ""),
     }
     for key, value in fields.items():
         event[str(key)] = value
-    events.append(event)
-    store.update(job_id, job_events=events[-200:])
+    request_id = _normalize_request_id(fields.get("request_id"))
+    if request_id:
+        event["request_id"] = request_id
+    write_seq = store.append_rows(
+        job_id,
+        "job_events",
+        [event],
+        keep_last=JOB_EVENTS_KEEP_LAST,
+        unique_fields=("type", "request_id") if request_id else (),
+    )
+    if write_seq is None:
+        return
+    _record_portfolio_aggregate_write(job_id, None)
+    _publish_job_change(job_id)
+
+
+def _append_job_rows(
+    job_id: str,
+    collection: str,
+    rows: list[Dict[str, Any]],
+    *,
+    keep_last: int,
+    expected_revision: Optional[int] = None,
+) -> bool:
+    """Append items to a job collection (e.g. review comments); False when the job is gone.
+
+    With `expected_revision` the append is conditional and a lost race raises JobRevisionConflict.
+    """
+    write_seq = _job_store().append_rows(
+        job_id, collection, rows, keep_last=keep_last, **_revision_guard(expected_revision)
+    )
+    if write_seq is None:
+        return False
+    _record_portfolio_aggregate_write(job_id, None)
+    _publish_job_change(job_id)
+    return True
 
 
 def _record_ingest_event(
@@ -153,36 +270,76 @@ def _ingest_inventory(*, donor_id: Optional[str] = None, tenant_id: Optional[str
     return list(grouped.values())
 
 
-def _set_job(job_id: str, payload: Dict[str, Any]) -> None:
-    store = _job_store()
-    previous = store.get(job_id)
+# Job fields owned by writers other than the pipeline; an owner transition (`_set_job`) keeps their stored value
+# unless the payload sets them.
+JOB_CARRY_OVER_KEYS = (
+    "webhook_url",
+    "webhook_secret",
+    "client_metadata",
+    "generate_preflight",
+    "strict_preflight",
+    "idempotency_records",
+    "batch",
+    "review_comments",
+)
+
+
+def _set_job(job_id: str, payload: Dict[str, Any], expected_revision: Optional[int] = None) -> None:
+    """Replace a job's pipeline-owned fields with `payload` (an owner transition such as accepted -> running).
+
+    Each attempt re-reads the job and re-applies the transition to it, so fields other writers own (see
+    JOB_CARRY_OVER_KEYS) and their event history survive a lost race. With `expected_revision` the write is
+    conditional and a concurrent change raises JobRevisionConflict instead.
+    """
+    if expected_revision is not None:
+        _set_job_once(job_id, expected_revision, payload)
+        return
+    _retry_on_job_revision_conflict(lambda: _set_job_once(job_id, None, payload))
+
+
+def _owner_transition(previous: Optional[Dict[str, Any]], payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The job `payload` makes of `previous`, or None when a canceled job must stay canceled."""
     next_payload = dict(payload)
     state_payload = next_payload.get("state")
     if isinstance(state_payload, dict):
         normalize_state_contract(state_payload)
 
     if previous and previous.get("status") == "canceled" and next_payload.get("status") != "canceled":
-        return
+        return None
 
-    for key in (
-        "webhook_url",
-        "webhook_secret",
-        "client_metadata",
-        "generate_preflight",
-        "strict_preflight",
-        "idempotency_records",
-    ):
+    for key in JOB_CARRY_OVER_KEYS:
         if key not in next_payload and previous and key in previous:
             next_payload[key] = previous.get(key)
+    return _append_job_event_records(previous, next_payload)
+
 
-    next_payload = _append_job_event_records(previous, next_payload)
-    store.set(job_id, next_payload)
+def _set_job_once(job_id: str, expected_revision: Optional[int], payload: Dict[str, Any]) -> None:
+    store = _job_store()
+    previous, revision = _get_job_with_revision(job_id)
+    if expected_revision is not None and revision is not None and revision != expected_revision:
+        raise JobRevisionConflict(job_id, expected_revision, revision)
+    next_payload = _owner_transition(previous, payload)
+    if next_payload is None:
+        return
+    write_seq = store.set(job_id, next_payload, **_revision_guard(revision))
+    _record_portfolio_aggregate_write(job_id, next_payload, write_seq)
+    _publish_job_change(job_id)
     _dispatch_status_webhook(job_id, previous, next_payload)
 
 
-def _update_job(job_id: str, **patch: Any) -> Dict[str, Any]:
+def _update_job(job_id: str, expected_revision: Optional[int] = None, **patch: Any) -> Dict[str, Any]:
+    """Patch a job. With `expected_revision` the write is conditional and a lost race raises
+    JobRevisionConflict for the caller to recompute; without it the merge itself is retried internally."""
+    if expected_revision is not None:
+        return _update_job_once(job_id, expected_revision, patch)
+    return _retry_on_job_revision_conflict(lambda: _update_job_once(job_id, None, patch))
+
+
+def _update_job_once(job_id: str, expected_revision: Optional[int], patch: Dict[str, Any]) -> Dict[str, Any]:
     store = _job_store()
-    previous = store.get(job_id)
+    previous, revision = _get_job_with_revision(job_id)
+    if expected_revision is not None and revision is not None and revision != expected_revision:
+        raise JobRevisionConflict(job_id, expected_revision, revision)
     if previous and previous.get("status") == "canceled" and "status" in patch and patch.get("status") != "canceled":
         return previous
     next_patch = dict(patch)
@@ -191,12 +348,34 @@ def _update_job(job_id: str, **patch: Any) -> Dict[str, Any]:
         normalize_state_contract(state_patch)
     merged_preview = dict(previous or {})
     merged_preview.update(next_patch)
-    merged_preview = _append_job_event_records(previous, merged_preview)
-    if "job_events" in merged_preview:
-        next_patch["job_events"] = merged_preview["job_events"]
-    updated = store.update(job_id, **next_patch)
-    _dispatch_status_webhook(job_id, previous, updated)
-    return updated
+    if isinstance(state_patch, dict):
+        # Stores write the state with its legacy aliases; return it the way a later read sees it.
+        preview_state = dict(state_patch)
+        normalize_state_contract(preview_state, emit_legacy_aliases=True)
+        merged_preview["state"] = preview_state
+    status_event = _status_change_event(previous, merged_preview)
+    if previous is not None and status_event is not None and "job_events" not in next_patch:
+        # Only the new status event is written; the stored event list is not rewritten.
+        raw_events = previous.get("job_events")
+        events = [e for e in raw_events if isinstance(e, dict)] if isinstance(raw_events, list) else []
+        merged_preview["job_events"] = [*events, status_event][-JOB_EVENTS_KEEP_LAST:]
+        write_seq = store.append_rows(
+            job_id,
+            "job_events",
+            [status_event],
+            keep_last=JOB_EVENTS_KEEP_LAST,
+            **_revision_guard(revision),
+            **next_patch,
+        )
+    else:
+        merged_preview = _append_job_event_records(previous, merged_preview)
+        if "job_events" in merged_preview and ("job_events" in next_patch or status_event is not None):
+            next_patch["job_events"] = merged_preview["job_events"]
+        write_seq = store.update(job_id, **_revision_guard(revision), **next_patch)
+    _record_portfolio_aggregate_write(job_id, merged_preview, write_seq)
+    _publish_job_change(job_id)
+    _dispatch_status_webhook(job_id, previous, merged_preview)
+    return merged_preview
 
 
 def _get_job(job_id: str) -> Optional[Dict[str, Any]]:
@@ -210,3 +389,229 @@ def _list_jobs() -> Dict[str, Dict[str, Any]]:
         if isinstance(result, dict):
             return result
     return {}
+
+
+def _list_portfolio_jobs(
+    *,
+    tenant_id: Optional[str] = None,
+    donor_id: Optional[str] = None,
+    status: Optional[str] = None,
+    hitl_enabled: Optional[bool] = None,
+    warning_level: Optional[str] = None,
+    grounding_risk_level: Optional[str] = None,
+) -> Dict[str, Dict[str, Any]]:
+    from grantflow.api.job_index import portfolio_index_filters
+    from grantflow.api.tenant import _filter_jobs_by_tenant
+
+    filters = portfolio_index_filters(
+        tenant_id=tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
+    list_filtered_fn = getattr(_job_store(), "list_filtered", None)
+    if callable(list_filtered_fn):
+        result = list_filtered_fn(**filters)
+        jobs = result if isinstance(result, dict) else {}
+    else:
+        jobs = _list_jobs()
+    # The index only pre-filters; tenant scoping is re-checked on the hydrated payloads.
+    return _filter_jobs_by_tenant(jobs, tenant_id)
+
+
+def _list_batch_jobs(batch_id: str) -> Dict[str, Dict[str, Any]]:
+    token = str(batch_id or "").strip()
+    if not token:
+        return {}
+    jobs = _job_store().list_filtered(batch_id=token)
+    # Jobs without an index row have a NULL batch_id and pass the pre-filter, so re-check the payload.
+    return {
+        job_id: job
+        for job_id, job in jobs.items()
+        if isinstance(job.get("batch"), dict) and str(job["batch"].get("batch_id") or "") == token
+    }
+
+
+def _catch_up_portfolio_aggregate(aggregate: Any, store: Any) -> None:
+    """Fold in job writes this process has not applied, including writes made by other processes."""
+    watermark_fn = getattr(store, "change_watermark", None)
+    changes_fn = getattr(store, "list_changes", None)
+    if not callable(watermark_fn) or not callable(changes_fn):
+        return
+    watermark = int(watermark_fn())
+    if watermark <= aggregate.watermark():
+        return
+    for job_id, write_seq in changes_fn(aggregate.watermark()):
+        if write_seq > aggregate.write_seq(job_id):
+            aggregate.apply(job_id, store.get(job_id), write_seq=write_seq)
+        watermark = max(watermark, write_seq)
+    aggregate.advance_watermark(watermark)
+
+
+def _rebuild_portfolio_aggregate_from_store(aggregate: Any, store: Any) -> int:
+    changes_fn = getattr(store, "list_changes", None)
+    # Write sequences are read before the payloads: a job written in between is refetched by the catch-up.
+    write_seqs = dict(changes_fn(0)) if callable(changes_fn) else None
+    rebuilt_job_count = aggregate.rebuild(_list_jobs(), source=store, write_seqs=write_seqs)
+    _catch_up_portfolio_aggregate(aggregate, store)
+    return rebuilt_job_count
+
+
+def _ensure_portfolio_aggregate_ready():
+    aggregate = _portfolio_metrics_aggregate()
+    store = _job_store()
+    if not aggregate.is_ready_for(store):
+        _rebuild_portfolio_aggregate_from_store(aggregate, store)
+    else:
+        _catch_up_portfolio_aggregate(aggregate, store)
+    return aggregate
+
+
+def _rebuild_portfolio_aggregates() -> Dict[str, Any]:
+    aggregate = _portfolio_metrics_aggregate()
+    rebuilt_job_count = _rebuild_portfolio_aggregate_from_store(aggregate, _job_store())
+    return {"rebuilt_job_count": rebuilt_job_count, **aggregate.stats()}
+
+
+def _portfolio_metrics_full_scan(
+    *,
+    tenant_id: Optional[str] = None,
+    donor_id: Optional[str] = None,
+    status: Optional[str] = None,
+    hitl_enabled: Optional[bool] = None,
+    warning_level: Optional[str] = None,
+    grounding_risk_level: Optional[str] = None,
+    toc_text_risk_level: Optional[str] = None,
+    mel_risk_level: Optional[str] = None,
+) -> Dict[str, Any]:
+    from grantflow.api.public_views import public_portfolio_metrics_payload
+
+    jobs = _list_portfolio_jobs(
+        tenant_id=tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
+    return public_portfolio_metrics_payload(
+        jobs,
+        donor_id=(donor_id or None),
+        status=(status or None),
+        hitl_enabled=hitl_enabled,
+        warning_level=(warning_level or None),
+        grounding_risk_level=(grounding_risk_level or None),
+        toc_text_risk_level=(toc_text_risk_level or None),
+        mel_risk_level=(mel_risk_level or None),
+    )
+
+
+def _portfolio_quality_full_scan(
+    *,
+    tenant_id: Optional[str] = None,
+    donor_id: Optional[str] = None,
+    status: Optional[str] = None,
+    hitl_enabled: Optional[bool] = None,
+    warning_level: Optional[str] = None,
+    grounding_risk_level: Optional[str] = None,
+    finding_status: Optional[str] = None,
+    finding_severity: Optional[str] = None,
+    toc_text_risk_level: Optional[str] = None,
+    mel_risk_level: Optional[str] = None,
+) -> Dict[str, Any]:
+    from grantflow.api.public_views import public_portfolio_quality_payload
+
+    jobs = _list_portfolio_jobs(
+        tenant_id=tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
+    return public_portfolio_quality_payload(
+        jobs,
+        donor_id=(donor_id or None),
+        status=(status or None),
+        hitl_enabled=hitl_enabled,
+        warning_level=(warning_level or None),
+        grounding_risk_level=(grounding_risk_level or None),
+        finding_status=(finding_status or None),
+        finding_severity=(finding_severity or None),
+        toc_text_risk_level=(toc_text_risk_level or None),
+        mel_risk_level=(mel_risk_level or None),
+    )
+
+
+def _record_portfolio_aggregate_check(aggregate: Any, cached: Dict[str, Any], expected: Dict[str, Any]) -> list[str]:
+    from grantflow.api.portfolio_aggregates import portfolio_metrics_mismatches
+
+    mismatches = portfolio_metrics_mismatches(cached, expected)
+    aggregate.record_check(mismatches)
+    if mismatches:
+        logger.warning("Portfolio aggregate diverged from full scan at %s", ", ".join(mismatches[:10]))
+    return mismatches
+
+
+def _compare_portfolio_aggregates(**filters: Any) -> tuple[Dict[str, Any], Dict[str, Any], list[str]]:
+    aggregate = _ensure_portfolio_aggregate_ready()
+    cached = aggregate.metrics_payload(**filters)
+    # The full scan keeps the store's own (newest write first) order, so ordering drift shows up in the
+    # order-sensitive triage lists instead of being lined up away.
+    expected = _portfolio_metrics_full_scan(**filters)
+    return cached, expected, _record_portfolio_aggregate_check(aggregate, cached, expected)
+
+
+def _compare_portfolio_quality_aggregates(**filters: Any) -> tuple[Dict[str, Any], Dict[str, Any], list[str]]:
+    aggregate = _ensure_portfolio_aggregate_ready()
+    cached = aggregate.quality_payload(**filters)
+    expected = _portfolio_quality_full_scan(**filters)
+    return cached, expected, _record_portfolio_aggregate_check(aggregate, cached, expected)
+
+
+def _check_portfolio_aggregates(**filters: Any) -> Dict[str, Any]:
+    cached, expected, metrics_mismatches = _compare_portfolio_aggregates(**filters)
+    _, _, quality_mismatches = _compare_portfolio_quality_aggregates(**filters)
+    mismatches = metrics_mismatches + [f"quality.{path}" for path in quality_mismatches]
+    return {
+        "consistent": not mismatches,
+        "mismatch_count": len(mismatches),
+        "mismatches": mismatches[:50],
+        "cached_job_count": int(cached.get("job_count") or 0),
+        "full_scan_job_count": int(expected.get("job_count") or 0),
+        "aggregate": _portfolio_metrics_aggregate().stats(),
+    }
+
+
+def _portfolio_metrics_payload(**filters: Any) -> Dict[str, Any]:
+    """Serve /portfolio/metrics per GRANTFLOW_PORTFOLIO_AGGREGATES: full scan (off), aggregate (on) or both (check)."""
+    from grantflow.api.portfolio_aggregates import portfolio_aggregate_mode
+
+    mode = portfolio_aggregate_mode()
+    if mode == "on":
+        return _ensure_portfolio_aggregate_ready().metrics_payload(**filters)
+    if mode == "check":
+        _, expected, _ = _compare_portfolio_aggregates(**filters)
+        return expected
+    return _portfolio_metrics_full_scan(**filters)
+
+
+def _portfolio_quality_payload(**filters: Any) -> Dict[str, Any]:
+    """Serve /portfolio/quality like /portfolio/metrics; finding status/severity filters always take the full scan.
+
+    Those two filters match on individual critic findings, which the per-group totals do not keep.
+    """
+    from grantflow.api.portfolio_aggregates import portfolio_aggregate_mode
+
+    mode = portfolio_aggregate_mode()
+    if mode == "off" or filters.get("finding_status") or filters.get("finding_severity"):
+        return _portfolio_quality_full_scan(**filters)
+    aggregate_filters = {
+        name: value for name, value in filters.items() if name not in {"finding_status", "finding_severity"}
+    }
+    if mode == "on":
+        return _ensure_portfolio_aggregate_ready().quality_payload(**aggregate_filters)
+    _, expected, _ = _compare_portfolio_quality_aggregates(**aggregate_filters)
+    return expected
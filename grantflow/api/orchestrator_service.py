@@ -1,16 +1,14 @@
 from __future__ import annotations
 
-import io
 from typing import Any, Dict, Optional
 
-from openpyxl import load_workbook
-
 from grantflow.core.config import config
 from grantflow.exporters.donor_contracts import (
     DONOR_XLSX_PRIMARY_SHEET,
     evaluate_export_contract_gate,
     normalize_export_contract_policy_mode,
 )
+from grantflow.exporters.excel_builder import XlsxBuildManifest
 from grantflow.exporters.template_profile import normalize_export_template_key
 
 
@@ -249,20 +247,14 @@ def _evaluate_export_contract_gate(
 
 
 def _xlsx_contract_validation_context(
-    xlsx_payload: bytes,
+    manifest: XlsxBuildManifest,
     *,
     donor_id: str,
 ) -> tuple[list[str], list[str]]:
-    workbook = load_workbook(io.BytesIO(xlsx_payload), data_only=True, read_only=True)
-    try:
-        sheetnames = list(workbook.sheetnames)
-        donor_key = normalize_export_template_key(donor_id)
-        primary_sheet = DONOR_XLSX_PRIMARY_SHEET.get(donor_key)
-        if not primary_sheet or primary_sheet not in workbook.sheetnames:
-            return sheetnames, []
-        sheet = workbook[primary_sheet]
-        header_row = next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
-        headers = [str(value).strip() for value in header_row if str(value or "").strip()]
-        return sheetnames, headers
-    finally:
-        workbook.close()
+    sheetnames = manifest.sheetnames
+    donor_key = normalize_export_template_key(donor_id)
+    primary_sheet = DONOR_XLSX_PRIMARY_SHEET.get(donor_key)
+    sheet = manifest.sheet(primary_sheet) if primary_sheet else None
+    if sheet is None:
+        return sheetnames, []
+    return sheetnames, list(sheet.headers)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, Literal
 
 from fastapi import BackgroundTasks, HTTPException
@@ -7,7 +10,7 @@ from fastapi import BackgroundTasks, HTTPException
 from grantflow.api.constants import RUNTIME_PIPELINE_STATE_KEYS, TERMINAL_JOB_STATUSES
 from grantflow.api.idempotency_store_facade import _get_job, _record_job_event, _set_job
 from grantflow.api.orchestrator_service import _evaluate_runtime_grounded_quality_gate_from_state
-from grantflow.api.review_service import _job_is_canceled, _pause_for_hitl
+from grantflow.api.review_service import _job_is_canceled, _normalized_critic_fatal_flaws_state, _pause_for_hitl
 from grantflow.api.review_runtime_helpers import _checkpoint_status_token, _clear_hitl_runtime_state
 from grantflow.api.runtime_gate_helpers import (
     _append_runtime_grounded_quality_gate_finding,
@@ -17,11 +20,17 @@ from grantflow.api.runtime_gate_helpers import (
     _runtime_grounded_quality_gate_block_reason,
 )
 from grantflow.api.runtime_service import _job_runner_mode, _uses_queue_runner
+from grantflow.core.stores import copy_job_containers
 from grantflow.swarm.hitl import HITLStatus
 from grantflow.swarm.state_contract import normalize_state_contract
 
+logger = logging.getLogger(__name__)
+
 HITLStartAt = Literal["start", "architect", "mel", "critic"]
 
+# Threads start on first submit; one worker keeps prerendering from competing with the job runner.
+_PRERENDER_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="grantflow-export-prerender")
+
 
 def _job_runner():
     from grantflow.api import app as api_app_module
@@ -45,6 +54,42 @@ def _dispatch_pipeline_task(background_tasks: BackgroundTasks, fn: Callable[...,
     return "background_tasks"
 
 
+def _prerender_exports_enabled() -> bool:
+    return str(os.getenv("GRANTFLOW_PRERENDER_EXPORTS", "false") or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _prerender_job_exports(job_id: str) -> None:
+    """Warm the export artifact cache for a job that just finished; best effort, never fails the job.
+
+    Only a disk cache (`GRANTFLOW_EXPORT_CACHE_DIR`) is shared with the API processes that serve downloads, so
+    nothing is rendered into a process-local cache. Rendering runs on its own thread, not the runner slot.
+    """
+    if not _prerender_exports_enabled():
+        return
+    from grantflow.api.routes.exports import export_artifact_cache
+
+    if not export_artifact_cache.enabled or export_artifact_cache.directory is None:
+        return
+    _PRERENDER_EXECUTOR.submit(_run_export_prerender, job_id)
+
+
+def _run_export_prerender(job_id: str) -> None:
+    from grantflow.api.routes.exports import _prerender_job_export_bundle
+
+    try:
+        result = _prerender_job_export_bundle(job_id)
+    except Exception:
+        logger.exception("Export prerender failed for job %s", job_id)
+        return
+    logger.info("Export prerender for job %s: %s", job_id, result.get("status"))
+
+
+def _done_state(final_state: dict) -> dict:
+    """Final state with critic finding due dates filled in, so exports read from it (including the prerender)
+    match the payload review endpoints normalize on first access."""
+    return _normalized_critic_fatal_flaws_state({"state": final_state}) or final_state
+
+
 def _record_hitl_feedback_in_state(state: dict, checkpoint: Dict[str, Any]) -> None:
     feedback = checkpoint.get("feedback")
     if not feedback:
@@ -66,6 +111,8 @@ def _run_pipeline_to_completion(job_id: str, initial_state: dict) -> None:
     try:
         if _job_is_canceled(job_id):
             return
+        # Graph nodes mutate nested state (e.g. append to `errors`); detach it from any job store snapshot.
+        initial_state = copy_job_containers(initial_state)
         normalize_state_contract(initial_state)
         _clear_hitl_runtime_state(initial_state, clear_pending=True)
         initial_state["hitl_enabled"] = False
@@ -127,7 +174,8 @@ def _run_pipeline_to_completion(job_id: str, initial_state: dict) -> None:
                 },
             )
             return
-        _set_job(job_id, {"status": "done", "state": final_state, "hitl_enabled": False})
+        _set_job(job_id, {"status": "done", "state": _done_state(final_state), "hitl_enabled": False})
+        _prerender_job_exports(job_id)
     except Exception as exc:
         _set_job(job_id, {"status": "error", "error": str(exc), "hitl_enabled": False})
 
@@ -154,6 +202,7 @@ def _run_hitl_pipeline(job_id: str, state: dict, start_at: HITLStartAt) -> None:
     try:
         if _job_is_canceled(job_id):
             return
+        state = copy_job_containers(state)
         normalize_state_contract(state)
         _clear_hitl_runtime_state(state, clear_pending=True)
         state["hitl_enabled"] = True
@@ -251,7 +300,8 @@ def _run_hitl_pipeline(job_id: str, state: dict, start_at: HITLStartAt) -> None:
                 },
             )
             return
-        _set_job(job_id, {"status": "done", "state": final_state, "hitl_enabled": True})
+        _set_job(job_id, {"status": "done", "state": _done_state(final_state), "hitl_enabled": True})
+        _prerender_job_exports(job_id)
         return
     except Exception as exc:
         _set_job(job_id, {"status": "error", "error": str(exc), "hitl_enabled": True, "state": state})
@@ -0,0 +1,689 @@
+from __future__ import annotations
+
+import copy
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from grantflow.api.public_views import (
+    _comment_triage_summary_payload,
+    _critic_triage_counts,
+    _critic_triage_summary_from_counts,
+    _finding_priority_sort_key,
+    _job_donor_id,
+    _job_grounding_risk_level,
+    _job_mel_risk_level,
+    _job_state_dict,
+    _job_toc_text_risk_level,
+    _job_warning_level,
+    _merge_portfolio_quality_totals,
+    _normalize_grounding_risk_filter,
+    _normalize_mel_risk_filter,
+    _normalize_toc_text_risk_filter,
+    _normalize_warning_level_filter,
+    _portfolio_metrics_payload_from_totals,
+    _portfolio_quality_payload_from_totals,
+    _portfolio_quality_row,
+    _portfolio_quality_totals,
+    _review_readiness_summary_payload,
+    _triage_enriched_finding,
+    public_job_comments_payload,
+    public_job_critic_payload,
+    public_job_metrics_payload,
+)
+from grantflow.api.tenant import _job_tenant_id, _normalize_tenant_candidate
+from grantflow.swarm.findings import state_critic_findings
+
+PORTFOLIO_AGGREGATE_MODES = {"off", "on", "check"}
+PORTFOLIO_AGGREGATE_TERMINAL_STATUSES = {"done", "error", "canceled"}
+PORTFOLIO_AGGREGATE_AVG_METRIC_KEYS = (
+    "time_to_first_draft_seconds",
+    "time_to_terminal_seconds",
+    "time_in_pending_hitl_seconds",
+)
+# Review readiness totals in payload order; the comment-age counters are recomputed on read.
+PORTFOLIO_AGGREGATE_REVIEW_KEYS = (
+    "needs_revision_job_count",
+    "open_critic_findings",
+    "high_severity_open_findings",
+    "open_review_comments",
+    "resolved_review_comments",
+    "acknowledged_review_comments",
+    "pending_review_comments",
+    "overdue_review_comments",
+    "stale_open_review_comments",
+    "linked_review_comments",
+    "orphan_linked_review_comments",
+    "low_confidence_citations",
+    "fallback_strategy_citations",
+)
+PORTFOLIO_AGGREGATE_LIVE_REVIEW_KEYS = {
+    "pending_review_comments": "pending_comment_count",
+    "overdue_review_comments": "overdue_comment_count",
+    "stale_open_review_comments": "stale_open_comment_count",
+}
+PORTFOLIO_AGGREGATE_FLOAT_TOLERANCE = 0.0011
+
+# (tenant_id, donor_id, donor_label, status, hitl_enabled, warning, grounding, toc_text, mel)
+GroupKey = Tuple[str, str, str, str, bool, str, str, str, str]
+
+
+def portfolio_aggregate_mode() -> str:
+    raw_mode = os.getenv("GRANTFLOW_PORTFOLIO_AGGREGATES", os.getenv("AIDGRAPH_PORTFOLIO_AGGREGATES", "off"))
+    token = str(raw_mode or "").strip().lower()
+    return token if token in PORTFOLIO_AGGREGATE_MODES else "off"
+
+
+def _job_triage_parts(donor_label: str, critic_findings: list[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Per-job share of the portfolio triage summary, mirroring `_portfolio_triage_summary_payload`."""
+    donor_enriched = [
+        _triage_enriched_finding(item, donor_id=donor_label) for item in critic_findings if isinstance(item, dict)
+    ]
+    if not donor_enriched:
+        return None
+    actions: list[str] = []
+    for item in donor_enriched:
+        action = str(item.get("reviewer_next_step") or item.get("recommended_action") or "").strip()
+        if action and action not in actions:
+            actions.append(action)
+    findings = [_triage_enriched_finding(item) for item in donor_enriched]
+    unresolved = [
+        item for item in findings if str(item.get("status") or "open").strip().lower() not in {"resolved", "closed"}
+    ]
+    priority_counts, bucket_counts, stale_open_finding_count = _critic_triage_counts(unresolved)
+    return {
+        "priority_counts": priority_counts,
+        "bucket_counts": bucket_counts,
+        "stale_open_finding_count": stale_open_finding_count,
+        # Sorting is stable, so each job's top three are enough to rebuild the portfolio top three.
+        "top_unresolved": sorted(unresolved, key=_finding_priority_sort_key, reverse=True)[:3],
+        "actions": actions,
+    }
+
+
+def job_metrics_contribution(job_id: str, job: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce one job payload to its group key, summable counters and the few order/time-sensitive inputs."""
+    state_dict = _job_state_dict(job)
+    donor_label = _job_donor_id(job, default="unknown")
+    status = str(job.get("status") or "")
+    hitl_enabled = bool(job.get("hitl_enabled"))
+    key: GroupKey = (
+        _job_tenant_id(job) or "",
+        _job_donor_id(job),
+        donor_label,
+        status,
+        hitl_enabled,
+        _job_warning_level(job),
+        _job_grounding_risk_level(job),
+        _job_toc_text_risk_level(job),
+        _job_mel_risk_level(job),
+    )
+
+    metrics = public_job_metrics_payload(job_id, job)
+    counters: Dict[str, int] = {
+        "job_count": 1,
+        "hitl_job_count": 1 if hitl_enabled else 0,
+        "terminal_job_count": (
+            1 if str(metrics.get("terminal_status") or "") in PORTFOLIO_AGGREGATE_TERMINAL_STATUSES else 0
+        ),
+        "total_pause_count": int(metrics.get("pause_count") or 0),
+        "total_resume_count": int(metrics.get("resume_count") or 0),
+    }
+    for metric_key in PORTFOLIO_AGGREGATE_AVG_METRIC_KEYS:
+        value = metrics.get(metric_key)
+        if isinstance(value, (int, float)):
+            # Per-job metrics are already rounded to milliseconds; integer sums never drift on subtract.
+            counters[f"{metric_key}:ms"] = int(round(float(value) * 1000))
+            counters[f"{metric_key}:n"] = 1
+
+    raw_citations = state_dict.get("citations")
+    citations = [row for row in raw_citations if isinstance(row, dict)] if isinstance(raw_citations, list) else []
+    raw_comments = job.get("review_comments")
+    review_comments = [row for row in raw_comments if isinstance(row, dict)] if isinstance(raw_comments, list) else []
+    critic_findings = [
+        item for item in state_critic_findings(state_dict, default_source="rules") if isinstance(item, dict)
+    ]
+    review_summary = _review_readiness_summary_payload(
+        needs_revision=state_dict.get("needs_revision"),
+        citations=citations,
+        critic_findings=critic_findings,
+        review_comments=review_comments,
+    )
+    counters["needs_revision_job_count"] = 1 if bool(review_summary.get("needs_revision")) else 0
+    for review_key in PORTFOLIO_AGGREGATE_REVIEW_KEYS:
+        if review_key == "needs_revision_job_count" or review_key in PORTFOLIO_AGGREGATE_LIVE_REVIEW_KEYS:
+            continue
+        counters[review_key] = int(review_summary.get(review_key) or 0)
+
+    triage = _job_triage_parts(donor_label, critic_findings)
+
+    # Pending/overdue/stale comment counts depend on the wall clock, so jobs with open comments keep their inputs.
+    live_comments = None
+    if int(review_summary.get("open_review_comments") or 0) > 0:
+        live_comments = {
+            "review_comments": copy.deepcopy(review_comments),
+            "critic_findings": copy.deepcopy(critic_findings),
+        }
+    quality, quality_live_comments = _job_quality_parts(job_id, job, key)
+    return {
+        "key": key,
+        "counters": counters,
+        "triage": copy.deepcopy(triage) if triage is not None else None,
+        "live_comments": live_comments,
+        "quality": quality,
+        "quality_live_comments": quality_live_comments,
+    }
+
+
+def _job_quality_parts(
+    job_id: str, job: Dict[str, Any], key: GroupKey
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Per-job /portfolio/quality totals, with comment ageing split out the same way as for metrics."""
+    donor_label = key[2]
+    row = _portfolio_quality_row(job_id, job)
+    review_summary = row.get("review_readiness_summary")
+    live_comments = None
+    if isinstance(review_summary, dict) and int(review_summary.get("open_review_comments") or 0) > 0:
+        comments_payload = public_job_comments_payload(job_id, job)
+        critic_payload = public_job_critic_payload(job_id, job)
+        live_comments = {
+            "donor_id": donor_label,
+            "review_comments": copy.deepcopy(comments_payload.get("comments") or []),
+            "critic_findings": copy.deepcopy(critic_payload.get("fatal_flaws") or []),
+        }
+        row["review_readiness_summary"] = {
+            **review_summary,
+            **{review_key: 0 for review_key in PORTFOLIO_AGGREGATE_LIVE_REVIEW_KEYS},
+            "comment_triage_summary": {},
+        }
+    return _sparse_quality_totals(_portfolio_quality_totals([row]), _quality_skeleton(key)), live_comments
+
+
+def _quality_skeleton(key: GroupKey) -> Dict[str, Any]:
+    """Zeroed quality totals of a job with no content in group `key`: the paths every job in it emits."""
+    _, _, donor_label, status, _, warning_level, grounding_risk_level, _, _ = key
+    row = {
+        "_status": status,
+        "_donor_id": donor_label,
+        "_warning_level": warning_level,
+        "_grounding_risk_level": grounding_risk_level,
+    }
+    return _zeroed_quality_totals(_portfolio_quality_totals([row]))
+
+
+def _zeroed_quality_totals(values: Dict[str, Any]) -> Dict[str, Any]:
+    zeroed: Dict[str, Any] = {}
+    for name, value in values.items():
+        if isinstance(value, dict):
+            zeroed[name] = _zeroed_quality_totals(value)
+        elif isinstance(value, list):
+            zeroed[name] = []
+        else:
+            zeroed[name] = type(value)(0)
+    return zeroed
+
+
+def _sparse_quality_totals(values: Dict[str, Any], skeleton: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop zero leaves the group skeleton already carries; most of a job's ~80 template counters are zero."""
+    sparse: Dict[str, Any] = {}
+    for name, value in values.items():
+        template = skeleton.get(name)
+        if isinstance(value, dict):
+            nested = _sparse_quality_totals(value, template if isinstance(template, dict) else {})
+            if nested or not isinstance(template, dict):
+                sparse[name] = nested
+        elif isinstance(value, list):
+            sparse[name] = copy.deepcopy(value)
+        elif value != 0 or name not in skeleton:
+            sparse[name] = value
+    return sparse
+
+
+def _add_quality_live_comments(totals: Dict[str, Any], live_comments: Dict[str, Any]) -> None:
+    """Fold one job's current comment ageing into quality totals, as the full scan's per-row sums would."""
+    comment_triage = _comment_triage_summary_payload(
+        review_comments=[row for row in live_comments["review_comments"] if isinstance(row, dict)],
+        critic_findings=[row for row in live_comments["critic_findings"] if isinstance(row, dict)],
+    )
+    donor_row = totals["donor_review_readiness_breakdown"][live_comments["donor_id"]]
+    for review_key, triage_key in PORTFOLIO_AGGREGATE_LIVE_REVIEW_KEYS.items():
+        count = int(comment_triage.get(triage_key) or 0)
+        totals["review_comment_totals"][review_key] += count
+        donor_row[review_key] = int(donor_row.get(review_key) or 0) + count
+    stale_bucket_counts = comment_triage.get("stale_comment_bucket_counts")
+    if isinstance(stale_bucket_counts, dict):
+        donor_bucket_counts = dict(donor_row.get("stale_comment_bucket_counts") or {})
+        for bucket, count in stale_bucket_counts.items():
+            token = str(bucket).strip().lower() or "general"
+            donor_bucket_counts[token] = int(donor_bucket_counts.get(token) or 0) + int(count or 0)
+        donor_row["stale_comment_bucket_counts"] = donor_bucket_counts
+
+
+def _group_matches(
+    key: GroupKey,
+    *,
+    tenant_filter: Optional[str],
+    donor_id: Optional[str],
+    status: Optional[str],
+    hitl_enabled: Optional[bool],
+    warning_level_filter: Optional[str],
+    grounding_risk_filter: Optional[str],
+    toc_text_risk_filter: Optional[str],
+    mel_risk_filter: Optional[str],
+) -> bool:
+    g_tenant, g_donor, _, g_status, g_hitl, g_warning, g_grounding, g_toc, g_mel = key
+    if tenant_filter and g_tenant != tenant_filter:
+        return False
+    if donor_id and g_donor != donor_id:
+        return False
+    if status and g_status != status:
+        return False
+    if hitl_enabled is not None and g_hitl != hitl_enabled:
+        return False
+    if warning_level_filter is not None and g_warning != warning_level_filter:
+        return False
+    if grounding_risk_filter is not None and g_grounding != grounding_risk_filter:
+        return False
+    if toc_text_risk_filter is not None and g_toc != toc_text_risk_filter:
+        return False
+    if mel_risk_filter is not None and g_mel != mel_risk_filter:
+        return False
+    return True
+
+
+def portfolio_metrics_mismatches(
+    cached: Any,
+    expected: Any,
+    *,
+    path: str = "",
+    tolerance: float = PORTFOLIO_AGGREGATE_FLOAT_TOLERANCE,
+) -> list[str]:
+    """List the payload paths where the aggregate answer differs from the full-scan answer."""
+    if isinstance(cached, dict) and isinstance(expected, dict):
+        mismatches: list[str] = []
+        for key in sorted(set(cached) | set(expected), key=str):
+            child_path = f"{path}.{key}" if path else str(key)
+            if key not in cached or key not in expected:
+                mismatches.append(child_path)
+                continue
+            mismatches.extend(portfolio_metrics_mismatches(cached[key], expected[key], path=child_path))
+        return mismatches
+    if isinstance(cached, list) and isinstance(expected, list):
+        if len(cached) != len(expected):
+            return [path]
+        mismatches = []
+        for index, (left, right) in enumerate(zip(cached, expected)):
+            mismatches.extend(portfolio_metrics_mismatches(left, right, path=f"{path}[{index}]"))
+        return mismatches
+    if (
+        isinstance(cached, float)
+        and isinstance(expected, (int, float))
+        or isinstance(expected, float)
+        and isinstance(cached, (int, float))
+    ):
+        return [] if abs(float(cached) - float(expected)) <= tolerance else [path]
+    return [] if cached == expected else [path]
+
+
+class PortfolioMetricsAggregate:
+    """Incrementally maintained /portfolio/metrics and /portfolio/quality totals, grouped by filterable dimension.
+
+    Reads sum the matching groups instead of re-deriving metrics or quality payloads from each job state. Jobs with open review
+    comments (time-dependent ageing) and the leading jobs with critic findings (the triage summary only spans
+    rows until three reviewer actions are known) contribute per-job inputs at read time; those inputs are
+    kept in memory so the job store is not touched.
+
+    Jobs are ordered by the store's write sequence, newest first, matching the job store listings the full
+    scan walks. `watermark` is the highest store write sequence already folded in, so a reader can catch up
+    on writes made by any process (API workers, pool or queue runners) with `list_changes`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._groups: Dict[GroupKey, Dict[str, Any]] = {}
+        self._seq: Dict[str, int] = {}
+        self._next_seq = 1
+        self._watermark = 0
+        self._source_id: Optional[int] = None
+        self._ready = False
+        self._rebuild_count = 0
+        self._apply_count = 0
+        self._last_rebuild_ms: Optional[float] = None
+        self._check_count = 0
+        self._check_mismatch_count = 0
+        self._last_check_mismatches: list[str] = []
+
+    def is_ready_for(self, source: Any) -> bool:
+        with self._lock:
+            return self._ready and self._source_id == id(source)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._ready = False
+
+    def rebuild(
+        self,
+        jobs_by_id: Dict[str, Dict[str, Any]],
+        *,
+        source: Any = None,
+        write_seqs: Optional[Dict[str, int]] = None,
+    ) -> int:
+        """Replace every contribution. Without `write_seqs`, `jobs_by_id` is taken to be newest first."""
+        started = time.perf_counter()
+        contributions = [
+            (str(job_id), job_metrics_contribution(str(job_id), job))
+            for job_id, job in jobs_by_id.items()
+            if isinstance(job, dict)
+        ]
+        if write_seqs is None:
+            write_seqs = {job_id: len(contributions) - index for index, (job_id, _) in enumerate(contributions)}
+        with self._lock:
+            self._jobs = {}
+            self._groups = {}
+            self._seq = {}
+            self._watermark = max(write_seqs.values(), default=0)
+            self._next_seq = self._watermark + 1
+            for job_id, contribution in contributions:
+                # Jobs written after `write_seqs` was read sort first until the next catch-up numbers them.
+                self._add(job_id, contribution, write_seqs.get(job_id, self._watermark + 1))
+            self._source_id = id(source) if source is not None else None
+            self._ready = True
+            self._rebuild_count += 1
+            self._last_rebuild_ms = round((time.perf_counter() - started) * 1000.0, 3)
+        return len(contributions)
+
+    def apply(self, job_id: str, job: Optional[Dict[str, Any]], *, write_seq: Optional[int] = None) -> None:
+        """Replace the job's previous contribution with one derived from its next payload.
+
+        `write_seq` is the store write sequence the payload was read at; older payloads are ignored. Without
+        it the job counts as the newest write.
+        """
+        with self._lock:
+            if not self._ready:
+                return
+        contribution = job_metrics_contribution(job_id, job) if isinstance(job, dict) else None
+        with self._lock:
+            if not self._ready:
+                return
+            seq = self._next_seq if write_seq is None else int(write_seq)
+            if seq < self._seq.get(job_id, 0):
+                return
+            self._remove(job_id)
+            if contribution is not None:
+                self._add(job_id, contribution, seq)
+            self._apply_count += 1
+
+    def watermark(self) -> int:
+        with self._lock:
+            return self._watermark
+
+    def write_seq(self, job_id: str) -> int:
+        with self._lock:
+            return self._seq.get(job_id, 0)
+
+    def advance_watermark(self, write_seq: int) -> None:
+        with self._lock:
+            self._watermark = max(self._watermark, int(write_seq))
+            self._next_seq = max(self._next_seq, self._watermark + 1)
+
+    def job_ids(self) -> list[str]:
+        """Aggregated job ids, newest write first."""
+        with self._lock:
+            return sorted(self._jobs, key=lambda job_id: self._seq.get(job_id, 0), reverse=True)
+
+    def record_check(self, mismatches: list[str]) -> None:
+        with self._lock:
+            self._check_count += 1
+            if mismatches:
+                self._check_mismatch_count += 1
+            self._last_check_mismatches = list(mismatches[:20])
+
+    def _add(self, job_id: str, contribution: Dict[str, Any], seq: int) -> None:
+        self._seq[job_id] = seq
+        self._next_seq = max(self._next_seq, seq + 1)
+        self._jobs[job_id] = contribution
+        group = self._groups.setdefault(contribution["key"], {"counters": {}, "job_ids": set(), "quality": None})
+        counters = group["counters"]
+        for name, value in contribution["counters"].items():
+            counters[name] = int(counters.get(name) or 0) + int(value)
+        group["job_ids"].add(job_id)
+        group["quality"] = None
+
+    def _remove(self, job_id: str) -> None:
+        self._seq.pop(job_id, None)
+        contribution = self._jobs.pop(job_id, None)
+        if contribution is None:
+            return
+        group = self._groups.get(contribution["key"])
+        if group is None:
+            return
+        counters = group["counters"]
+        for name, value in contribution["counters"].items():
+            remaining = int(counters.get(name) or 0) - int(value)
+            if remaining:
+                counters[name] = remaining
+            else:
+                counters.pop(name, None)
+        group["job_ids"].discard(job_id)
+        group["quality"] = None
+        if not group["job_ids"]:
+            self._groups.pop(contribution["key"], None)
+
+    def metrics_payload(
+        self,
+        *,
+        tenant_id: Optional[str] = None,
+        donor_id: Optional[str] = None,
+        status: Optional[str] = None,
+        hitl_enabled: Optional[bool] = None,
+        warning_level: Optional[str] = None,
+        grounding_risk_level: Optional[str] = None,
+        toc_text_risk_level: Optional[str] = None,
+        mel_risk_level: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        tenant_filter = _normalize_tenant_candidate(tenant_id)
+        warning_level_filter = _normalize_warning_level_filter(warning_level)
+        grounding_risk_filter = _normalize_grounding_risk_filter(grounding_risk_level)
+        toc_text_risk_filter = _normalize_toc_text_risk_filter(toc_text_risk_level)
+        mel_risk_filter = _normalize_mel_risk_filter(mel_risk_level)
+
+        status_counts: Dict[str, int] = {}
+        donor_counts: Dict[str, int] = {}
+        warning_level_counts: Dict[str, int] = {}
+        grounding_risk_counts: Dict[str, int] = {}
+        mel_risk_counts: Dict[str, int] = {}
+        totals: Dict[str, int] = {}
+        active_job_ids: list[str] = []
+        active: list[Dict[str, Any]] = []
+
+        with self._lock:
+            for key, group in self._groups.items():
+                if not _group_matches(
+                    key,
+                    tenant_filter=tenant_filter,
+                    donor_id=donor_id,
+                    status=status,
+                    hitl_enabled=hitl_enabled,
+                    warning_level_filter=warning_level_filter,
+                    grounding_risk_filter=grounding_risk_filter,
+                    toc_text_risk_filter=toc_text_risk_filter,
+                    mel_risk_filter=mel_risk_filter,
+                ):
+                    continue
+                _, _, g_label, g_status, _, g_warning, g_grounding, _, g_mel = key
+                counters = group["counters"]
+                group_job_count = int(counters.get("job_count") or 0)
+                status_counts[g_status] = status_counts.get(g_status, 0) + group_job_count
+                donor_counts[g_label] = donor_counts.get(g_label, 0) + group_job_count
+                warning_level_counts[g_warning] = warning_level_counts.get(g_warning, 0) + group_job_count
+                grounding_risk_counts[g_grounding] = grounding_risk_counts.get(g_grounding, 0) + group_job_count
+                mel_risk_counts[g_mel] = mel_risk_counts.get(g_mel, 0) + group_job_count
+                for name, value in counters.items():
+                    totals[name] = totals.get(name, 0) + int(value)
+                for job_id in group["job_ids"]:
+                    contribution = self._jobs.get(job_id) or {}
+                    if contribution.get("triage") is not None or contribution.get("live_comments") is not None:
+                        active_job_ids.append(job_id)
+            active_job_ids.sort(key=lambda job_id: self._seq.get(job_id, 0), reverse=True)
+            active = [self._jobs[job_id] for job_id in active_job_ids]
+
+        review_readiness_totals = {key: int(totals.get(key) or 0) for key in PORTFOLIO_AGGREGATE_REVIEW_KEYS}
+        stale_comment_bucket_counts: Dict[str, int] = {}
+        priority_counts, bucket_counts, stale_open_finding_count = _critic_triage_counts([])
+        top_candidates: list[Dict[str, Any]] = []
+        top_actions: list[str] = []
+        for contribution in active:
+            live_comments = contribution.get("live_comments")
+            if isinstance(live_comments, dict):
+                comment_triage = _comment_triage_summary_payload(
+                    review_comments=live_comments["review_comments"],
+                    critic_findings=live_comments["critic_findings"],
+                )
+                for review_key, triage_key in PORTFOLIO_AGGREGATE_LIVE_REVIEW_KEYS.items():
+                    review_readiness_totals[review_key] += int(comment_triage.get(triage_key) or 0)
+                stale_bucket_counts = comment_triage.get("stale_comment_bucket_counts")
+                if isinstance(stale_bucket_counts, dict):
+                    for bucket, count in stale_bucket_counts.items():
+                        token = str(bucket).strip().lower() or "general"
+                        stale_comment_bucket_counts[token] = int(stale_comment_bucket_counts.get(token) or 0) + int(
+                            count or 0
+                        )
+            triage = contribution.get("triage")
+            # The full scan stops collecting triage rows once three reviewer actions are known.
+            if isinstance(triage, dict) and len(top_actions) < 3:
+                for priority, count in triage["priority_counts"].items():
+                    priority_counts[priority] = int(priority_counts.get(priority) or 0) + int(count)
+                for bucket, count in triage["bucket_counts"].items():
+                    bucket_counts[bucket] = int(bucket_counts.get(bucket) or 0) + int(count)
+                stale_open_finding_count += int(triage["stale_open_finding_count"])
+                top_candidates.extend(triage["top_unresolved"])
+                for action in triage["actions"]:
+                    if len(top_actions) >= 3:
+                        break
+                    if action not in top_actions:
+                        top_actions.append(action)
+
+        triage_summary = _critic_triage_summary_from_counts(
+            priority_counts=priority_counts,
+            bucket_counts=bucket_counts,
+            stale_open_finding_count=stale_open_finding_count,
+            sorted_unresolved=sorted(top_candidates, key=_finding_priority_sort_key, reverse=True),
+        )
+        triage_summary["top_reviewer_actions"] = top_actions[:3]
+
+        def _avg(metric_key: str) -> Optional[float]:
+            count = int(totals.get(f"{metric_key}:n") or 0)
+            if not count:
+                return None
+            return round(int(totals.get(f"{metric_key}:ms") or 0) / 1000.0 / count, 3)
+
+        return _portfolio_metrics_payload_from_totals(
+            job_count=int(totals.get("job_count") or 0),
+            filters={
+                "donor_id": donor_id,
+                "status": status,
+                "hitl_enabled": hitl_enabled,
+                "warning_level": warning_level_filter,
+                "grounding_risk_level": grounding_risk_filter,
+                "toc_text_risk_level": toc_text_risk_filter,
+                "mel_risk_level": mel_risk_filter,
+            },
+            status_counts=status_counts,
+            donor_counts=donor_counts,
+            warning_level_counts=warning_level_counts,
+            grounding_risk_counts=grounding_risk_counts,
+            mel_risk_counts=mel_risk_counts,
+            terminal_job_count=int(totals.get("terminal_job_count") or 0),
+            hitl_job_count=int(totals.get("hitl_job_count") or 0),
+            total_pause_count=int(totals.get("total_pause_count") or 0),
+            total_resume_count=int(totals.get("total_resume_count") or 0),
+            avg_time_to_first_draft_seconds=_avg("time_to_first_draft_seconds"),
+            avg_time_to_terminal_seconds=_avg("time_to_terminal_seconds"),
+            avg_time_in_pending_hitl_seconds=_avg("time_in_pending_hitl_seconds"),
+            review_readiness_totals=review_readiness_totals,
+            triage_summary=triage_summary,
+            stale_comment_bucket_counts=stale_comment_bucket_counts,
+        )
+
+    def quality_payload(
+        self,
+        *,
+        tenant_id: Optional[str] = None,
+        donor_id: Optional[str] = None,
+        status: Optional[str] = None,
+        hitl_enabled: Optional[bool] = None,
+        warning_level: Optional[str] = None,
+        grounding_risk_level: Optional[str] = None,
+        toc_text_risk_level: Optional[str] = None,
+        mel_risk_level: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """/portfolio/quality from per-group quality totals; finding status/severity filters need the full scan."""
+        tenant_filter = _normalize_tenant_candidate(tenant_id)
+        warning_level_filter = _normalize_warning_level_filter(warning_level)
+        grounding_risk_filter = _normalize_grounding_risk_filter(grounding_risk_level)
+        toc_text_risk_filter = _normalize_toc_text_risk_filter(toc_text_risk_level)
+        mel_risk_filter = _normalize_mel_risk_filter(mel_risk_level)
+
+        totals = _portfolio_quality_totals([])
+        live_job_ids: list[str] = []
+        live: list[Dict[str, Any]] = []
+        with self._lock:
+            for key, group in self._groups.items():
+                if not _group_matches(
+                    key,
+                    tenant_filter=tenant_filter,
+                    donor_id=donor_id,
+                    status=status,
+                    hitl_enabled=hitl_enabled,
+                    warning_level_filter=warning_level_filter,
+                    grounding_risk_filter=grounding_risk_filter,
+                    toc_text_risk_filter=toc_text_risk_filter,
+                    mel_risk_filter=mel_risk_filter,
+                ):
+                    continue
+                if group["quality"] is None:
+                    # Merged lazily: a write only marks its group stale, the next read re-sums that one group.
+                    group_totals = _quality_skeleton(key)
+                    for job_id in sorted(group["job_ids"], key=lambda job_id: self._seq.get(job_id, 0), reverse=True):
+                        _merge_portfolio_quality_totals(group_totals, self._jobs[job_id]["quality"])
+                    group["quality"] = group_totals
+                _merge_portfolio_quality_totals(totals, group["quality"])
+                live_job_ids.extend(
+                    job_id for job_id in group["job_ids"] if self._jobs[job_id].get("quality_live_comments") is not None
+                )
+            live = [self._jobs[job_id]["quality_live_comments"] for job_id in live_job_ids]
+
+        for live_comments in live:
+            _add_quality_live_comments(totals, live_comments)
+        return _portfolio_quality_payload_from_totals(
+            totals,
+            filters={
+                "donor_id": donor_id,
+                "status": status,
+                "hitl_enabled": hitl_enabled,
+                "warning_level": warning_level_filter,
+                "grounding_risk_level": grounding_risk_filter,
+                "finding_status": None,
+                "finding_severity": None,
+                "toc_text_risk_level": toc_text_risk_filter,
+                "mel_risk_level": mel_risk_filter,
+            },
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "mode": portfolio_aggregate_mode(),
+                "ready": self._ready,
+                "job_count": len(self._jobs),
+                "group_count": len(self._groups),
+                "watermark": self._watermark,
+                "rebuild_count": self._rebuild_count,
+                "apply_count": self._apply_count,
+                "last_rebuild_ms": self._last_rebuild_ms,
+                "check_count": self._check_count,
+                "check_mismatch_count": self._check_mismatch_count,
+                "last_check_mismatches": list(self._last_check_mismatches),
+            }
@@ -0,0 +1,577 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from fastapi import BackgroundTasks, HTTPException, Request
+
+from grantflow.api.idempotency_store_facade import _list_portfolio_jobs
+from grantflow.api.orchestrator_service import _evaluate_export_contract_gate, _xlsx_contract_validation_context
+from grantflow.api.public_views import portfolio_metrics_filtered_jobs
+from grantflow.api.schemas import PortfolioExportBundleRequest
+from grantflow.api.tenant import _job_donor_id, _resolve_tenant_id, _tenant_authz_enabled
+from grantflow.exporters.artifact_cache import ExportArtifact, export_artifact_cache
+from grantflow.exporters.portfolio_bundle import PORTFOLIO_BUNDLE_DOCUMENTS, render_job_export_documents
+from grantflow.exporters.zip_stream import iter_zip_stream
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORTFOLIO_EXPORT_WORKERS = 2
+DEFAULT_PORTFOLIO_EXPORT_MAX_JOBS = 500
+DEFAULT_PORTFOLIO_EXPORT_TTL_SECONDS = 24 * 3600
+DEFAULT_PORTFOLIO_EXPORT_MAX_BUNDLES = 20
+PORTFOLIO_EXPORT_JOB_STATUSES = {"done", "pending_hitl"}
+PORTFOLIO_EXPORT_ROW_OUTCOMES = ("exported", "skipped", "blocked", "error")
+PORTFOLIO_EXPORT_FILTER_FIELDS = (
+    "donor_id",
+    "status",
+    "hitl_enabled",
+    "warning_level",
+    "grounding_risk_level",
+    "toc_text_risk_level",
+    "mel_risk_level",
+)
+_DOCUMENT_FORMATS = {"proposal.docx": "docx", "mel.xlsx": "xlsx"}
+_DOCUMENT_MEDIA_TYPES = {
+    "proposal.docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "mel.xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    try:
+        return int(raw) if raw is not None else default
+    except ValueError:
+        return default
+
+
+def _portfolio_export_workers() -> int:
+    """Render processes shared by all bundles, capped at the CPU count; 0 renders in the API process."""
+    configured = max(0, _env_int("GRANTFLOW_PORTFOLIO_EXPORT_WORKERS", DEFAULT_PORTFOLIO_EXPORT_WORKERS))
+    return min(configured, os.cpu_count() or 1)
+
+
+def _portfolio_export_max_jobs() -> int:
+    return max(1, _env_int("GRANTFLOW_PORTFOLIO_EXPORT_MAX_JOBS", DEFAULT_PORTFOLIO_EXPORT_MAX_JOBS))
+
+
+def _portfolio_export_ttl_seconds() -> int:
+    return max(0, _env_int("GRANTFLOW_PORTFOLIO_EXPORT_TTL_SECONDS", DEFAULT_PORTFOLIO_EXPORT_TTL_SECONDS))
+
+
+def _portfolio_export_max_bundles() -> int:
+    return max(1, _env_int("GRANTFLOW_PORTFOLIO_EXPORT_MAX_BUNDLES", DEFAULT_PORTFOLIO_EXPORT_MAX_BUNDLES))
+
+
+def _portfolio_export_dir() -> Path:
+    configured = str(os.getenv("GRANTFLOW_PORTFOLIO_EXPORT_DIR") or "").strip()
+    directory = Path(configured) if configured else Path(tempfile.gettempdir()) / "grantflow_portfolio_exports"
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _bundle_status_path(bundle_id: str) -> Path:
+    return _portfolio_export_dir() / f"{bundle_id}.json"
+
+
+def _bundle_archive_path(bundle_id: str) -> Path:
+    return _portfolio_export_dir() / f"{bundle_id}.zip"
+
+
+def _write_bundle_status(bundle: Dict[str, Any], *, include_jobs: bool = True) -> None:
+    # Written to a temp file and renamed, so a status read from another worker process never sees a partial file.
+    # Per-job progress writes leave out the job rows so each one stays O(1) in the bundle size.
+    path = _bundle_status_path(str(bundle["bundle_id"]))
+    payload = bundle if include_jobs else {key: value for key, value in bundle.items() if key != "jobs"}
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _read_bundle_status(bundle_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        token = str(uuid.UUID(str(bundle_id)))
+    except ValueError:
+        return None
+    try:
+        payload = json.loads(_bundle_status_path(token).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _readable_bundle_status(bundle_id: str, request: Request) -> Dict[str, Any]:
+    bundle = _read_bundle_status(bundle_id)
+    if bundle is not None and _tenant_authz_enabled():
+        request_tenant = _resolve_tenant_id(request, require_if_enabled=True)
+        if bundle.get("tenant_id") != request_tenant:
+            bundle = None
+    if bundle is None:
+        raise HTTPException(status_code=404, detail="Portfolio export bundle not found")
+    return bundle
+
+
+def _select_portfolio_export_jobs(
+    req: PortfolioExportBundleRequest, tenant_id: Optional[str]
+) -> list[tuple[str, Dict[str, Any]]]:
+    """The jobs `/portfolio/metrics` would count for the same filters."""
+    jobs = _list_portfolio_jobs(
+        tenant_id=tenant_id,
+        donor_id=(req.donor_id or None),
+        status=(req.status or None),
+        hitl_enabled=req.hitl_enabled,
+        warning_level=(req.warning_level or None),
+        grounding_risk_level=(req.grounding_risk_level or None),
+    )
+    return portfolio_metrics_filtered_jobs(
+        jobs,
+        donor_id=(req.donor_id or None),
+        status=(req.status or None),
+        hitl_enabled=req.hitl_enabled,
+        warning_level=(req.warning_level or None),
+        grounding_risk_level=(req.grounding_risk_level or None),
+        toc_text_risk_level=(req.toc_text_risk_level or None),
+        mel_risk_level=(req.mel_risk_level or None),
+    )
+
+
+def _bundle_documents(fmt: str) -> tuple[str, ...]:
+    if fmt == "docx":
+        return ("proposal.docx",)
+    if fmt == "xlsx":
+        return ("mel.xlsx",)
+    return PORTFOLIO_BUNDLE_DOCUMENTS
+
+
+def _start_portfolio_export_bundle(
+    req: PortfolioExportBundleRequest,
+    background_tasks: BackgroundTasks,
+    request: Request,
+) -> Dict[str, Any]:
+    tenant_id = _resolve_tenant_id(request, explicit_tenant=req.tenant_id, require_if_enabled=True)
+    selected = _select_portfolio_export_jobs(req, tenant_id)
+    if not selected:
+        raise HTTPException(status_code=400, detail="No jobs match the portfolio filters")
+    max_jobs = _portfolio_export_max_jobs()
+    if len(selected) > max_jobs:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Portfolio export bundle limit exceeded ({len(selected)} jobs, max {max_jobs})",
+        )
+
+    _prune_portfolio_export_dir()
+    bundle_id = str(uuid.uuid4())
+    jobs: list[Dict[str, Any]] = [
+        {
+            "job_id": job_id,
+            "status": "queued",
+            "job_status": str(job.get("status") or ""),
+            "donor_id": _job_donor_id(job) or None,
+            "documents": [],
+            "cached_document_count": 0,
+        }
+        for job_id, job in selected
+    ]
+    bundle: Dict[str, Any] = {
+        "bundle_id": bundle_id,
+        "status": "accepted",
+        "format": req.format,
+        "include_diagnostics": bool(req.include_diagnostics),
+        "tenant_id": tenant_id,
+        "filters": {field: getattr(req, field) for field in PORTFOLIO_EXPORT_FILTER_FIELDS},
+        "total": len(jobs),
+        "processed_count": 0,
+        "progress": 0.0,
+        "exported_count": 0,
+        "skipped_count": 0,
+        "blocked_count": 0,
+        "error_count": 0,
+        "cached_document_count": 0,
+        "rendered_document_count": 0,
+        "jobs": jobs,
+        "created_at": _utc_now_iso(),
+    }
+    _write_bundle_status(bundle)
+    background_tasks.add_task(_run_portfolio_export_bundle, bundle_id)
+    return bundle
+
+
+def _portfolio_export_bundle_status_payload(bundle_id: str, request: Request) -> Dict[str, Any]:
+    return _readable_bundle_status(bundle_id, request)
+
+
+def _portfolio_export_bundle_archive(bundle_id: str, request: Request) -> tuple[Path, str]:
+    bundle = _readable_bundle_status(bundle_id, request)
+    archive_path = _bundle_archive_path(str(bundle["bundle_id"]))
+    if bundle.get("status") != "done" or not archive_path.exists():
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "reason": "portfolio_export_bundle_not_ready",
+                "status": bundle.get("status"),
+                "progress": bundle.get("progress"),
+            },
+        )
+    return archive_path, f"grantflow_portfolio_bundle_{bundle['bundle_id']}.zip"
+
+
+class PortfolioRenderPool:
+    """Process-wide render pool shared by every portfolio bundle.
+
+    Started lazily on the first bundle and sized once from `GRANTFLOW_PORTFOLIO_EXPORT_WORKERS`, so concurrent
+    bundles queue on the same workers instead of each spawning its own interpreters. A pool broken by a dead
+    worker is replaced on the next submission.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self._max_workers = max_workers
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        if self._max_workers is None:
+            self._max_workers = _portfolio_export_workers()
+        return self._max_workers
+
+    def _ensure_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.max_workers <= 0:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="grantflow-portfolio-export")
+                else:
+                    # Spawned like the process job runner: workers import only the builders, never app state.
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+            return self._executor
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        executor = self._ensure_executor()
+        try:
+            return executor.submit(fn, *args)
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False)
+            return self._ensure_executor().submit(fn, *args)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+portfolio_render_pool = PortfolioRenderPool()
+
+
+def _remove_bundle_files(bundle_id: str) -> None:
+    for path in _portfolio_export_dir().glob(f"{bundle_id}.*"):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _prune_portfolio_export_dir() -> int:
+    """Delete bundles idle past the TTL, then the oldest finished bundles beyond the retention count."""
+    cutoff = time.time() - _portfolio_export_ttl_seconds()
+    finished: list[tuple[float, str]] = []
+    removed = 0
+    for status_path in _portfolio_export_dir().glob("*.json"):
+        bundle_id = status_path.stem
+        try:
+            uuid.UUID(bundle_id)
+        except ValueError:
+            continue
+        try:
+            modified = status_path.stat().st_mtime
+        except OSError:
+            continue
+        if modified < cutoff:
+            _remove_bundle_files(bundle_id)
+            removed += 1
+            continue
+        bundle = _read_bundle_status(bundle_id)
+        if bundle is not None and bundle.get("status") in {"done", "error"}:
+            finished.append((modified, bundle_id))
+    finished.sort(reverse=True)
+    for _, bundle_id in finished[_portfolio_export_max_bundles() :]:
+        _remove_bundle_files(bundle_id)
+        removed += 1
+    return removed
+
+
+def _cached_bundle_documents(prepared: Dict[str, Any], document_keys: Dict[str, str]) -> Dict[str, bytes]:
+    """Documents already in the export artifact cache, per format or inside the job's cached ZIP bundle."""
+    found: Dict[str, bytes] = {}
+    for name, key in document_keys.items():
+        cached = export_artifact_cache.get(key)
+        if cached is None:
+            continue
+        try:
+            found[name] = cached.read_bytes()
+        except OSError:
+            continue
+    missing = [name for name in document_keys if name not in found]
+    if not missing or not prepared.get("cache_key"):
+        return found
+    cached_zip = export_artifact_cache.get(prepared["cache_key"])
+    if cached_zip is None:
+        return found
+    try:
+        source = cached_zip.path if cached_zip.path is not None else io.BytesIO(cached_zip.content)
+        with zipfile.ZipFile(source) as archive:
+            names = set(archive.namelist())
+            for name in missing:
+                if name in names:
+                    found[name] = archive.read(name)
+    except (OSError, zipfile.BadZipFile):
+        pass
+    return found
+
+
+def _cache_rendered_documents(
+    rendered: Dict[str, bytes],
+    manifest: Any,
+    *,
+    prepared: Dict[str, Any],
+    document_keys: Dict[str, str],
+) -> None:
+    """Store pool-rendered documents under their `POST /export` keys, with the headers that route would send."""
+    from grantflow.api.routes.exports import _export_contract_headers
+
+    for name, content in rendered.items():
+        export_contract_gate = prepared["export_contract_gate"]
+        if name == "mel.xlsx" and manifest is not None:
+            workbook_sheetnames, workbook_primary_sheet_headers = _xlsx_contract_validation_context(
+                manifest,
+                donor_id=prepared["donor_id"],
+            )
+            export_contract_gate = _evaluate_export_contract_gate(
+                donor_id=prepared["donor_id"],
+                toc_draft=prepared["toc_draft"],
+                workbook_sheetnames=workbook_sheetnames,
+                workbook_primary_sheet_headers=workbook_primary_sheet_headers,
+            )
+        headers = {
+            "Content-Disposition": f"attachment; filename={name}",
+            **_export_contract_headers(export_contract_gate),
+        }
+        export_artifact_cache.put(
+            document_keys[name],
+            ExportArtifact(content=content, media_type=_DOCUMENT_MEDIA_TYPES[name], headers=headers),
+        )
+
+
+def _plan_bundle_job(bundle: Dict[str, Any], row: Dict[str, Any], documents: tuple[str, ...]) -> Dict[str, Any]:
+    """Resolve one job's export inputs and cached documents; whatever is left is rendered by the pool."""
+    from grantflow.api.routes.exports import _export_artifact_cache_key, _job_export_request, _prepare_export
+
+    plan: Dict[str, Any] = {"row": row, "documents": {}, "missing": [], "future": None}
+    if row["job_status"] not in PORTFOLIO_EXPORT_JOB_STATUSES:
+        row.update(status="skipped", reason="job_status_not_exportable")
+        return plan
+    req = _job_export_request(
+        row["job_id"],
+        include_diagnostics=bool(bundle.get("include_diagnostics")),
+        read_only=True,
+    )
+    if req is None:
+        row.update(status="skipped", reason="job_not_found")
+        return plan
+    try:
+        prepared = _prepare_export(req)
+    except HTTPException as exc:
+        detail = exc.detail if isinstance(exc.detail, dict) else {}
+        row.update(status="blocked", http_status=int(exc.status_code), reason=detail.get("reason"))
+        return plan
+    document_keys = {
+        name: _export_artifact_cache_key(
+            req,
+            fmt=_DOCUMENT_FORMATS[name],
+            donor_id=prepared["donor_id"],
+            toc_draft=prepared["toc_draft"],
+            logframe_draft=prepared["logframe_draft"],
+            citations=prepared["citations"],
+            critic_findings=prepared["critic_findings"],
+            review_comments=prepared["review_comments"],
+            quality_summary=prepared["quality_summary"],
+            export_contract_gate=prepared["export_contract_gate"],
+        )
+        for name in documents
+    }
+    plan["documents"] = _cached_bundle_documents(prepared, document_keys)
+    plan["missing"] = [name for name in documents if name not in plan["documents"]]
+    plan["prepared"] = prepared
+    plan["document_keys"] = document_keys
+    row["cached_document_count"] = len(plan["documents"])
+    return plan
+
+
+def _submit_bundle_render(pool: PortfolioRenderPool, bundle: Dict[str, Any], plan: Dict[str, Any]) -> None:
+    if not plan["missing"]:
+        return
+    prepared = plan["prepared"]
+    inputs = {
+        field: prepared[field]
+        for field in (
+            "donor_id",
+            "toc_draft",
+            "logframe_draft",
+            "citations",
+            "critic_findings",
+            "review_comments",
+            "quality_summary",
+        )
+    }
+    future: Future = pool.submit(
+        render_job_export_documents,
+        tuple(plan["missing"]),
+        inputs,
+        bool(bundle.get("include_diagnostics")),
+    )
+    plan["future"] = future
+
+
+def _finish_bundle_job(bundle: Dict[str, Any], plan: Dict[str, Any]) -> None:
+    row = plan["row"]
+    future = plan["future"]
+    if future is not None:
+        try:
+            rendered, manifest = future.result()
+        except Exception as exc:
+            logger.exception("Portfolio export render failed for job %s", row["job_id"])
+            row.update(status="error", error=str(exc) or exc.__class__.__name__)
+            plan["documents"] = {}
+            return
+        _cache_rendered_documents(
+            rendered,
+            manifest,
+            prepared=plan["prepared"],
+            document_keys=plan["document_keys"],
+        )
+        plan["documents"].update(rendered)
+        bundle["rendered_document_count"] += len(rendered)
+    if row["status"] == "queued":
+        row["status"] = "exported"
+        row["documents"] = sorted(plan["documents"])
+        bundle["cached_document_count"] += int(row["cached_document_count"])
+
+
+def _record_bundle_progress(bundle: Dict[str, Any], row: Dict[str, Any]) -> None:
+    status = str(row["status"])
+    if status in PORTFOLIO_EXPORT_ROW_OUTCOMES:
+        bundle[f"{status}_count"] += 1
+    bundle["processed_count"] += 1
+    total = int(bundle["total"])
+    bundle["progress"] = round(bundle["processed_count"] / total, 4) if total else 1.0
+    _write_bundle_status(bundle, include_jobs=False)
+
+
+def _bundle_entry_prefix(row: Dict[str, Any]) -> str:
+    from grantflow.api.routes.exports import _annex_slug
+
+    return f"{_annex_slug(row.get('donor_id'), fallback='unknown_donor')}/{row['job_id']}"
+
+
+def _iter_bundle_entries(bundle: Dict[str, Any], pool: PortfolioRenderPool, window: int) -> Iterator[tuple[str, bytes]]:
+    """Yield archive entries in job order while up to `window` jobs render ahead in the pool."""
+    documents = _bundle_documents(str(bundle["format"]))
+    rows = iter(bundle["jobs"])
+    in_flight: deque[Dict[str, Any]] = deque()
+    while True:
+        while len(in_flight) < window:
+            row = next(rows, None)
+            if row is None:
+                break
+            plan = _plan_bundle_job(bundle, row, documents)
+            _submit_bundle_render(pool, bundle, plan)
+            in_flight.append(plan)
+        if not in_flight:
+            break
+        plan = in_flight.popleft()
+        _finish_bundle_job(bundle, plan)
+        prefix = _bundle_entry_prefix(plan["row"])
+        for name in documents:
+            content = plan["documents"].pop(name, None)
+            if content is not None:
+                yield f"{prefix}/{name}", content
+        _record_bundle_progress(bundle, plan["row"])
+    manifest = {
+        key: bundle.get(key)
+        for key in (
+            "bundle_id",
+            "format",
+            "filters",
+            "total",
+            "exported_count",
+            "skipped_count",
+            "blocked_count",
+            "error_count",
+            "cached_document_count",
+            "rendered_document_count",
+            "jobs",
+        )
+    }
+    manifest["generated_at"] = _utc_now_iso()
+    yield "manifest.json", json.dumps(manifest, indent=2, ensure_ascii=True).encode("utf-8")
+
+
+def _run_portfolio_export_bundle(bundle_id: str) -> None:
+    """Render every selected job and stream the archive to disk, recording progress after each job."""
+    bundle = _read_bundle_status(bundle_id)
+    if bundle is None:
+        return
+    bundle.update(status="running", started_at=_utc_now_iso())
+    _write_bundle_status(bundle)
+    archive_path = _bundle_archive_path(bundle_id)
+    tmp_path = archive_path.with_name(f"{archive_path.name}.tmp")
+    pool = portfolio_render_pool
+    try:
+        with tmp_path.open("wb") as handle:
+            archive_bytes = 0
+            for chunk in iter_zip_stream(_iter_bundle_entries(bundle, pool, window=max(1, pool.max_workers) * 2)):
+                handle.write(chunk)
+                archive_bytes += len(chunk)
+        os.replace(tmp_path, archive_path)
+    except Exception as exc:
+        logger.exception("Portfolio export bundle %s failed", bundle_id)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        bundle.update(status="error", error=str(exc) or exc.__class__.__name__, finished_at=_utc_now_iso())
+        _write_bundle_status(bundle)
+        return
+    bundle.update(
+        status="done",
+        progress=1.0,
+        archive_bytes=archive_bytes,
+        download_url=f"/portfolio/export/bundle/{bundle_id}/download",
+        finished_at=_utc_now_iso(),
+    )
+    _write_bundle_status(bundle)
@@ -13,7 +13,7 @@ from grantflow.api.tenant import _normalize_tenant_candidate, _tenant_rag_namesp
 from grantflow.core.config import config
 from grantflow.memory_bank.vector_store import vector_store
 from grantflow.swarm.citations import citation_traceability_status
-from grantflow.swarm.nodes.architect_generation import generate_toc_under_contract
+from grantflow.swarm.nodes.architect_generation import generate_toc_with_stage_cache
 from grantflow.swarm.nodes.architect_retrieval import retrieve_architect_evidence
 from grantflow.swarm.retrieval_query import donor_query_preset_list
 from grantflow.swarm.state_contract import build_graph_state
@@ -226,6 +226,36 @@ def _preflight_grounding_policy_thresholds() -> Dict[str, Any]:
     }
 
 
+def _preflight_retrieval_namespace(strategy: Any, tenant_id: Optional[str]) -> Optional[str]:
+    base_namespace = str(getattr(strategy, "get_rag_collection", lambda: "")() or "").strip() or None
+    return _tenant_rag_namespace(base_namespace or "", tenant_id) if base_namespace else None
+
+
+def _preflight_architect_state(
+    *,
+    donor_id: str,
+    strategy: Any,
+    namespace: str,
+    input_context: Dict[str, Any],
+    tenant_id: Optional[str] = None,
+    architect_rag_enabled: bool = True,
+) -> Dict[str, Any]:
+    """Graph state for the preflight architect estimate; batch warm-up builds the same state to share cache keys."""
+    return build_graph_state(
+        donor_id=donor_id,
+        input_context=input_context,
+        donor_strategy=strategy,
+        tenant_id=tenant_id,
+        rag_namespace=namespace,
+        llm_mode=False,
+        max_iterations=int(getattr(config.graph, "max_iterations", 3) or 3),
+        extras={
+            "architect_rag_enabled": bool(architect_rag_enabled),
+            "stage_cache_source": "preflight",
+        },
+    )
+
+
 def _estimate_preflight_architect_claims(
     *,
     donor_id: str,
@@ -248,21 +278,17 @@ def _estimate_preflight_architect_claims(
             "retrieval_expected": bool(architect_rag_enabled),
         }
 
-    state = build_graph_state(
+    state = _preflight_architect_state(
         donor_id=donor_id,
+        strategy=strategy,
+        namespace=namespace,
         input_context=input_context,
-        donor_strategy=strategy,
         tenant_id=tenant_id,
-        rag_namespace=namespace,
-        llm_mode=False,
-        max_iterations=int(getattr(config.graph, "max_iterations", 3) or 3),
-        extras={
-            "architect_rag_enabled": bool(architect_rag_enabled),
-        },
+        architect_rag_enabled=architect_rag_enabled,
     )
     try:
         retrieval_summary, retrieval_hits = retrieve_architect_evidence(state, namespace)
-        _toc, _validation, generation_meta, claim_citations = generate_toc_under_contract(
+        _toc, _validation, generation_meta, claim_citations = generate_toc_with_stage_cache(
             state=state,
             strategy=strategy,
             evidence_hits=retrieval_hits,
@@ -509,8 +535,7 @@ def _build_generate_preflight(
     resolved_tenant_id = _normalize_tenant_candidate(tenant_id) or _normalize_tenant_candidate(
         metadata.get("tenant_id") or metadata.get("tenant")
     )
-    base_namespace = str(getattr(strategy, "get_rag_collection", lambda: "")() or "").strip() or None
-    namespace = _tenant_rag_namespace(base_namespace or "", resolved_tenant_id) if base_namespace else None
+    namespace = _preflight_retrieval_namespace(strategy, resolved_tenant_id)
     namespace_normalized = vector_store.normalize_namespace(namespace or "")
     inventory_rows = _ingest_inventory(donor_id=donor_id or None, tenant_id=resolved_tenant_id)
     inventory_payload = public_ingest_inventory_payload(
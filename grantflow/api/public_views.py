@@ -40,6 +40,21 @@ PORTFOLIO_QUALITY_HIGH_PRIORITY_SIGNALS = {
     "rag_low_confidence_citation_count",
     "traceability_gap_citation_count",
 }
+PORTFOLIO_QUALITY_CITATION_AVERAGE_KEYS = (
+    "citation_confidence_avg",
+    "architect_threshold_hit_rate",
+    "architect_claim_support_rate",
+)
+PORTFOLIO_QUALITY_REVIEW_COMMENT_KEYS = (
+    "open_review_comments",
+    "resolved_review_comments",
+    "acknowledged_review_comments",
+    "pending_review_comments",
+    "overdue_review_comments",
+    "stale_open_review_comments",
+    "linked_review_comments",
+    "orphan_linked_review_comments",
+)
 PORTFOLIO_WARNING_LEVELS = {"high", "medium", "low", "none"}
 PORTFOLIO_WARNING_LEVEL_ORDER = ("high", "medium", "low", "none")
 GROUNDING_RISK_LEVEL_ORDER = ("high", "medium", "low", "unknown")
@@ -455,6 +470,17 @@ def _critic_triage_summary_payload(
     unresolved = [
         item for item in findings if str(item.get("status") or "open").strip().lower() not in {"resolved", "closed"}
     ]
+    priority_counts, bucket_counts, stale_open_finding_count = _critic_triage_counts(unresolved)
+    sorted_unresolved = sorted(unresolved, key=_finding_priority_sort_key, reverse=True)
+    return _critic_triage_summary_from_counts(
+        priority_counts=priority_counts,
+        bucket_counts=bucket_counts,
+        stale_open_finding_count=stale_open_finding_count,
+        sorted_unresolved=sorted_unresolved,
+    )
+
+
+def _critic_triage_counts(unresolved: list[Dict[str, Any]]) -> tuple[Dict[str, int], Dict[str, int], int]:
     priority_counts = {key: 0 for key in FINDING_TRIAGE_PRIORITY_ORDER}
     bucket_counts = {"grounding": 0, "measurement": 0, "logic": 0, "compliance": 0, "general": 0}
     stale_open_finding_count = 0
@@ -468,7 +494,16 @@ def _critic_triage_summary_payload(
             bucket_counts[bucket] += 1
         if staleness in {"aging", "overdue"}:
             stale_open_finding_count += 1
-    sorted_unresolved = sorted(unresolved, key=_finding_priority_sort_key, reverse=True)
+    return priority_counts, bucket_counts, stale_open_finding_count
+
+
+def _critic_triage_summary_from_counts(
+    *,
+    priority_counts: Dict[str, int],
+    bucket_counts: Dict[str, int],
+    stale_open_finding_count: int,
+    sorted_unresolved: list[Dict[str, Any]],
+) -> Dict[str, Any]:
     top_priority_finding_ids = [finding_primary_id(item) for item in sorted_unresolved[:3] if finding_primary_id(item)]
     next_item = sorted_unresolved[0] if sorted_unresolved else None
     return {
@@ -2619,7 +2654,11 @@ def public_job_diff_payload(
     }
 
 
-def public_job_events_payload(job_id: str, job: Dict[str, Any]) -> Dict[str, Any]:
+def public_job_events_payload(
+    job_id: str,
+    job: Dict[str, Any],
+    webhook_deliveries: Optional[list[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
     raw_events = job.get("job_events")
     events: list[Dict[str, Any]] = []
     if isinstance(raw_events, list):
@@ -2627,12 +2666,17 @@ def public_job_events_payload(job_id: str, job: Dict[str, Any]) -> Dict[str, Any
             if not isinstance(item, dict):
                 continue
             events.append(sanitize_for_public_response(item))
-    return {
+    payload: Dict[str, Any] = {
         "job_id": str(job_id),
         "status": str(job.get("status") or ""),
         "event_count": len(events),
         "events": events,
     }
+    if webhook_deliveries:
+        payload["webhook_deliveries"] = [
+            sanitize_for_public_response(item) for item in webhook_deliveries if isinstance(item, dict)
+        ]
+    return payload
 
 
 def _parse_event_ts(value: Any) -> Optional[datetime]:
@@ -4467,7 +4511,7 @@ def public_job_grounding_gate_payload(job_id: str, job: Dict[str, Any]) -> Dict[
     return payload
 
 
-def public_portfolio_metrics_payload(
+def portfolio_metrics_filtered_jobs(
     jobs_by_id: Dict[str, Dict[str, Any]],
     *,
     donor_id: Optional[str] = None,
@@ -4477,7 +4521,8 @@ def public_portfolio_metrics_payload(
     grounding_risk_level: Optional[str] = None,
     toc_text_risk_level: Optional[str] = None,
     mel_risk_level: Optional[str] = None,
-) -> Dict[str, Any]:
+) -> list[tuple[str, Dict[str, Any]]]:
+    """Jobs selected by the `/portfolio/metrics` filters, in input order."""
     warning_level_filter = _normalize_warning_level_filter(warning_level)
     grounding_risk_filter = _normalize_grounding_risk_filter(grounding_risk_level)
     toc_text_risk_filter = _normalize_toc_text_risk_filter(toc_text_risk_level)
@@ -4505,6 +4550,34 @@ def public_portfolio_metrics_payload(
         if mel_risk_filter is not None and _job_mel_risk_level(job) != mel_risk_filter:
             continue
         filtered.append((str(job_id), job))
+    return filtered
+
+
+def public_portfolio_metrics_payload(
+    jobs_by_id: Dict[str, Dict[str, Any]],
+    *,
+    donor_id: Optional[str] = None,
+    status: Optional[str] = None,
+    hitl_enabled: Optional[bool] = None,
+    warning_level: Optional[str] = None,
+    grounding_risk_level: Optional[str] = None,
+    toc_text_risk_level: Optional[str] = None,
+    mel_risk_level: Optional[str] = None,
+) -> Dict[str, Any]:
+    warning_level_filter = _normalize_warning_level_filter(warning_level)
+    grounding_risk_filter = _normalize_grounding_risk_filter(grounding_risk_level)
+    toc_text_risk_filter = _normalize_toc_text_risk_filter(toc_text_risk_level)
+    mel_risk_filter = _normalize_mel_risk_filter(mel_risk_level)
+    filtered = portfolio_metrics_filtered_jobs(
+        jobs_by_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+        toc_text_risk_level=toc_text_risk_level,
+        mel_risk_level=mel_risk_level,
+    )
 
     status_counts: Dict[str, int] = {}
     donor_counts: Dict[str, int] = {}
@@ -4616,14 +4689,9 @@ def public_portfolio_metrics_payload(
     terminal_statuses = {"done", "error", "canceled"}
     terminal_rows = [m for m in metrics_rows if str(m.get("terminal_status") or "") in terminal_statuses]
 
-    job_count = len(filtered)
-    warning_level_job_counts, warning_level_job_rates = _warning_level_breakdown(warning_level_counts, job_count)
-    grounding_risk_job_counts, grounding_risk_job_rates = _grounding_risk_breakdown(grounding_risk_counts, job_count)
-    mel_risk_job_counts, mel_risk_job_rates = _mel_risk_breakdown(mel_risk_counts, job_count)
-
-    return {
-        "job_count": job_count,
-        "filters": {
+    return _portfolio_metrics_payload_from_totals(
+        job_count=len(filtered),
+        filters={
             "donor_id": donor_id,
             "status": status,
             "hitl_enabled": hitl_enabled,
@@ -4632,6 +4700,52 @@ def public_portfolio_metrics_payload(
             "toc_text_risk_level": toc_text_risk_filter,
             "mel_risk_level": mel_risk_filter,
         },
+        status_counts=status_counts,
+        donor_counts=donor_counts,
+        warning_level_counts=warning_level_counts,
+        grounding_risk_counts=grounding_risk_counts,
+        mel_risk_counts=mel_risk_counts,
+        terminal_job_count=len(terminal_rows),
+        hitl_job_count=sum(1 for _, job in filtered if bool(job.get("hitl_enabled"))),
+        total_pause_count=total_pause_count,
+        total_resume_count=total_resume_count,
+        avg_time_to_first_draft_seconds=_avg("time_to_first_draft_seconds"),
+        avg_time_to_terminal_seconds=_avg("time_to_terminal_seconds"),
+        avg_time_in_pending_hitl_seconds=_avg("time_in_pending_hitl_seconds"),
+        review_readiness_totals=review_readiness_totals,
+        triage_summary=_portfolio_triage_summary_payload(triage_rows),
+        stale_comment_bucket_counts=stale_comment_bucket_counts_total,
+    )
+
+
+def _portfolio_metrics_payload_from_totals(
+    *,
+    job_count: int,
+    filters: Dict[str, Any],
+    status_counts: Dict[str, int],
+    donor_counts: Dict[str, int],
+    warning_level_counts: Dict[str, int],
+    grounding_risk_counts: Dict[str, int],
+    mel_risk_counts: Dict[str, int],
+    terminal_job_count: int,
+    hitl_job_count: int,
+    total_pause_count: int,
+    total_resume_count: int,
+    avg_time_to_first_draft_seconds: Optional[float],
+    avg_time_to_terminal_seconds: Optional[float],
+    avg_time_in_pending_hitl_seconds: Optional[float],
+    review_readiness_totals: Dict[str, int],
+    triage_summary: Dict[str, Any],
+    stale_comment_bucket_counts: Dict[str, int],
+) -> Dict[str, Any]:
+    """Shape /portfolio/metrics from pre-summed totals (shared by the full scan and the aggregate cache)."""
+    warning_level_job_counts, warning_level_job_rates = _warning_level_breakdown(warning_level_counts, job_count)
+    grounding_risk_job_counts, grounding_risk_job_rates = _grounding_risk_breakdown(grounding_risk_counts, job_count)
+    mel_risk_job_counts, mel_risk_job_rates = _mel_risk_breakdown(mel_risk_counts, job_count)
+
+    return {
+        "job_count": job_count,
+        "filters": filters,
         "status_counts": status_counts,
         "donor_counts": donor_counts,
         "warning_level_counts": warning_level_counts,
@@ -4651,13 +4765,13 @@ def public_portfolio_metrics_payload(
         "mel_risk_medium_job_count": int(mel_risk_job_counts.get("medium") or 0),
         "mel_risk_low_job_count": int(mel_risk_job_counts.get("low") or 0),
         "mel_risk_unknown_job_count": int(mel_risk_job_counts.get("unknown") or 0),
-        "terminal_job_count": len(terminal_rows),
-        "hitl_job_count": sum(1 for _, job in filtered if bool(job.get("hitl_enabled"))),
+        "terminal_job_count": terminal_job_count,
+        "hitl_job_count": hitl_job_count,
         "total_pause_count": total_pause_count,
         "total_resume_count": total_resume_count,
-        "avg_time_to_first_draft_seconds": _avg("time_to_first_draft_seconds"),
-        "avg_time_to_terminal_seconds": _avg("time_to_terminal_seconds"),
-        "avg_time_in_pending_hitl_seconds": _avg("time_in_pending_hitl_seconds"),
+        "avg_time_to_first_draft_seconds": avg_time_to_first_draft_seconds,
+        "avg_time_to_terminal_seconds": avg_time_to_terminal_seconds,
+        "avg_time_in_pending_hitl_seconds": avg_time_in_pending_hitl_seconds,
         "review_readiness_summary": {
             **review_readiness_totals,
             "needs_revision_rate": (
@@ -4693,8 +4807,8 @@ def public_portfolio_metrics_payload(
             "orphan_linked_review_comments_per_job_avg": (
                 round(review_readiness_totals["orphan_linked_review_comments"] / job_count, 4) if job_count else None
             ),
-            "triage_summary": _portfolio_triage_summary_payload(triage_rows),
-            "stale_comment_bucket_counts": dict(sorted(stale_comment_bucket_counts_total.items())),
+            "triage_summary": triage_summary,
+            "stale_comment_bucket_counts": dict(sorted(stale_comment_bucket_counts.items())),
         },
     }
 
@@ -4790,6 +4904,38 @@ def public_portfolio_quality_payload(
             continue
         filtered.append((str(job_id), job))
 
+    quality_rows = [_portfolio_quality_row(job_id, job) for job_id, job in filtered]
+    return _portfolio_quality_payload_from_totals(
+        _portfolio_quality_totals(quality_rows),
+        filters={
+            "donor_id": donor_id,
+            "status": status,
+            "hitl_enabled": hitl_enabled,
+            "warning_level": warning_level_filter,
+            "grounding_risk_level": grounding_risk_filter,
+            "finding_status": finding_status_filter,
+            "finding_severity": finding_severity_filter,
+            "toc_text_risk_level": toc_text_risk_filter,
+            "mel_risk_level": mel_risk_filter,
+        },
+    )
+
+
+def _portfolio_quality_row(job_id: str, job: Dict[str, Any]) -> Dict[str, Any]:
+    row = public_job_quality_payload(job_id, job)
+    row["_status"] = str(job.get("status") or "")
+    row["_donor_id"] = _job_donor_id(job, default="unknown")
+    row["_warning_level"] = _job_warning_level(job)
+    row["_grounding_risk_level"] = _job_grounding_risk_level(job)
+    return row
+
+
+def _portfolio_quality_totals(quality_rows: list[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sum `_portfolio_quality_row` rows into the counters `_portfolio_quality_payload_from_totals` shapes.
+
+    Every value is a count, a float sum, or a dict/list of them, so totals for disjoint job sets merge by
+    addition (`_merge_portfolio_quality_totals`).
+    """
     status_counts: Dict[str, int] = {}
     donor_counts: Dict[str, int] = {}
     warning_level_counts: Dict[str, int] = {}
@@ -4807,21 +4953,37 @@ def public_portfolio_quality_payload(
     grounded_gate_present_job_count = 0
     grounded_gate_blocked_job_count = 0
     grounded_gate_passed_job_count = 0
-    quality_rows: list[Dict[str, Any]] = []
+    job_count = len(quality_rows)
+    terminal_statuses = {"done", "error", "canceled"}
+    terminal_job_count = 0
+    average_totals: Dict[str, float] = {
+        key: 0.0 for key in ("quality_score", "critic_score", *PORTFOLIO_QUALITY_CITATION_AVERAGE_KEYS)
+    }
+    average_counts: Dict[str, int] = {key: 0 for key in average_totals}
+    review_comment_totals: Dict[str, int] = {key: 0 for key in PORTFOLIO_QUALITY_REVIEW_COMMENT_KEYS}
+    triage_rows: list[tuple[str, list[Dict[str, Any]]]] = []
 
-    for job_id, job in filtered:
-        job_status = str(job.get("status") or "")
+    for q in quality_rows:
+        job_status = str(q.get("_status") or "")
         status_counts[job_status] = status_counts.get(job_status, 0) + 1
-        job_donor = _job_donor_id(job, default="unknown")
+        job_donor = str(q.get("_donor_id") or "unknown")
         donor_counts[job_donor] = donor_counts.get(job_donor, 0) + 1
-        job_warning_level = _job_warning_level(job)
+        job_warning_level = str(q.get("_warning_level") or "")
         warning_level_counts[job_warning_level] = warning_level_counts.get(job_warning_level, 0) + 1
-        job_grounding_risk_level = _job_grounding_risk_level(job)
+        job_grounding_risk_level = str(q.get("_grounding_risk_level") or "")
         grounding_risk_counts[job_grounding_risk_level] = grounding_risk_counts.get(job_grounding_risk_level, 0) + 1
-
-        q = public_job_quality_payload(job_id, job)
-        q["_donor_id"] = job_donor
-        quality_rows.append(q)
+        if str(q.get("terminal_status") or "") in terminal_statuses:
+            terminal_job_count += 1
+        for average_key in ("quality_score", "critic_score"):
+            if isinstance(q.get(average_key), (int, float)):
+                average_totals[average_key] += float(q[average_key])
+                average_counts[average_key] += 1
+        if isinstance(q.get("citations"), dict):
+            q_citations = cast(Dict[str, Any], q.get("citations"))
+            for average_key in PORTFOLIO_QUALITY_CITATION_AVERAGE_KEYS:
+                if isinstance(q_citations.get(average_key), (int, float)):
+                    average_totals[average_key] += float(q_citations[average_key])
+                    average_counts[average_key] += 1
 
         critic_summary: Dict[str, Any] = (
             cast(Dict[str, Any], q.get("critic")) if isinstance(q.get("critic"), dict) else {}
@@ -4834,9 +4996,9 @@ def public_portfolio_quality_payload(
         critic_payload: Dict[str, Any] = (
             cast(Dict[str, Any], q.get("critic")) if isinstance(q.get("critic"), dict) else {}
         )
-        donor_triage_rows.setdefault(job_donor, []).extend(
-            [item for item in critic_payload.get("fatal_flaws") or [] if isinstance(item, dict)]
-        )
+        job_triage_findings = [item for item in critic_payload.get("fatal_flaws") or [] if isinstance(item, dict)]
+        donor_triage_rows.setdefault(job_donor, []).extend(job_triage_findings)
+        triage_rows.append((job_donor, job_triage_findings))
         if bool(q.get("needs_revision")):
             donor_needs_revision_counts[job_donor] = donor_needs_revision_counts.get(job_donor, 0) + 1
         open_findings = int(critic_summary.get("open_finding_count") or 0)
@@ -4898,6 +5060,8 @@ def public_portfolio_quality_payload(
             "fallback_strategy_citations",
         ):
             donor_readiness_row[field] = int(donor_readiness_row.get(field) or 0) + int(review_summary.get(field) or 0)
+        for field in review_comment_totals:
+            review_comment_totals[field] += int(review_summary.get(field) or 0)
         comment_triage = (
             review_summary.get("comment_triage_summary")
             if isinstance(review_summary.get("comment_triage_summary"), dict)
@@ -4915,15 +5079,6 @@ def public_portfolio_quality_payload(
                 donor_bucket_counts[token] = int(donor_bucket_counts.get(token) or 0) + int(count or 0)
             donor_readiness_row["stale_comment_bucket_counts"] = donor_bucket_counts
 
-    def _avg(rows: list[Dict[str, Any]], key: str) -> Optional[float]:
-        values = [float(row[key]) for row in rows if isinstance(row.get(key), (int, float))]
-        if not values:
-            return None
-        return round(sum(values) / len(values), 4)
-
-    terminal_statuses = {"done", "error", "canceled"}
-    terminal_rows = [row for row in quality_rows if str(row.get("terminal_status") or "") in terminal_statuses]
-
     critic_open_findings_total = 0
     critic_high_severity_total = 0
     critic_fatal_flaws_total = 0
@@ -5539,6 +5694,191 @@ def public_portfolio_quality_payload(
         if bool(row.get("needs_revision")):
             donor_row["needs_revision_job_count"] += 1
 
+    return {
+        "status_counts": status_counts,
+        "donor_counts": donor_counts,
+        "warning_level_counts": warning_level_counts,
+        "grounding_risk_counts": grounding_risk_counts,
+        "finding_status_counts": finding_status_counts,
+        "finding_severity_counts": finding_severity_counts,
+        "donor_needs_revision_counts": donor_needs_revision_counts,
+        "donor_open_findings_counts": donor_open_findings_counts,
+        "donor_review_readiness_breakdown": donor_review_readiness_breakdown,
+        "donor_triage_rows": donor_triage_rows,
+        "donor_weighted_risk_breakdown": donor_weighted_risk_breakdown,
+        "donor_grounded_gate_breakdown": donor_grounded_gate_breakdown,
+        "grounded_gate_section_fail_counts": grounded_gate_section_fail_counts,
+        "grounded_gate_reason_counts": grounded_gate_reason_counts,
+        "grounded_gate_present_job_count": grounded_gate_present_job_count,
+        "grounded_gate_blocked_job_count": grounded_gate_blocked_job_count,
+        "grounded_gate_passed_job_count": grounded_gate_passed_job_count,
+        "job_count": job_count,
+        "terminal_job_count": terminal_job_count,
+        "average_totals": average_totals,
+        "average_counts": average_counts,
+        "review_comment_totals": review_comment_totals,
+        "triage_rows": triage_rows,
+        "critic_open_findings_total": critic_open_findings_total,
+        "critic_high_severity_total": critic_high_severity_total,
+        "critic_fatal_flaws_total": critic_fatal_flaws_total,
+        "critic_medium_severity_total": critic_medium_severity_total,
+        "needs_revision_job_count": needs_revision_job_count,
+        "citation_count_total": citation_count_total,
+        "low_confidence_citation_count": low_confidence_citation_count,
+        "rag_low_confidence_citation_count": rag_low_confidence_citation_count,
+        "architect_rag_low_confidence_citation_count": architect_rag_low_confidence_citation_count,
+        "mel_rag_low_confidence_citation_count": mel_rag_low_confidence_citation_count,
+        "fallback_namespace_citation_count": fallback_namespace_citation_count,
+        "strategy_reference_citation_count": strategy_reference_citation_count,
+        "retrieval_grounded_citation_count": retrieval_grounded_citation_count,
+        "doc_id_present_citation_count": doc_id_present_citation_count,
+        "retrieval_rank_present_citation_count": retrieval_rank_present_citation_count,
+        "retrieval_confidence_present_citation_count": retrieval_confidence_present_citation_count,
+        "retrieval_metadata_complete_citation_count": retrieval_metadata_complete_citation_count,
+        "non_retrieval_citation_count": non_retrieval_citation_count,
+        "architect_doc_id_present_citation_count": architect_doc_id_present_citation_count,
+        "architect_retrieval_rank_present_citation_count": architect_retrieval_rank_present_citation_count,
+        "architect_retrieval_confidence_present_citation_count": architect_retrieval_confidence_present_citation_count,
+        "architect_retrieval_metadata_complete_citation_count": architect_retrieval_metadata_complete_citation_count,
+        "mel_doc_id_present_citation_count": mel_doc_id_present_citation_count,
+        "mel_retrieval_rank_present_citation_count": mel_retrieval_rank_present_citation_count,
+        "mel_retrieval_confidence_present_citation_count": mel_retrieval_confidence_present_citation_count,
+        "mel_retrieval_metadata_complete_citation_count": mel_retrieval_metadata_complete_citation_count,
+        "traceability_complete_citation_count": traceability_complete_citation_count,
+        "traceability_partial_citation_count": traceability_partial_citation_count,
+        "traceability_missing_citation_count": traceability_missing_citation_count,
+        "traceability_gap_citation_count": traceability_gap_citation_count,
+        "retrieval_expected_true_job_count": retrieval_expected_true_job_count,
+        "retrieval_expected_false_job_count": retrieval_expected_false_job_count,
+        "llm_finding_label_counts_total": llm_finding_label_counts_total,
+        "llm_advisory_diagnostics_job_count": llm_advisory_diagnostics_job_count,
+        "llm_advisory_applied_job_count": llm_advisory_applied_job_count,
+        "llm_advisory_candidate_finding_count": llm_advisory_candidate_finding_count,
+        "llm_advisory_rejected_reason_counts": llm_advisory_rejected_reason_counts,
+        "architect_citation_count_total": architect_citation_count_total,
+        "architect_claim_support_citation_count": architect_claim_support_citation_count,
+        "citation_type_counts_total": citation_type_counts_total,
+        "architect_citation_type_counts_total": architect_citation_type_counts_total,
+        "mel_citation_type_counts_total": mel_citation_type_counts_total,
+        "toc_text_quality_risk_counts": toc_text_quality_risk_counts,
+        "toc_text_quality_placeholder_check_status_counts": toc_text_quality_placeholder_check_status_counts,
+        "toc_text_quality_repetition_check_status_counts": toc_text_quality_repetition_check_status_counts,
+        "toc_text_quality_issues_total": toc_text_quality_issues_total,
+        "toc_text_quality_placeholder_finding_count": toc_text_quality_placeholder_finding_count,
+        "toc_text_quality_repetition_finding_count": toc_text_quality_repetition_finding_count,
+        "mel_indicator_job_count": mel_indicator_job_count,
+        "mel_indicator_count_total": mel_indicator_count_total,
+        "mel_baseline_placeholder_count": mel_baseline_placeholder_count,
+        "mel_target_placeholder_count": mel_target_placeholder_count,
+        "mel_field_present_weighted_totals": mel_field_present_weighted_totals,
+        "mel_result_level_counts_total": mel_result_level_counts_total,
+        "mel_risk_counts": mel_risk_counts,
+    }
+
+
+def _merge_portfolio_quality_totals(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any]:
+    """Add `source` totals into `target` in place; nested dicts are copied, never shared with `source`."""
+    for key, value in source.items():
+        if isinstance(value, dict):
+            _merge_portfolio_quality_totals(target.setdefault(key, {}), value)
+        elif isinstance(value, list):
+            target.setdefault(key, []).extend(value)
+        else:
+            target[key] = target.get(key, 0) + value
+    return target
+
+
+def _portfolio_quality_payload_from_totals(totals: Dict[str, Any], *, filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape /portfolio/quality from `_portfolio_quality_totals` (shared by the full scan and the aggregate cache)."""
+    status_counts = totals["status_counts"]
+    donor_counts = totals["donor_counts"]
+    warning_level_counts = totals["warning_level_counts"]
+    grounding_risk_counts = totals["grounding_risk_counts"]
+    finding_status_counts = totals["finding_status_counts"]
+    finding_severity_counts = totals["finding_severity_counts"]
+    donor_needs_revision_counts = totals["donor_needs_revision_counts"]
+    donor_open_findings_counts = totals["donor_open_findings_counts"]
+    donor_review_readiness_breakdown = totals["donor_review_readiness_breakdown"]
+    donor_triage_rows = totals["donor_triage_rows"]
+    donor_weighted_risk_breakdown = totals["donor_weighted_risk_breakdown"]
+    donor_grounded_gate_breakdown = totals["donor_grounded_gate_breakdown"]
+    grounded_gate_section_fail_counts = totals["grounded_gate_section_fail_counts"]
+    grounded_gate_reason_counts = totals["grounded_gate_reason_counts"]
+    grounded_gate_present_job_count = totals["grounded_gate_present_job_count"]
+    grounded_gate_blocked_job_count = totals["grounded_gate_blocked_job_count"]
+    grounded_gate_passed_job_count = totals["grounded_gate_passed_job_count"]
+    job_count = totals["job_count"]
+    terminal_job_count = totals["terminal_job_count"]
+    average_totals = totals["average_totals"]
+    average_counts = totals["average_counts"]
+    review_comment_totals = totals["review_comment_totals"]
+    triage_rows = totals["triage_rows"]
+    critic_open_findings_total = totals["critic_open_findings_total"]
+    critic_high_severity_total = totals["critic_high_severity_total"]
+    critic_fatal_flaws_total = totals["critic_fatal_flaws_total"]
+    critic_medium_severity_total = totals["critic_medium_severity_total"]
+    needs_revision_job_count = totals["needs_revision_job_count"]
+    citation_count_total = totals["citation_count_total"]
+    low_confidence_citation_count = totals["low_confidence_citation_count"]
+    rag_low_confidence_citation_count = totals["rag_low_confidence_citation_count"]
+    architect_rag_low_confidence_citation_count = totals["architect_rag_low_confidence_citation_count"]
+    mel_rag_low_confidence_citation_count = totals["mel_rag_low_confidence_citation_count"]
+    fallback_namespace_citation_count = totals["fallback_namespace_citation_count"]
+    strategy_reference_citation_count = totals["strategy_reference_citation_count"]
+    retrieval_grounded_citation_count = totals["retrieval_grounded_citation_count"]
+    doc_id_present_citation_count = totals["doc_id_present_citation_count"]
+    retrieval_rank_present_citation_count = totals["retrieval_rank_present_citation_count"]
+    retrieval_confidence_present_citation_count = totals["retrieval_confidence_present_citation_count"]
+    retrieval_metadata_complete_citation_count = totals["retrieval_metadata_complete_citation_count"]
+    non_retrieval_citation_count = totals["non_retrieval_citation_count"]
+    architect_doc_id_present_citation_count = totals["architect_doc_id_present_citation_count"]
+    architect_retrieval_rank_present_citation_count = totals["architect_retrieval_rank_present_citation_count"]
+    architect_retrieval_confidence_present_citation_count = totals[
+        "architect_retrieval_confidence_present_citation_count"
+    ]
+    architect_retrieval_metadata_complete_citation_count = totals[
+        "architect_retrieval_metadata_complete_citation_count"
+    ]
+    mel_doc_id_present_citation_count = totals["mel_doc_id_present_citation_count"]
+    mel_retrieval_rank_present_citation_count = totals["mel_retrieval_rank_present_citation_count"]
+    mel_retrieval_confidence_present_citation_count = totals["mel_retrieval_confidence_present_citation_count"]
+    mel_retrieval_metadata_complete_citation_count = totals["mel_retrieval_metadata_complete_citation_count"]
+    traceability_complete_citation_count = totals["traceability_complete_citation_count"]
+    traceability_partial_citation_count = totals["traceability_partial_citation_count"]
+    traceability_missing_citation_count = totals["traceability_missing_citation_count"]
+    traceability_gap_citation_count = totals["traceability_gap_citation_count"]
+    retrieval_expected_true_job_count = totals["retrieval_expected_true_job_count"]
+    retrieval_expected_false_job_count = totals["retrieval_expected_false_job_count"]
+    llm_finding_label_counts_total = totals["llm_finding_label_counts_total"]
+    llm_advisory_diagnostics_job_count = totals["llm_advisory_diagnostics_job_count"]
+    llm_advisory_applied_job_count = totals["llm_advisory_applied_job_count"]
+    llm_advisory_candidate_finding_count = totals["llm_advisory_candidate_finding_count"]
+    llm_advisory_rejected_reason_counts = totals["llm_advisory_rejected_reason_counts"]
+    architect_citation_count_total = totals["architect_citation_count_total"]
+    architect_claim_support_citation_count = totals["architect_claim_support_citation_count"]
+    citation_type_counts_total = totals["citation_type_counts_total"]
+    architect_citation_type_counts_total = totals["architect_citation_type_counts_total"]
+    mel_citation_type_counts_total = totals["mel_citation_type_counts_total"]
+    toc_text_quality_risk_counts = totals["toc_text_quality_risk_counts"]
+    toc_text_quality_placeholder_check_status_counts = totals["toc_text_quality_placeholder_check_status_counts"]
+    toc_text_quality_repetition_check_status_counts = totals["toc_text_quality_repetition_check_status_counts"]
+    toc_text_quality_issues_total = totals["toc_text_quality_issues_total"]
+    toc_text_quality_placeholder_finding_count = totals["toc_text_quality_placeholder_finding_count"]
+    toc_text_quality_repetition_finding_count = totals["toc_text_quality_repetition_finding_count"]
+    mel_indicator_job_count = totals["mel_indicator_job_count"]
+    mel_indicator_count_total = totals["mel_indicator_count_total"]
+    mel_baseline_placeholder_count = totals["mel_baseline_placeholder_count"]
+    mel_target_placeholder_count = totals["mel_target_placeholder_count"]
+    mel_field_present_weighted_totals = totals["mel_field_present_weighted_totals"]
+    mel_result_level_counts_total = totals["mel_result_level_counts_total"]
+    mel_risk_counts = totals["mel_risk_counts"]
+
+    def _avg(key: str) -> Optional[float]:
+        count = int(average_counts.get(key) or 0)
+        if not count:
+            return None
+        return round(float(average_totals.get(key) or 0.0) / count, 4)
+
     signal_counts = {
         "high_severity_findings_total": critic_high_severity_total,
         "medium_severity_findings_total": critic_medium_severity_total,
@@ -5890,7 +6230,6 @@ def public_portfolio_quality_payload(
             "grounding_risk_level": donor_grounding_level,
         }
 
-    job_count = len(filtered)
     warning_level_job_counts, warning_level_job_rates = _warning_level_breakdown(warning_level_counts, job_count)
     grounding_risk_job_counts, grounding_risk_job_rates = _grounding_risk_breakdown(grounding_risk_counts, job_count)
     toc_text_quality_risk_job_rates: Dict[str, Optional[float]] = {
@@ -5942,12 +6281,9 @@ def public_portfolio_quality_payload(
     mel_risk_job_rates: Dict[str, Optional[float]] = {
         level: (round(int(count) / job_count, 4) if job_count else None) for level, count in mel_risk_counts.items()
     }
-    quality_score_job_count = sum(1 for row in quality_rows if isinstance(row.get("quality_score"), (int, float)))
-    critic_score_job_count = sum(1 for row in quality_rows if isinstance(row.get("critic_score"), (int, float)))
+    quality_score_job_count = int(average_counts.get("quality_score") or 0)
+    critic_score_job_count = int(average_counts.get("critic_score") or 0)
 
-    citation_summary_rows: list[Dict[str, Any]] = [
-        cast(Dict[str, Any], row.get("citations")) for row in quality_rows if isinstance(row.get("citations"), dict)
-    ]
     fallback_namespace_citation_rate = (
         round(fallback_namespace_citation_count / citation_count_total, 4) if citation_count_total else None
     )
@@ -6078,64 +6414,17 @@ def public_portfolio_quality_payload(
         "high_severity_open_findings_per_job_avg": (
             round(critic_high_severity_total / job_count, 4) if job_count else None
         ),
-        "open_review_comments": sum(
-            int((cast(Dict[str, Any], row.get("review_readiness_summary")).get("open_review_comments") or 0))
-            for row in quality_rows
-            if isinstance(row.get("review_readiness_summary"), dict)
-        ),
-        "resolved_review_comments": sum(
-            int((cast(Dict[str, Any], row.get("review_readiness_summary")).get("resolved_review_comments") or 0))
-            for row in quality_rows
-            if isinstance(row.get("review_readiness_summary"), dict)
-        ),
-        "acknowledged_review_comments": sum(
-            int((cast(Dict[str, Any], row.get("review_readiness_summary")).get("acknowledged_review_comments") or 0))
-            for row in quality_rows
-            if isinstance(row.get("review_readiness_summary"), dict)
-        ),
-        "pending_review_comments": sum(
-            int((cast(Dict[str, Any], row.get("review_readiness_summary")).get("pending_review_comments") or 0))
-            for row in quality_rows
-            if isinstance(row.get("review_readiness_summary"), dict)
-        ),
-        "overdue_review_comments": sum(
-            int((cast(Dict[str, Any], row.get("review_readiness_summary")).get("overdue_review_comments") or 0))
-            for row in quality_rows
-            if isinstance(row.get("review_readiness_summary"), dict)
-        ),
-        "stale_open_review_comments": sum(
-            int((cast(Dict[str, Any], row.get("review_readiness_summary")).get("stale_open_review_comments") or 0))
-            for row in quality_rows
-            if isinstance(row.get("review_readiness_summary"), dict)
-        ),
-        "linked_review_comments": sum(
-            int((cast(Dict[str, Any], row.get("review_readiness_summary")).get("linked_review_comments") or 0))
-            for row in quality_rows
-            if isinstance(row.get("review_readiness_summary"), dict)
-        ),
-        "orphan_linked_review_comments": sum(
-            int((cast(Dict[str, Any], row.get("review_readiness_summary")).get("orphan_linked_review_comments") or 0))
-            for row in quality_rows
-            if isinstance(row.get("review_readiness_summary"), dict)
-        ),
+        "open_review_comments": review_comment_totals["open_review_comments"],
+        "resolved_review_comments": review_comment_totals["resolved_review_comments"],
+        "acknowledged_review_comments": review_comment_totals["acknowledged_review_comments"],
+        "pending_review_comments": review_comment_totals["pending_review_comments"],
+        "overdue_review_comments": review_comment_totals["overdue_review_comments"],
+        "stale_open_review_comments": review_comment_totals["stale_open_review_comments"],
+        "linked_review_comments": review_comment_totals["linked_review_comments"],
+        "orphan_linked_review_comments": review_comment_totals["orphan_linked_review_comments"],
         "low_confidence_citations": low_confidence_citation_count,
         "fallback_strategy_citations": fallback_namespace_citation_count + strategy_reference_citation_count,
-        "triage_summary": _portfolio_triage_summary_payload(
-            [
-                (
-                    str(row.get("_donor_id") or "").strip(),
-                    [
-                        item
-                        for item in (
-                            (cast(Dict[str, Any], row.get("critic")) if isinstance(row.get("critic"), dict) else {})
-                        ).get("fatal_flaws")
-                        or []
-                        if isinstance(item, dict)
-                    ],
-                )
-                for row in quality_rows
-            ]
-        ),
+        "triage_summary": _portfolio_triage_summary_payload(triage_rows),
     }
     for donor_token, donor_row in donor_review_readiness_breakdown.items():
         donor_job_count = int(donor_row.get("job_count") or 0)
@@ -6188,17 +6477,7 @@ def public_portfolio_quality_payload(
 
     return {
         "job_count": job_count,
-        "filters": {
-            "donor_id": donor_id,
-            "status": status,
-            "hitl_enabled": hitl_enabled,
-            "warning_level": warning_level_filter,
-            "grounding_risk_level": grounding_risk_filter,
-            "finding_status": finding_status_filter,
-            "finding_severity": finding_severity_filter,
-            "toc_text_risk_level": toc_text_risk_filter,
-            "mel_risk_level": mel_risk_filter,
-        },
+        "filters": filters,
         "status_counts": status_counts,
         "donor_counts": donor_counts,
         "warning_level_counts": warning_level_counts,
@@ -6281,11 +6560,11 @@ def public_portfolio_quality_payload(
             "missing_field_counts": mel_missing_field_counts,
             "result_level_counts": mel_result_level_counts_total,
         },
-        "terminal_job_count": len(terminal_rows),
+        "terminal_job_count": terminal_job_count,
         "quality_score_job_count": quality_score_job_count,
         "critic_score_job_count": critic_score_job_count,
-        "avg_quality_score": _avg(quality_rows, "quality_score"),
-        "avg_critic_score": _avg(quality_rows, "critic_score"),
+        "avg_quality_score": _avg("quality_score"),
+        "avg_critic_score": _avg("critic_score"),
         "severity_weighted_risk_score": severity_weighted_risk_score,
         "high_priority_signal_count": high_priority_signal_count,
         "review_readiness_summary": review_readiness_summary,
@@ -6313,7 +6592,7 @@ def public_portfolio_quality_payload(
             "architect_citation_count_total": architect_citation_count_total,
             "architect_claim_support_citation_count": architect_claim_support_citation_count,
             "architect_claim_support_rate": architect_claim_support_rate,
-            "citation_confidence_avg": _avg(citation_summary_rows, "citation_confidence_avg"),
+            "citation_confidence_avg": _avg("citation_confidence_avg"),
             "citation_type_counts_total": dict(sorted(citation_type_counts_total.items())),
             "architect_citation_type_counts_total": dict(sorted(architect_citation_type_counts_total.items())),
             "mel_citation_type_counts_total": dict(sorted(mel_citation_type_counts_total.items())),
@@ -6385,8 +6664,8 @@ def public_portfolio_quality_payload(
             "traceability_gap_citation_rate": (
                 round(traceability_gap_citation_count / citation_count_total, 4) if citation_count_total else None
             ),
-            "architect_threshold_hit_rate_avg": _avg(citation_summary_rows, "architect_threshold_hit_rate"),
-            "architect_claim_support_rate_avg": _avg(citation_summary_rows, "architect_claim_support_rate"),
+            "architect_threshold_hit_rate_avg": _avg("architect_threshold_hit_rate"),
+            "architect_claim_support_rate_avg": _avg("architect_claim_support_rate"),
         },
         "priority_signal_breakdown": priority_signal_breakdown,
         "donor_weighted_risk_breakdown": donor_weighted_risk_breakdown,
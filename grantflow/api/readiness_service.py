@@ -25,7 +25,12 @@ from grantflow.api.orchestrator_service import (
     _preflight_grounding_policy_thresholds,
     _runtime_grounded_quality_gate_thresholds,
 )
-from grantflow.api.runtime_service import _job_runner_mode, _uses_inmemory_queue_runner, _uses_redis_queue_runner
+from grantflow.api.runtime_service import (
+    _job_runner_mode,
+    _uses_inmemory_queue_runner,
+    _uses_process_pool_runner,
+    _uses_redis_queue_runner,
+)
 
 
 def _job_runner():
@@ -60,7 +65,7 @@ def _build_readiness_payload() -> dict[str, Any]:
         and dead_letter_queue_size >= dead_letter_threshold
     )
     job_runner_ready = True
-    if _uses_inmemory_queue_runner():
+    if _uses_inmemory_queue_runner() or _uses_process_pool_runner():
         job_runner_ready = bool(job_runner_diag.get("running"))
     elif _uses_redis_queue_runner():
         consumer_enabled = bool(job_runner_diag.get("consumer_enabled", True))
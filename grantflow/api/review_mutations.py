@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 from fastapi import HTTPException
 
@@ -12,7 +13,15 @@ from grantflow.api.idempotency import (
     _normalize_request_id,
     _store_idempotency_response,
 )
-from grantflow.api.idempotency_store_facade import _get_job, _record_job_event, _update_job
+from grantflow.api.idempotency_store_facade import (
+    _append_job_rows,
+    _get_job,
+    _get_job_with_revision,
+    _record_job_event,
+    _retry_on_job_revision_conflict,
+    _update_job,
+)
+from grantflow.api.job_store_service import JobWriteContention
 from grantflow.api.public_views import REVIEW_WORKFLOW_OVERDUE_DEFAULT_HOURS, public_job_review_workflow_sla_payload
 from grantflow.api.review_runtime_helpers import _comment_sla_hours, _iso_plus_hours, _utcnow_iso
 from grantflow.api.review_service import (
@@ -29,7 +38,27 @@ from grantflow.swarm.findings import (
     write_state_critic_findings,
 )
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _with_job_revision_retry(fn: F) -> F:
+    """Re-run a read-modify-write review mutation when another writer bumped the job revision first.
+
+    Only the mutation's own conditional write can conflict: the `_record_job_event` calls that follow it are
+    unconditional appends, so a mutation that has landed is never reported as a 409.
+    """
+
+    @functools.wraps(fn)
+    def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return _retry_on_job_revision_conflict(lambda: fn(*args, **kwargs))
+        except JobWriteContention as exc:
+            raise HTTPException(status_code=409, detail="Job was modified concurrently; retry the request") from exc
 
+    return _wrapper  # type: ignore[return-value]
+
+
+@_with_job_revision_retry
 def _recompute_review_workflow_sla(
     job_id: str,
     *,
@@ -38,8 +67,9 @@ def _recompute_review_workflow_sla(
     default_comment_sla_hours: Optional[Any] = None,
     use_saved_profile: bool = False,
 ) -> Dict[str, Any]:
-    job = _normalize_critic_fatal_flaws_for_job(job_id) or _get_job(job_id)
-    job = _normalize_review_comments_for_job(job_id) or job
+    _normalize_critic_fatal_flaws_for_job(job_id)
+    _normalize_review_comments_for_job(job_id)
+    job, revision = _get_job_with_revision(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -128,7 +158,7 @@ def _recompute_review_workflow_sla(
         update_payload["client_metadata"] = metadata
 
     if update_payload:
-        job = _update_job(job_id, **update_payload) or _get_job(job_id) or job
+        job = _update_job(job_id, expected_revision=revision, **update_payload) or _get_job(job_id) or job
 
     total_updated_count = finding_updated_count + comment_updated_count
     _record_job_event(
@@ -166,6 +196,7 @@ def _recompute_review_workflow_sla(
     }
 
 
+@_with_job_revision_retry
 def _set_critic_fatal_flaw_status(
     job_id: str,
     *,
@@ -183,7 +214,8 @@ def _set_critic_fatal_flaw_status(
         raise HTTPException(status_code=400, detail="Unsupported if_match_status")
     request_id_token = _normalize_request_id(request_id)
 
-    job = _normalize_critic_fatal_flaws_for_job(job_id) or _get_job(job_id)
+    _normalize_critic_fatal_flaws_for_job(job_id)
+    job, revision = _get_job_with_revision(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     idempotency_fingerprint = _idempotency_fingerprint(
@@ -256,7 +288,7 @@ def _set_critic_fatal_flaw_status(
     if changed and not dry_run:
         next_state = dict(state)
         write_state_critic_findings(next_state, next_flaws, previous_items=next_flaws, default_source="rules")
-        _update_job(job_id, state=next_state)
+        _update_job(job_id, expected_revision=revision, state=next_state)
         _record_job_event(
             job_id,
             "critic_finding_status_changed",
@@ -341,6 +373,7 @@ def _apply_critic_finding_status_transition(
     return current, True
 
 
+@_with_job_revision_retry
 def _set_critic_fatal_flaws_status_bulk(
     job_id: str,
     *,
@@ -390,7 +423,8 @@ def _set_critic_fatal_flaws_status_bulk(
         raise HTTPException(status_code=400, detail="Provide at least one selector or set apply_to_all=true")
     request_id_token = _normalize_request_id(request_id)
 
-    job = _normalize_critic_fatal_flaws_for_job(job_id) or _get_job(job_id)
+    _normalize_critic_fatal_flaws_for_job(job_id)
+    job, revision = _get_job_with_revision(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     idempotency_fingerprint = _idempotency_fingerprint(
@@ -504,7 +538,7 @@ def _set_critic_fatal_flaws_status_bulk(
     if changed and not dry_run:
         next_state = dict(state)
         write_state_critic_findings(next_state, next_flaws, previous_items=next_flaws, default_source="rules")
-        _update_job(job_id, state=next_state)
+        _update_job(job_id, expected_revision=revision, state=next_state)
         for updated in changed_items:
             _record_job_event(
                 job_id,
@@ -554,6 +588,7 @@ def _set_critic_fatal_flaws_status_bulk(
     return response
 
 
+@_with_job_revision_retry
 def _append_review_comment(
     job_id: str,
     *,
@@ -565,7 +600,7 @@ def _append_review_comment(
     linked_finding_severity: Optional[str] = None,
     request_id: Optional[str] = None,
 ) -> Dict[str, Any]:
-    job = _get_job(job_id)
+    job, revision = _get_job_with_revision(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     request_id_token = _normalize_request_id(request_id)
@@ -589,8 +624,6 @@ def _append_review_comment(
     if replay is not None:
         return replay
 
-    existing = job.get("review_comments")
-    comments = [c for c in existing if isinstance(c, dict)] if isinstance(existing, list) else []
     comment: Dict[str, Any] = {
         "comment_id": str(uuid.uuid4()),
         "ts": _utcnow_iso(),
@@ -608,8 +641,7 @@ def _append_review_comment(
         comment["linked_finding_id"] = linked_finding_id
     if request_id_token:
         comment["request_id"] = request_id_token
-    comments.append(comment)
-    _update_job(job_id, review_comments=comments[-500:])
+    _append_job_rows(job_id, "review_comments", [comment], keep_last=500, expected_revision=revision)
     _record_job_event(
         job_id,
         "review_comment_added",
@@ -631,6 +663,7 @@ def _append_review_comment(
     return comment
 
 
+@_with_job_revision_retry
 def _set_review_comment_status(
     job_id: str,
     *,
@@ -639,7 +672,7 @@ def _set_review_comment_status(
     actor: Optional[str] = None,
     request_id: Optional[str] = None,
 ) -> Dict[str, Any]:
-    job = _get_job(job_id)
+    job, revision = _get_job_with_revision(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     request_id_token = _normalize_request_id(request_id)
@@ -700,7 +733,7 @@ def _set_review_comment_status(
         raise HTTPException(status_code=404, detail="Comment not found")
 
     if changed:
-        _update_job(job_id, review_comments=next_comments[-500:])
+        _update_job(job_id, expected_revision=revision, review_comments=next_comments[-500:])
     if status_transitioned:
         _record_job_event(
             job_id,
@@ -727,6 +760,7 @@ def _set_review_comment_status(
     return response
 
 
+@_with_job_revision_retry
 def _set_review_comments_status_bulk(
     job_id: str,
     *,
@@ -774,7 +808,7 @@ def _set_review_comments_status_bulk(
         raise HTTPException(status_code=400, detail="Provide at least one selector or set apply_to_all=true")
 
     request_id_token = _normalize_request_id(request_id)
-    job = _get_job(job_id)
+    job, revision = _get_job_with_revision(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     idempotency_fingerprint = _idempotency_fingerprint(
@@ -895,7 +929,7 @@ def _set_review_comments_status_bulk(
         )
 
     if changed and not dry_run:
-        _update_job(job_id, review_comments=next_comments[-500:])
+        _update_job(job_id, expected_revision=revision, review_comments=next_comments[-500:])
         for updated in changed_items:
             _record_job_event(
                 job_id,
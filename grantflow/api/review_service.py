@@ -10,7 +10,15 @@ from grantflow.api.constants import (
     REVIEW_COMMENT_DEFAULT_SLA_HOURS,
     STATUS_WEBHOOK_EVENTS,
 )
-from grantflow.api.idempotency_store_facade import _get_job, _list_jobs, _record_job_event, _set_job, _update_job
+from grantflow.api.idempotency_store_facade import (
+    _get_job,
+    _get_job_with_revision,
+    _list_jobs,
+    _record_job_event,
+    _retry_on_job_revision_conflict,
+    _set_job,
+    _update_job,
+)
 from grantflow.api.public_views import public_job_payload
 from grantflow.api.review_helpers import _normalize_comment_sla_hours, _normalize_finding_sla_profile
 from grantflow.api.review_runtime_helpers import (
@@ -21,7 +29,7 @@ from grantflow.api.review_runtime_helpers import (
     _iso_plus_hours,
     _utcnow_iso,
 )
-from grantflow.api.webhooks import send_job_webhook_event
+from grantflow.api.webhooks import send_job_webhook_event, webhook_delivery_mode
 from grantflow.swarm.findings import finding_primary_id, state_critic_findings, write_state_critic_findings
 from grantflow.swarm.hitl import HITLStatus, hitl_manager
 from grantflow.swarm.state_contract import normalize_state_contract, state_donor_id
@@ -184,15 +192,35 @@ def _ensure_finding_due_at(
 
 
 def _normalize_critic_fatal_flaws_for_job(job_id: str) -> Optional[Dict[str, Any]]:
-    job = _get_job(job_id)
+    return _retry_on_job_revision_conflict(lambda: _normalize_critic_fatal_flaws_for_job_once(job_id))
+
+
+def _normalize_critic_fatal_flaws_for_job_once(job_id: str) -> Optional[Dict[str, Any]]:
+    job, revision = _get_job_with_revision(job_id)
     if not job:
         return None
+    next_state = _normalized_critic_fatal_flaws_state(job)
+    if next_state is None:
+        return job
+    return _update_job(job_id, expected_revision=revision, state=next_state)
+
+
+def _job_with_normalized_critic_fatal_flaws(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Read-only view of `job` as `_normalize_critic_fatal_flaws_for_job` would leave it; nothing is written."""
+    next_state = _normalized_critic_fatal_flaws_state(job)
+    if next_state is None:
+        return job
+    return {**job, "state": next_state}
+
+
+def _normalized_critic_fatal_flaws_state(job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The job state with critic findings normalized and due dates filled in, or None if nothing changes."""
     state = job.get("state")
     if not isinstance(state, dict):
-        return job
+        return None
     raw_flaws = state_critic_findings(state, default_source="rules")
     if not raw_flaws:
-        return job
+        return None
 
     now_iso = _utcnow_iso()
     normalized_with_due = [_ensure_finding_due_at(item, now_iso=now_iso) for item in raw_flaws]
@@ -205,13 +233,13 @@ def _normalize_critic_fatal_flaws_for_job(job_id: str) -> Optional[Dict[str, Any
     changed = normalized_with_due != existing_notes_flaws or normalized_with_due != existing_state_flaws
 
     if not changed:
-        return job
+        return None
 
     next_state = dict(state)
     write_state_critic_findings(
         next_state, normalized_with_due, previous_items=normalized_with_due, default_source="rules"
     )
-    return _update_job(job_id, state=next_state)
+    return next_state
 
 
 def _find_critic_fatal_flaw(job: Dict[str, Any], finding_id: str) -> Optional[Dict[str, Any]]:
@@ -276,7 +304,11 @@ def _ensure_comment_due_at(
 
 
 def _normalize_review_comments_for_job(job_id: str) -> Optional[Dict[str, Any]]:
-    job = _get_job(job_id)
+    return _retry_on_job_revision_conflict(lambda: _normalize_review_comments_for_job_once(job_id))
+
+
+def _normalize_review_comments_for_job_once(job_id: str) -> Optional[Dict[str, Any]]:
+    job, revision = _get_job_with_revision(job_id)
     if not job:
         return None
     raw_comments = job.get("review_comments")
@@ -287,7 +319,7 @@ def _normalize_review_comments_for_job(job_id: str) -> Optional[Dict[str, Any]]:
     normalized_comments = [_ensure_comment_due_at(comment, job=job, now_iso=now_iso) for comment in comments]
     if normalized_comments == comments:
         return job
-    return _update_job(job_id, review_comments=normalized_comments[-500:])
+    return _update_job(job_id, expected_revision=revision, review_comments=normalized_comments[-500:])
 
 
 def _job_is_canceled(job_id: str) -> bool:
@@ -320,6 +352,21 @@ def _dispatch_job_webhook_for_status_change(
     public_payload = public_job_payload(current)
     from grantflow.api import app as api_app_module
 
+    if webhook_delivery_mode() == "outbox":
+        # Persist the delivery and return; the worker pool owns retries and backoff.
+        try:
+            api_app_module.WEBHOOK_DELIVERY_WORKER.enqueue(
+                url=webhook_url,
+                secret=str(webhook_secret) if webhook_secret else None,
+                event=event_name,
+                job_id=job_id,
+                job=public_payload,
+            )
+            return
+        except Exception:
+            # The worker logged and counted the failed write; deliver synchronously rather than drop the event.
+            pass
+
     sender = getattr(api_app_module, "send_job_webhook_event", send_job_webhook_event)
     try:
         sender(
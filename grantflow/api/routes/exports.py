@@ -3,17 +3,18 @@ from __future__ import annotations
 import io
 import json
 import re
-import zipfile
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, Optional
 
-from fastapi import HTTPException, Query, Request
-from fastapi.responses import StreamingResponse
+from fastapi import BackgroundTasks, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
 from grantflow.api.idempotency_store_facade import (
     _get_job,
     _ingest_inventory,
-    _list_jobs,
+    _list_portfolio_jobs,
+    _portfolio_metrics_payload,
+    _portfolio_quality_payload,
 )
 from grantflow.api.orchestrator_service import (
     _configured_export_require_grounded_gate_pass,
@@ -23,6 +24,7 @@ from grantflow.api.orchestrator_service import (
 )
 from grantflow.api.review_service import (
     _hitl_history_payload,
+    _job_with_normalized_critic_fatal_flaws,
     _normalize_critic_fatal_flaws_for_job,
     _normalize_review_comments_for_job,
 )
@@ -60,9 +62,7 @@ from grantflow.api.public_views import (
     public_job_review_workflow_trends_csv_text,
     public_job_review_workflow_trends_payload,
     public_portfolio_metrics_csv_text,
-    public_portfolio_metrics_payload,
     public_portfolio_quality_csv_text,
-    public_portfolio_quality_payload,
     public_portfolio_review_workflow_csv_text,
     public_portfolio_review_workflow_payload,
     public_portfolio_review_workflow_sla_csv_text,
@@ -76,21 +76,34 @@ from grantflow.api.public_views import (
     public_portfolio_review_workflow_trends_csv_text,
     public_portfolio_review_workflow_trends_payload,
 )
-from grantflow.api.schemas import ExportRequest, JobExportPayloadPublicResponse
+from grantflow.api.portfolio_export_service import (
+    _portfolio_export_bundle_archive,
+    _portfolio_export_bundle_status_payload,
+    _start_portfolio_export_bundle,
+)
+from grantflow.api.schemas import (
+    ExportRequest,
+    JobExportPayloadPublicResponse,
+    PortfolioExportBundleRequest,
+    PortfolioExportBundleStatusPublicResponse,
+)
 from grantflow.api.security import require_api_key_if_configured
 from grantflow.api.tenant import (
     _ensure_job_tenant_read_access,
-    _filter_jobs_by_tenant,
     _job_donor_id,
     _job_tenant_id,
     _resolve_tenant_id,
 )
 from grantflow.api.routers import exports_router
 from grantflow.api.queue_admin_service import _redis_queue_admin_runner
+from grantflow.exporters.artifact_cache import export_artifact_cache, export_artifact_cache_key
 from grantflow.exporters.donor_contracts import evaluate_export_contract
+from grantflow.exporters.template_profile import resolve_export_template_key
 from grantflow.exporters.toc_normalization import normalize_toc_for_export
+from grantflow.exporters.zip_stream import iter_zip_stream
 from grantflow.core.evaluation_rfq import KATCH_EVALUATION_RFQ_PROFILE
 from grantflow.core.security_utils import resolve_allowed_attachment_path
+from grantflow.core.version import __version__
 
 
 def _annex_slug(value: object, *, fallback: str) -> str:
@@ -113,6 +126,89 @@ def _safe_attachment_export_name(*, index: int, attachment: str, source_path: st
     return f"{index:02d}_{stem}{suffix}"
 
 
+EXPORT_ARTIFACT_FORMATS = {"docx", "xlsx", "both"}
+
+
+def _export_attachment_fingerprints(toc_draft: dict) -> list[list[object]]:
+    """(path, size, mtime) of every staged annex file, so replacing a file on disk changes the export key."""
+    toc_root = toc_draft.get("toc") if isinstance(toc_draft.get("toc"), dict) else toc_draft
+    rows = toc_root.get("attachment_manifest") if isinstance(toc_root, dict) else None
+    fingerprints: list[list[object]] = []
+    for row in rows if isinstance(rows, list) else []:
+        source_path = _attachment_source_path(row) if isinstance(row, dict) else ""
+        if not source_path:
+            continue
+        source = resolve_allowed_attachment_path(source_path)
+        try:
+            stat = source.stat() if source is not None else None
+        except OSError:
+            stat = None
+        if stat is None:
+            fingerprints.append([source_path, None, None])
+        else:
+            fingerprints.append([str(source), int(stat.st_size), int(stat.st_mtime_ns)])
+    return fingerprints
+
+
+def _export_artifact_cache_key(
+    req: ExportRequest,
+    *,
+    fmt: str,
+    donor_id: str,
+    toc_draft: dict,
+    logframe_draft: dict,
+    citations: list[dict],
+    critic_findings: list[dict],
+    review_comments: list[dict],
+    quality_summary: dict,
+    export_contract_gate: dict,
+) -> str:
+    return export_artifact_cache_key(
+        builder_version=__version__,
+        format=fmt,
+        donor_id=donor_id,
+        template_key=resolve_export_template_key(donor_id=donor_id, toc_payload=toc_draft),
+        include_diagnostics=bool(req.include_diagnostics),
+        production_export=bool(req.production_export),
+        allow_unsafe_export=bool(req.allow_unsafe_export),
+        export_contract_gate=export_contract_gate,
+        toc_draft=toc_draft,
+        logframe_draft=logframe_draft,
+        citations=citations,
+        critic_findings=critic_findings,
+        review_comments=review_comments,
+        quality_summary=quality_summary,
+        attachments=_export_attachment_fingerprints(toc_draft) if fmt == "both" else [],
+    )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    for token in str(if_none_match or "").split(","):
+        candidate = token.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate and candidate == etag:
+            return True
+    return False
+
+
+def _export_artifact_response(
+    media_type: str,
+    headers: Dict[str, str],
+    chunks: Iterable[bytes],
+    *,
+    cache_key: str,
+    cache_status: str,
+) -> StreamingResponse:
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={**headers, "ETag": f'"{cache_key}"', "X-GrantFlow-Export-Cache": cache_status},
+    )
+
+
 def _adjust_submission_readiness_for_attachment_files(summary: dict, attachment_rows: list[dict]) -> dict:
     adjusted = dict(summary) if isinstance(summary, dict) else {}
     if not attachment_rows:
@@ -178,7 +274,9 @@ def _adjust_submission_readiness_for_attachment_files(summary: dict, attachment_
     return adjusted
 
 
-def _evaluation_rfq_annex_pack_artifacts(*, donor_id: str, toc_draft: dict, export_contract: dict) -> dict[str, bytes]:
+def _evaluation_rfq_annex_pack_artifacts(
+    *, donor_id: str, toc_draft: dict, export_contract: dict
+) -> dict[str, bytes | Path]:
     contract = evaluate_export_contract(donor_id=donor_id, toc_payload=toc_draft)
     if str(contract.get("template_key") or "") != "evaluation_rfq":
         return {}
@@ -235,7 +333,7 @@ def _evaluation_rfq_annex_pack_artifacts(*, donor_id: str, toc_draft: dict, expo
     else:
         lines.append("- none")
     lines.extend(["", "## Attachment Manifest"])
-    artifacts: dict[str, bytes] = {}
+    artifacts: dict[str, bytes | Path] = {}
     package_lines = [
         "# Submission Package Placeholder Structure",
         "",
@@ -306,7 +404,10 @@ def _evaluation_rfq_annex_pack_artifacts(*, donor_id: str, toc_draft: dict, expo
                 export_name = _safe_attachment_export_name(index=idx, attachment=attachment, source_path=str(source))
                 binary_path = f"{annex_folder}/files/{export_name}"
                 try:
-                    artifacts[binary_path] = source.read_bytes()
+                    with source.open("rb"):
+                        pass
+                    # Only readability is checked here; the ZIP stream copies the file from disk in chunks.
+                    artifacts[binary_path] = source
                     attached_file = True
                 except OSError:
                     attached_file = False
@@ -1162,9 +1263,8 @@ def export_portfolio_metrics(
 ):
     require_api_key_if_configured(request, for_read=True)
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
-    payload = public_portfolio_metrics_payload(
-        jobs,
+    payload = _portfolio_metrics_payload(
+        tenant_id=resolved_tenant_id,
         donor_id=(donor_id or None),
         status=(status or None),
         hitl_enabled=hitl_enabled,
@@ -1204,9 +1304,8 @@ def export_portfolio_quality(
 ):
     require_api_key_if_configured(request, for_read=True)
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
-    payload = public_portfolio_quality_payload(
-        jobs,
+    payload = _portfolio_quality_payload(
+        tenant_id=resolved_tenant_id,
         donor_id=(donor_id or None),
         status=(status or None),
         hitl_enabled=hitl_enabled,
@@ -1265,7 +1364,14 @@ def export_portfolio_review_workflow(
         detail="Unsupported finding_section filter",
     )
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
+    jobs = _list_portfolio_jobs(
+        tenant_id=resolved_tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
     payload = public_portfolio_review_workflow_payload(
         jobs,
         donor_id=(donor_id or None),
@@ -1330,7 +1436,14 @@ def export_portfolio_review_workflow_sla(
         detail="Unsupported finding_section filter",
     )
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
+    jobs = _list_portfolio_jobs(
+        tenant_id=resolved_tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
     payload = public_portfolio_review_workflow_sla_payload(
         jobs,
         donor_id=(donor_id or None),
@@ -1408,7 +1521,14 @@ def export_portfolio_review_workflow_sla_hotspots(
         detail="Unsupported hotspot_severity filter",
     )
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
+    jobs = _list_portfolio_jobs(
+        tenant_id=resolved_tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
     payload = public_portfolio_review_workflow_sla_hotspots_payload(
         jobs,
         donor_id=(donor_id or None),
@@ -1489,7 +1609,14 @@ def export_portfolio_review_workflow_sla_hotspots_trends(
         detail="Unsupported hotspot_severity filter",
     )
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
+    jobs = _list_portfolio_jobs(
+        tenant_id=resolved_tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
     payload = public_portfolio_review_workflow_sla_hotspots_trends_payload(
         jobs,
         donor_id=(donor_id or None),
@@ -1557,7 +1684,14 @@ def export_portfolio_review_workflow_trends(
         detail="Unsupported finding_section filter",
     )
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
+    jobs = _list_portfolio_jobs(
+        tenant_id=resolved_tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
     payload = public_portfolio_review_workflow_trends_payload(
         jobs,
         donor_id=(donor_id or None),
@@ -1621,7 +1755,14 @@ def export_portfolio_review_workflow_sla_trends(
         detail="Unsupported finding_section filter",
     )
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
+    jobs = _list_portfolio_jobs(
+        tenant_id=resolved_tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
     payload = public_portfolio_review_workflow_sla_trends_payload(
         jobs,
         donor_id=(donor_id or None),
@@ -2281,9 +2422,8 @@ def export_ingest_inventory(
     )
 
 
-@exports_router.post("/export")
-def export_artifacts(req: ExportRequest, request: Request):
-    require_api_key_if_configured(request)
+def _prepare_export(req: ExportRequest) -> Dict[str, Any]:
+    """Apply the request-level export policies (raising their 409 blocks) and resolve the builder inputs."""
     grounding_gate = _extract_export_grounding_gate(req)
     runtime_grounded_gate = _extract_export_runtime_grounded_quality_gate(req)
     if (
@@ -2352,115 +2492,262 @@ def export_artifacts(req: ExportRequest, request: Request):
                 "export_grounding_policy": export_grounding_policy,
             },
         )
-    try:
-        docx_bytes: Optional[bytes] = None
-        xlsx_bytes: Optional[bytes] = None
-
-        if fmt in {"docx", "both"}:
-            docx_bytes = _app_module().build_docx_from_toc(
-                toc_draft,
-                donor_id,
-                logframe_draft=logframe_draft,
-                citations=citations,
-                critic_findings=critic_findings,
-                review_comments=review_comments,
-                quality_summary=quality_summary,
-                include_diagnostics=bool(req.include_diagnostics),
-            )
+    cache_key = ""
+    if fmt in EXPORT_ARTIFACT_FORMATS:
+        cache_key = _export_artifact_cache_key(
+            req,
+            fmt=fmt,
+            donor_id=donor_id,
+            toc_draft=toc_draft,
+            logframe_draft=logframe_draft,
+            citations=citations,
+            critic_findings=critic_findings,
+            review_comments=review_comments,
+            quality_summary=quality_summary,
+            export_contract_gate=export_contract_gate,
+        )
+    return {
+        "fmt": fmt,
+        "donor_id": donor_id,
+        "toc_draft": toc_draft,
+        "logframe_draft": logframe_draft,
+        "citations": citations,
+        "critic_findings": critic_findings,
+        "review_comments": review_comments,
+        "quality_summary": quality_summary,
+        "export_contract_gate": export_contract_gate,
+        "cache_key": cache_key,
+    }
 
-        if fmt in {"xlsx", "both"}:
-            xlsx_bytes = _app_module().build_xlsx_from_logframe(
-                logframe_draft,
-                donor_id,
-                toc_draft=toc_draft,
-                citations=citations,
-                critic_findings=critic_findings,
-                review_comments=review_comments,
-                quality_summary=quality_summary,
+
+def _export_contract_headers(export_contract_gate: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        "X-GrantFlow-Export-Contract-Mode": str(export_contract_gate.get("mode") or ""),
+        "X-GrantFlow-Export-Contract-Status": str(export_contract_gate.get("status") or ""),
+        "X-GrantFlow-Export-Contract-Summary": str(export_contract_gate.get("summary") or ""),
+    }
+
+
+def _render_export(
+    req: ExportRequest, prepared: Dict[str, Any]
+) -> Optional[tuple[str, Dict[str, str], Iterable[bytes]]]:
+    """Run the builders and the workbook contract check, then return (media type, headers, body chunks).
+
+    The docx and xlsx are rendered up front so builder errors and the workbook contract block still surface as
+    500/409 before the response starts. The ZIP itself is never assembled in memory: its entries, including
+    the RFQ annex/submission kit files, are deflated straight into the response stream.
+    """
+    fmt = prepared["fmt"]
+    donor_id = prepared["donor_id"]
+    toc_draft = prepared["toc_draft"]
+    export_contract_gate = prepared["export_contract_gate"]
+    docx_bytes: Optional[bytes] = None
+    xlsx_bytes: Optional[bytes] = None
+
+    if fmt in {"docx", "both"}:
+        docx_bytes = _app_module().build_docx_from_toc(
+            toc_draft,
+            donor_id,
+            logframe_draft=prepared["logframe_draft"],
+            citations=prepared["citations"],
+            critic_findings=prepared["critic_findings"],
+            review_comments=prepared["review_comments"],
+            quality_summary=prepared["quality_summary"],
+            include_diagnostics=bool(req.include_diagnostics),
+        )
+
+    if fmt in {"xlsx", "both"}:
+        xlsx_build = _app_module().build_xlsx_with_manifest(
+            prepared["logframe_draft"],
+            donor_id,
+            toc_draft=toc_draft,
+            citations=prepared["citations"],
+            critic_findings=prepared["critic_findings"],
+            review_comments=prepared["review_comments"],
+            quality_summary=prepared["quality_summary"],
+        )
+        xlsx_bytes = xlsx_build.content
+        # The builder records sheet names and headers while writing, so the gate never re-opens the workbook.
+        workbook_sheetnames, workbook_primary_sheet_headers = _xlsx_contract_validation_context(
+            xlsx_build.manifest,
+            donor_id=donor_id,
+        )
+        export_contract_gate = _evaluate_export_contract_gate(
+            donor_id=donor_id,
+            toc_draft=toc_draft,
+            workbook_sheetnames=workbook_sheetnames,
+            workbook_primary_sheet_headers=workbook_primary_sheet_headers,
+        )
+        if req.production_export and not req.allow_unsafe_export and bool(export_contract_gate.get("blocking")):
+            raise HTTPException(
+                status_code=409,
+                detail={
+                    "reason": "export_contract_policy_block",
+                    "message": (
+                        "Export blocked by strict export contract policy "
+                        "(missing required donor sections/sheets). "
+                        "Set allow_unsafe_export=true to override, or use production_export=false."
+                    ),
+                    "export_contract_gate": export_contract_gate,
+                },
             )
 
-        if xlsx_bytes is not None:
-            workbook_sheetnames, workbook_primary_sheet_headers = _xlsx_contract_validation_context(
-                xlsx_bytes,
+    export_headers = _export_contract_headers(export_contract_gate)
+
+    if fmt == "docx" and docx_bytes is not None:
+        return (
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            {"Content-Disposition": "attachment; filename=proposal.docx", **export_headers},
+            [docx_bytes],
+        )
+
+    if fmt == "xlsx" and xlsx_bytes is not None:
+        return (
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            {"Content-Disposition": "attachment; filename=mel.xlsx", **export_headers},
+            [xlsx_bytes],
+        )
+
+    if fmt == "both" and docx_bytes is not None and xlsx_bytes is not None:
+        built = {"proposal.docx": docx_bytes, "mel.xlsx": xlsx_bytes}
+        del docx_bytes, xlsx_bytes
+
+        def zip_entries() -> Iterator[tuple[str, bytes | Path]]:
+            # Pop each built document so it is released once deflated.
+            for filename in ("proposal.docx", "mel.xlsx"):
+                yield filename, built.pop(filename)
+            yield from _evaluation_rfq_annex_pack_artifacts(
                 donor_id=donor_id,
-            )
-            export_contract_gate = _evaluate_export_contract_gate(
+                toc_draft=toc_draft,
+                export_contract=export_contract_gate,
+            ).items()
+            yield from _evaluation_rfq_submission_kit_artifacts(
                 donor_id=donor_id,
                 toc_draft=toc_draft,
-                workbook_sheetnames=workbook_sheetnames,
-                workbook_primary_sheet_headers=workbook_primary_sheet_headers,
-            )
-            if req.production_export and not req.allow_unsafe_export and bool(export_contract_gate.get("blocking")):
-                raise HTTPException(
-                    status_code=409,
-                    detail={
-                        "reason": "export_contract_policy_block",
-                        "message": (
-                            "Export blocked by strict export contract policy "
-                            "(missing required donor sections/sheets). "
-                            "Set allow_unsafe_export=true to override, or use production_export=false."
-                        ),
-                        "export_contract_gate": export_contract_gate,
-                    },
-                )
+                export_contract=export_contract_gate,
+            ).items()
 
-        export_headers = {
-            "X-GrantFlow-Export-Contract-Mode": str(export_contract_gate.get("mode") or ""),
-            "X-GrantFlow-Export-Contract-Status": str(export_contract_gate.get("status") or ""),
-            "X-GrantFlow-Export-Contract-Summary": str(export_contract_gate.get("summary") or ""),
-        }
-
-        if fmt == "docx" and docx_bytes is not None:
-            headers = {
-                "Content-Disposition": "attachment; filename=proposal.docx",
-                **export_headers,
-            }
-            return StreamingResponse(
-                io.BytesIO(docx_bytes),
-                media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                headers=headers,
-            )
+        return (
+            "application/zip",
+            {"Content-Disposition": "attachment; filename=grantflow_export.zip", **export_headers},
+            iter_zip_stream(zip_entries()),
+        )
+    return None
 
-        if fmt == "xlsx" and xlsx_bytes is not None:
-            headers = {
-                "Content-Disposition": "attachment; filename=mel.xlsx",
-                **export_headers,
-            }
-            return StreamingResponse(
-                io.BytesIO(xlsx_bytes),
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                headers=headers,
-            )
 
-        if fmt == "both" and docx_bytes is not None and xlsx_bytes is not None:
-            buf = io.BytesIO()
-            with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-                archive.writestr("proposal.docx", docx_bytes)
-                archive.writestr("mel.xlsx", xlsx_bytes)
-                for filename, content in _evaluation_rfq_annex_pack_artifacts(
-                    donor_id=donor_id,
-                    toc_draft=toc_draft,
-                    export_contract=export_contract_gate,
-                ).items():
-                    archive.writestr(filename, content)
-                for filename, content in _evaluation_rfq_submission_kit_artifacts(
-                    donor_id=donor_id,
-                    toc_draft=toc_draft,
-                    export_contract=export_contract_gate,
-                ).items():
-                    archive.writestr(filename, content)
-            buf.seek(0)
-            return StreamingResponse(
-                buf,
-                media_type="application/zip",
-                headers={
-                    "Content-Disposition": "attachment; filename=grantflow_export.zip",
-                    **export_headers,
-                },
-            )
+@exports_router.post("/export")
+def export_artifacts(req: ExportRequest, request: Request):
+    require_api_key_if_configured(request)
+    prepared = _prepare_export(req)
+    cache_key = prepared["cache_key"]
+    if cache_key:
+        etag = f'"{cache_key}"'
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        cached = export_artifact_cache.get(cache_key)
+        if cached is not None:
+            try:
+                return _export_artifact_response(
+                    cached.media_type,
+                    cached.headers,
+                    cached.iter_chunks(),
+                    cache_key=cache_key,
+                    cache_status="hit",
+                )
+            except OSError:
+                pass
+    try:
+        rendered = _render_export(req, prepared)
     except HTTPException:
         raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+    if rendered is None:
+        raise HTTPException(status_code=400, detail="Unsupported format")
+    media_type, headers, chunks = rendered
+    return _export_artifact_response(
+        media_type,
+        headers,
+        export_artifact_cache.tee(cache_key, chunks, media_type=media_type, headers=headers),
+        cache_key=cache_key,
+        cache_status="miss",
+    )
+
+
+def _job_export_request(
+    job_id: str, *, include_diagnostics: bool = False, read_only: bool = False
+) -> Optional[ExportRequest]:
+    """The `POST /export` request the review UI builds from `GET /status/{job_id}/export-payload`, format=both.
+
+    Background renders pass ``read_only``: critic findings are normalized in the returned payload only, never
+    written back, so they cannot race review mutations on the job.
+    """
+    if read_only:
+        stored = _get_job(job_id)
+        job = _job_with_normalized_critic_fatal_flaws(stored) if stored else None
+    else:
+        job = _normalize_critic_fatal_flaws_for_job(job_id) or _get_job(job_id)
+    if not job:
+        return None
+    inventory_rows = _ingest_inventory(donor_id=_job_donor_id(job) or None, tenant_id=_job_tenant_id(job))
+    export_payload = JobExportPayloadPublicResponse.model_validate(
+        public_job_export_payload(job_id, job, ingest_inventory_rows=inventory_rows)
+    ).model_dump(mode="json", exclude_none=True)
+    return ExportRequest(payload=export_payload["payload"], format="both", include_diagnostics=include_diagnostics)
+
+
+def _prerender_job_export_bundle(job_id: str) -> Dict[str, Any]:
+    """Render a finished job's default ZIP bundle into the export artifact cache.
+
+    Builds the same request the review UI sends (`GET /status/{job_id}/export-payload`, then `POST /export`
+    with format=both), so the first download of an unchanged job is a cache hit. Reads the job without writing.
+    """
+    req = _job_export_request(job_id, read_only=True)
+    if req is None:
+        return {"status": "missing"}
+    try:
+        prepared = _prepare_export(req)
+        cache_key = prepared["cache_key"]
+        if cache_key in export_artifact_cache:
+            return {"status": "cached", "cache_key": cache_key}
+        rendered = _render_export(req, prepared)
+    except HTTPException as exc:
+        return {"status": "blocked", "http_status": exc.status_code}
+    if rendered is None:
+        return {"status": "skipped"}
+    media_type, headers, chunks = rendered
+    size = 0
+    for chunk in export_artifact_cache.tee(cache_key, chunks, media_type=media_type, headers=headers):
+        size += len(chunk)
+    return {"status": "rendered", "cache_key": cache_key, "bytes": size}
+
+
+@exports_router.post(
+    "/portfolio/export/bundle",
+    response_model=PortfolioExportBundleStatusPublicResponse,
+    response_model_exclude_none=True,
+)
+def create_portfolio_export_bundle(
+    req: PortfolioExportBundleRequest,
+    background_tasks: BackgroundTasks,
+    request: Request,
+):
+    require_api_key_if_configured(request)
+    return _start_portfolio_export_bundle(req, background_tasks, request)
 
-    raise HTTPException(status_code=400, detail="Unsupported format")
+
+@exports_router.get(
+    "/portfolio/export/bundle/{bundle_id}",
+    response_model=PortfolioExportBundleStatusPublicResponse,
+    response_model_exclude_none=True,
+)
+def get_portfolio_export_bundle(bundle_id: str, request: Request):
+    require_api_key_if_configured(request, for_read=True)
+    return _portfolio_export_bundle_status_payload(bundle_id, request)
+
+
+@exports_router.get("/portfolio/export/bundle/{bundle_id}/download")
+def download_portfolio_export_bundle(bundle_id: str, request: Request):
+    require_api_key_if_configured(request, for_read=True)
+    archive_path, filename = _portfolio_export_bundle_archive(bundle_id, request)
+    return FileResponse(archive_path, media_type="application/zip", filename=filename)
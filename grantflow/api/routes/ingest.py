@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import json
+import os
 import tempfile
 from typing import Any, Dict, Optional
 
 from fastapi import File, Form, HTTPException, Query, Request, UploadFile
+from starlette.concurrency import run_in_threadpool
 
+from grantflow.api.blocking_executor import run_blocking
 from grantflow.api.idempotency_store_facade import (
     _ingest_inventory,
     _list_ingest_events,
@@ -28,6 +31,8 @@ from grantflow.api.routers import ingest_router
 from grantflow.core.strategies.factory import DonorFactory
 from grantflow.memory_bank.vector_store import vector_store
 
+UPLOAD_READ_CHUNK_BYTES = 1024 * 1024
+
 
 def _app_module():
     from grantflow.api import app as api_app_module
@@ -144,10 +149,6 @@ async def ingest_pdf(
             raise HTTPException(status_code=400, detail="metadata_json must decode to an object")
         metadata = parsed
 
-    content = await file.read()
-    if not content:
-        raise HTTPException(status_code=400, detail="Uploaded file is empty")
-
     resolved_tenant_id = _resolve_tenant_id(
         request,
         explicit_tenant=tenant_id,
@@ -169,23 +170,41 @@ async def ingest_pdf(
 
     tmp_path: Optional[str] = None
     try:
+        # Spool the upload to disk in fixed-size reads instead of buffering the whole PDF in memory.
+        upload_size = 0
         with tempfile.NamedTemporaryFile(prefix="grantflow_ingest_", suffix=".pdf", delete=False) as tmp:
-            tmp.write(content)
             tmp_path = tmp.name
-        result = _app_module().ingest_pdf_to_namespace(tmp_path, namespace=namespace, metadata=upload_metadata)
+            while True:
+                block = await file.read(UPLOAD_READ_CHUNK_BYTES)
+                if not block:
+                    break
+                tmp.write(block)
+                upload_size += len(block)
+        if not upload_size:
+            raise HTTPException(status_code=400, detail="Uploaded file is empty")
+        # PDF parsing, embedding and vector upserts run on the bounded ingest pool, not the event loop.
+        result = await run_blocking(
+            "ingest",
+            _app_module().ingest_pdf_to_namespace,
+            tmp_path,
+            namespace=namespace,
+            metadata=upload_metadata,
+        )
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Ingest failed: {exc}") from exc
     finally:
         if tmp_path:
             try:
-                import os
-
                 os.unlink(tmp_path)
             except FileNotFoundError:
                 pass
 
     result_payload = result if isinstance(result, dict) else {"raw_result": str(result)}
-    _record_ingest_event(
+    # The upload has landed, so its audit row is written even when the ingest pool is shedding load.
+    await run_in_threadpool(
+        _record_ingest_event,
         donor_id=donor,
         namespace=namespace,
         filename=filename,
@@ -4,11 +4,16 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from fastapi import BackgroundTasks, HTTPException, Query, Request
+from fastapi import BackgroundTasks, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
+from grantflow.api.batch_service import _dispatch_generate_batch, _generate_batch_status_payload
 from grantflow.api.bid_no_bid import evaluate_bid_no_bid
+from grantflow.api.blocking_executor import run_blocking
 from grantflow.api.idempotency_store_facade import (
     _get_job,
+    _get_job_with_revision,
     _ingest_inventory,
     _record_job_event,
     _set_job,
@@ -24,7 +29,7 @@ from grantflow.api.pipeline_jobs import (
 from grantflow.api.review_service import _normalize_critic_fatal_flaws_for_job
 from grantflow.api.runtime_service import (
     _job_runner_mode,
-    _uses_redis_queue_runner,
+    _uses_job_id_dispatch,
 )
 from grantflow.api.idempotency import (
     _global_idempotency_replay_response,
@@ -52,6 +57,7 @@ from grantflow.api.schemas import (
     BidNoBidResponse,
     BidNoBidTrailResponse,
     GenerateAcceptedPublicResponse,
+    GenerateBatchStatusPublicResponse,
     GenerateFromPresetAcceptedPublicResponse,
     GenerateFromPresetBatchRequest,
     GenerateFromPresetBatchPublicResponse,
@@ -70,6 +76,12 @@ from grantflow.api.schemas import (
     JobVersionsPublicResponse,
 )
 from grantflow.api.security import require_api_key_if_configured
+from grantflow.api.status_stream import (
+    STATUS_STREAM_MAX_SECONDS,
+    STATUS_WAIT_MAX_TIMEOUT_SECONDS,
+    job_status_event_stream,
+    wait_for_job_change,
+)
 from grantflow.api.tenant import (
     _ensure_job_tenant_read_access,
     _ensure_job_tenant_write_access,
@@ -78,6 +90,7 @@ from grantflow.api.tenant import (
     _resolve_tenant_id,
 )
 from grantflow.api.routers import jobs_router
+from grantflow.api.webhooks import public_webhook_delivery
 from grantflow.core.config import config
 from grantflow.core.strategies.factory import DonorFactory
 from grantflow.swarm.hitl import HITLStatus, hitl_manager
@@ -226,12 +239,7 @@ def _maybe_refresh_bid_no_bid_decision(job_id: str, job: Dict[str, Any]) -> Dict
     return _get_job(job_id) or job
 
 
-@jobs_router.post(
-    "/generate/preflight",
-    response_model=GeneratePreflightPublicResponse,
-    response_model_exclude_none=True,
-)
-def generate_preflight(req: GeneratePreflightRequest, request: Request):
+def _build_preflight_for_request(req: GeneratePreflightRequest, request: Request):
     require_api_key_if_configured(request)
     donor, strategy, client_metadata = _resolve_preflight_request_context(
         request=request,
@@ -248,6 +256,15 @@ def generate_preflight(req: GeneratePreflightRequest, request: Request):
     )
 
 
+@jobs_router.post(
+    "/generate/preflight",
+    response_model=GeneratePreflightPublicResponse,
+    response_model_exclude_none=True,
+)
+async def generate_preflight(req: GeneratePreflightRequest, request: Request):
+    return await run_blocking("generate", _build_preflight_for_request, req, request)
+
+
 @jobs_router.post(
     "/generate/from-preset",
     response_model=GenerateFromPresetAcceptedPublicResponse,
@@ -280,75 +297,26 @@ async def generate_from_preset_batch(
     request_id: Optional[str] = Query(default=None),
 ):
     require_api_key_if_configured(request)
-    items = list(req.items or [])
-    if not items:
-        raise HTTPException(status_code=400, detail="items must be non-empty")
-    if len(items) > 25:
-        raise HTTPException(status_code=400, detail="items limit exceeded (max 25)")
-
-    results: list[dict[str, Any]] = []
-    accepted_count = 0
-    error_count = 0
-    request_id_prefix = str(request_id or "").strip()
-
-    for idx, item in enumerate(items):
-        preset_key = str(item.preset_key or "").strip()
-        if request_id_prefix:
-            item_request_id = f"{request_id_prefix}:{idx}"[:120]
-        else:
-            item_request_id = None
-        try:
-            result = await _dispatch_generate_from_preset(
-                item,
-                background_tasks,
-                request,
-                request_id=item_request_id,
-            )
-            row = dict(result) if isinstance(result, dict) else {"result": result}
-            row["index"] = idx
-            results.append(row)
-            accepted_count += 1
-        except HTTPException as exc:
-            error_count += 1
-            error_row = {
-                "index": idx,
-                "preset_key": preset_key,
-                "status": "error",
-                "http_status": int(exc.status_code),
-                "error": exc.detail,
-            }
-            results.append(error_row)
-            if not req.continue_on_error:
-                raise HTTPException(
-                    status_code=exc.status_code,
-                    detail={
-                        "reason": "generate_from_preset_batch_item_failed",
-                        "index": idx,
-                        "preset_key": preset_key,
-                        "item_error": exc.detail,
-                        "results": results,
-                    },
-                ) from exc
-
-    return {
-        "status": "accepted" if error_count == 0 else "partial_error",
-        "total": len(items),
-        "accepted_count": accepted_count,
-        "error_count": error_count,
-        "results": results,
-    }
+    return await _dispatch_generate_batch(req, background_tasks, request, request_id=request_id)
 
 
-@jobs_router.post(
-    "/generate",
-    response_model=GenerateAcceptedPublicResponse,
+@jobs_router.get(
+    "/generate/batches/{batch_id}",
+    response_model=GenerateBatchStatusPublicResponse,
     response_model_exclude_none=True,
 )
-async def generate(
+async def get_generate_batch_status(batch_id: str, request: Request):
+    require_api_key_if_configured(request, for_read=True)
+    return await run_in_threadpool(_generate_batch_status_payload, batch_id, request)
+
+
+def _accept_generate_request(
     req: GenerateRequest,
     background_tasks: BackgroundTasks,
     request: Request,
-    request_id: Optional[str] = Query(default=None),
+    request_id: Optional[str],
+    *,
+    batch: Optional[Dict[str, Any]] = None,
 ):
     require_api_key_if_configured(request)
     request_id_token = _resolve_request_id(request, request_id if request_id is not None else req.request_id)
@@ -483,20 +451,21 @@ async def generate(
         },
     )
 
-    _set_job(
-        job_id,
-        {
-            "status": "accepted",
-            "state": initial_state,
-            "hitl_enabled": req.hitl_enabled,
-            "webhook_url": webhook_url,
-            "webhook_secret": webhook_secret,
-            "client_metadata": client_metadata,
-            "generate_preflight": preflight_payload,
-            "strict_preflight": req.strict_preflight,
-            "require_grounded_generation": req.require_grounded_generation,
-        },
-    )
+    job_payload: Dict[str, Any] = {
+        "status": "accepted",
+        "state": initial_state,
+        "hitl_enabled": req.hitl_enabled,
+        "webhook_url": webhook_url,
+        "webhook_secret": webhook_secret,
+        "client_metadata": client_metadata,
+        "generate_preflight": preflight_payload,
+        "strict_preflight": req.strict_preflight,
+        "require_grounded_generation": req.require_grounded_generation,
+    }
+    if batch:
+        # Kept out of client_metadata so batch membership does not change idempotency fingerprints.
+        job_payload["batch"] = dict(batch)
+    _set_job(job_id, job_payload)
     _record_job_event(
         job_id,
         "generate_preflight_evaluated",
@@ -516,7 +485,7 @@ async def generate(
     try:
         queue_backend = "background_tasks"
         if req.hitl_enabled:
-            if _uses_redis_queue_runner():
+            if _uses_job_id_dispatch():
                 queue_backend = _dispatch_pipeline_task(
                     background_tasks, _app_module()._run_hitl_pipeline_by_job_id, job_id, "start"
                 )
@@ -525,7 +494,7 @@ async def generate(
                     background_tasks, _app_module()._run_hitl_pipeline, job_id, initial_state, "start"
                 )
         else:
-            if _uses_redis_queue_runner():
+            if _uses_job_id_dispatch():
                 queue_backend = _dispatch_pipeline_task(
                     background_tasks, _app_module()._run_pipeline_to_completion_by_job_id, job_id
                 )
@@ -572,6 +541,21 @@ async def generate(
     return response
 
 
+@jobs_router.post(
+    "/generate",
+    response_model=GenerateAcceptedPublicResponse,
+    response_model_exclude_none=True,
+)
+async def generate(
+    req: GenerateRequest,
+    background_tasks: BackgroundTasks,
+    request: Request,
+    request_id: Optional[str] = Query(default=None),
+):
+    # Preflight retrieval/ToC synthesis and job writes block; keep them off the event loop.
+    return await run_blocking("generate", _accept_generate_request, req, background_tasks, request, request_id)
+
+
 @jobs_router.post("/cancel/{job_id}")
 def cancel_job(job_id: str, request: Request, request_id: Optional[str] = Query(default=None)):
     require_api_key_if_configured(request)
@@ -645,12 +629,11 @@ def cancel_job(job_id: str, request: Request, request_id: Optional[str] = Query(
     return response
 
 
-@jobs_router.post("/resume/{job_id}")
-async def resume_job(
+def _accept_resume_request(
     job_id: str,
     background_tasks: BackgroundTasks,
     request: Request,
-    request_id: Optional[str] = Query(default=None),
+    request_id: Optional[str],
 ):
     require_api_key_if_configured(request)
     job = _get_job(job_id)
@@ -720,7 +703,7 @@ async def resume_job(
         request_id=request_id_token,
     )
     try:
-        if _uses_redis_queue_runner():
+        if _uses_job_id_dispatch():
             queue_backend = _dispatch_pipeline_task(
                 background_tasks, _app_module()._run_hitl_pipeline_by_job_id, job_id, start_at
             )
@@ -779,16 +762,58 @@ async def resume_job(
     return response
 
 
+@jobs_router.post("/resume/{job_id}")
+async def resume_job(
+    job_id: str,
+    background_tasks: BackgroundTasks,
+    request: Request,
+    request_id: Optional[str] = Query(default=None),
+):
+    return await run_blocking("generate", _accept_resume_request, job_id, background_tasks, request, request_id)
+
+
 @jobs_router.get("/status/{job_id}", response_model=JobStatusPublicResponse, response_model_exclude_none=True)
-def get_status(job_id: str, request: Request):
+async def get_status(
+    job_id: str,
+    request: Request,
+    response: Response,
+    wait_for_change: Optional[int] = Query(default=None, ge=0),
+    timeout: float = Query(default=30.0, ge=0.0, le=STATUS_WAIT_MAX_TIMEOUT_SECONDS),
+):
     require_api_key_if_configured(request, for_read=True)
-    job = _get_job(job_id)
+    job, revision = await run_in_threadpool(_get_job_with_revision, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     _ensure_job_tenant_read_access(request, job)
+    if wait_for_change is not None and int(revision or 0) == wait_for_change:
+        job, revision = await wait_for_job_change(job_id, known_revision=wait_for_change, timeout=timeout)
+    response.headers["X-Job-Revision"] = str(int(revision or 0))
     return public_job_payload(job)
 
 
+@jobs_router.get("/status/{job_id}/stream")
+async def stream_status(
+    job_id: str,
+    request: Request,
+    since_revision: Optional[int] = Query(default=None, ge=0),
+    timeout: float = Query(default=STATUS_STREAM_MAX_SECONDS, gt=0.0, le=STATUS_STREAM_MAX_SECONDS),
+    last_event_id: Optional[str] = Header(default=None, alias="Last-Event-ID"),
+):
+    require_api_key_if_configured(request, for_read=True)
+    job = await run_in_threadpool(_get_job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    _ensure_job_tenant_read_access(request, job)
+    resume_revision = since_revision
+    if resume_revision is None and str(last_event_id or "").strip().isdigit():
+        resume_revision = int(str(last_event_id).strip())
+    return StreamingResponse(
+        job_status_event_stream(job_id, since_revision=resume_revision, max_seconds=timeout),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @jobs_router.get(
     "/status/{job_id}/citations",
     response_model=JobCitationsPublicResponse,
@@ -854,7 +879,8 @@ def get_status_events(job_id: str, request: Request):
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     _ensure_job_tenant_read_access(request, job)
-    return public_job_events_payload(job_id, job)
+    deliveries = [public_webhook_delivery(row) for row in _app_module().WEBHOOK_OUTBOX.list_for_job(job_id)]
+    return public_job_events_payload(job_id, job, webhook_deliveries=deliveries)
 
 
 @jobs_router.get(
@@ -4,13 +4,17 @@ from typing import Optional
 
 from fastapi import HTTPException, Query, Request
 
-from grantflow.api.idempotency_store_facade import _list_jobs
+from grantflow.api.idempotency_store_facade import (
+    _check_portfolio_aggregates,
+    _list_portfolio_jobs,
+    _portfolio_metrics_payload,
+    _portfolio_quality_payload,
+    _rebuild_portfolio_aggregates,
+)
 from grantflow.api.filters import _validated_filter_token
 from grantflow.api.public_views import (
     REVIEW_WORKFLOW_OVERDUE_DEFAULT_HOURS,
     REVIEW_WORKFLOW_STATE_FILTER_VALUES,
-    public_portfolio_metrics_payload,
-    public_portfolio_quality_payload,
     public_portfolio_review_workflow_payload,
     public_portfolio_review_workflow_sla_hotspots_payload,
     public_portfolio_review_workflow_sla_hotspots_trends_payload,
@@ -20,6 +24,8 @@ from grantflow.api.public_views import (
 )
 from grantflow.api.routers import portfolio_router
 from grantflow.api.schemas import (
+    PortfolioAggregateCheckPublicResponse,
+    PortfolioAggregateStatsPublicResponse,
     PortfolioMetricsPublicResponse,
     PortfolioQualityPublicResponse,
     PortfolioReviewWorkflowPublicResponse,
@@ -30,7 +36,7 @@ from grantflow.api.schemas import (
     PortfolioReviewWorkflowTrendsPublicResponse,
 )
 from grantflow.api.security import require_api_key_if_configured
-from grantflow.api.tenant import _filter_jobs_by_tenant, _resolve_tenant_id
+from grantflow.api.tenant import _resolve_tenant_id
 
 
 @portfolio_router.get(
@@ -51,9 +57,38 @@ def get_portfolio_metrics(
 ):
     require_api_key_if_configured(request, for_read=True)
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
-    return public_portfolio_metrics_payload(
-        jobs,
+    return _portfolio_metrics_payload(
+        tenant_id=resolved_tenant_id,
+        donor_id=(donor_id or None),
+        status=(status or None),
+        hitl_enabled=hitl_enabled,
+        warning_level=(warning_level or None),
+        grounding_risk_level=(grounding_risk_level or None),
+        toc_text_risk_level=(toc_text_risk_level or None),
+        mel_risk_level=(mel_risk_level or None),
+    )
+
+
+@portfolio_router.get(
+    "/portfolio/metrics/aggregates/check",
+    response_model=PortfolioAggregateCheckPublicResponse,
+    response_model_exclude_none=True,
+)
+def check_portfolio_metrics_aggregates(
+    request: Request,
+    donor_id: Optional[str] = None,
+    tenant_id: Optional[str] = Query(default=None),
+    status: Optional[str] = None,
+    hitl_enabled: Optional[bool] = Query(default=None),
+    warning_level: Optional[str] = None,
+    grounding_risk_level: Optional[str] = None,
+    toc_text_risk_level: Optional[str] = None,
+    mel_risk_level: Optional[str] = None,
+):
+    require_api_key_if_configured(request, for_read=True)
+    resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
+    return _check_portfolio_aggregates(
+        tenant_id=resolved_tenant_id,
         donor_id=(donor_id or None),
         status=(status or None),
         hitl_enabled=hitl_enabled,
@@ -64,6 +99,16 @@ def get_portfolio_metrics(
     )
 
 
+@portfolio_router.post(
+    "/portfolio/metrics/aggregates/rebuild",
+    response_model=PortfolioAggregateStatsPublicResponse,
+    response_model_exclude_none=True,
+)
+def rebuild_portfolio_metrics_aggregates(request: Request):
+    require_api_key_if_configured(request)
+    return _rebuild_portfolio_aggregates()
+
+
 @portfolio_router.get(
     "/portfolio/quality",
     response_model=PortfolioQualityPublicResponse,
@@ -84,9 +129,8 @@ def get_portfolio_quality(
 ):
     require_api_key_if_configured(request, for_read=True)
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
-    return public_portfolio_quality_payload(
-        jobs,
+    return _portfolio_quality_payload(
+        tenant_id=resolved_tenant_id,
         donor_id=(donor_id or None),
         status=(status or None),
         hitl_enabled=hitl_enabled,
@@ -136,7 +180,14 @@ def get_portfolio_review_workflow(
         detail="Unsupported finding_section filter",
     )
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
+    jobs = _list_portfolio_jobs(
+        tenant_id=resolved_tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
     return public_portfolio_review_workflow_payload(
         jobs,
         donor_id=(donor_id or None),
@@ -192,7 +243,14 @@ def get_portfolio_review_workflow_sla(
         detail="Unsupported finding_section filter",
     )
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
+    jobs = _list_portfolio_jobs(
+        tenant_id=resolved_tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
     return public_portfolio_review_workflow_sla_payload(
         jobs,
         donor_id=(donor_id or None),
@@ -261,7 +319,14 @@ def get_portfolio_review_workflow_sla_hotspots(
         detail="Unsupported hotspot_severity filter",
     )
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
+    jobs = _list_portfolio_jobs(
+        tenant_id=resolved_tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
     return public_portfolio_review_workflow_sla_hotspots_payload(
         jobs,
         donor_id=(donor_id or None),
@@ -333,7 +398,14 @@ def get_portfolio_review_workflow_sla_hotspots_trends(
         detail="Unsupported hotspot_severity filter",
     )
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
+    jobs = _list_portfolio_jobs(
+        tenant_id=resolved_tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
     return public_portfolio_review_workflow_sla_hotspots_trends_payload(
         jobs,
         donor_id=(donor_id or None),
@@ -392,7 +464,14 @@ def get_portfolio_review_workflow_trends(
         detail="Unsupported finding_section filter",
     )
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
+    jobs = _list_portfolio_jobs(
+        tenant_id=resolved_tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
     return public_portfolio_review_workflow_trends_payload(
         jobs,
         donor_id=(donor_id or None),
@@ -447,7 +526,14 @@ def get_portfolio_review_workflow_sla_trends(
         detail="Unsupported finding_section filter",
     )
     resolved_tenant_id = _resolve_tenant_id(request, explicit_tenant=tenant_id, require_if_enabled=True)
-    jobs = _filter_jobs_by_tenant(_list_jobs(), resolved_tenant_id)
+    jobs = _list_portfolio_jobs(
+        tenant_id=resolved_tenant_id,
+        donor_id=donor_id,
+        status=status,
+        hitl_enabled=hitl_enabled,
+        warning_level=warning_level,
+        grounding_risk_level=grounding_risk_level,
+    )
     return public_portfolio_review_workflow_sla_trends_payload(
         jobs,
         donor_id=(donor_id or None),
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import logging
 import os
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Optional
 
 from fastapi import FastAPI
 
@@ -10,13 +11,19 @@ from grantflow.api.diagnostics_service import (
     _configured_runtime_compatibility_policy_mode,
     _tenant_authz_configuration_status,
 )
+from grantflow.api.portfolio_export_service import portfolio_render_pool
 from grantflow.api.security import api_key_configured
+from grantflow.api.webhooks import webhook_delivery_mode
 from grantflow.core.config import config
-from grantflow.core.job_runner import InMemoryJobRunner, RedisJobRunner
+from grantflow.core.job_changes import JobChangeNotifier, RedisJobChangeBridge, job_change_recheck_seconds_from_env
+from grantflow.core.job_runner import InMemoryJobRunner, ProcessPoolJobRunner, RedisJobRunner
+from grantflow.core.strategies.factory import donor_registry
 
-JOB_RUNNER_MODES = {"background_tasks", "inmemory_queue", "redis_queue"}
+JOB_RUNNER_MODES = {"background_tasks", "inmemory_queue", "redis_queue", "process_pool"}
 PRODUCTION_ENV_TOKENS = {"prod", "production"}
 
+logger = logging.getLogger(__name__)
+
 
 def _app_module():
     from grantflow.api import app as api_app_module
@@ -40,6 +47,18 @@ def _job_runner():
     return _app_module().JOB_RUNNER
 
 
+def _webhook_delivery_worker():
+    return _app_module().WEBHOOK_DELIVERY_WORKER
+
+
+def _blocking_executor():
+    return _app_module().BLOCKING_EXECUTOR
+
+
+def _job_change_notifier():
+    return _app_module().JOB_CHANGE_NOTIFIER
+
+
 def _job_runner_mode() -> str:
     raw_mode = str(getattr(config.job_runner, "mode", "background_tasks") or "background_tasks").strip().lower()
     if raw_mode not in JOB_RUNNER_MODES:
@@ -55,8 +74,43 @@ def _uses_redis_queue_runner() -> bool:
     return _job_runner_mode() == "redis_queue"
 
 
+def _uses_process_pool_runner() -> bool:
+    return _job_runner_mode() == "process_pool"
+
+
 def _uses_queue_runner() -> bool:
-    return _uses_inmemory_queue_runner() or _uses_redis_queue_runner()
+    return _uses_inmemory_queue_runner() or _uses_redis_queue_runner() or _uses_process_pool_runner()
+
+
+def _uses_job_id_dispatch() -> bool:
+    """Out-of-process runners reload job state from the store instead of receiving it as a task argument."""
+    return _uses_redis_queue_runner() or _uses_process_pool_runner()
+
+
+def _settle_process_pool_task(metadata: dict[str, Any], error: Optional[BaseException], crashed: bool) -> None:
+    """Mark a job whose worker process crashed before it reached a terminal status.
+
+    Worker writes need no folding back: the portfolio aggregate catches up from the store write sequence on its
+    next read, as it does for `redis_queue` workers.
+    """
+    from grantflow.api.constants import TERMINAL_JOB_STATUSES
+    from grantflow.api.idempotency_store_facade import _get_job, _record_job_event, _update_job
+
+    job_id = str(metadata.get("job_id") or "").strip()
+    if not job_id:
+        return
+    job = _get_job(job_id)
+    if not isinstance(job, dict):
+        return
+    status = str(job.get("status") or "").strip().lower()
+    if crashed and status not in TERMINAL_JOB_STATUSES and status != "pending_hitl":
+        _record_job_event(
+            job_id,
+            "job_runner_worker_crashed",
+            task_name=str(metadata.get("task_name") or ""),
+            error=str(error or ""),
+        )
+        _update_job(job_id, status="error", error=f"Job worker process crashed: {error}")
 
 
 def _build_job_runner():
@@ -76,11 +130,36 @@ def _build_job_runner():
             worker_heartbeat_ttl_seconds=float(
                 getattr(config.job_runner, "redis_worker_heartbeat_ttl_seconds", 45.0) or 45.0
             ),
+            reliable_queue=bool(getattr(config.job_runner, "redis_reliable_queue", False)),
+            visibility_timeout_seconds=float(
+                getattr(config.job_runner, "redis_visibility_timeout_seconds", 60.0) or 60.0
+            ),
+            reaper_interval_seconds=float(getattr(config.job_runner, "redis_reaper_interval_seconds", 5.0) or 5.0),
             consumer_enabled=consumer_enabled,
         )
+    if _uses_process_pool_runner():
+        return ProcessPoolJobRunner(
+            worker_count=worker_count,
+            queue_maxsize=queue_maxsize,
+            max_tasks_per_child=int(getattr(config.job_runner, "process_max_tasks_per_child", 0) or 0),
+            crash_retry_limit=int(getattr(config.job_runner, "process_crash_retry_limit", 1) or 0),
+            prewarm=bool(getattr(config.job_runner, "process_prewarm", True)),
+            on_task_settled=_settle_process_pool_task,
+        )
     return InMemoryJobRunner(worker_count=worker_count, queue_maxsize=queue_maxsize)
 
 
+def _build_job_change_notifier() -> JobChangeNotifier:
+    bridge = None
+    if _uses_redis_queue_runner():
+        # Worker processes write job state in this mode; relay their change signals to API waiters.
+        bridge = RedisJobChangeBridge(
+            redis_url=str(getattr(config.job_runner, "redis_url", "redis://127.0.0.1:6379/0") or ""),
+            channel=str(getattr(config.job_runner, "redis_status_channel", "grantflow:job-status") or ""),
+        )
+    return JobChangeNotifier(bridge=bridge, recheck_seconds=job_change_recheck_seconds_from_env())
+
+
 def _job_store_mode() -> str:
     return "sqlite" if getattr(_job_store(), "db_path", None) else "inmem"
 
@@ -105,6 +184,18 @@ def _validate_store_backend_alignment() -> None:
     )
 
 
+def _validate_job_runner_store_alignment() -> None:
+    if not _uses_process_pool_runner():
+        return
+    if _job_store_mode() == "sqlite" and _hitl_store_mode() == "sqlite":
+        return
+    raise RuntimeError(
+        "Job runner misconfiguration: GRANTFLOW_JOB_RUNNER_MODE=process_pool requires shared persistent stores "
+        f"(JOB_STORE={_job_store_mode()}, HITL_STORE={_hitl_store_mode()}). "
+        "Set GRANTFLOW_JOB_STORE=sqlite and GRANTFLOW_HITL_STORE=sqlite so worker processes see job state."
+    )
+
+
 def _validate_tenant_authz_configuration() -> None:
     status = _tenant_authz_configuration_status()
     policy_mode = str(status.get("policy_mode") or "warn")
@@ -206,17 +297,41 @@ def _validate_persistent_store_startup_security() -> None:
     )
 
 
+def _warm_donor_registry() -> dict[str, Any]:
+    from grantflow.swarm.nodes.architect_generation import warm_toc_contract_hints
+    from grantflow.swarm.nodes.mel_specialist import warm_mel_contract_hints
+
+    stats = donor_registry.warm_up(warmers=(warm_toc_contract_hints, warm_mel_contract_hints))
+    logger.info(
+        "Donor registry warmed: %s donors in %.3fs (%s errors)",
+        stats["donor_count"],
+        stats["warmup_seconds"] or 0.0,
+        len(stats["warmup_errors"]),
+    )
+    return stats
+
+
 @asynccontextmanager
 async def _app_lifespan(_: FastAPI) -> AsyncIterator[None]:
     _validate_store_backend_alignment()
+    _validate_job_runner_store_alignment()
     _validate_tenant_authz_configuration()
     _validate_runtime_compatibility_configuration()
     _validate_api_key_startup_security()
     _validate_persistent_store_startup_security()
+    _warm_donor_registry()
     if _uses_queue_runner():
         _job_runner().start()
+    _job_change_notifier().start()
+    if webhook_delivery_mode() == "outbox":
+        # Drain deliveries persisted by a previous process before new events arrive.
+        _webhook_delivery_worker().start()
     try:
         yield
     finally:
+        _blocking_executor().shutdown()
+        portfolio_render_pool.shutdown()
+        _job_change_notifier().stop()
+        _webhook_delivery_worker().stop()
         if _uses_queue_runner():
             _job_runner().stop()
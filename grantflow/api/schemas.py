@@ -94,6 +94,21 @@ class ExportRequest(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+class PortfolioExportBundleRequest(BaseModel):
+    donor_id: Optional[str] = None
+    tenant_id: Optional[str] = None
+    status: Optional[str] = None
+    hitl_enabled: Optional[bool] = None
+    warning_level: Optional[str] = None
+    grounding_risk_level: Optional[str] = None
+    toc_text_risk_level: Optional[str] = None
+    mel_risk_level: Optional[str] = None
+    format: Literal["docx", "xlsx", "both"] = "both"
+    include_diagnostics: bool = False
+
+    model_config = ConfigDict(extra="forbid")
+
+
 class JobCommentCreateRequest(BaseModel):
     section: str
     message: str
@@ -292,11 +307,28 @@ class JobEventPublicResponse(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+class JobWebhookDeliveryPublicResponse(BaseModel):
+    delivery_id: str
+    event: str
+    status: str
+    attempts: int
+    max_attempts: int
+    last_status_code: Optional[int] = None
+    last_error: Optional[str] = None
+    next_attempt_at: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    delivered_at: Optional[str] = None
+
+    model_config = ConfigDict(extra="allow")
+
+
 class JobEventsPublicResponse(BaseModel):
     job_id: str
     status: str
     event_count: int
     events: list[JobEventPublicResponse]
+    webhook_deliveries: Optional[list[JobWebhookDeliveryPublicResponse]] = None
 
     model_config = ConfigDict(extra="allow")
 
@@ -1384,6 +1416,33 @@ class PortfolioMetricsPublicResponse(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+class PortfolioAggregateStatsPublicResponse(BaseModel):
+    mode: str
+    ready: bool
+    job_count: int
+    group_count: int
+    rebuild_count: int
+    apply_count: int
+    last_rebuild_ms: Optional[float] = None
+    check_count: int = 0
+    check_mismatch_count: int = 0
+    last_check_mismatches: Optional[list[str]] = None
+    rebuilt_job_count: Optional[int] = None
+
+    model_config = ConfigDict(extra="allow")
+
+
+class PortfolioAggregateCheckPublicResponse(BaseModel):
+    consistent: bool
+    mismatch_count: int
+    mismatches: list[str]
+    cached_job_count: int
+    full_scan_job_count: int
+    aggregate: PortfolioAggregateStatsPublicResponse
+
+    model_config = ConfigDict(extra="allow")
+
+
 class PortfolioQualityCriticSummaryPublicResponse(BaseModel):
     open_findings_total: int
     open_findings_per_job_avg: Optional[float] = None
@@ -1836,14 +1895,75 @@ class GenerateFromPresetBatchItemErrorPublicResponse(BaseModel):
 
 class GenerateFromPresetBatchPublicResponse(BaseModel):
     status: str
+    batch_id: Optional[str] = None
     total: int
     accepted_count: int
     error_count: int
+    warmup: Optional[Dict[str, Any]] = None
     results: list[GenerateFromPresetBatchItemAcceptedPublicResponse | GenerateFromPresetBatchItemErrorPublicResponse]
 
     model_config = ConfigDict(extra="allow")
 
 
+class GenerateBatchJobPublicResponse(BaseModel):
+    job_id: str
+    index: int
+    status: str
+    donor_id: Optional[str] = None
+    tenant_id: Optional[str] = None
+    preset_key: Optional[str] = None
+
+    model_config = ConfigDict(extra="allow")
+
+
+class GenerateBatchStatusPublicResponse(BaseModel):
+    batch_id: str
+    total: int
+    job_count: int
+    terminal_count: int
+    progress: float
+    complete: bool
+    status_counts: Dict[str, int]
+    jobs: list[GenerateBatchJobPublicResponse]
+
+    model_config = ConfigDict(extra="allow")
+
+
+class PortfolioExportBundleJobPublicResponse(BaseModel):
+    job_id: str
+    status: str
+    donor_id: Optional[str] = None
+    documents: list[str]
+    cached_document_count: int
+
+    model_config = ConfigDict(extra="allow")
+
+
+class PortfolioExportBundleStatusPublicResponse(BaseModel):
+    bundle_id: str
+    status: str
+    format: str
+    total: int
+    processed_count: int
+    progress: float
+    exported_count: int
+    skipped_count: int
+    blocked_count: int
+    error_count: int
+    cached_document_count: int
+    rendered_document_count: int
+    filters: Dict[str, Any]
+    jobs: Optional[list[PortfolioExportBundleJobPublicResponse]] = None
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    archive_bytes: Optional[int] = None
+    download_url: Optional[str] = None
+    error: Optional[str] = None
+
+    model_config = ConfigDict(extra="allow")
+
+
 class QueueWorkerHeartbeatPolicyPublicResponse(BaseModel):
     mode: str
 
@@ -10,6 +10,7 @@ PROTECTED_OPERATIONS = {
     ("post", "/generate"),
     ("post", "/generate/from-preset"),
     ("post", "/generate/from-preset/batch"),
+    ("get", "/generate/batches/{batch_id}"),
     ("post", "/generate/preflight"),
     ("post", "/ingest"),
     ("post", "/ingest/readiness"),
@@ -26,6 +27,7 @@ PROTECTED_OPERATIONS = {
     ("post", "/hitl/approve"),
     ("post", "/export"),
     ("get", "/status/{job_id}"),
+    ("get", "/status/{job_id}/stream"),
     ("get", "/status/{job_id}/citations"),
     ("get", "/status/{job_id}/export-payload"),
     ("get", "/status/{job_id}/pilot-quick-report/export"),
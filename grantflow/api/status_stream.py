@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+
+from grantflow.api.constants import TERMINAL_JOB_STATUSES
+from grantflow.api.idempotency_store_facade import _get_job_with_revision
+from grantflow.api.public_views import public_job_payload
+
+STATUS_WAIT_MAX_TIMEOUT_SECONDS = 60.0
+STATUS_STREAM_MAX_SECONDS = 3600.0
+STATUS_STREAM_HEARTBEAT_SECONDS = 15.0
+STATUS_STREAM_RETRY_MS = 2000
+
+
+def _job_change_notifier():
+    from grantflow.api import app as api_app_module
+
+    return api_app_module.JOB_CHANGE_NOTIFIER
+
+
+async def _read_job_with_revision(job_id: str) -> Tuple[Optional[Dict[str, Any]], int]:
+    job, revision = await run_in_threadpool(_get_job_with_revision, job_id)
+    return job, int(revision or 0)
+
+
+async def wait_for_job_change(
+    job_id: str,
+    *,
+    known_revision: int,
+    timeout: float,
+) -> Tuple[Dict[str, Any], int]:
+    """Long-poll: return the job as soon as its revision differs from `known_revision`, or at `timeout`.
+
+    Waiters sleep on change signals from job store writes and recheck the store every
+    `JOB_CHANGE_NOTIFIER.recheck_seconds` for writers that do not signal this process.
+    """
+    notifier = _job_change_notifier()
+    deadline = time.monotonic() + max(0.0, min(float(timeout), STATUS_WAIT_MAX_TIMEOUT_SECONDS))
+    with notifier.subscribe(job_id) as subscription:
+        while True:
+            job, revision = await _read_job_with_revision(job_id)
+            if not job:
+                raise HTTPException(status_code=404, detail="Job not found")
+            remaining = deadline - time.monotonic()
+            if revision != known_revision or remaining <= 0:
+                return job, revision
+            await subscription.wait(min(remaining, notifier.recheck_seconds))
+
+
+def _sse_event(event: str, data: Dict[str, Any], *, event_id: Optional[int] = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append("data: " + json.dumps(data, separators=(",", ":"), default=str))
+    return "\n".join(lines) + "\n\n"
+
+
+async def job_status_event_stream(
+    job_id: str,
+    *,
+    since_revision: Optional[int] = None,
+    max_seconds: float = STATUS_STREAM_MAX_SECONDS,
+    heartbeat_seconds: float = STATUS_STREAM_HEARTBEAT_SECONDS,
+) -> AsyncIterator[str]:
+    """Server-sent events for one job: a `status` event per observed change, ending at a terminal status.
+
+    Each event id is the job revision, so a reconnecting client resumes via `Last-Event-ID` without
+    replaying a status it already has. Writes that leave the public payload unchanged are not re-sent.
+    """
+    notifier = _job_change_notifier()
+    deadline = time.monotonic() + max(0.0, min(float(max_seconds), STATUS_STREAM_MAX_SECONDS))
+    heartbeat_every = max(1.0, float(heartbeat_seconds))
+    last_revision = since_revision
+    last_payload: Optional[Dict[str, Any]] = None
+    last_sent_at = time.monotonic()
+    yield f"retry: {STATUS_STREAM_RETRY_MS}\n\n"
+    with notifier.subscribe(job_id) as subscription:
+        while True:
+            job, revision = await _read_job_with_revision(job_id)
+            if not job:
+                yield _sse_event("gone", {"job_id": job_id})
+                return
+            if last_revision is None or revision != last_revision:
+                payload = public_job_payload(job)
+                if payload != last_payload:
+                    yield _sse_event("status", payload, event_id=revision)
+                    last_payload = payload
+                    last_sent_at = time.monotonic()
+                last_revision = revision
+            if str(job.get("status") or "") in TERMINAL_JOB_STATUSES:
+                return
+            now = time.monotonic()
+            if now >= deadline:
+                yield _sse_event("timeout", {"job_id": job_id, "revision": revision})
+                return
+            if now - last_sent_at >= heartbeat_every:
+                yield ": keep-alive\n\n"
+                last_sent_at = now
+            await subscription.wait(min(deadline - now, notifier.recheck_seconds, heartbeat_every))
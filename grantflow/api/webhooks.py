@@ -5,8 +5,12 @@ import hmac
 import json
 import logging
 import os
+import threading
 import time
-from typing import Any, Dict, Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
 from urllib.parse import urlparse
 import ipaddress
 
@@ -16,6 +20,20 @@ from grantflow.core.security_utils import is_safe_webhook_url
 
 logger = logging.getLogger(__name__)
 
+WEBHOOK_DELIVERY_MODES = {"sync", "outbox"}
+PUBLIC_WEBHOOK_DELIVERY_FIELDS = (
+    "delivery_id",
+    "event",
+    "status",
+    "attempts",
+    "max_attempts",
+    "last_status_code",
+    "last_error",
+    "created_at",
+    "updated_at",
+    "delivered_at",
+)
+
 
 def _env_int(name: str, default: int) -> int:
     raw = os.getenv(name)
@@ -55,6 +73,24 @@ def _backoff_max_seconds() -> float:
     return max_ms / 1000.0
 
 
+def _delivery_worker_count() -> int:
+    return max(1, _env_int("GRANTFLOW_WEBHOOK_DELIVERY_WORKERS", 4))
+
+
+def _per_endpoint_concurrency() -> int:
+    return max(1, _env_int("GRANTFLOW_WEBHOOK_PER_ENDPOINT_CONCURRENCY", 2))
+
+
+def _poll_interval_seconds() -> float:
+    poll_ms = max(10, _env_int("GRANTFLOW_WEBHOOK_POLL_INTERVAL_MS", 500))
+    return poll_ms / 1000.0
+
+
+def webhook_delivery_mode() -> str:
+    mode = str(os.getenv("GRANTFLOW_WEBHOOK_DELIVERY_MODE", "sync") or "").strip().lower()
+    return mode if mode in WEBHOOK_DELIVERY_MODES else "sync"
+
+
 def _retryable_status_code(status_code: int) -> bool:
     return status_code == 429 or status_code == 408 or 500 <= status_code <= 599
 
@@ -97,31 +133,41 @@ def _validate_webhook_url_or_raise(url: str) -> str:
     return candidate
 
 
-def send_job_webhook_event(
-    *,
-    url: str,
-    secret: Optional[str],
-    event: str,
-    job_id: str,
-    job: Dict[str, Any],
-) -> None:
-    if not is_safe_webhook_url(url):
-        raise ValueError("Webhook URL is not allowed by SSRF policy")
-    safe_url = _validate_webhook_url_or_raise(url)
-
+def webhook_event_body(*, event: str, job_id: str, job: Dict[str, Any]) -> bytes:
     payload = {
         "event": event,
         "job_id": job_id,
         "status": str(job.get("status") or ""),
         "job": job,
     }
-    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _webhook_headers(secret: Optional[str], body: bytes) -> Dict[str, str]:
     headers = {
         "Content-Type": "application/json",
         "User-Agent": "GrantFlow-Webhook/1.0",
     }
     if secret:
         headers["X-GrantFlow-Signature"] = _signature_header(secret, body)
+    return headers
+
+
+def send_job_webhook_event(
+    *,
+    url: str,
+    secret: Optional[str],
+    event: str,
+    job_id: str,
+    job: Dict[str, Any],
+) -> None:
+    if not is_safe_webhook_url(url):
+        raise ValueError("Webhook URL is not allowed by SSRF policy")
+    safe_url = _validate_webhook_url_or_raise(url)
+
+    job_status = str(job.get("status") or "")
+    body = webhook_event_body(event=event, job_id=job_id, job=job)
+    headers = _webhook_headers(secret, body)
 
     attempts = _max_attempts()
     timeout_s = _timeout_seconds()
@@ -135,7 +181,7 @@ def send_job_webhook_event(
                     "Webhook delivery succeeded (event=%s job_id=%s status=%s attempt=%s code=%s)",
                     event,
                     job_id,
-                    payload["status"],
+                    job_status,
                     attempt,
                     response.status_code,
                 )
@@ -184,3 +230,304 @@ def send_job_webhook_event(
 
     if last_error is not None:
         raise last_error
+
+
+def _utcnow_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _endpoint_key(url: str) -> str:
+    parsed = urlparse(str(url or "").strip())
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+def public_webhook_delivery(row: Dict[str, Any]) -> Dict[str, Any]:
+    # Target URL and signing secret stay server-side; only delivery progress is exposed.
+    item = {key: row.get(key) for key in PUBLIC_WEBHOOK_DELIVERY_FIELDS}
+    next_attempt_at = row.get("next_attempt_at")
+    item["next_attempt_at"] = (
+        datetime.fromtimestamp(float(next_attempt_at), tz=timezone.utc).isoformat()
+        if row.get("status") == "pending" and next_attempt_at
+        else None
+    )
+    return item
+
+
+class WebhookDeliveryWorker:
+    """Drains the webhook outbox on a small thread pool with a shared HTTP client.
+
+    Each claim makes a single POST attempt; retries are rescheduled in the outbox with the
+    same backoff as synchronous delivery so no worker thread ever sleeps on a slow endpoint.
+    """
+
+    def __init__(
+        self,
+        outbox: Any,
+        *,
+        worker_count: Optional[int] = None,
+        per_endpoint_concurrency: Optional[int] = None,
+        poll_interval_seconds: Optional[float] = None,
+        client_factory: Optional[Callable[[], httpx.Client]] = None,
+    ) -> None:
+        self.outbox = outbox
+        self.worker_count = max(1, int(worker_count or _delivery_worker_count()))
+        self.per_endpoint_concurrency = max(1, int(per_endpoint_concurrency or _per_endpoint_concurrency()))
+        self.poll_interval_seconds = max(0.01, float(poll_interval_seconds or _poll_interval_seconds()))
+        self._client_factory = client_factory
+        self._client: Optional[httpx.Client] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, int] = {}
+        self._counters = {"enqueued": 0, "delivered": 0, "retried": 0, "failed": 0, "deferred": 0, "enqueue_failed": 0}
+
+    def _new_client(self) -> httpx.Client:
+        if self._client_factory is not None:
+            return self._client_factory()
+        limit = self.worker_count
+        return httpx.Client(
+            timeout=_timeout_seconds(),
+            limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+        )
+
+    def _lease_seconds(self) -> float:
+        # A claim outlives one request timeout; rows held by a crashed worker become due again.
+        return _timeout_seconds() * 2 + 5.0
+
+    def _bump(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] = int(self._counters.get(counter) or 0) + 1
+
+    @property
+    def running(self) -> bool:
+        thread = self._thread
+        return bool(thread and thread.is_alive())
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            if self._client is None:
+                self._client = self._new_client()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.worker_count,
+                    thread_name_prefix="grantflow-webhook",
+                )
+            self._thread = threading.Thread(
+                target=self._dispatch_loop,
+                name="grantflow-webhook-dispatcher",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout_seconds: float = 5.0) -> None:
+        with self._lock:
+            thread, executor, client = self._thread, self._executor, self._client
+            self._thread = None
+            self._executor = None
+            self._client = None
+        self._stopping.set()
+        self._wake.set()
+        if thread is not None:
+            thread.join(timeout=max(0.0, float(timeout_seconds)))
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if client is not None:
+            client.close()
+
+    def enqueue(
+        self, *, url: str, secret: Optional[str], event: str, job_id: str, job: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        now_iso = _utcnow_iso()
+        try:
+            row = self.outbox.enqueue(
+                {
+                    "delivery_id": uuid.uuid4().hex,
+                    "job_id": job_id,
+                    "event": event,
+                    "url": url,
+                    "secret": secret,
+                    "body": webhook_event_body(event=event, job_id=job_id, job=job).decode("utf-8"),
+                    "status": "pending",
+                    "attempts": 0,
+                    "max_attempts": _max_attempts(),
+                    "next_attempt_at": time.time(),
+                    "created_at": now_iso,
+                    "updated_at": now_iso,
+                }
+            )
+        except Exception:
+            # Counted and logged here; the caller decides whether to deliver some other way.
+            self._bump("enqueue_failed")
+            logger.exception("Webhook outbox enqueue failed for job %s event %s", job_id, event)
+            raise
+        self._bump("enqueued")
+        self.start()
+        self._wake.set()
+        return row
+
+    def _dispatch_loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                dispatched = self.dispatch_due()
+            except Exception:
+                logger.exception("Webhook outbox dispatch failed")
+                dispatched = 0
+            if not dispatched:
+                self._wake.wait(self.poll_interval_seconds)
+                self._wake.clear()
+
+    def _acquire_endpoint(self, endpoint: str) -> bool:
+        with self._lock:
+            current = int(self._in_flight.get(endpoint) or 0)
+            if current >= self.per_endpoint_concurrency:
+                return False
+            self._in_flight[endpoint] = current + 1
+            return True
+
+    def _release_endpoint(self, endpoint: str) -> None:
+        with self._lock:
+            current = int(self._in_flight.get(endpoint) or 0) - 1
+            if current > 0:
+                self._in_flight[endpoint] = current
+            else:
+                self._in_flight.pop(endpoint, None)
+
+    def dispatch_due(self) -> int:
+        executor = self._executor
+        if executor is None:
+            return 0
+        with self._lock:
+            capacity = self.worker_count - sum(self._in_flight.values())
+        if capacity <= 0:
+            return 0
+        rows = self.outbox.claim_due(now=time.time(), limit=capacity, lease_seconds=self._lease_seconds())
+        dispatched = 0
+        for row in rows:
+            endpoint = _endpoint_key(str(row.get("url") or ""))
+            if not self._acquire_endpoint(endpoint):
+                # Saturated endpoint: hand the row back without spending one of its attempts.
+                self.outbox.update(
+                    row["delivery_id"],
+                    status="pending",
+                    next_attempt_at=time.time() + self.poll_interval_seconds,
+                )
+                self._bump("deferred")
+                continue
+            executor.submit(self._deliver_claimed, row, endpoint)
+            dispatched += 1
+        return dispatched
+
+    def _deliver_claimed(self, row: Dict[str, Any], endpoint: str) -> None:
+        try:
+            self.deliver(row)
+        except Exception:
+            logger.exception("Webhook outbox delivery crashed (delivery_id=%s)", row.get("delivery_id"))
+        finally:
+            self._release_endpoint(endpoint)
+            self._wake.set()
+
+    def deliver(self, row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        delivery_id = str(row["delivery_id"])
+        event = str(row.get("event") or "")
+        job_id = str(row.get("job_id") or "")
+        attempt = int(row.get("attempts") or 0) + 1
+        max_attempts = max(1, int(row.get("max_attempts") or 1))
+        url = str(row.get("url") or "")
+        try:
+            if not is_safe_webhook_url(url):
+                raise ValueError("Webhook URL is not allowed by SSRF policy")
+            safe_url = _validate_webhook_url_or_raise(url)
+        except ValueError as exc:
+            return self._settle(row, attempt, status="failed", error=str(exc))
+
+        body = str(row.get("body") or "").encode("utf-8")
+        client = self._client
+        if client is None:
+            client = self._client = self._new_client()
+        try:
+            response = client.post(safe_url, content=body, headers=_webhook_headers(row.get("secret"), body))
+        except httpx.RequestError as exc:
+            retry = attempt < max_attempts
+            logger.warning(
+                "Webhook delivery failed (event=%s job_id=%s attempt=%s/%s): %s; %s",
+                event,
+                job_id,
+                attempt,
+                max_attempts,
+                exc,
+                "retrying" if retry else "giving up",
+            )
+            return self._settle(row, attempt, status="pending" if retry else "failed", error=str(exc))
+
+        status_code = int(response.status_code)
+        if 200 <= status_code < 300:
+            logger.info(
+                "Webhook delivery succeeded (event=%s job_id=%s delivery_id=%s attempt=%s code=%s)",
+                event,
+                job_id,
+                delivery_id,
+                attempt,
+                status_code,
+            )
+            return self._settle(row, attempt, status="delivered", status_code=status_code)
+
+        retry = _retryable_status_code(status_code) and attempt < max_attempts
+        message = (
+            f"Webhook delivery returned HTTP {status_code}"
+            f" (event={event} job_id={job_id} attempt={attempt}/{max_attempts})"
+        )
+        logger.warning("%s; %s", message, "retrying" if retry else "giving up")
+        return self._settle(
+            row,
+            attempt,
+            status="pending" if retry else "failed",
+            status_code=status_code,
+            error=f"HTTP {status_code}",
+        )
+
+    def _settle(
+        self,
+        row: Dict[str, Any],
+        attempt: int,
+        *,
+        status: str,
+        status_code: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        now_iso = _utcnow_iso()
+        fields: Dict[str, Any] = {
+            "status": status,
+            "attempts": attempt,
+            "last_status_code": status_code,
+            "last_error": error,
+            "updated_at": now_iso,
+        }
+        if status == "pending":
+            fields["next_attempt_at"] = now + _backoff_delay_s(attempt)
+            self._bump("retried")
+        elif status == "delivered":
+            fields["delivered_at"] = now_iso
+            self._bump("delivered")
+        else:
+            self._bump("failed")
+        return self.outbox.update(str(row["delivery_id"]), **fields)
+
+    def diagnostics(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            in_flight = sum(self._in_flight.values())
+        return {
+            "running": self.running,
+            "worker_count": self.worker_count,
+            "per_endpoint_concurrency": self.per_endpoint_concurrency,
+            "poll_interval_seconds": self.poll_interval_seconds,
+            "in_flight": in_flight,
+            "counters": counters,
+            "outbox": self.outbox.status_counts(),
+        }
@@ -89,6 +89,9 @@ class JobRunnerConfig(BaseModel):
     worker_count: int = 2
     queue_maxsize: int = 200
     consumer_enabled: bool = True
+    process_max_tasks_per_child: int = 0
+    process_crash_retry_limit: int = 1
+    process_prewarm: bool = True
     redis_url: str = "redis://127.0.0.1:6379/0"
     redis_queue_name: str = "grantflow:jobs"
     redis_pop_timeout_seconds: float = 1.0
@@ -98,6 +101,10 @@ class JobRunnerConfig(BaseModel):
     redis_worker_heartbeat_ttl_seconds: float = 45.0
     redis_worker_heartbeat_interval_seconds: float = 10.0
     redis_worker_heartbeat_policy_mode: str = "strict"
+    redis_reliable_queue: bool = False
+    redis_visibility_timeout_seconds: float = 60.0
+    redis_reaper_interval_seconds: float = 5.0
+    redis_status_channel: str = "grantflow:job-status"
     dead_letter_alert_threshold: int = 0
     dead_letter_alert_blocking: bool = False
 
@@ -230,6 +237,9 @@ class GrantFlowConfig(BaseModel):
                 worker_count=int(_env("GRANTFLOW_JOB_RUNNER_WORKER_COUNT", "2")),
                 queue_maxsize=int(_env("GRANTFLOW_JOB_RUNNER_QUEUE_MAXSIZE", "200")),
                 consumer_enabled=_env("GRANTFLOW_JOB_RUNNER_CONSUMER_ENABLED", "true").lower() == "true",
+                process_max_tasks_per_child=int(_env("GRANTFLOW_JOB_RUNNER_MAX_TASKS_PER_CHILD", "0")),
+                process_crash_retry_limit=int(_env("GRANTFLOW_JOB_RUNNER_CRASH_RETRY_LIMIT", "1")),
+                process_prewarm=_env("GRANTFLOW_JOB_RUNNER_PREWARM", "true").lower() == "true",
                 redis_url=_env("GRANTFLOW_JOB_RUNNER_REDIS_URL", "redis://127.0.0.1:6379/0"),
                 redis_queue_name=_env("GRANTFLOW_JOB_RUNNER_REDIS_QUEUE_NAME", "grantflow:jobs"),
                 redis_pop_timeout_seconds=float(_env("GRANTFLOW_JOB_RUNNER_REDIS_POP_TIMEOUT_SECONDS", "1.0")),
@@ -246,6 +256,12 @@ class GrantFlowConfig(BaseModel):
                     "GRANTFLOW_JOB_RUNNER_REDIS_WORKER_HEARTBEAT_POLICY_MODE",
                     "strict",
                 ),
+                redis_reliable_queue=_env("GRANTFLOW_JOB_RUNNER_REDIS_RELIABLE_QUEUE", "false").lower() == "true",
+                redis_visibility_timeout_seconds=float(
+                    _env("GRANTFLOW_JOB_RUNNER_REDIS_VISIBILITY_TIMEOUT_SECONDS", "60.0")
+                ),
+                redis_reaper_interval_seconds=float(_env("GRANTFLOW_JOB_RUNNER_REDIS_REAPER_INTERVAL_SECONDS", "5.0")),
+                redis_status_channel=_env("GRANTFLOW_JOB_RUNNER_REDIS_STATUS_CHANNEL", "grantflow:job-status"),
                 dead_letter_alert_threshold=int(_env("GRANTFLOW_JOB_RUNNER_DEAD_LETTER_ALERT_THRESHOLD", "0")),
                 dead_letter_alert_blocking=_env("GRANTFLOW_JOB_RUNNER_DEAD_LETTER_ALERT_BLOCKING", "false").lower()
                 == "true",
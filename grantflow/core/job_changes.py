@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import uuid
+from typing import Any, Callable, Dict, Optional, Set
+
+try:
+    from redis import Redis as RedisClient
+except Exception as exc:  # pragma: no cover - import surface depends on installed extras
+    RedisClient = None
+    REDIS_IMPORT_ERROR: Optional[Exception] = exc
+else:
+    REDIS_IMPORT_ERROR = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_CHANGE_RECHECK_SECONDS = 5.0
+
+
+class JobChangeSubscription:
+    """One waiter's view of change signals for a job.
+
+    Open the subscription before reading the job so a write landing between the read and the wait still
+    wakes the waiter: the event stays set until `wait` consumes it.
+    """
+
+    def __init__(self, notifier: "JobChangeNotifier", job_id: str) -> None:
+        self.notifier = notifier
+        self.job_id = job_id
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def _signal(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            # The waiter's loop already closed; it is about to unsubscribe.
+            pass
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for a change signal; False on timeout. Consumes the signal either way."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=max(0.0, float(timeout)))
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._event.clear()
+
+    def __enter__(self) -> "JobChangeSubscription":
+        self.notifier._subscribe(self)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.notifier._unsubscribe(self)
+
+
+class RedisJobChangeBridge:
+    """Relays job change signals between processes over Redis pub/sub.
+
+    Job runners in `redis_queue` mode write job state from worker processes, so API replicas would not see
+    those writes through the in-process notifier alone. Each bridge tags what it publishes with its own
+    origin and ignores those messages when they come back.
+    """
+
+    def __init__(
+        self,
+        *,
+        redis_url: str,
+        channel: str = "grantflow:job-status",
+        redis_client_factory: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        self.redis_url = str(redis_url or "redis://127.0.0.1:6379/0")
+        self.channel = str(channel or "grantflow:job-status")
+        self.origin = uuid.uuid4().hex
+        self._redis_client_factory = redis_client_factory
+        self._client: Any = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.published_count = 0
+        self.received_count = 0
+        self.last_error: Optional[str] = None
+
+    def _ensure_client(self) -> Any:
+        with self._lock:
+            if self._client is not None:
+                return self._client
+        if REDIS_IMPORT_ERROR is not None and self._redis_client_factory is None:
+            self.last_error = str(REDIS_IMPORT_ERROR)
+            return None
+        try:
+            if self._redis_client_factory is not None:
+                client = self._redis_client_factory(self.redis_url)
+            else:
+                assert RedisClient is not None
+                client = RedisClient.from_url(self.redis_url, decode_responses=False)
+        except Exception as exc:
+            self.last_error = str(exc)
+            return None
+        with self._lock:
+            self._client = client
+        return client
+
+    def publish(self, job_id: str) -> None:
+        client = self._ensure_client()
+        if client is None:
+            return
+        message = json.dumps({"job_id": str(job_id), "origin": self.origin}, separators=(",", ":"))
+        try:
+            client.publish(self.channel, message)
+            self.published_count += 1
+        except Exception as exc:
+            # Waiters still recheck the store periodically; a dropped signal only delays them.
+            self.last_error = str(exc)
+
+    def start(self, on_change: Callable[[str], None]) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen_loop,
+            args=(on_change,),
+            name="grantflow-job-change-bridge",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        self._thread = None
+
+    def _listen_loop(self, on_change: Callable[[str], None]) -> None:
+        while not self._stop.is_set():
+            client = self._ensure_client()
+            if client is None:
+                self._stop.wait(1.0)
+                continue
+            pubsub = None
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if not message or message.get("type") != "message":
+                        continue
+                    job_id = self._decode(message.get("data"))
+                    if job_id:
+                        self.received_count += 1
+                        on_change(job_id)
+            except Exception as exc:
+                self.last_error = str(exc)
+                self._stop.wait(1.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def _decode(self, data: Any) -> Optional[str]:
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", errors="replace")
+        try:
+            payload = json.loads(str(data))
+        except ValueError:
+            return None
+        if not isinstance(payload, dict) or payload.get("origin") == self.origin:
+            return None
+        job_id = str(payload.get("job_id") or "").strip()
+        return job_id or None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "redis",
+            "channel": self.channel,
+            "listening": bool(self._thread is not None and self._thread.is_alive()),
+            "published_count": self.published_count,
+            "received_count": self.received_count,
+            "last_error": self.last_error,
+        }
+
+
+class JobChangeNotifier:
+    """In-process fan-out of "job changed" signals to long-poll and SSE status waiters.
+
+    Job store writes call `publish`; waiters re-read the job themselves, so a signal carries no payload and
+    coalescing several writes into one wake-up is harmless. `recheck_seconds` bounds how long a waiter
+    trusts the signals alone, which covers writers the notifier cannot see (process-pool children).
+    """
+
+    def __init__(
+        self,
+        *,
+        bridge: Optional[RedisJobChangeBridge] = None,
+        recheck_seconds: float = DEFAULT_JOB_CHANGE_RECHECK_SECONDS,
+    ) -> None:
+        self.bridge = bridge
+        self.recheck_seconds = max(0.1, float(recheck_seconds))
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[str, Set[JobChangeSubscription]] = {}
+        self.published_count = 0
+
+    def subscribe(self, job_id: str) -> JobChangeSubscription:
+        return JobChangeSubscription(self, str(job_id))
+
+    def _subscribe(self, subscription: JobChangeSubscription) -> None:
+        with self._lock:
+            self._subscriptions.setdefault(subscription.job_id, set()).add(subscription)
+
+    def _unsubscribe(self, subscription: JobChangeSubscription) -> None:
+        with self._lock:
+            waiters = self._subscriptions.get(subscription.job_id)
+            if waiters is None:
+                return
+            waiters.discard(subscription)
+            if not waiters:
+                self._subscriptions.pop(subscription.job_id, None)
+
+    def notify_local(self, job_id: str) -> None:
+        with self._lock:
+            waiters = list(self._subscriptions.get(str(job_id), ()))
+        for subscription in waiters:
+            subscription._signal()
+
+    def publish(self, job_id: str) -> None:
+        self.published_count += 1
+        self.notify_local(job_id)
+        if self.bridge is not None:
+            self.bridge.publish(job_id)
+
+    def start(self) -> None:
+        if self.bridge is not None:
+            self.bridge.start(self.notify_local)
+
+    def stop(self) -> None:
+        if self.bridge is not None:
+            self.bridge.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waiting = sum(len(waiters) for waiters in self._subscriptions.values())
+            watched_jobs = len(self._subscriptions)
+        return {
+            "published_count": self.published_count,
+            "waiting_count": waiting,
+            "watched_job_count": watched_jobs,
+            "recheck_seconds": self.recheck_seconds,
+            "bridge": self.bridge.stats() if self.bridge is not None else None,
+        }
+
+
+def job_change_recheck_seconds_from_env() -> float:
+    raw = os.getenv("GRANTFLOW_STATUS_WAIT_RECHECK_SECONDS")
+    if raw is None:
+        return DEFAULT_JOB_CHANGE_RECHECK_SECONDS
+    try:
+        return float(raw)
+    except ValueError:
+        return DEFAULT_JOB_CHANGE_RECHECK_SECONDS
@@ -3,11 +3,15 @@ from __future__ import annotations
 import importlib
 import inspect
 import json
+import multiprocessing
 import os
 import queue
+import socket
 import threading
 import time
 import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Optional
 from urllib.parse import quote, urlparse, urlunparse
@@ -231,6 +235,310 @@ class InMemoryJobRunner:
                 self._queue.task_done()
 
 
+def _resolve_allowed_task(task_name: str, allowed_import_prefixes: tuple[str, ...]) -> Optional[TaskCallable]:
+    module_name = str(task_name.split(":", 1)[0] if ":" in task_name else "")
+    if allowed_import_prefixes and not any(module_name.startswith(prefix) for prefix in allowed_import_prefixes):
+        return None
+    return callable_from_task_name(task_name)
+
+
+def _process_pool_worker_init(preload_modules: tuple[str, ...]) -> None:
+    # Pay import/graph construction once per worker process instead of once per job.
+    for module_name in preload_modules:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            continue
+
+
+def _process_pool_ping() -> int:
+    return int(os.getpid())
+
+
+def _process_pool_execute(
+    task_name: str,
+    args: list[Any],
+    kwargs: dict[str, Any],
+    allowed_import_prefixes: tuple[str, ...],
+) -> None:
+    fn = _resolve_allowed_task(task_name, allowed_import_prefixes)
+    if fn is None:
+        raise RuntimeError(f"Job runner task could not be resolved: {task_name}")
+    fn(*tuple(args), **kwargs)
+
+
+TaskSettledCallback = Callable[[dict[str, Any], Optional[BaseException], bool], None]
+
+
+class ProcessPoolJobRunner:
+    """Runs queued jobs in preloaded worker processes so CPU-bound graph work is not serialized by the GIL.
+
+    Tasks travel by import name with JSON arguments, exactly like the Redis runner: workers re-read job
+    state from the shared job store instead of receiving pickled closures. A worker that dies mid-task
+    breaks the pool; the runner rebuilds it, retries the affected tasks `crash_retry_limit` times and then
+    reports them through `on_task_settled(..., crashed=True)`.
+    """
+
+    def __init__(
+        self,
+        worker_count: int = 2,
+        queue_maxsize: int = 200,
+        *,
+        max_tasks_per_child: int = 0,
+        crash_retry_limit: int = 1,
+        preload_modules: tuple[str, ...] = ("grantflow.api.app",),
+        allowed_import_prefixes: tuple[str, ...] = ("grantflow.",),
+        prewarm: bool = True,
+        on_task_settled: Optional[TaskSettledCallback] = None,
+    ) -> None:
+        self.worker_count = max(1, int(worker_count))
+        self.queue_maxsize = max(1, int(queue_maxsize))
+        self.max_tasks_per_child = max(0, _coerce_int(max_tasks_per_child, 0))
+        self.crash_retry_limit = max(0, _coerce_int(crash_retry_limit, 1))
+        self.preload_modules = tuple(str(m or "").strip() for m in preload_modules if str(m or "").strip())
+        self.allowed_import_prefixes = tuple(
+            str(p or "").strip() for p in allowed_import_prefixes if str(p or "").strip()
+        )
+        self.prewarm = bool(prewarm)
+        self._on_task_settled = on_task_settled
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: set[Future] = set()
+        self._lock = threading.Lock()
+        self._started = False
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._crashed = 0
+        self._crash_retried = 0
+        self._pool_restarts = 0
+        self._last_error: Optional[str] = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            executor = self._new_executor()
+            self._executor = executor
+        if self.prewarm:
+            for _ in range(self.worker_count):
+                try:
+                    executor.submit(_process_pool_ping)
+                except Exception as exc:
+                    self._record_error(exc)
+                    break
+
+    def stop(self, timeout_seconds: float = 2.0) -> None:
+        with self._lock:
+            if not self._started:
+                return
+            self._started = False
+            executor = self._executor
+            self._executor = None
+            pending = list(self._pending)
+        if executor is None:
+            return
+        for future in pending:
+            future.cancel()
+        deadline = time.monotonic() + max(0.0, float(timeout_seconds))
+        for future in pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                future.exception(timeout=remaining)
+            except Exception:
+                continue
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, fn: TaskCallable, *args: Any, **kwargs: Any) -> bool:
+        if not callable(fn):
+            raise TypeError("Job runner task must be callable")
+        task_name = task_name_for_callable(fn)
+        if _resolve_allowed_task(task_name, self.allowed_import_prefixes) is None:
+            raise TypeError("Process pool job runner tasks must be importable module-level functions")
+        try:
+            # Round-trip through JSON so only plain data (never live objects) crosses the process boundary.
+            encoded_args, encoded_kwargs = json.loads(json.dumps([list(args), dict(kwargs)]))
+        except (TypeError, ValueError) as exc:
+            raise TypeError("Process pool job runner arguments must be JSON-serializable") from exc
+        metadata = dict(_extract_task_metadata(fn, tuple(args), dict(kwargs)) or {})
+        metadata["task_name"] = task_name
+        self.start()
+        with self._lock:
+            if len(self._pending) >= self.queue_maxsize + self.worker_count:
+                return False
+            self._submitted += 1
+        return self._dispatch(task_name, encoded_args, encoded_kwargs, metadata, attempt=0)
+
+    def is_running(self) -> bool:
+        with self._lock:
+            return self._started
+
+    def diagnostics(self) -> Dict[str, Any]:
+        with self._lock:
+            executor = self._executor
+            pending = len(self._pending)
+            processes = dict(getattr(executor, "_processes", None) or {}) if executor is not None else {}
+            return {
+                "backend": "process_pool",
+                "consumer_enabled": True,
+                "running": bool(self._started),
+                "worker_count": self.worker_count,
+                "active_workers": sum(1 for p in processes.values() if p.is_alive()),
+                "queue_maxsize": self.queue_maxsize,
+                "queue_size": max(0, pending - self.worker_count),
+                "submitted_count": int(self._submitted),
+                "completed_count": int(self._completed),
+                "failed_count": int(self._failed),
+                "in_flight_count": pending,
+                "crashed_count": int(self._crashed),
+                "crash_retry_count": int(self._crash_retried),
+                "pool_restart_count": int(self._pool_restarts),
+                "max_tasks_per_child": self.max_tasks_per_child,
+                "last_error": self._last_error,
+            }
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # Spawned workers never inherit the parent's threads, locks or sqlite handles.
+        options: dict[str, Any] = {
+            "max_workers": self.worker_count,
+            "mp_context": multiprocessing.get_context("spawn"),
+            "initializer": _process_pool_worker_init,
+            "initargs": (self.preload_modules,),
+        }
+        if self.max_tasks_per_child > 0:
+            options["max_tasks_per_child"] = self.max_tasks_per_child
+        return ProcessPoolExecutor(**options)
+
+    def _replace_broken_executor(self, broken: Optional[ProcessPoolExecutor]) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if not self._started:
+                return None
+            if self._executor is broken or self._executor is None:
+                self._executor = self._new_executor()
+                self._pool_restarts += 1
+            executor = self._executor
+        if broken is not None:
+            broken.shutdown(wait=False, cancel_futures=True)
+        return executor
+
+    def _dispatch(
+        self,
+        task_name: str,
+        args: list[Any],
+        kwargs: dict[str, Any],
+        metadata: dict[str, Any],
+        *,
+        attempt: int,
+    ) -> bool:
+        with self._lock:
+            executor = self._executor
+        if executor is None:
+            self._settle(metadata, RuntimeError("Process pool job runner is stopped"), crashed=False)
+            return False
+        try:
+            try:
+                future = executor.submit(_process_pool_execute, task_name, args, kwargs, self.allowed_import_prefixes)
+            except BrokenProcessPool:
+                executor = self._replace_broken_executor(executor)
+                if executor is None:
+                    raise RuntimeError("Process pool job runner is stopped")
+                future = executor.submit(_process_pool_execute, task_name, args, kwargs, self.allowed_import_prefixes)
+        except RuntimeError as exc:
+            self._record_error(exc)
+            self._settle(metadata, exc, crashed=False)
+            return False
+        with self._lock:
+            self._pending.add(future)
+
+        def _done(done: Future) -> None:
+            self._on_future_done(done, executor, task_name, args, kwargs, metadata, attempt)
+
+        future.add_done_callback(_done)
+        return True
+
+    def _on_future_done(
+        self,
+        future: Future,
+        executor: Optional[ProcessPoolExecutor],
+        task_name: str,
+        args: list[Any],
+        kwargs: dict[str, Any],
+        metadata: dict[str, Any],
+        attempt: int,
+    ) -> None:
+        with self._lock:
+            self._pending.discard(future)
+            started = self._started
+        if future.cancelled():
+            self._settle(metadata, RuntimeError("Job runner task was cancelled"), crashed=False)
+            return
+        error = future.exception()
+        if isinstance(error, BrokenProcessPool):
+            # Every task queued on a broken pool fails together; retrying lets innocent neighbours finish
+            # while a task that keeps killing its worker exhausts the limit and is reported as crashed.
+            self._record_error(error)
+            replacement = self._replace_broken_executor(executor) if started else None
+            if replacement is not None and attempt < self.crash_retry_limit:
+                with self._lock:
+                    self._crash_retried += 1
+                self._dispatch(task_name, args, kwargs, metadata, attempt=attempt + 1)
+                return
+            self._settle(metadata, error, crashed=True)
+            return
+        if error is not None:
+            self._record_error(error)
+        self._settle(metadata, error, crashed=False)
+
+    def _settle(self, metadata: dict[str, Any], error: Optional[BaseException], *, crashed: bool) -> None:
+        with self._lock:
+            if error is None:
+                self._completed += 1
+            else:
+                self._failed += 1
+            if crashed:
+                self._crashed += 1
+        callback = self._on_task_settled
+        if callback is None:
+            return
+        try:
+            callback(dict(metadata), error, crashed)
+        except Exception as exc:
+            self._record_error(exc)
+
+    def _record_error(self, exc: BaseException) -> None:
+        with self._lock:
+            self._last_error = str(exc) or exc.__class__.__name__
+
+
+# Capacity check and push in one round trip so concurrent dispatchers cannot overshoot queue_maxsize.
+_CAPPED_ENQUEUE_LUA = """
+if redis.call('LLEN', KEYS[1]) >= tonumber(ARGV[2]) then
+  return 0
+end
+redis.call('RPUSH', KEYS[1], ARGV[1])
+return 1
+"""
+
+# Returns a dead worker's processing list to the head of the queue once its lease key has expired.
+_REAP_PROCESSING_LIST_LUA = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+  return -1
+end
+local moved = 0
+while true do
+  local item = redis.call('RPOPLPUSH', KEYS[1], KEYS[3])
+  if not item then
+    break
+  end
+  moved = moved + 1
+end
+redis.call('SREM', KEYS[4], ARGV[1])
+return moved
+"""
+
+
 class RedisJobRunner:
     def __init__(
         self,
@@ -246,6 +554,9 @@ class RedisJobRunner:
         worker_heartbeat_key: str = "",
         worker_heartbeat_ttl_seconds: float = 45.0,
         allowed_import_prefixes: tuple[str, ...] = ("grantflow.",),
+        reliable_queue: bool = False,
+        visibility_timeout_seconds: float = 60.0,
+        reaper_interval_seconds: float = 5.0,
         redis_client_factory: Optional[Callable[[str], Any]] = None,
         consumer_enabled: bool = True,
     ) -> None:
@@ -266,10 +577,20 @@ class RedisJobRunner:
         self.allowed_import_prefixes = tuple(
             str(p or "").strip() for p in allowed_import_prefixes if str(p or "").strip()
         )
+        self.reliable_queue = bool(reliable_queue)
+        self.visibility_timeout_seconds = max(0.1, float(visibility_timeout_seconds or 60.0))
+        self.reaper_interval_seconds = max(0.05, float(reaper_interval_seconds or 5.0))
+        self.processing_registry_key = f"{self.queue_name}:processing"
+        self.deliveries_key = f"{self.queue_name}:deliveries"
+        self._consumer_token = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
         self._redis_client_factory = redis_client_factory
         self.consumer_enabled = bool(consumer_enabled)
         self._client: Any = None
         self._threads: list[threading.Thread] = []
+        self._reliable_workers: dict[str, threading.Thread] = {}
+        self._lease_thread: Optional[threading.Thread] = None
+        self._lease_wakeup = threading.Event()
+        self._scripts: dict[str, Any] = {}
         self._lock = threading.Lock()
         self._started = False
         self._submitted = 0
@@ -278,6 +599,8 @@ class RedisJobRunner:
         self._retried = 0
         self._requeued = 0
         self._dead_lettered = 0
+        self._reaped = 0
+        self._in_flight = 0
         self._last_error: Optional[str] = None
         self._task_registry: dict[str, TaskCallable] = {}
 
@@ -287,27 +610,72 @@ class RedisJobRunner:
                 return
             self._started = True
             self._threads = []
+            self._reliable_workers = {}
             if not self.consumer_enabled:
                 return
+            self._lease_wakeup.clear()
             for idx in range(self.worker_count):
-                worker = threading.Thread(
-                    target=self._worker_loop,
-                    name=f"grantflow-redis-job-runner-{idx + 1}",
-                    daemon=True,
-                )
+                if self.reliable_queue:
+                    worker_id = f"{self._consumer_token}:{idx + 1}"
+                    worker = threading.Thread(
+                        target=self._reliable_worker_loop,
+                        args=(worker_id,),
+                        name=f"grantflow-redis-job-runner-{idx + 1}",
+                        daemon=True,
+                    )
+                    self._reliable_workers[worker_id] = worker
+                else:
+                    worker = threading.Thread(
+                        target=self._worker_loop,
+                        name=f"grantflow-redis-job-runner-{idx + 1}",
+                        daemon=True,
+                    )
                 worker.start()
                 self._threads.append(worker)
+            if self.reliable_queue:
+                lease_thread = threading.Thread(
+                    target=self._lease_loop,
+                    name="grantflow-redis-job-runner-lease",
+                    daemon=True,
+                )
+                lease_thread.start()
+                self._lease_thread = lease_thread
 
     def stop(self, timeout_seconds: float = 2.0) -> None:
         with self._lock:
             if not self._started:
                 return
             threads = list(self._threads)
+            if self._lease_thread is not None:
+                threads.append(self._lease_thread)
+            reliable_workers = dict(self._reliable_workers)
             self._started = False
+        self._lease_wakeup.set()
         for worker in threads:
             worker.join(timeout=max(0.0, float(timeout_seconds)))
+        self._release_stopped_workers(reliable_workers)
         with self._lock:
             self._threads = []
+            self._reliable_workers = {}
+            self._lease_thread = None
+
+    def _release_stopped_workers(self, workers: dict[str, threading.Thread]) -> None:
+        # Workers that drained cleanly hand back their registration; ones still busy keep their
+        # processing list and let the lease lapse so a peer reaps the task after this process exits.
+        finished = [worker_id for worker_id, thread in workers.items() if not thread.is_alive()]
+        if not finished:
+            return
+        client = self._ensure_client()
+        if client is None:
+            return
+        for worker_id in finished:
+            try:
+                if int(client.llen(self.processing_list_name(worker_id))) > 0:
+                    continue
+                client.delete(self.lease_key_name(worker_id))
+                client.srem(self.processing_registry_key, worker_id)
+            except Exception as exc:
+                self._record_error(exc)
 
     def submit(self, fn: TaskCallable, *args: Any, **kwargs: Any) -> bool:
         if not callable(fn):
@@ -338,10 +706,20 @@ class RedisJobRunner:
         if client is None:
             return False
         try:
-            current_size = int(client.llen(self.queue_name))
-            if current_size >= self.queue_maxsize:
-                return False
-            client.rpush(self.queue_name, encoded)
+            if callable(getattr(client, "register_script", None)):
+                accepted = self._run_script(
+                    client,
+                    _CAPPED_ENQUEUE_LUA,
+                    keys=[self.queue_name],
+                    args=[encoded, self.queue_maxsize],
+                )
+                if not _coerce_int(accepted, 0):
+                    return False
+            else:
+                current_size = int(client.llen(self.queue_name))
+                if current_size >= self.queue_maxsize:
+                    return False
+                client.rpush(self.queue_name, encoded)
         except Exception as exc:
             self._record_error(exc)
             return False
@@ -361,6 +739,8 @@ class RedisJobRunner:
             retried = int(self._retried)
             requeued = int(self._requeued)
             dead_lettered = int(self._dead_lettered)
+            reaped = int(self._reaped)
+            local_in_flight = int(self._in_flight)
             running = bool(self._started)
             active_workers = sum(1 for t in self._threads if t.is_alive())
             last_error = self._last_error
@@ -374,6 +754,7 @@ class RedisJobRunner:
         if availability_error:
             last_error = availability_error
         worker_heartbeat = self.worker_heartbeat_status()
+        in_flight, processing_worker_count = self._in_flight_status()
         return {
             "backend": "redis",
             "consumer_enabled": self.consumer_enabled,
@@ -388,6 +769,12 @@ class RedisJobRunner:
             "retry_count": retried,
             "requeued_count": requeued,
             "dead_lettered_count": dead_lettered,
+            "reliable_queue": self.reliable_queue,
+            "in_flight_count": in_flight,
+            "local_in_flight_count": local_in_flight,
+            "processing_worker_count": processing_worker_count,
+            "reaped_count": reaped,
+            "visibility_timeout_seconds": self.visibility_timeout_seconds,
             "redis_url": _mask_redis_url(self.redis_url),
             "queue_name": self.queue_name,
             "max_attempts": self.max_attempts,
@@ -704,12 +1091,7 @@ class RedisJobRunner:
             fn = self._task_registry.get(task_name)
         if callable(fn):
             return fn
-        module_name = str(task_name.split(":", 1)[0] if ":" in task_name else "")
-        if self.allowed_import_prefixes and not any(
-            module_name.startswith(prefix) for prefix in self.allowed_import_prefixes
-        ):
-            return None
-        resolved = callable_from_task_name(task_name)
+        resolved = _resolve_allowed_task(task_name, self.allowed_import_prefixes)
         if callable(resolved):
             with self._lock:
                 self._task_registry[task_name] = resolved
@@ -726,7 +1108,7 @@ class RedisJobRunner:
         reason: str,
         error: Optional[Exception] = None,
         metadata: Optional[dict[str, Any]] = None,
-    ) -> None:
+    ) -> bool:
         retry_payload = payload if isinstance(payload, dict) else None
         current_attempt = _coerce_int((retry_payload or {}).get("attempt"), 0)
         configured_max = _coerce_int((retry_payload or {}).get("max_attempts"), self.max_attempts)
@@ -752,6 +1134,7 @@ class RedisJobRunner:
             "invalid_payload_shape",
             "invalid_task_envelope",
             "task_not_resolved",
+            "visibility_timeout_exceeded",
         }
         retry_allowed = reason not in non_retry_reasons
 
@@ -774,7 +1157,7 @@ class RedisJobRunner:
                 client.rpush(self.queue_name, encoded)
                 with self._lock:
                     self._retried += 1
-                return
+                return True
             except Exception as exc:
                 self._record_error(exc)
                 reason = f"retry_enqueue_failed:{reason}"
@@ -815,6 +1198,7 @@ class RedisJobRunner:
 
         with self._lock:
             self._failed += 1
+        return False
 
     def _worker_loop(self) -> None:
         while True:
@@ -836,73 +1220,255 @@ class RedisJobRunner:
             raw_payload: Any = item
             if isinstance(item, (list, tuple)) and len(item) >= 2:
                 raw_payload = item[1]
-            if isinstance(raw_payload, (bytes, bytearray)):
-                decoded_payload = raw_payload.decode("utf-8", errors="replace")
-            else:
-                decoded_payload = str(raw_payload)
+            self._handle_raw_payload(client, raw_payload)
+
+    def _reliable_worker_loop(self, worker_id: str) -> None:
+        processing_list = self.processing_list_name(worker_id)
+        registered = False
+        while True:
+            with self._lock:
+                if not self._started:
+                    break
+            client = self._ensure_client()
+            if client is None:
+                time.sleep(self.reconnect_sleep_seconds)
+                continue
             try:
-                payload = json.loads(decoded_payload)
-            except Exception as exc:
-                self._retry_or_dead_letter(
-                    client=client,
-                    payload=None,
-                    raw_payload=decoded_payload,
-                    task_name="",
-                    reason="invalid_payload_json",
-                    error=exc,
-                    metadata=None,
+                if not registered:
+                    client.sadd(self.processing_registry_key, worker_id)
+                    self._renew_lease(client, worker_id)
+                    registered = True
+                # BLMOVE hands the payload to this worker's processing list atomically: a crash after this
+                # point leaves it there for the reaper instead of losing it.
+                raw_payload = client.blmove(
+                    self.queue_name,
+                    processing_list,
+                    max(1, int(round(self.pop_timeout_seconds))),
+                    "LEFT",
+                    "RIGHT",
                 )
+            except Exception as exc:
+                self._record_error(exc)
+                time.sleep(self.reconnect_sleep_seconds)
                 continue
-            if not isinstance(payload, dict):
-                self._retry_or_dead_letter(
-                    client=client,
-                    payload=None,
-                    raw_payload=decoded_payload,
-                    task_name="",
-                    reason="invalid_payload_shape",
-                    error=None,
-                    metadata=None,
-                )
+            if raw_payload is None:
                 continue
-            task_name = str(payload.get("task_name") or "").strip()
-            args = payload.get("args", [])
-            kwargs = payload.get("kwargs", {})
-            payload_metadata = payload.get("metadata") if isinstance(payload.get("metadata"), dict) else None
-            if not task_name or not isinstance(args, list) or not isinstance(kwargs, dict):
-                self._retry_or_dead_letter(
-                    client=client,
-                    payload=payload,
-                    raw_payload=decoded_payload,
-                    task_name=task_name,
-                    reason="invalid_task_envelope",
-                    error=None,
-                    metadata=payload_metadata,
-                )
+            try:
+                self._handle_raw_payload(client, raw_payload, reliable=True)
+            finally:
+                try:
+                    client.lrem(processing_list, 1, raw_payload)
+                except Exception as exc:
+                    # The lease lapses once this worker stops renewing it; the reaper then redelivers.
+                    self._record_error(exc)
+
+    def _lease_loop(self) -> None:
+        next_reap_at = 0.0
+        interval = max(0.05, min(self.visibility_timeout_seconds / 3.0, self.reaper_interval_seconds))
+        while True:
+            with self._lock:
+                if not self._started:
+                    break
+                worker_ids = [wid for wid, t in self._reliable_workers.items() if t.is_alive()]
+            client = self._ensure_client()
+            if client is not None:
+                for worker_id in worker_ids:
+                    try:
+                        self._renew_lease(client, worker_id)
+                    except Exception as exc:
+                        self._record_error(exc)
+                if time.monotonic() >= next_reap_at:
+                    self.reap_expired_leases()
+                    next_reap_at = time.monotonic() + self.reaper_interval_seconds
+            self._lease_wakeup.wait(interval)
+
+    def _renew_lease(self, client: Any, worker_id: str) -> None:
+        client.set(
+            self.lease_key_name(worker_id),
+            str(time.time()),
+            px=max(1, int(self.visibility_timeout_seconds * 1000)),
+        )
+
+    def processing_list_name(self, worker_id: str) -> str:
+        return f"{self.processing_registry_key}:{worker_id}"
+
+    def lease_key_name(self, worker_id: str) -> str:
+        return f"{self.queue_name}:lease:{worker_id}"
+
+    def reap_expired_leases(self) -> int:
+        """Requeue tasks held by workers whose lease expired (crashed or killed mid-task)."""
+        client = self._ensure_client()
+        if client is None:
+            return 0
+        with self._lock:
+            own_ids = {wid for wid, t in self._reliable_workers.items() if t.is_alive()}
+        try:
+            members = client.smembers(self.processing_registry_key) or set()
+        except Exception as exc:
+            self._record_error(exc)
+            return 0
+        reaped = 0
+        for member in members:
+            worker_id = member.decode("utf-8", errors="replace") if isinstance(member, bytes) else str(member)
+            if worker_id in own_ids:
                 continue
-            fn = self._resolve_task_callable(task_name)
-            if fn is None:
-                self._retry_or_dead_letter(
-                    client=client,
-                    payload=payload,
-                    raw_payload=decoded_payload,
-                    task_name=task_name,
-                    reason="task_not_resolved",
-                    error=None,
-                    metadata=payload_metadata,
+            try:
+                moved = self._run_script(
+                    client,
+                    _REAP_PROCESSING_LIST_LUA,
+                    keys=[
+                        self.processing_list_name(worker_id),
+                        self.lease_key_name(worker_id),
+                        self.queue_name,
+                        self.processing_registry_key,
+                    ],
+                    args=[worker_id],
                 )
+            except Exception as exc:
+                self._record_error(exc)
                 continue
+            if _coerce_int(moved, -1) > 0:
+                reaped += int(moved)
+        if reaped:
+            with self._lock:
+                self._reaped += reaped
+        return reaped
+
+    def _in_flight_status(self) -> tuple[int, int]:
+        with self._lock:
+            local = int(self._in_flight)
+        if not self.reliable_queue:
+            return local, 0
+        client = self._ensure_client()
+        if client is None:
+            return -1, -1
+        try:
+            members = list(client.smembers(self.processing_registry_key) or [])
+            total = 0
+            for member in members:
+                worker_id = member.decode("utf-8", errors="replace") if isinstance(member, bytes) else str(member)
+                total += int(client.llen(self.processing_list_name(worker_id)))
+        except Exception as exc:
+            self._record_error(exc)
+            return -1, -1
+        return total, len(members)
+
+    def _run_script(self, client: Any, source: str, *, keys: list[str], args: list[Any]) -> Any:
+        with self._lock:
+            script = self._scripts.get(source)
+        if script is None:
+            script = client.register_script(source)
+            with self._lock:
+                self._scripts[source] = script
+        return script(keys=keys, args=args)
+
+    def _handle_raw_payload(self, client: Any, raw_payload: Any, *, reliable: bool = False) -> None:
+        if isinstance(raw_payload, (bytes, bytearray)):
+            decoded_payload = raw_payload.decode("utf-8", errors="replace")
+        else:
+            decoded_payload = str(raw_payload)
+        try:
+            payload = json.loads(decoded_payload)
+        except Exception as exc:
+            self._retry_or_dead_letter(
+                client=client,
+                payload=None,
+                raw_payload=decoded_payload,
+                task_name="",
+                reason="invalid_payload_json",
+                error=exc,
+                metadata=None,
+            )
+            return
+        if not isinstance(payload, dict):
+            self._retry_or_dead_letter(
+                client=client,
+                payload=None,
+                raw_payload=decoded_payload,
+                task_name="",
+                reason="invalid_payload_shape",
+                error=None,
+                metadata=None,
+            )
+            return
+        task_name = str(payload.get("task_name") or "").strip()
+        args = payload.get("args", [])
+        kwargs = payload.get("kwargs", {})
+        payload_metadata = payload.get("metadata") if isinstance(payload.get("metadata"), dict) else None
+        dispatch_id = str(payload.get("dispatch_id") or "").strip() if reliable else ""
+        if dispatch_id:
             try:
-                fn(*tuple(args), **kwargs)
+                deliveries = int(client.hincrby(self.deliveries_key, dispatch_id, 1))
             except Exception as exc:
+                self._record_error(exc)
+                deliveries = 0
+            max_attempts = max(1, _coerce_int(payload.get("max_attempts"), self.max_attempts))
+            if deliveries > max_attempts:
+                # Redelivered by the reaper more often than retries allow: likely kills its worker.
                 self._retry_or_dead_letter(
                     client=client,
                     payload=payload,
                     raw_payload=decoded_payload,
                     task_name=task_name,
-                    reason="task_execution_error",
-                    error=exc,
+                    reason="visibility_timeout_exceeded",
+                    error=None,
                     metadata=payload_metadata,
                 )
-            else:
-                with self._lock:
-                    self._completed += 1
+                self._forget_deliveries(client, dispatch_id)
+                return
+        if not task_name or not isinstance(args, list) or not isinstance(kwargs, dict):
+            self._retry_or_dead_letter(
+                client=client,
+                payload=payload,
+                raw_payload=decoded_payload,
+                task_name=task_name,
+                reason="invalid_task_envelope",
+                error=None,
+                metadata=payload_metadata,
+            )
+            self._forget_deliveries(client, dispatch_id)
+            return
+        fn = self._resolve_task_callable(task_name)
+        if fn is None:
+            self._retry_or_dead_letter(
+                client=client,
+                payload=payload,
+                raw_payload=decoded_payload,
+                task_name=task_name,
+                reason="task_not_resolved",
+                error=None,
+                metadata=payload_metadata,
+            )
+            self._forget_deliveries(client, dispatch_id)
+            return
+        with self._lock:
+            self._in_flight += 1
+        try:
+            fn(*tuple(args), **kwargs)
+        except Exception as exc:
+            retried = self._retry_or_dead_letter(
+                client=client,
+                payload=payload,
+                raw_payload=decoded_payload,
+                task_name=task_name,
+                reason="task_execution_error",
+                error=exc,
+                metadata=payload_metadata,
+            )
+            if not retried:
+                self._forget_deliveries(client, dispatch_id)
+        else:
+            with self._lock:
+                self._completed += 1
+            self._forget_deliveries(client, dispatch_id)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _forget_deliveries(self, client: Any, dispatch_id: str) -> None:
+        if not dispatch_id:
+            return
+        try:
+            client.hdel(self.deliveries_key, dispatch_id)
+        except Exception as exc:
+            self._record_error(exc)
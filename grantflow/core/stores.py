@@ -1,19 +1,34 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import json
 import os
 import sqlite3
 import threading
+import time
 from collections import deque
+from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 
 from grantflow.core.strategies.factory import DonorFactory
 from grantflow.swarm.state_contract import normalize_state_contract
 
 RUNTIME_STATE_KEYS = {"strategy", "donor_strategy"}
+JOB_INDEX_FILTER_COLUMNS = (
+    "tenant_id",
+    "donor_id",
+    "status",
+    "hitl_enabled",
+    "warning_level",
+    "grounding_risk_level",
+    "batch_id",
+)
+JOB_INDEX_COUNT_COLUMNS = ("citation_count", "draft_version_count", "review_comment_count", "job_event_count")
 DEFAULT_SQLITE_BUSY_TIMEOUT_MS = 5000
+DEFAULT_SQLITE_POOL_SIZE = 4
+DEFAULT_SQLITE_POOL_TIMEOUT_SECONDS = 30.0
 
 
 def _env(name: str, default: str) -> str:
@@ -34,6 +49,24 @@ def sqlite_busy_timeout_ms() -> int:
     return max(0, value)
 
 
+def sqlite_pool_size() -> int:
+    raw = _env("GRANTFLOW_SQLITE_POOL_SIZE", str(DEFAULT_SQLITE_POOL_SIZE))
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_SQLITE_POOL_SIZE
+    return max(1, value)
+
+
+def sqlite_pool_timeout_seconds() -> float:
+    raw = _env("GRANTFLOW_SQLITE_POOL_TIMEOUT_SECONDS", str(DEFAULT_SQLITE_POOL_TIMEOUT_SECONDS))
+    try:
+        value = float(raw)
+    except ValueError:
+        return DEFAULT_SQLITE_POOL_TIMEOUT_SECONDS
+    return max(0.0, value)
+
+
 def storage_mode(name: str, default: str = "inmem") -> str:
     return _env(name, default).strip().lower()
 
@@ -70,7 +103,9 @@ def prepare_state_for_storage(state: Any) -> Any:
     if not isinstance(state, dict):
         return sanitize_jsonable(state)
 
-    normalized_state = copy.deepcopy(state)
+    # normalize_state_contract only rebinds top-level keys and sanitize_jsonable rebuilds every container,
+    # so a shallow copy keeps the caller's state untouched without a full deep copy.
+    normalized_state = dict(state)
     normalize_state_contract(normalized_state, emit_legacy_aliases=True)
     stored_state: Dict[str, Any] = {}
     for key, value in normalized_state.items():
@@ -81,10 +116,11 @@ def prepare_state_for_storage(state: Any) -> Any:
 
 
 def restore_state_from_storage(state: Any) -> Any:
+    """Rehydrate a stored state; the result shares nested values with `state`, which is left unmodified."""
     if not isinstance(state, dict):
         return state
 
-    restored = copy.deepcopy(state)
+    restored = dict(state)
     donor_id = restored.get("donor_id") or restored.get("donor")
     if donor_id and "donor_strategy" not in restored and "strategy" not in restored:
         try:
@@ -97,12 +133,34 @@ def restore_state_from_storage(state: Any) -> Any:
     return restored
 
 
-def _normalize_state_in_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
-    out = copy.deepcopy(payload)
-    state = out.get("state")
+def copy_job_containers(value: Any) -> Any:
+    """Copy the dict/list skeleton of a job value; leaves and runtime objects (e.g. strategies) are shared."""
+    if isinstance(value, dict):
+        return {key: copy_job_containers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_job_containers(item) for item in value]
+    return value
+
+
+def _snapshot_job_patch(patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Detach written values from the caller and normalize a written state, copying nothing else."""
+    snapshot = {key: copy_job_containers(value) for key, value in patch.items()}
+    state = snapshot.get("state")
     if isinstance(state, dict):
         normalize_state_contract(state, emit_legacy_aliases=True)
-    return out
+    return snapshot
+
+
+def _job_payload_view(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """A reader's view of a stored snapshot: fresh top-level and state dicts over shared nested values.
+
+    Snapshots are never mutated in place, so readers may rebind keys freely but must copy a nested value
+    (see `copy_job_containers`) before mutating it.
+    """
+    view = dict(payload)
+    if isinstance(view.get("state"), dict):
+        view["state"] = dict(view["state"])
+    return view
 
 
 def prepare_job_payload_for_storage(payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -116,7 +174,8 @@ def prepare_job_payload_for_storage(payload: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def restore_job_payload_from_storage(payload: Dict[str, Any]) -> Dict[str, Any]:
-    restored = copy.deepcopy(payload)
+    """Rehydrate a freshly decoded payload. Callers hand over ownership, so nothing is deep-copied."""
+    restored = dict(payload)
     if "state" in restored:
         restored["state"] = restore_state_from_storage(restored["state"])
     return restored
@@ -130,8 +189,8 @@ def storage_json_loads(value: str) -> Any:
     return json.loads(value)
 
 
-def open_sqlite_connection(db_path: str) -> sqlite3.Connection:
-    conn = sqlite3.connect(db_path, timeout=30)
+def open_sqlite_connection(db_path: str, *, check_same_thread: bool = True) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, timeout=30, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
     conn.execute(f"PRAGMA busy_timeout = {sqlite_busy_timeout_ms()}")
     conn.execute("PRAGMA journal_mode = WAL")
@@ -139,6 +198,219 @@ def open_sqlite_connection(db_path: str) -> sqlite3.Connection:
     return conn
 
 
+class SQLiteConnectionPool:
+    """Long-lived SQLite connections for one database file.
+
+    WAL mode lets readers run alongside a single writer, so reads borrow from a bounded
+    set of reader connections while writes serialize on one dedicated writer connection.
+    Connections are opened lazily and keep their PRAGMAs for the life of the pool.
+    """
+
+    def __init__(self, db_path: str, *, max_readers: int, timeout_seconds: float) -> None:
+        self.db_path = str(db_path)
+        self.max_readers = max(1, int(max_readers))
+        self.timeout_seconds = max(0.0, float(timeout_seconds))
+        self._cond = threading.Condition(threading.Lock())
+        self._writer_lock = threading.RLock()
+        self._local = threading.local()
+        self._reset_connections()
+
+    def _reset_connections(self) -> None:
+        self._pid = os.getpid()
+        self._idle_readers: list[sqlite3.Connection] = []
+        self._open_readers = 0
+        self._borrowed_readers = 0
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_borrowed = False
+        self._reader_borrow_count = 0
+        self._writer_borrow_count = 0
+        self._reader_wait_seconds_total = 0.0
+        self._writer_wait_seconds_total = 0.0
+        self._max_wait_seconds = 0.0
+        self._timeouts = 0
+        self._discarded = 0
+
+    def _check_pid(self) -> None:
+        # SQLite handles must not cross fork(); a child process starts with a fresh pool.
+        if self._pid != os.getpid():
+            with self._cond:
+                if self._pid != os.getpid():
+                    self._local = threading.local()
+                    self._reset_connections()
+
+    def _open(self) -> sqlite3.Connection:
+        return open_sqlite_connection(self.db_path, check_same_thread=False)
+
+    def _record_wait(self, waited: float, *, writer: bool) -> None:
+        if writer:
+            self._writer_borrow_count += 1
+            self._writer_wait_seconds_total += waited
+        else:
+            self._reader_borrow_count += 1
+            self._reader_wait_seconds_total += waited
+        self._max_wait_seconds = max(self._max_wait_seconds, waited)
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        self._check_pid()
+        held = getattr(self._local, "reader", None)
+        if held is not None:
+            yield held
+            return
+
+        started = time.monotonic()
+        conn: Optional[sqlite3.Connection] = None
+        with self._cond:
+            while not self._idle_readers and self._open_readers >= self.max_readers:
+                remaining = self.timeout_seconds - (time.monotonic() - started)
+                if remaining <= 0 or not self._cond.wait(timeout=remaining):
+                    if not self._idle_readers and self._open_readers >= self.max_readers:
+                        self._timeouts += 1
+                        raise RuntimeError(
+                            f"SQLite reader pool exhausted for {self.db_path} "
+                            f"({self.max_readers} connections, waited {self.timeout_seconds:.1f}s)"
+                        )
+            if self._idle_readers:
+                conn = self._idle_readers.pop()
+            else:
+                self._open_readers += 1
+            self._borrowed_readers += 1
+            self._record_wait(time.monotonic() - started, writer=False)
+
+        healthy = True
+        try:
+            if conn is None:
+                conn = self._open()
+            self._local.reader = conn
+            yield conn
+        except (sqlite3.ProgrammingError, sqlite3.InterfaceError):
+            healthy = False
+            raise
+        finally:
+            self._local.reader = None
+            with self._cond:
+                self._borrowed_readers -= 1
+                if conn is not None and healthy:
+                    self._idle_readers.append(conn)
+                else:
+                    self._open_readers -= 1
+                    self._discarded += 1
+                    if conn is not None:
+                        conn.close()
+                self._cond.notify()
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        self._check_pid()
+        if getattr(self._local, "writer_depth", 0):
+            assert self._writer is not None
+            self._local.writer_depth += 1
+            try:
+                yield self._writer
+            finally:
+                self._local.writer_depth -= 1
+            return
+
+        started = time.monotonic()
+        timeout = self.timeout_seconds if self.timeout_seconds > 0 else -1
+        if not self._writer_lock.acquire(timeout=timeout):
+            with self._cond:
+                self._timeouts += 1
+            raise RuntimeError(f"Timed out waiting for SQLite writer connection for {self.db_path}")
+        try:
+            with self._cond:
+                self._record_wait(time.monotonic() - started, writer=True)
+                self._writer_borrowed = True
+            if self._writer is None:
+                self._writer = self._open()
+            conn = self._writer
+            self._local.writer_depth = 1
+            try:
+                with conn:
+                    yield conn
+            except (sqlite3.ProgrammingError, sqlite3.InterfaceError):
+                with self._cond:
+                    self._discarded += 1
+                self._writer = None
+                conn.close()
+                raise
+            finally:
+                self._local.writer_depth = 0
+        finally:
+            with self._cond:
+                self._writer_borrowed = False
+            self._writer_lock.release()
+
+    def close(self) -> None:
+        with self._writer_lock:
+            with self._cond:
+                for conn in self._idle_readers:
+                    conn.close()
+                self._open_readers -= len(self._idle_readers)
+                self._idle_readers = []
+                if self._writer is not None:
+                    self._writer.close()
+                    self._writer = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            reader_borrows = int(self._reader_borrow_count)
+            writer_borrows = int(self._writer_borrow_count)
+            return {
+                "path": self.db_path,
+                "max_readers": self.max_readers,
+                "open_connections": int(self._open_readers) + (1 if self._writer is not None else 0),
+                "open_readers": int(self._open_readers),
+                "idle_readers": len(self._idle_readers),
+                "borrowed_readers": int(self._borrowed_readers),
+                "writer_open": self._writer is not None,
+                "writer_borrowed": bool(self._writer_borrowed),
+                "reader_borrow_count": reader_borrows,
+                "writer_borrow_count": writer_borrows,
+                "reader_wait_ms_avg": (
+                    round(1000.0 * self._reader_wait_seconds_total / reader_borrows, 3) if reader_borrows else 0.0
+                ),
+                "writer_wait_ms_avg": (
+                    round(1000.0 * self._writer_wait_seconds_total / writer_borrows, 3) if writer_borrows else 0.0
+                ),
+                "wait_ms_max": round(1000.0 * self._max_wait_seconds, 3),
+                "timeout_count": int(self._timeouts),
+                "discarded_count": int(self._discarded),
+            }
+
+
+_SQLITE_POOLS: Dict[str, SQLiteConnectionPool] = {}
+_SQLITE_POOLS_LOCK = threading.Lock()
+
+
+def sqlite_connection_pool(db_path: str) -> SQLiteConnectionPool:
+    key = os.path.abspath(str(db_path))
+    with _SQLITE_POOLS_LOCK:
+        pool = _SQLITE_POOLS.get(key)
+        if pool is None:
+            pool = SQLiteConnectionPool(
+                str(db_path),
+                max_readers=sqlite_pool_size(),
+                timeout_seconds=sqlite_pool_timeout_seconds(),
+            )
+            _SQLITE_POOLS[key] = pool
+        return pool
+
+
+def sqlite_pool_stats() -> list[Dict[str, Any]]:
+    with _SQLITE_POOLS_LOCK:
+        pools = list(_SQLITE_POOLS.values())
+    return [pool.stats() for pool in pools]
+
+
+def close_sqlite_connection_pools() -> None:
+    with _SQLITE_POOLS_LOCK:
+        pools = list(_SQLITE_POOLS.values())
+        _SQLITE_POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
 def ensure_sqlite_schema_meta(conn: sqlite3.Connection) -> None:
     conn.execute("""
         CREATE TABLE IF NOT EXISTS schema_meta (
@@ -180,32 +452,237 @@ def ensure_sqlite_component_schema(conn: sqlite3.Connection, component: str, tar
     return target_version
 
 
+JobIndexFieldsFn = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def _list_len(value: Any) -> int:
+    return len(value) if isinstance(value, list) else 0
+
+
+def _header_batch_id(payload: Dict[str, Any]) -> str:
+    batch_raw = payload.get("batch")
+    batch: Dict[str, Any] = batch_raw if isinstance(batch_raw, dict) else {}
+    return str(batch.get("batch_id") or "")
+
+
+def default_job_index_fields(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Index columns derivable from the raw job payload without API-layer helpers.
+
+    Columns left out of the returned mapping are stored as NULL and treated as unknown,
+    so filters on them never exclude a job.
+    """
+    state_raw = payload.get("state")
+    state: Dict[str, Any] = state_raw if isinstance(state_raw, dict) else {}
+    raw_events = payload.get("job_events")
+    events = [row for row in raw_events if isinstance(row, dict)] if isinstance(raw_events, list) else []
+    event_timestamps = sorted(str(row.get("ts") or "") for row in events if str(row.get("ts") or ""))
+    return {
+        "status": str(payload.get("status") or ""),
+        "batch_id": _header_batch_id(payload),
+        "hitl_enabled": bool(payload.get("hitl_enabled")),
+        "created_at": event_timestamps[0] if event_timestamps else None,
+        "citation_count": _list_len(state.get("citations")),
+        "draft_version_count": _list_len(state.get("draft_versions")),
+        "review_comment_count": _list_len(payload.get("review_comments")),
+        "job_event_count": len(events),
+    }
+
+
+def normalize_job_index_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
+    normalized: Dict[str, Any] = {}
+    for column in JOB_INDEX_FILTER_COLUMNS:
+        value = filters.get(column)
+        if value is None:
+            continue
+        if column == "hitl_enabled":
+            normalized[column] = bool(value)
+            continue
+        token = str(value)
+        if token:
+            normalized[column] = token
+    return normalized
+
+
+def job_index_matches(index_row: Optional[Dict[str, Any]], filters: Dict[str, Any]) -> bool:
+    if not index_row:
+        return True
+    for column, expected in filters.items():
+        value = index_row.get(column)
+        if value is None:
+            continue
+        if column == "hitl_enabled":
+            if bool(value) != bool(expected):
+                return False
+        elif str(value) != str(expected):
+            return False
+    return True
+
+
+def _safe_job_index_fields(index_fields_fn: JobIndexFieldsFn, payload: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        fields = index_fields_fn(payload)
+    except Exception:
+        # A broken extractor must never block job writes; fall back to the payload-only columns.
+        fields = default_job_index_fields(payload)
+    return dict(fields) if isinstance(fields, dict) else {}
+
+
+def _unseen_rows(existing: list[Any], rows: list[Any], unique_fields: Sequence[str]) -> list[Any]:
+    """Drop rows whose `unique_fields` values match a stored row (or an earlier row in the same append)."""
+    if not unique_fields:
+        return list(rows)
+    seen = {tuple(row.get(field) for field in unique_fields) for row in existing if isinstance(row, dict)}
+    unseen: list[Any] = []
+    for row in rows:
+        key = tuple(row.get(field) for field in unique_fields) if isinstance(row, dict) else None
+        if key is not None and key in seen:
+            continue
+        if key is not None:
+            seen.add(key)
+        unseen.append(row)
+    return unseen
+
+
+class JobRevisionConflict(RuntimeError):
+    """A conditional job write lost the race: the stored revision moved past `expected_revision`."""
+
+    def __init__(self, job_id: str, expected_revision: int, actual_revision: int) -> None:
+        super().__init__(f"Job {job_id} revision conflict: expected {expected_revision}, found {actual_revision}")
+        self.job_id = job_id
+        self.expected_revision = expected_revision
+        self.actual_revision = actual_revision
+
+
 class InMemoryJobStore:
-    def __init__(self) -> None:
+    def __init__(self, index_fields_fn: Optional[JobIndexFieldsFn] = None) -> None:
         self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._revisions: Dict[str, int] = {}
+        self._write_seqs: Dict[str, int] = {}
+        self._write_seq = 0
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._index_fields_fn: JobIndexFieldsFn = index_fields_fn or default_job_index_fields
         self._lock = threading.Lock()
 
-    def set(self, job_id: str, payload: Dict[str, Any]) -> None:
-        normalized_payload = _normalize_state_in_payload(payload)
+    def _check_revision(self, job_id: str, expected_revision: Optional[int]) -> None:
+        actual = self._revisions.get(job_id, 0)
+        if expected_revision is not None and int(expected_revision) != actual:
+            raise JobRevisionConflict(job_id, int(expected_revision), actual)
+        self._revisions[job_id] = actual + 1
+
+    def _store_snapshot(self, job_id: str, snapshot: Dict[str, Any], index_row: Dict[str, Any]) -> None:
+        # Re-inserting keeps every dict in write order, so listings walk them newest-first.
+        self._write_seq += 1
+        for mapping in (self._jobs, self._index, self._write_seqs):
+            mapping.pop(job_id, None)
+        self._jobs[job_id] = snapshot
+        self._index[job_id] = index_row
+        self._write_seqs[job_id] = self._write_seq
+
+    def set(self, job_id: str, payload: Dict[str, Any], *, expected_revision: Optional[int] = None) -> int:
+        snapshot = _snapshot_job_patch(payload)
+        index_row = _safe_job_index_fields(self._index_fields_fn, snapshot)
         with self._lock:
-            self._jobs[job_id] = copy.deepcopy(normalized_payload)
+            self._check_revision(job_id, expected_revision)
+            self._store_snapshot(job_id, snapshot, index_row)
+            return self._write_seq
+
+    def update(self, job_id: str, *, expected_revision: Optional[int] = None, **patch: Any) -> int:
+        # Copy-on-write: only the patched branches are copied; untouched keys keep sharing the previous
+        # snapshot, whose state was already normalized when it was written.
+        patch_snapshot = _snapshot_job_patch(patch)
+        with self._lock:
+            self._check_revision(job_id, expected_revision)
+            snapshot = {**self._jobs.get(job_id, {}), **patch_snapshot}
+            self._store_snapshot(job_id, snapshot, _safe_job_index_fields(self._index_fields_fn, snapshot))
+            return self._write_seq
 
-    def update(self, job_id: str, **patch: Any) -> Dict[str, Any]:
+    def append_rows(
+        self,
+        job_id: str,
+        collection: str,
+        rows: list[Any],
+        *,
+        keep_last: Optional[int] = None,
+        expected_revision: Optional[int] = None,
+        unique_fields: Sequence[str] = (),
+        **patch: Any,
+    ) -> Optional[int]:
+        """Append to a top-level job collection (and apply `patch`) in one write; see `SQLiteJobStore.append_rows`."""
+        if collection in patch:
+            raise ValueError(f"Cannot both append to and replace job collection {collection!r}")
+        rows_snapshot = _snapshot_job_patch({collection: list(rows)})[collection]
+        patch_snapshot = _snapshot_job_patch(patch)
         with self._lock:
-            current = copy.deepcopy(self._jobs.get(job_id, {}))
-            current.update(patch)
-            normalized = _normalize_state_in_payload(current)
-            self._jobs[job_id] = copy.deepcopy(normalized)
-            return copy.deepcopy(normalized)
+            current = self._jobs.get(job_id)
+            if current is None:
+                return None
+            raw_existing = current.get(collection)
+            existing = raw_existing if isinstance(raw_existing, list) else []
+            appended = _unseen_rows(existing, rows_snapshot, unique_fields)
+            if not appended and not patch_snapshot:
+                return None
+            self._check_revision(job_id, expected_revision)
+            merged = [*existing, *appended]
+            if keep_last is not None:
+                merged = merged[-keep_last:]
+            snapshot = {**current, **patch_snapshot, collection: merged}
+            self._store_snapshot(job_id, snapshot, _safe_job_index_fields(self._index_fields_fn, snapshot))
+            return self._write_seq
 
     def get(self, job_id: str) -> Optional[Dict[str, Any]]:
         with self._lock:
             payload = self._jobs.get(job_id)
-            return copy.deepcopy(payload) if payload is not None else None
+        return _job_payload_view(payload) if payload is not None else None
+
+    def get_with_revision(self, job_id: str) -> tuple[Optional[Dict[str, Any]], int]:
+        with self._lock:
+            payload = self._jobs.get(job_id)
+            revision = self._revisions.get(job_id, 0)
+        return (_job_payload_view(payload) if payload is not None else None), revision
+
+    def get_index(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._index.get(job_id)
+        return {"job_id": job_id, **row} if row is not None else None
 
     def list(self) -> Dict[str, Dict[str, Any]]:
         with self._lock:
-            return {job_id: copy.deepcopy(payload) for job_id, payload in self._jobs.items()}
+            snapshots = list(reversed(self._jobs.items()))
+        return {job_id: _job_payload_view(payload) for job_id, payload in snapshots}
+
+    def list_index(self, **filters: Any) -> List[Dict[str, Any]]:
+        normalized_filters = normalize_job_index_filters(filters)
+        with self._lock:
+            return [
+                {"job_id": job_id, **row}
+                for job_id, row in reversed(self._index.items())
+                if job_index_matches(row, normalized_filters)
+            ]
+
+    def list_filtered(self, **filters: Any) -> Dict[str, Dict[str, Any]]:
+        normalized_filters = normalize_job_index_filters(filters)
+        with self._lock:
+            snapshots = [
+                (job_id, payload)
+                for job_id, payload in reversed(self._jobs.items())
+                if job_index_matches(self._index.get(job_id), normalized_filters)
+            ]
+        return {job_id: _job_payload_view(payload) for job_id, payload in snapshots}
+
+    def change_watermark(self) -> int:
+        with self._lock:
+            return self._write_seq
+
+    def list_changes(self, since: int = 0) -> List[tuple[str, int]]:
+        """Jobs written after write sequence `since`, oldest write first, with their latest write sequence."""
+        changes: List[tuple[str, int]] = []
+        with self._lock:
+            for job_id, write_seq in reversed(self._write_seqs.items()):
+                if write_seq <= since:
+                    break
+                changes.append((job_id, write_seq))
+        changes.reverse()
+        return changes
 
 
 class InMemoryIngestAuditStore:
@@ -298,80 +775,575 @@ class InMemoryIngestAuditStore:
         )
 
 
+# Append-mostly job collections stored one row per item, keyed by job_id, instead of inline in payload_json.
+# The header keeps a reference marker at the collection's path so reads can reassemble the original shape.
+JOB_COLLECTION_TABLES: Dict[tuple[str, ...], str] = {
+    ("job_events",): "job_events",
+    ("review_comments",): "job_review_comments",
+    ("state", "draft_versions"): "job_draft_versions",
+    ("state", "citations"): "job_citations",
+}
+JOB_COLLECTION_REF_KEY = "$rows"
+# Top-level collections writers can append to without reading the stored rows back.
+JOB_APPENDABLE_COLLECTIONS: Dict[str, str] = {
+    path[0]: table for path, table in JOB_COLLECTION_TABLES.items() if len(path) == 1
+}
+# job_index columns derived from each collection (plus its parent branch). A write that leaves a collection
+# referenced rewrote neither, so these columns keep their stored values instead of reloading the rows.
+JOB_COLLECTION_INDEX_COLUMNS: Dict[str, tuple[str, ...]] = {
+    "job_events": ("job_event_count",),
+    "job_review_comments": ("review_comment_count",),
+    "job_draft_versions": ("draft_version_count",),
+    "job_citations": ("citation_count", "grounding_risk_level"),
+}
+JOB_COLLECTION_COUNT_COLUMNS: Dict[str, str] = {
+    "job_events": "job_event_count",
+    "job_review_comments": "review_comment_count",
+    "job_draft_versions": "draft_version_count",
+    "job_citations": "citation_count",
+}
+# Evaluated inside the write transaction, which already holds the database write lock.
+JOB_NEXT_WRITE_SEQ_SQL = "SELECT COALESCE(MAX(write_seq), 0) + 1 FROM jobs"
+
+
+def _collection_ref(value: Any) -> Optional[str]:
+    if isinstance(value, dict) and len(value) == 1 and isinstance(value.get(JOB_COLLECTION_REF_KEY), str):
+        return str(value[JOB_COLLECTION_REF_KEY])
+    return None
+
+
+def _collection_parent(payload: Dict[str, Any], path: tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    parent: Any = payload
+    for key in path[:-1]:
+        parent = parent.get(key) if isinstance(parent, dict) else None
+    return parent if isinstance(parent, dict) else None
+
+
+def split_job_collections(stored_payload: Dict[str, Any]) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    """Split a storage-ready payload into its header and per-table collection values.
+
+    Collection values are the inline list to sync, the table name when the header already references
+    stored rows (nothing to write), or None when the payload no longer carries that collection.
+    """
+    header = dict(stored_payload)
+    if isinstance(header.get("state"), dict):
+        header["state"] = dict(header["state"])
+    collections: Dict[str, Any] = {}
+    for path, table in JOB_COLLECTION_TABLES.items():
+        parent = _collection_parent(header, path)
+        value = parent.get(path[-1]) if parent is not None else None
+        if _collection_ref(value) == table:
+            collections[table] = table
+        elif isinstance(value, list) and parent is not None:
+            collections[table] = value
+            parent[path[-1]] = {JOB_COLLECTION_REF_KEY: table}
+        else:
+            collections[table] = None
+    return header, collections
+
+
+def join_job_collections(header: Dict[str, Any], rows_by_table: Dict[str, list[Any]]) -> Dict[str, Any]:
+    payload = dict(header)
+    if isinstance(payload.get("state"), dict):
+        payload["state"] = dict(payload["state"])
+    for path, table in JOB_COLLECTION_TABLES.items():
+        parent = _collection_parent(payload, path)
+        if parent is not None and _collection_ref(parent.get(path[-1])) == table:
+            parent[path[-1]] = list(rows_by_table.get(table) or [])
+    return payload
+
+
+JOB_INDEX_SELECT_SQL = (
+    "SELECT j.job_id AS job_id, ji.tenant_id, ji.donor_id, ji.status, ji.hitl_enabled, ji.warning_level, "
+    "ji.grounding_risk_level, ji.created_at, ji.updated_at, ji.citation_count, ji.draft_version_count, "
+    "ji.review_comment_count, ji.job_event_count, ji.batch_id "
+    "FROM jobs j LEFT JOIN job_index ji ON ji.job_id = j.job_id"
+)
+
+
+def _job_index_item(row: Any) -> Dict[str, Any]:
+    item = dict(row)
+    if item.get("hitl_enabled") is not None:
+        item["hitl_enabled"] = bool(item["hitl_enabled"])
+    return item
+
+
+def _collection_offset(old_hashes: list[str], new_hashes: list[str]) -> int:
+    """How many leading stored rows the new list dropped; usually 0 (append) or the trimmed head length."""
+    if not new_hashes:
+        return len(old_hashes)
+    for offset, row_hash in enumerate(old_hashes):
+        if row_hash != new_hashes[0]:
+            continue
+        overlap = min(len(old_hashes) - offset, len(new_hashes))
+        if old_hashes[offset : offset + overlap] == new_hashes[:overlap]:
+            return offset
+    # No aligned run (e.g. an edited first item): compare positionally against the stored tail.
+    return max(0, len(old_hashes) - len(new_hashes))
+
+
 class SQLiteJobStore:
     SCHEMA_COMPONENT = "jobs"
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 3
+    INDEX_SCHEMA_COMPONENT = "job_index"
+    INDEX_SCHEMA_VERSION = 2
+    COLLECTIONS_SCHEMA_COMPONENT = "job_collections"
+    COLLECTIONS_SCHEMA_VERSION = 1
 
-    def __init__(self, db_path: Optional[str] = None) -> None:
+    def __init__(self, db_path: Optional[str] = None, index_fields_fn: Optional[JobIndexFieldsFn] = None) -> None:
         self.db_path = db_path or default_sqlite_path()
-        self._write_lock = threading.Lock()
+        self._index_fields_fn: JobIndexFieldsFn = index_fields_fn or default_job_index_fields
+        self._pool = sqlite_connection_pool(self.db_path)
         self._init_db()
 
-    def _connect(self) -> sqlite3.Connection:
-        return open_sqlite_connection(self.db_path)
-
     def _init_db(self) -> None:
-        with self._connect() as conn:
+        with self._pool.writer() as conn:
             ensure_sqlite_component_schema(conn, self.SCHEMA_COMPONENT, self.SCHEMA_VERSION)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS jobs (
                   job_id TEXT PRIMARY KEY,
                   payload_json TEXT NOT NULL,
-                  updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                  updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                  revision INTEGER NOT NULL DEFAULT 0,
+                  write_seq INTEGER NOT NULL DEFAULT 0
                 )
                 """)
-
-    def set(self, job_id: str, payload: Dict[str, Any]) -> None:
-        stored_payload = prepare_job_payload_for_storage(payload)
-        payload_json = storage_json_dumps(stored_payload)
-        with self._write_lock:
-            with self._connect() as conn:
-                conn.execute(
-                    """
-                    INSERT INTO jobs (job_id, payload_json, updated_at)
-                    VALUES (?, ?, CURRENT_TIMESTAMP)
-                    ON CONFLICT(job_id) DO UPDATE SET
-                      payload_json=excluded.payload_json,
-                      updated_at=CURRENT_TIMESTAMP
-                    """,
-                    (job_id, payload_json),
+            job_columns = {str(row["name"]) for row in conn.execute("PRAGMA table_info(jobs)").fetchall()}
+            if "revision" not in job_columns:
+                # v1 -> v2: every write bumps `revision`, which conditional updates compare against.
+                conn.execute("ALTER TABLE jobs ADD COLUMN revision INTEGER NOT NULL DEFAULT 0")
+            if "write_seq" not in job_columns:
+                # v2 -> v3: a store-wide write sequence orders listings and lets readers in other processes
+                # find what changed; existing jobs are numbered in their previous `updated_at` order.
+                conn.execute("ALTER TABLE jobs ADD COLUMN write_seq INTEGER NOT NULL DEFAULT 0")
+                ordered = conn.execute("SELECT job_id FROM jobs ORDER BY updated_at, rowid").fetchall()
+                conn.executemany(
+                    "UPDATE jobs SET write_seq = ? WHERE job_id = ?",
+                    [(index, str(row["job_id"])) for index, row in enumerate(ordered, start=1)],
+                )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_write_seq ON jobs (write_seq)")
+            ensure_sqlite_component_schema(conn, self.INDEX_SCHEMA_COMPONENT, self.INDEX_SCHEMA_VERSION)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_index (
+                  job_id TEXT PRIMARY KEY,
+                  tenant_id TEXT,
+                  donor_id TEXT,
+                  status TEXT,
+                  hitl_enabled INTEGER,
+                  warning_level TEXT,
+                  grounding_risk_level TEXT,
+                  created_at TEXT,
+                  updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                  citation_count INTEGER NOT NULL DEFAULT 0,
+                  draft_version_count INTEGER NOT NULL DEFAULT 0,
+                  review_comment_count INTEGER NOT NULL DEFAULT 0,
+                  job_event_count INTEGER NOT NULL DEFAULT 0,
+                  batch_id TEXT
+                )
+                """)
+            index_columns = {str(row["name"]) for row in conn.execute("PRAGMA table_info(job_index)").fetchall()}
+            if "batch_id" not in index_columns:
+                # v1 -> v2: backfill from the stored header (`batch` is never split out), "" meaning no batch.
+                conn.execute("ALTER TABLE job_index ADD COLUMN batch_id TEXT")
+                indexed = conn.execute(
+                    "SELECT j.job_id, j.payload_json FROM jobs j JOIN job_index ji ON ji.job_id = j.job_id"
+                ).fetchall()
+                conn.executemany(
+                    "UPDATE job_index SET batch_id = ? WHERE job_id = ?",
+                    [
+                        (_header_batch_id(storage_json_loads(row["payload_json"])), str(row["job_id"]))
+                        for row in indexed
+                    ],
+                )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_job_index_tenant_donor_status ON job_index (tenant_id, donor_id, status)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_index_batch ON job_index (batch_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_index_status ON job_index (status)")
+            ensure_sqlite_component_schema(conn, self.COLLECTIONS_SCHEMA_COMPONENT, self.COLLECTIONS_SCHEMA_VERSION)
+            for table in JOB_COLLECTION_TABLES.values():
+                conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
+                      job_id TEXT NOT NULL,
+                      seq INTEGER NOT NULL,
+                      row_hash TEXT NOT NULL,
+                      row_json TEXT NOT NULL,
+                      PRIMARY KEY (job_id, seq)
+                    )
+                    """)
+            missing = conn.execute("""
+                SELECT j.job_id, j.payload_json
+                FROM jobs j LEFT JOIN job_index ji ON ji.job_id = j.job_id
+                WHERE ji.job_id IS NULL
+                """).fetchall()
+            for row in missing:
+                job_id = str(row["job_id"])
+                header = storage_json_loads(row["payload_json"])
+                self._write_index_row(
+                    conn, job_id, join_job_collections(header, self._load_rows(conn, [job_id])[job_id])
                 )
 
-    def update(self, job_id: str, **patch: Any) -> Dict[str, Any]:
-        with self._write_lock:
-            with self._connect() as conn:
-                row = conn.execute("SELECT payload_json FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
-                current: Dict[str, Any] = storage_json_loads(row["payload_json"]) if row else {}
-                merged = dict(current)
-                merged.update(prepare_job_payload_for_storage(patch))
+    def _write_index_row(
+        self,
+        conn: sqlite3.Connection,
+        job_id: str,
+        stored_payload: Dict[str, Any],
+        *,
+        keep_columns: Sequence[str] = (),
+    ) -> None:
+        """Upsert the job's index row; `keep_columns` keep their stored value when the row already exists."""
+        fields = _safe_job_index_fields(self._index_fields_fn, stored_payload)
+        hitl_enabled = fields.get("hitl_enabled")
+        assignments = ",\n".join(
+            f"{column}=job_index.{column}" if column in keep_columns else f"{column}=excluded.{column}"
+            for column in (
+                "tenant_id",
+                "donor_id",
+                "status",
+                "hitl_enabled",
+                "warning_level",
+                "grounding_risk_level",
+                *JOB_INDEX_COUNT_COLUMNS,
+                "batch_id",
+            )
+        )
+        conn.execute(
+            f"""
+            INSERT INTO job_index (
+              job_id, tenant_id, donor_id, status, hitl_enabled, warning_level, grounding_risk_level,
+              created_at, updated_at, citation_count, draft_version_count, review_comment_count, job_event_count,
+              batch_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), CURRENT_TIMESTAMP, ?, ?, ?, ?, ?)
+            ON CONFLICT(job_id) DO UPDATE SET
+              {assignments},
+              created_at=COALESCE(job_index.created_at, excluded.created_at),
+              updated_at=CURRENT_TIMESTAMP
+            """,
+            (
+                job_id,
+                None if fields.get("tenant_id") is None else str(fields.get("tenant_id")),
+                None if fields.get("donor_id") is None else str(fields.get("donor_id")),
+                None if fields.get("status") is None else str(fields.get("status")),
+                None if hitl_enabled is None else int(bool(hitl_enabled)),
+                None if fields.get("warning_level") is None else str(fields.get("warning_level")),
+                None if fields.get("grounding_risk_level") is None else str(fields.get("grounding_risk_level")),
+                fields.get("created_at") or None,
+                *(int(fields.get(column) or 0) for column in JOB_INDEX_COUNT_COLUMNS),
+                None if fields.get("batch_id") is None else str(fields.get("batch_id")),
+            ),
+        )
+
+    def rebuild_index(self) -> int:
+        with self._pool.writer() as conn:
+            rows = conn.execute("SELECT job_id, payload_json FROM jobs").fetchall()
+            rows_by_job = self._load_rows(conn, None)
+            conn.execute("DELETE FROM job_index")
+            for row in rows:
+                job_id = str(row["job_id"])
+                header = storage_json_loads(row["payload_json"])
+                self._write_index_row(conn, job_id, join_job_collections(header, rows_by_job.get(job_id, {})))
+        return len(rows)
+
+    @staticmethod
+    def _load_rows(conn: sqlite3.Connection, job_ids: Optional[list[str]]) -> Dict[str, Dict[str, list[Any]]]:
+        """Load collection rows per job and table, for the given jobs or for every job when `job_ids` is None."""
+        rows_by_job: Dict[str, Dict[str, list[Any]]] = {job_id: {} for job_id in job_ids or []}
+        id_chunks: list[Optional[list[str]]] = [None] if job_ids is None else []
+        for start in range(0, len(job_ids or []), 500):
+            id_chunks.append(list(job_ids or [])[start : start + 500])
+        for table in JOB_COLLECTION_TABLES.values():
+            for chunk in id_chunks:
+                if chunk is None:
+                    rows = conn.execute(f"SELECT job_id, row_json FROM {table} ORDER BY job_id, seq").fetchall()
+                else:
+                    placeholders = ",".join("?" for _ in chunk)
+                    rows = conn.execute(
+                        f"SELECT job_id, row_json FROM {table} WHERE job_id IN ({placeholders}) ORDER BY job_id, seq",
+                        tuple(chunk),
+                    ).fetchall()
+                for row in rows:
+                    job_rows = rows_by_job.setdefault(str(row["job_id"]), {})
+                    job_rows.setdefault(table, []).append(storage_json_loads(row["row_json"]))
+        return rows_by_job
+
+    @staticmethod
+    def _sync_collection(conn: sqlite3.Connection, table: str, job_id: str, items: Optional[list[Any]]) -> int:
+        """Make the stored rows equal `items` by touching only the rows that differ; returns rows written."""
+        existing = conn.execute(
+            f"SELECT seq, row_hash FROM {table} WHERE job_id = ? ORDER BY seq", (job_id,)
+        ).fetchall()
+        seqs = [int(row["seq"]) for row in existing]
+        old_hashes = [str(row["row_hash"]) for row in existing]
+        encoded = [storage_json_dumps(item) for item in items or []]
+        new_hashes = [hashlib.sha1(text.encode("utf-8")).hexdigest() for text in encoded]
+        offset = _collection_offset(old_hashes, new_hashes)
+        writes = 0
+        if offset:
+            conn.execute(f"DELETE FROM {table} WHERE job_id = ? AND seq <= ?", (job_id, seqs[offset - 1]))
+            writes += offset
+        overlap = min(len(seqs) - offset, len(encoded))
+        for index in range(overlap):
+            if old_hashes[offset + index] != new_hashes[index]:
                 conn.execute(
-                    """
-                    INSERT INTO jobs (job_id, payload_json, updated_at)
-                    VALUES (?, ?, CURRENT_TIMESTAMP)
-                    ON CONFLICT(job_id) DO UPDATE SET
-                      payload_json=excluded.payload_json,
-                      updated_at=CURRENT_TIMESTAMP
-                    """,
-                    (job_id, storage_json_dumps(merged)),
+                    f"UPDATE {table} SET row_hash = ?, row_json = ? WHERE job_id = ? AND seq = ?",
+                    (new_hashes[index], encoded[index], job_id, seqs[offset + index]),
+                )
+                writes += 1
+        if len(seqs) - offset > overlap:
+            conn.execute(f"DELETE FROM {table} WHERE job_id = ? AND seq >= ?", (job_id, seqs[offset + overlap]))
+            writes += len(seqs) - offset - overlap
+        next_seq = seqs[-1] + 1 if seqs else 0
+        appended = [
+            (job_id, next_seq + index, new_hashes[overlap + index], text)
+            for index, text in enumerate(encoded[overlap:])
+        ]
+        if appended:
+            conn.executemany(
+                f"INSERT INTO {table} (job_id, seq, row_hash, row_json) VALUES (?, ?, ?, ?)",
+                appended,
+            )
+            writes += len(appended)
+        return writes
+
+    @staticmethod
+    def _claim_revision(conn: sqlite3.Connection, job_id: str, expected_revision: Optional[int]) -> Optional[str]:
+        """Bump the job's revision first so the write lock is held before the header is read.
+
+        Returns the current header JSON (None for a new job). Taking the lock up front serializes
+        read-merge-write across processes; `expected_revision` turns the bump into compare-and-swap.
+        """
+        claim = (
+            "UPDATE jobs SET revision = revision + 1, updated_at = CURRENT_TIMESTAMP, "
+            f"write_seq = ({JOB_NEXT_WRITE_SEQ_SQL}) WHERE job_id = ?"
+        )
+        if expected_revision is None:
+            cursor = conn.execute(claim, (job_id,))
+        else:
+            cursor = conn.execute(claim + " AND revision = ?", (job_id, int(expected_revision)))
+        row = conn.execute("SELECT payload_json, revision FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if cursor.rowcount:
+            return str(row["payload_json"])
+        actual = int(row["revision"]) if row else 0
+        if expected_revision is not None and int(expected_revision) != actual:
+            raise JobRevisionConflict(job_id, int(expected_revision), actual)
+        return None
+
+    def _write_payload(
+        self, conn: sqlite3.Connection, job_id: str, stored_payload: Dict[str, Any], current_json: Optional[str]
+    ) -> int:
+        """Write header, changed collections and index row; returns the job's new write sequence."""
+        header, collections = split_job_collections(stored_payload)
+        for table, value in collections.items():
+            if value != table:
+                self._sync_collection(conn, table, job_id, value)
+        header_json = storage_json_dumps(header)
+        if current_json is None:
+            conn.execute(
+                "INSERT INTO jobs (job_id, payload_json, updated_at, revision, write_seq) "
+                f"VALUES (?, ?, CURRENT_TIMESTAMP, 1, ({JOB_NEXT_WRITE_SEQ_SQL}))",
+                (job_id, header_json),
+            )
+        elif header_json != current_json:
+            # Unchanged headers are left alone: collection-only writes never re-serialize the job.
+            conn.execute("UPDATE jobs SET payload_json = ? WHERE job_id = ?", (header_json, job_id))
+        inline = {table: value for table, value in collections.items() if isinstance(value, list)}
+        referenced = [table for table, value in collections.items() if value == table]
+        keep_columns: list[str] = []
+        if referenced:
+            has_index_row = conn.execute("SELECT 1 FROM job_index WHERE job_id = ?", (job_id,)).fetchone()
+            if has_index_row:
+                keep_columns = [column for table in referenced for column in JOB_COLLECTION_INDEX_COLUMNS[table]]
+            else:
+                loaded = self._load_rows(conn, [job_id]).get(job_id, {})
+                inline.update({table: loaded.get(table, []) for table in referenced})
+        self._write_index_row(conn, job_id, join_job_collections(header, inline), keep_columns=keep_columns)
+        return self._current_write_seq(conn, job_id)
+
+    @staticmethod
+    def _current_write_seq(conn: sqlite3.Connection, job_id: str) -> int:
+        row = conn.execute("SELECT write_seq FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return int(row["write_seq"]) if row else 0
+
+    def set(self, job_id: str, payload: Dict[str, Any], *, expected_revision: Optional[int] = None) -> int:
+        stored_payload = prepare_job_payload_for_storage(payload)
+        with self._pool.writer() as conn:
+            current_json = self._claim_revision(conn, job_id, expected_revision)
+            return self._write_payload(conn, job_id, stored_payload, current_json)
+
+    def update(self, job_id: str, *, expected_revision: Optional[int] = None, **patch: Any) -> int:
+        """Merge `patch` into the stored job; returns the write sequence (read the job back with `get`)."""
+        with self._pool.writer() as conn:
+            current_json = self._claim_revision(conn, job_id, expected_revision)
+            merged: Dict[str, Any] = storage_json_loads(current_json) if current_json else {}
+            merged.update(prepare_job_payload_for_storage(patch))
+            return self._write_payload(conn, job_id, merged, current_json)
+
+    def append_rows(
+        self,
+        job_id: str,
+        collection: str,
+        rows: list[Any],
+        *,
+        keep_last: Optional[int] = None,
+        expected_revision: Optional[int] = None,
+        unique_fields: Sequence[str] = (),
+        **patch: Any,
+    ) -> Optional[int]:
+        """Append items to a top-level job collection, applying `patch` to the header in the same write.
+
+        Stored rows are neither loaded nor re-hashed: the new rows are inserted after the last sequence
+        number, `keep_last` trims the oldest ones and the index count is recounted from the table. Rows
+        whose `unique_fields` match a stored row are skipped. Returns the write sequence, or None when
+        the job does not exist or there was nothing to write.
+        """
+        if collection in patch:
+            raise ValueError(f"Cannot both append to and replace job collection {collection!r}")
+        table = JOB_APPENDABLE_COLLECTIONS[collection]
+        stored_rows = [sanitize_jsonable(row) for row in rows]
+        stored_patch = prepare_job_payload_for_storage(patch)
+        with self._pool.writer() as conn:
+            current_json = self._claim_revision(conn, job_id, expected_revision)
+            if current_json is None:
+                return None
+            header: Dict[str, Any] = storage_json_loads(current_json)
+            if _collection_ref(header.get(collection)) != table:
+                # Legacy inline (or absent) list: a regular merge moves it into its table.
+                raw_existing = header.get(collection)
+                existing = raw_existing if isinstance(raw_existing, list) else []
+                appended = _unseen_rows(existing, stored_rows, unique_fields)
+                if not appended and not stored_patch:
+                    conn.rollback()
+                    return None
+                merged_rows = [*existing, *appended]
+                header.update(stored_patch)
+                header[collection] = merged_rows[-keep_last:] if keep_last is not None else merged_rows
+                return self._write_payload(conn, job_id, header, current_json)
+            if unique_fields:
+                stored = conn.execute(f"SELECT row_json FROM {table} WHERE job_id = ?", (job_id,)).fetchall()
+                stored_rows = _unseen_rows(
+                    [storage_json_loads(row["row_json"]) for row in stored], stored_rows, unique_fields
                 )
-        return restore_job_payload_from_storage(merged)
+            if not stored_rows and not stored_patch:
+                conn.rollback()
+                return None
+            if stored_rows:
+                self._append_collection_rows(conn, table, job_id, stored_rows, keep_last)
+            header.update(stored_patch)
+            write_seq = self._write_payload(conn, job_id, header, current_json)
+            count_column = JOB_COLLECTION_COUNT_COLUMNS[table]
+            conn.execute(
+                f"UPDATE job_index SET {count_column} = (SELECT COUNT(*) FROM {table} WHERE job_id = ?) "
+                "WHERE job_id = ?",
+                (job_id, job_id),
+            )
+            return write_seq
+
+    @staticmethod
+    def _append_collection_rows(
+        conn: sqlite3.Connection, table: str, job_id: str, rows: list[Any], keep_last: Optional[int]
+    ) -> None:
+        last = conn.execute(f"SELECT MAX(seq) AS seq FROM {table} WHERE job_id = ?", (job_id,)).fetchone()
+        next_seq = int(last["seq"]) + 1 if last and last["seq"] is not None else 0
+        encoded = [storage_json_dumps(row) for row in rows]
+        conn.executemany(
+            f"INSERT INTO {table} (job_id, seq, row_hash, row_json) VALUES (?, ?, ?, ?)",
+            [
+                (job_id, next_seq + index, hashlib.sha1(text.encode("utf-8")).hexdigest(), text)
+                for index, text in enumerate(encoded)
+            ],
+        )
+        if keep_last is not None:
+            conn.execute(
+                f"DELETE FROM {table} WHERE job_id = ? AND seq < ?",
+                (job_id, next_seq + len(encoded) - max(0, int(keep_last))),
+            )
 
-    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
-        with self._connect() as conn:
-            row = conn.execute("SELECT payload_json FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
-        if not row:
-            return None
-        payload = storage_json_loads(row["payload_json"])
-        return restore_job_payload_from_storage(payload)
+    @contextmanager
+    def _read_snapshot(self) -> Iterator[sqlite3.Connection]:
+        # Header and collection rows come from separate statements; read them in one WAL snapshot.
+        with self._pool.reader() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            finally:
+                conn.execute("COMMIT")
 
-    def list(self) -> Dict[str, Dict[str, Any]]:
-        with self._connect() as conn:
-            rows = conn.execute("SELECT job_id, payload_json FROM jobs ORDER BY updated_at DESC").fetchall()
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.get_with_revision(job_id)[0]
+
+    def get_with_revision(self, job_id: str) -> tuple[Optional[Dict[str, Any]], int]:
+        with self._read_snapshot() as conn:
+            row = conn.execute("SELECT payload_json, revision FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if not row:
+                return None, 0
+            rows_by_table = self._load_rows(conn, [job_id]).get(job_id, {})
+        payload = join_job_collections(storage_json_loads(row["payload_json"]), rows_by_table)
+        return restore_job_payload_from_storage(payload), int(row["revision"])
+
+    def get_index(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._pool.reader() as conn:
+            row = conn.execute(f"{JOB_INDEX_SELECT_SQL} WHERE j.job_id = ?", (job_id,)).fetchone()
+        return _job_index_item(row) if row else None
+
+    def _hydrate_rows(self, conn: sqlite3.Connection, rows: list[Any], *, all_jobs: bool) -> Dict[str, Dict[str, Any]]:
+        job_ids = [str(row["job_id"]) for row in rows]
+        rows_by_job = self._load_rows(conn, None if all_jobs else job_ids)
         items: Dict[str, Dict[str, Any]] = {}
         for row in rows:
-            items[str(row["job_id"])] = restore_job_payload_from_storage(storage_json_loads(row["payload_json"]))
+            job_id = str(row["job_id"])
+            payload = join_job_collections(storage_json_loads(row["payload_json"]), rows_by_job.get(job_id, {}))
+            items[job_id] = restore_job_payload_from_storage(payload)
         return items
 
+    def list(self) -> Dict[str, Dict[str, Any]]:
+        with self._read_snapshot() as conn:
+            rows = conn.execute("SELECT job_id, payload_json FROM jobs ORDER BY write_seq DESC").fetchall()
+            return self._hydrate_rows(conn, rows, all_jobs=True)
+
+    @staticmethod
+    def _index_where_clause(filters: Dict[str, Any]) -> tuple[str, List[Any]]:
+        # NULL index columns (and jobs without an index row) are unknown and must still be hydrated.
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, expected in normalize_job_index_filters(filters).items():
+            clauses.append(f"(ji.{column} IS NULL OR ji.{column} = ?)")
+            params.append(int(expected) if column == "hitl_enabled" else expected)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def list_index(self, **filters: Any) -> List[Dict[str, Any]]:
+        where, params = self._index_where_clause(filters)
+        query = JOB_INDEX_SELECT_SQL + where + " ORDER BY j.write_seq DESC"
+        with self._pool.reader() as conn:
+            rows = conn.execute(query, tuple(params)).fetchall()
+        return [_job_index_item(row) for row in rows]
+
+    def list_filtered(self, **filters: Any) -> Dict[str, Dict[str, Any]]:
+        where, params = self._index_where_clause(filters)
+        query = (
+            "SELECT j.job_id, j.payload_json FROM jobs j LEFT JOIN job_index ji ON ji.job_id = j.job_id"
+            + where
+            + " ORDER BY j.write_seq DESC"
+        )
+        with self._read_snapshot() as conn:
+            rows = conn.execute(query, tuple(params)).fetchall()
+            return self._hydrate_rows(conn, rows, all_jobs=not params)
+
+    def change_watermark(self) -> int:
+        with self._pool.reader() as conn:
+            row = conn.execute("SELECT COALESCE(MAX(write_seq), 0) AS write_seq FROM jobs").fetchone()
+        return int(row["write_seq"])
+
+    def list_changes(self, since: int = 0) -> List[tuple[str, int]]:
+        """Jobs written after write sequence `since`, oldest write first, with their latest write sequence."""
+        with self._pool.reader() as conn:
+            rows = conn.execute(
+                "SELECT job_id, write_seq FROM jobs WHERE write_seq > ? ORDER BY write_seq", (int(since),)
+            ).fetchall()
+        return [(str(row["job_id"]), int(row["write_seq"])) for row in rows]
+
 
 class SQLiteIngestAuditStore:
     SCHEMA_COMPONENT = "ingest_audit"
@@ -379,14 +1351,11 @@ class SQLiteIngestAuditStore:
 
     def __init__(self, db_path: Optional[str] = None) -> None:
         self.db_path = db_path or default_sqlite_path()
-        self._write_lock = threading.Lock()
+        self._pool = sqlite_connection_pool(self.db_path)
         self._init_db()
 
-    def _connect(self) -> sqlite3.Connection:
-        return open_sqlite_connection(self.db_path)
-
     def _init_db(self) -> None:
-        with self._connect() as conn:
+        with self._pool.writer() as conn:
             ensure_sqlite_component_schema(conn, self.SCHEMA_COMPONENT, self.SCHEMA_VERSION)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS ingest_audit_events (
@@ -404,34 +1373,33 @@ class SQLiteIngestAuditStore:
 
     def append(self, row: Dict[str, Any]) -> None:
         item = sanitize_jsonable(dict(row or {}))
-        with self._write_lock:
-            with self._connect() as conn:
-                conn.execute(
-                    """
-                    INSERT INTO ingest_audit_events (
-                      event_id, ts, donor_id, namespace, filename, content_type, metadata_json, result_json, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    ON CONFLICT(event_id) DO UPDATE SET
-                      ts=excluded.ts,
-                      donor_id=excluded.donor_id,
-                      namespace=excluded.namespace,
-                      filename=excluded.filename,
-                      content_type=excluded.content_type,
-                      metadata_json=excluded.metadata_json,
-                      result_json=excluded.result_json,
-                      created_at=CURRENT_TIMESTAMP
-                    """,
-                    (
-                        str(item.get("event_id") or ""),
-                        str(item.get("ts") or ""),
-                        str(item.get("donor_id") or ""),
-                        str(item.get("namespace") or ""),
-                        str(item.get("filename") or ""),
-                        str(item.get("content_type") or ""),
-                        storage_json_dumps(item.get("metadata") or {}),
-                        storage_json_dumps(item.get("result") or {}),
-                    ),
-                )
+        with self._pool.writer() as conn:
+            conn.execute(
+                """
+                INSERT INTO ingest_audit_events (
+                  event_id, ts, donor_id, namespace, filename, content_type, metadata_json, result_json, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(event_id) DO UPDATE SET
+                  ts=excluded.ts,
+                  donor_id=excluded.donor_id,
+                  namespace=excluded.namespace,
+                  filename=excluded.filename,
+                  content_type=excluded.content_type,
+                  metadata_json=excluded.metadata_json,
+                  result_json=excluded.result_json,
+                  created_at=CURRENT_TIMESTAMP
+                """,
+                (
+                    str(item.get("event_id") or ""),
+                    str(item.get("ts") or ""),
+                    str(item.get("donor_id") or ""),
+                    str(item.get("namespace") or ""),
+                    str(item.get("filename") or ""),
+                    str(item.get("content_type") or ""),
+                    storage_json_dumps(item.get("metadata") or {}),
+                    storage_json_dumps(item.get("result") or {}),
+                ),
+            )
 
     def list_recent(
         self,
@@ -452,7 +1420,7 @@ class SQLiteIngestAuditStore:
             params.append(donor_filter)
         query += "ORDER BY ts DESC, created_at DESC LIMIT ?"
         params.append(cap)
-        with self._connect() as conn:
+        with self._pool.reader() as conn:
             rows = conn.execute(query, tuple(params)).fetchall()
 
         items: list[Dict[str, Any]] = []
@@ -477,9 +1445,8 @@ class SQLiteIngestAuditStore:
         return items
 
     def clear(self) -> None:
-        with self._write_lock:
-            with self._connect() as conn:
-                conn.execute("DELETE FROM ingest_audit_events")
+        with self._pool.writer() as conn:
+            conn.execute("DELETE FROM ingest_audit_events")
 
     def inventory(self, donor_id: Optional[str] = None, tenant_id: Optional[str] = None) -> list[Dict[str, Any]]:
         donor_filter = str(donor_id or "").strip()
@@ -490,7 +1457,7 @@ class SQLiteIngestAuditStore:
             query += "WHERE lower(donor_id) = lower(?) "
             params.append(donor_filter)
         query += "ORDER BY ts DESC, created_at DESC"
-        with self._connect() as conn:
+        with self._pool.reader() as conn:
             rows = conn.execute(query, tuple(params)).fetchall()
 
         grouped: Dict[str, Dict[str, Any]] = {}
@@ -532,11 +1499,212 @@ class SQLiteIngestAuditStore:
         )
 
 
-def create_job_store_from_env() -> InMemoryJobStore | SQLiteJobStore:
+WEBHOOK_OUTBOX_STATUSES = ("pending", "in_flight", "delivered", "failed")
+WEBHOOK_OUTBOX_FIELDS = (
+    "delivery_id",
+    "job_id",
+    "event",
+    "url",
+    "secret",
+    "body",
+    "status",
+    "attempts",
+    "max_attempts",
+    "next_attempt_at",
+    "last_status_code",
+    "last_error",
+    "created_at",
+    "updated_at",
+    "delivered_at",
+)
+WEBHOOK_OUTBOX_MUTABLE_FIELDS = (
+    "status",
+    "attempts",
+    "next_attempt_at",
+    "last_status_code",
+    "last_error",
+    "updated_at",
+    "delivered_at",
+)
+
+
+def _webhook_outbox_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    item = {key: row.get(key) for key in WEBHOOK_OUTBOX_FIELDS}
+    item["status"] = str(item.get("status") or "pending")
+    item["attempts"] = int(item.get("attempts") or 0)
+    item["max_attempts"] = max(1, int(item.get("max_attempts") or 1))
+    item["next_attempt_at"] = float(item.get("next_attempt_at") or 0.0)
+    return item
+
+
+class InMemoryWebhookOutboxStore:
+    def __init__(self, maxlen: int = 2000) -> None:
+        self.maxlen = max(1, int(maxlen))
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def enqueue(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        item = _webhook_outbox_row(row)
+        with self._lock:
+            self._rows[str(item["delivery_id"])] = item
+            if len(self._rows) > self.maxlen:
+                # Drop the oldest settled rows first; pending deliveries are never evicted.
+                for delivery_id, current in list(self._rows.items()):
+                    if len(self._rows) <= self.maxlen:
+                        break
+                    if current["status"] in {"delivered", "failed"}:
+                        self._rows.pop(delivery_id, None)
+            return dict(item)
+
+    def claim_due(self, *, now: float, limit: int, lease_seconds: float) -> list[Dict[str, Any]]:
+        claimed: list[Dict[str, Any]] = []
+        with self._lock:
+            due = sorted(
+                (
+                    item
+                    for item in self._rows.values()
+                    if item["status"] in {"pending", "in_flight"} and item["next_attempt_at"] <= now
+                ),
+                key=lambda item: item["next_attempt_at"],
+            )
+            for item in due[: max(0, int(limit))]:
+                item["status"] = "in_flight"
+                item["next_attempt_at"] = now + max(0.0, float(lease_seconds))
+                claimed.append(dict(item))
+        return claimed
+
+    def update(self, delivery_id: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._rows.get(str(delivery_id))
+            if item is None:
+                return None
+            for key in WEBHOOK_OUTBOX_MUTABLE_FIELDS:
+                if key in fields:
+                    item[key] = fields[key]
+            return dict(item)
+
+    def list_for_job(self, job_id: str, limit: int = 50) -> list[Dict[str, Any]]:
+        with self._lock:
+            rows = [dict(item) for item in self._rows.values() if item.get("job_id") == job_id]
+        rows.sort(key=lambda item: str(item.get("created_at") or ""))
+        return rows[-max(1, int(limit)) :]
+
+    def status_counts(self) -> Dict[str, int]:
+        counts = {status: 0 for status in WEBHOOK_OUTBOX_STATUSES}
+        with self._lock:
+            for item in self._rows.values():
+                counts[item["status"]] = int(counts.get(item["status"]) or 0) + 1
+        return counts
+
+
+class SQLiteWebhookOutboxStore:
+    SCHEMA_COMPONENT = "webhook_outbox"
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        self.db_path = db_path or default_sqlite_path()
+        self._pool = sqlite_connection_pool(self.db_path)
+        self._init_db()
+
+    def _init_db(self) -> None:
+        with self._pool.writer() as conn:
+            ensure_sqlite_component_schema(conn, self.SCHEMA_COMPONENT, self.SCHEMA_VERSION)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS webhook_outbox (
+                  delivery_id TEXT PRIMARY KEY,
+                  job_id TEXT NOT NULL,
+                  event TEXT NOT NULL,
+                  url TEXT NOT NULL,
+                  secret TEXT,
+                  body TEXT NOT NULL,
+                  status TEXT NOT NULL,
+                  attempts INTEGER NOT NULL DEFAULT 0,
+                  max_attempts INTEGER NOT NULL DEFAULT 1,
+                  next_attempt_at REAL NOT NULL DEFAULT 0,
+                  last_status_code INTEGER,
+                  last_error TEXT,
+                  created_at TEXT NOT NULL,
+                  updated_at TEXT NOT NULL,
+                  delivered_at TEXT
+                )
+                """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_webhook_outbox_due ON webhook_outbox(status, next_attempt_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_webhook_outbox_job ON webhook_outbox(job_id, created_at)")
+
+    def enqueue(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        item = _webhook_outbox_row(row)
+        with self._pool.writer() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO webhook_outbox ("
+                + ", ".join(WEBHOOK_OUTBOX_FIELDS)
+                + ") VALUES ("
+                + ", ".join("?" for _ in WEBHOOK_OUTBOX_FIELDS)
+                + ")",
+                tuple(item.get(key) for key in WEBHOOK_OUTBOX_FIELDS),
+            )
+        return item
+
+    def claim_due(self, *, now: float, limit: int, lease_seconds: float) -> list[Dict[str, Any]]:
+        claimed: list[Dict[str, Any]] = []
+        lease_until = now + max(0.0, float(lease_seconds))
+        with self._pool.writer() as conn:
+            rows = conn.execute(
+                "SELECT * FROM webhook_outbox WHERE status IN ('pending', 'in_flight') AND next_attempt_at <= ? "
+                "ORDER BY next_attempt_at LIMIT ?",
+                (now, max(0, int(limit))),
+            ).fetchall()
+            for row in rows:
+                # Conditional update so two processes draining the same outbox never claim one row twice.
+                cursor = conn.execute(
+                    "UPDATE webhook_outbox SET status = 'in_flight', next_attempt_at = ? "
+                    "WHERE delivery_id = ? AND status = ? AND next_attempt_at = ?",
+                    (lease_until, row["delivery_id"], row["status"], row["next_attempt_at"]),
+                )
+                if cursor.rowcount != 1:
+                    continue
+                item = _webhook_outbox_row(dict(row))
+                item["status"] = "in_flight"
+                item["next_attempt_at"] = lease_until
+                claimed.append(item)
+        return claimed
+
+    def update(self, delivery_id: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        assignments = [key for key in WEBHOOK_OUTBOX_MUTABLE_FIELDS if key in fields]
+        with self._pool.writer() as conn:
+            if assignments:
+                conn.execute(
+                    "UPDATE webhook_outbox SET "
+                    + ", ".join(f"{key} = ?" for key in assignments)
+                    + " WHERE delivery_id = ?",
+                    tuple(fields[key] for key in assignments) + (str(delivery_id),),
+                )
+            row = conn.execute("SELECT * FROM webhook_outbox WHERE delivery_id = ?", (str(delivery_id),)).fetchone()
+        return _webhook_outbox_row(dict(row)) if row else None
+
+    def list_for_job(self, job_id: str, limit: int = 50) -> list[Dict[str, Any]]:
+        with self._pool.reader() as conn:
+            rows = conn.execute(
+                "SELECT * FROM webhook_outbox WHERE job_id = ? ORDER BY created_at DESC LIMIT ?",
+                (job_id, max(1, int(limit))),
+            ).fetchall()
+        return [_webhook_outbox_row(dict(row)) for row in reversed(rows)]
+
+    def status_counts(self) -> Dict[str, int]:
+        counts = {status: 0 for status in WEBHOOK_OUTBOX_STATUSES}
+        with self._pool.reader() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS count FROM webhook_outbox GROUP BY status").fetchall()
+        for row in rows:
+            counts[str(row["status"])] = int(row["count"] or 0)
+        return counts
+
+
+def create_job_store_from_env(
+    index_fields_fn: Optional[JobIndexFieldsFn] = None,
+) -> InMemoryJobStore | SQLiteJobStore:
     mode = storage_mode("GRANTFLOW_JOB_STORE", _env("JOB_STORE", "inmem"))
     if mode == "sqlite":
-        return SQLiteJobStore()
-    return InMemoryJobStore()
+        return SQLiteJobStore(index_fields_fn=index_fields_fn)
+    return InMemoryJobStore(index_fields_fn=index_fields_fn)
 
 
 def create_ingest_audit_store_from_env() -> InMemoryIngestAuditStore | SQLiteIngestAuditStore:
@@ -547,3 +1715,13 @@ def create_ingest_audit_store_from_env() -> InMemoryIngestAuditStore | SQLiteIng
     if mode == "sqlite":
         return SQLiteIngestAuditStore()
     return InMemoryIngestAuditStore()
+
+
+def create_webhook_outbox_store_from_env() -> InMemoryWebhookOutboxStore | SQLiteWebhookOutboxStore:
+    mode = storage_mode(
+        "GRANTFLOW_WEBHOOK_OUTBOX_STORE",
+        storage_mode("GRANTFLOW_JOB_STORE", _env("JOB_STORE", "inmem")),
+    )
+    if mode == "sqlite":
+        return SQLiteWebhookOutboxStore()
+    return InMemoryWebhookOutboxStore()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 DonorRecord = Dict[str, Any]
@@ -534,10 +535,15 @@ for donor in DONOR_CATALOG:
         _ALIAS_TO_ID[normalize_donor_key(alias)] = canonical
 
 
-def resolve_donor_record(donor_id: str) -> Optional[DonorRecord]:
+@lru_cache(maxsize=1024)
+def canonical_donor_key(donor_id: str) -> str:
+    """Catalog id for a donor id or alias; unknown ids come back normalized but unresolved."""
     key = normalize_donor_key(donor_id)
-    key = _ALIAS_TO_ID.get(key, key)
-    donor = _DONOR_BY_ID.get(key)
+    return _ALIAS_TO_ID.get(key, key)
+
+
+def resolve_donor_record(donor_id: str) -> Optional[DonorRecord]:
+    donor = _DONOR_BY_ID.get(canonical_donor_key(donor_id))
     if donor is None:
         return None
     return copy.deepcopy(donor)
@@ -7,6 +7,7 @@ from grantflow.core.strategies.catalog import list_supported_donors, resolve_don
 from grantflow.core.strategies.eu import EUStrategy
 from grantflow.core.strategies.generic import GenericDonorStrategy
 from grantflow.core.strategies.giz import GIZStrategy
+from grantflow.core.strategies.registry import DonorRegistry
 from grantflow.core.strategies.state_department import StateDepartmentStrategy
 from grantflow.core.strategies.usaid import USAIDStrategy
 from grantflow.core.strategies.worldbank import WorldBankStrategy
@@ -32,10 +33,13 @@ def strategy_factory(donor_id: str) -> DonorStrategy:
     return GenericDonorStrategy(record)
 
 
+donor_registry = DonorRegistry(strategy_factory)
+
+
 class DonorFactory:
     @staticmethod
     def get_strategy(donor: str) -> DonorStrategy:
-        return strategy_factory(donor)
+        return donor_registry.get_strategy(donor)
 
     @staticmethod
     def list_supported() -> list[dict]:
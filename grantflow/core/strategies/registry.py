@@ -0,0 +1,100 @@
+# grantflow/core/strategies/registry.py
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Type
+
+from pydantic import BaseModel
+
+from grantflow.core.donor_strategy import DonorStrategy
+from grantflow.core.strategies.catalog import DONOR_CATALOG, canonical_donor_key
+
+
+@dataclass(frozen=True)
+class DonorContracts:
+    """Per-donor objects that never change for the life of the process."""
+
+    donor_key: str
+    strategy: DonorStrategy
+    rag_collection: str
+    toc_schema: Type[BaseModel]
+    mel_schema: Optional[Type[BaseModel]]
+    system_prompts: Mapping[str, str]
+
+
+ContractWarmer = Callable[[DonorContracts], Any]
+
+
+class DonorRegistry:
+    """Builds each donor strategy once and serves the same instance to every caller.
+
+    Strategies are stateless, so job reads (`restore_state_from_storage`), preflight and every graph node can
+    share one instance per canonical donor. `warm_up` builds the whole catalog up front and runs optional
+    warmers (e.g. schema prompt hints) so the first request does not pay for them.
+    """
+
+    def __init__(self, builder: Callable[[str], DonorStrategy]) -> None:
+        self._builder = builder
+        self._contracts: Dict[str, DonorContracts] = {}
+        self._lock = threading.Lock()
+        self.build_count = 0
+        self.warmup_seconds: Optional[float] = None
+        self.warmup_errors: Dict[str, str] = {}
+
+    def contracts(self, donor_id: str) -> DonorContracts:
+        key = canonical_donor_key(donor_id)
+        cached = self._contracts.get(key) if key else None
+        if cached is not None:
+            return cached
+        strategy = self._builder(donor_id)
+        built = DonorContracts(
+            donor_key=key,
+            strategy=strategy,
+            rag_collection=str(strategy.get_rag_collection() or ""),
+            toc_schema=strategy.get_toc_schema(),
+            mel_schema=strategy.get_mel_schema(),
+            system_prompts=MappingProxyType(dict(strategy.get_system_prompts() or {})),
+        )
+        with self._lock:
+            # A concurrent first lookup may have won; keep its instance so every caller shares one.
+            existing = self._contracts.setdefault(key, built)
+            if existing is built:
+                self.build_count += 1
+        return existing
+
+    def get_strategy(self, donor_id: str) -> DonorStrategy:
+        return self.contracts(donor_id).strategy
+
+    def warm_up(self, warmers: Iterable[ContractWarmer] = ()) -> Dict[str, Any]:
+        warmer_list = list(warmers)
+        started = time.perf_counter()
+        errors: Dict[str, str] = {}
+        for record in DONOR_CATALOG:
+            donor_id = str(record.get("id") or "")
+            try:
+                contracts = self.contracts(donor_id)
+                for warmer in warmer_list:
+                    warmer(contracts)
+            except Exception as exc:
+                errors[donor_id] = str(exc)
+        self.warmup_seconds = round(time.perf_counter() - started, 4)
+        self.warmup_errors = errors
+        return self.stats()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._contracts.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            donor_count = len(self._contracts)
+        return {
+            "donor_count": donor_count,
+            "build_count": self.build_count,
+            "warmup_seconds": self.warmup_seconds,
+            "warmup_errors": dict(self.warmup_errors),
+        }
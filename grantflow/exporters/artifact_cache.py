@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, Optional
+
+from grantflow.exporters.zip_stream import EXPORT_STREAM_CHUNK_BYTES
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def export_artifact_cache_key(**parts: Any) -> str:
+    """Content address of an export artifact: sha256 over canonical JSON of everything the builders read."""
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ExportArtifact:
+    """A rendered artifact: in-memory ``content``, or ``path`` for an entry served from the disk cache."""
+
+    content: bytes
+    media_type: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    path: Optional[str] = None
+
+    def iter_chunks(self, chunk_size: int = EXPORT_STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+        """Chunked body. A disk entry is opened here, before streaming starts, so an eviction that unlinks the
+        file afterwards cannot cut the response short; OSError means the entry is gone."""
+        step = max(1, int(chunk_size))
+        if self.path is None:
+            return (self.content[offset : offset + step] for offset in range(0, len(self.content), step))
+        return _iter_file_chunks(open(self.path, "rb"), step)
+
+    def read_bytes(self) -> bytes:
+        return b"".join(self.iter_chunks())
+
+
+def _iter_file_chunks(handle: IO[bytes], chunk_size: int) -> Iterator[bytes]:
+    with handle:
+        while True:
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+class ExportArtifactCache:
+    """Size-bounded LRU of rendered export artifacts (docx/xlsx/zip bytes) keyed by content address.
+
+    Keys cover the resolved export inputs, so a review change (finding status, new comment) yields a new key
+    and stale artifacts simply age out. With ``directory`` set, artifacts are written as ``<key>.bin`` plus a
+    ``<key>.json`` sidecar and survive restarts; otherwise bytes are held in memory.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 128,
+        max_bytes: int = 256 * 1024 * 1024,
+        directory: Optional[str] = None,
+        enabled: bool = True,
+    ) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self.max_bytes = max(0, int(max_bytes))
+        self.enabled = bool(enabled) and self.max_entries > 0 and self.max_bytes > 0
+        self.directory = Path(directory) if directory else None
+        self._entries: "OrderedDict[str, tuple[int, Optional[ExportArtifact]]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+        if self.enabled and self.directory is not None:
+            self._load_directory_index()
+
+    def _blob_path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{key}.bin"
+
+    def _meta_path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{key}.json"
+
+    def _load_directory_index(self) -> None:
+        assert self.directory is not None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        rows: list[tuple[float, str, int]] = []
+        for meta_path in self.directory.glob("*.json"):
+            blob_path = meta_path.with_suffix(".bin")
+            try:
+                stat = blob_path.stat()
+            except OSError:
+                continue
+            rows.append((meta_path.stat().st_mtime, meta_path.stem, int(stat.st_size)))
+        for _, key, size in sorted(rows):
+            self._entries[key] = (size, None)
+            self._total_bytes += size
+        self._evict_locked()
+
+    def get(self, key: str) -> Optional[ExportArtifact]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.miss_count += 1
+                return None
+            self._entries.move_to_end(key)
+            size, artifact = entry
+        if artifact is None:
+            artifact = self._read_artifact(key)
+            if artifact is None:
+                with self._lock:
+                    if self._entries.pop(key, None) is not None:
+                        self._total_bytes -= size
+                    self.miss_count += 1
+                return None
+        with self._lock:
+            self.hit_count += 1
+        return artifact
+
+    def put(self, key: str, artifact: ExportArtifact) -> None:
+        size = len(artifact.content)
+        if not self.enabled or size > self.max_bytes:
+            return
+        held: Optional[ExportArtifact] = artifact
+        if self.directory is not None:
+            if not self._write_artifact(key, artifact):
+                return
+            held = None
+        with self._lock:
+            self._index_locked(key, size, held)
+
+    def _evict_locked(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes):
+            key, (size, _) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.eviction_count += 1
+            self._remove_files(key)
+
+    def _read_artifact(self, key: str) -> Optional[ExportArtifact]:
+        blob_path = self._blob_path(key)
+        try:
+            meta = json.loads(self._meta_path(key).read_text(encoding="utf-8"))
+            if not blob_path.is_file():
+                return None
+        except (OSError, ValueError):
+            return None
+        headers = meta.get("headers") if isinstance(meta.get("headers"), dict) else {}
+        return ExportArtifact(
+            content=b"",
+            media_type=str(meta.get("media_type") or "application/octet-stream"),
+            headers={str(k): str(v) for k, v in headers.items()},
+            path=str(blob_path),
+        )
+
+    def _write_artifact(self, key: str, artifact: ExportArtifact) -> bool:
+        try:
+            handle, tmp_blob = self._open_tmp(self._blob_path(key))
+            with handle:
+                handle.write(artifact.content)
+        except OSError:
+            return False
+        return self._publish_blob(key, tmp_blob, artifact, len(artifact.content))
+
+    @staticmethod
+    def _open_tmp(target: Path) -> tuple[IO[bytes], Path]:
+        """A uniquely named temp file beside ``target``; other threads and processes sharing the directory
+        never write to the same one."""
+        fd, tmp_name = tempfile.mkstemp(dir=str(target.parent), prefix=f".{target.name}.", suffix=".tmp")
+        return os.fdopen(fd, "wb"), Path(tmp_name)
+
+    def _publish_blob(self, key: str, tmp_blob: Path, artifact: ExportArtifact, size: int) -> bool:
+        """Move a fully written temp blob into place, or discard it if it does not hold ``size`` bytes."""
+        meta_path = self._meta_path(key)
+        tmp_meta: Optional[Path] = None
+        try:
+            if tmp_blob.stat().st_size != size:
+                raise OSError(f"short export cache write for {key}")
+            os.replace(tmp_blob, self._blob_path(key))
+            handle, tmp_meta = self._open_tmp(meta_path)
+            with handle:
+                handle.write(
+                    json.dumps({"media_type": artifact.media_type, "headers": artifact.headers}).encode("utf-8")
+                )
+            # The sidecar lands last, so a listed entry always has its blob.
+            os.replace(tmp_meta, meta_path)
+        except OSError:
+            for path in (tmp_blob, tmp_meta):
+                if path is not None:
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+            return False
+        return True
+
+    def _index_locked(self, key: str, size: int, held: Optional[ExportArtifact]) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._total_bytes -= previous[0]
+        self._entries[key] = (size, held)
+        self._total_bytes += size
+        self._evict_locked()
+
+    def tee(
+        self,
+        key: str,
+        chunks: Iterable[bytes],
+        *,
+        media_type: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[bytes]:
+        """Pass a streamed artifact through while caching it.
+
+        The entry is stored only if the stream finishes; a client disconnect or a rendering error discards it.
+        In disk mode the body is spooled to a temp file, so the stream is never held in memory; an artifact
+        that outgrows ``max_bytes`` stops being recorded but keeps streaming.
+        """
+        if not self.enabled:
+            yield from chunks
+            return
+        artifact_headers = dict(headers or {})
+        spool: Optional[IO[bytes]] = None
+        tmp_blob: Optional[Path] = None
+        held: Optional[list[bytes]] = []
+        size = 0
+        if self.directory is not None:
+            try:
+                spool, tmp_blob = self._open_tmp(self._blob_path(key))
+            except OSError:
+                held = None
+        completed = False
+        try:
+            for chunk in chunks:
+                if held is not None:
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        held = None
+                    elif spool is not None:
+                        try:
+                            spool.write(chunk)
+                        except OSError:
+                            held = None
+                    else:
+                        held.append(chunk)
+                yield chunk
+            completed = True
+        finally:
+            if spool is not None:
+                try:
+                    spool.close()
+                except OSError:
+                    held = None
+            if completed and held is not None:
+                if tmp_blob is not None:
+                    artifact = ExportArtifact(content=b"", media_type=media_type, headers=artifact_headers)
+                    if self._publish_blob(key, tmp_blob, artifact, size):
+                        with self._lock:
+                            self._index_locked(key, size, None)
+                else:
+                    content = b"".join(held)
+                    with self._lock:
+                        self._index_locked(
+                            key, size, ExportArtifact(content=content, media_type=media_type, headers=artifact_headers)
+                        )
+            elif tmp_blob is not None:
+                try:
+                    tmp_blob.unlink()
+                except OSError:
+                    pass
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self.enabled and key in self._entries
+
+    def _remove_files(self, key: str) -> None:
+        if self.directory is None:
+            return
+        for path in (self._meta_path(key), self._blob_path(key)):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+            self._total_bytes = 0
+        for key in keys:
+            self._remove_files(key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "backend": "disk" if self.directory is not None else "memory",
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hit_count": self.hit_count,
+                "miss_count": self.miss_count,
+                "eviction_count": self.eviction_count,
+            }
+
+
+def create_export_artifact_cache_from_env() -> ExportArtifactCache:
+    mode = str(os.getenv("GRANTFLOW_EXPORT_CACHE", "on") or "on").strip().lower()
+    return ExportArtifactCache(
+        max_entries=_env_int("GRANTFLOW_EXPORT_CACHE_MAX_ENTRIES", 128),
+        max_bytes=_env_int("GRANTFLOW_EXPORT_CACHE_MAX_MB", 256) * 1024 * 1024,
+        directory=str(os.getenv("GRANTFLOW_EXPORT_CACHE_DIR") or "").strip() or None,
+        enabled=mode not in {"0", "off", "false", "no"},
+    )
+
+
+export_artifact_cache = create_export_artifact_cache_from_env()
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from io import BytesIO
 from typing import Any, Dict, List, Optional
 
 from openpyxl import Workbook
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
 
 from grantflow.core.security_utils import resolve_allowed_attachment_path
 from grantflow.exporters.donor_contracts import DONOR_XLSX_PRIMARY_SHEET, evaluate_export_contract
@@ -463,18 +466,149 @@ def _indicator_readiness_hint(indicator: Dict[str, Any]) -> str:
     return "review-ready"
 
 
-def _autosize_columns(ws) -> None:
-    for col in ws.columns:
-        max_length = 0
-        column = col[0].column_letter
-        for cell in col:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except Exception:
-                pass
-        adjusted_width = min(max_length + 2, 60)
-        ws.column_dimensions[column].width = adjusted_width
+@dataclass(frozen=True)
+class XlsxSheetManifest:
+    name: str
+    headers: tuple[str, ...]
+    row_count: int
+
+
+@dataclass(frozen=True)
+class XlsxBuildManifest:
+    """Structure of a built workbook, recorded before saving so callers never re-parse the bytes."""
+
+    sheets: tuple[XlsxSheetManifest, ...]
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return [sheet.name for sheet in self.sheets]
+
+    def sheet(self, name: str) -> Optional[XlsxSheetManifest]:
+        for sheet in self.sheets:
+            if sheet.name == name:
+                return sheet
+        return None
+
+
+@dataclass(frozen=True)
+class XlsxBuild:
+    content: bytes
+    manifest: XlsxBuildManifest
+
+
+_TABLE_HEADER_STYLE = "GrantFlow Table Header"
+_TABLE_CELL_STYLE = "GrantFlow Table Cell"
+_MAX_COLUMN_WIDTH = 60
+_WIDTH_SAMPLE_ROWS = 500
+
+
+def _table_named_styles() -> list[NamedStyle]:
+    thin = Side(style="thin")
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    return [
+        NamedStyle(
+            name=_TABLE_HEADER_STYLE,
+            font=Font(bold=True, color="FFFFFF"),
+            fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+            alignment=Alignment(horizontal="center", vertical="center"),
+            border=border,
+        ),
+        NamedStyle(name=_TABLE_CELL_STYLE, border=border),
+    ]
+
+
+class _TableSheet:
+    """One worksheet whose rows are streamed to the write-only sheet as they are appended.
+
+    A write-only sheet declares its column widths before its first row, so the first `_WIDTH_SAMPLE_ROWS` rows
+    are held back to size the columns; every later row goes straight to the sheet. Styled rows reference the
+    workbook's shared named styles.
+    """
+
+    def __init__(self, ws: Any) -> None:
+        self.ws = ws
+        self.title = str(ws.title)
+        self._pending: Optional[list[tuple[list[Any], Optional[str]]]] = []
+        self._widths: list[int] = []
+        self._headers: list[str] = []
+        self.row_count = 0
+
+    @property
+    def headers(self) -> list[str]:
+        return list(self._headers)
+
+    def append(self, values: List[Any], *, style: Optional[str] = None) -> None:
+        row = list(values)
+        if not self.row_count:
+            self._headers = [str(value).strip() for value in row if str(value or "").strip()]
+        self.row_count += 1
+        if self._pending is None:
+            self._write(row, style)
+            return
+        widths = self._widths
+        for idx, value in enumerate(row):
+            length = 0 if value is None else len(str(value))
+            if idx == len(widths):
+                widths.append(length)
+            elif length > widths[idx]:
+                widths[idx] = length
+        self._pending.append((row, style))
+        if len(self._pending) >= _WIDTH_SAMPLE_ROWS:
+            self._release()
+
+    def _write(self, row: list[Any], style: Optional[str]) -> None:
+        if style is None:
+            self.ws.append(row)
+            return
+        cells = []
+        for value in row:
+            cell = WriteOnlyCell(self.ws, value=value)
+            cell.style = style
+            cells.append(cell)
+        self.ws.append(cells)
+
+    def _release(self) -> None:
+        pending, self._pending = self._pending, None
+        for idx, width in enumerate(self._widths, start=1):
+            self.ws.column_dimensions[get_column_letter(idx)].width = min(width + 2, _MAX_COLUMN_WIDTH)
+        for row, style in pending or ():
+            self._write(row, style)
+
+    def flush(self) -> XlsxSheetManifest:
+        if self._pending is not None:
+            self._release()
+        return XlsxSheetManifest(name=self.title, headers=tuple(self._headers), row_count=self.row_count)
+
+
+class _XlsxWriter:
+    """Write-only workbook whose sheets stream their rows to disk, with widths sized from each sheet's first rows."""
+
+    def __init__(self) -> None:
+        self.wb = Workbook(write_only=True)
+        for style in _table_named_styles():
+            self.wb.add_named_style(style)
+        self._sheets: list[_TableSheet] = []
+
+    def create_sheet(self, title: str) -> _TableSheet:
+        sheet = _TableSheet(self.wb.create_sheet(title))
+        self._sheets.append(sheet)
+        return sheet
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return [sheet.title for sheet in self._sheets]
+
+    def sheet(self, title: str) -> Optional[_TableSheet]:
+        for sheet in self._sheets:
+            if sheet.title == title:
+                return sheet
+        return None
+
+    def save(self) -> XlsxBuild:
+        manifest = XlsxBuildManifest(sheets=tuple(sheet.flush() for sheet in self._sheets))
+        bio = BytesIO()
+        self.wb.save(bio)
+        return XlsxBuild(content=bio.getvalue(), manifest=manifest)
 
 
 def _toc_root(payload: Dict[str, Any], donor_id: str | None = None) -> Dict[str, Any]:
@@ -484,7 +618,7 @@ def _toc_root(payload: Dict[str, Any], donor_id: str | None = None) -> Dict[str,
     return normalize_toc_for_export(donor_key, unwrap_toc_payload(payload))
 
 
-def _add_citations_sheet(wb: Workbook, citations: list[Dict[str, Any]]) -> None:
+def _add_citations_sheet(wb: _XlsxWriter, citations: list[Dict[str, Any]]) -> None:
     if not citations:
         return
     ws = wb.create_sheet("Citations")
@@ -526,10 +660,9 @@ def _add_citations_sheet(wb: Workbook, citations: list[Dict[str, Any]]) -> None:
                 (c.get("excerpt", "") or "")[:500],
             ]
         )
-    _autosize_columns(ws)
 
 
-def _add_critic_findings_sheet(wb: Workbook, critic_findings: list[Dict[str, Any]]) -> None:
+def _add_critic_findings_sheet(wb: _XlsxWriter, critic_findings: list[Dict[str, Any]]) -> None:
     if not critic_findings:
         return
     ws = wb.create_sheet("Critic Findings")
@@ -570,10 +703,9 @@ def _add_critic_findings_sheet(wb: Workbook, critic_findings: list[Dict[str, Any
                 f.get("source", ""),
             ]
         )
-    _autosize_columns(ws)
 
 
-def _add_review_comments_sheet(wb: Workbook, review_comments: list[Dict[str, Any]]) -> None:
+def _add_review_comments_sheet(wb: _XlsxWriter, review_comments: list[Dict[str, Any]]) -> None:
     if not review_comments:
         return
     ws = wb.create_sheet("Review Comments")
@@ -592,10 +724,9 @@ def _add_review_comments_sheet(wb: Workbook, review_comments: list[Dict[str, Any
                 c.get("comment_id", ""),
             ]
         )
-    _autosize_columns(ws)
 
 
-def _add_quality_summary_sheet(wb: Workbook, quality_summary: dict[str, Any]) -> None:
+def _add_quality_summary_sheet(wb: _XlsxWriter, quality_summary: dict[str, Any]) -> None:
     if not quality_summary:
         return
     rows = [
@@ -613,16 +744,13 @@ def _add_quality_summary_sheet(wb: Workbook, quality_summary: dict[str, Any]) ->
         return
 
     ws = wb.create_sheet("Quality Summary")
-    border = _apply_table_header(ws, ["Field", "Value"])
-    for row_idx, (field_name, value) in enumerate(present_rows, start=2):
-        ws.append([field_name, value])
-        ws.cell(row=row_idx, column=1).border = border
-        ws.cell(row=row_idx, column=2).border = border
-    _autosize_columns(ws)
+    ws.append(["Field", "Value"], style=_TABLE_HEADER_STYLE)
+    for field_name, value in present_rows:
+        ws.append([field_name, value], style=_TABLE_CELL_STYLE)
 
 
 def _add_review_readiness_sheet(
-    wb: Workbook,
+    wb: _XlsxWriter,
     *,
     quality_summary: dict[str, Any],
     citations: list[Dict[str, Any]],
@@ -639,18 +767,15 @@ def _add_review_readiness_sheet(
         return
 
     ws = wb.create_sheet("Review Readiness")
-    border = _apply_table_header(ws, ["Field", "Value"])
-    for row_idx, (field_name, value) in enumerate(rows, start=2):
-        ws.append([field_name, value])
-        ws.cell(row=row_idx, column=1).border = border
-        ws.cell(row=row_idx, column=2).border = border
-    _autosize_columns(ws)
+    ws.append(["Field", "Value"], style=_TABLE_HEADER_STYLE)
+    for field_name, value in rows:
+        ws.append([field_name, value], style=_TABLE_CELL_STYLE)
 
 
-def _add_template_meta_sheet(wb: Workbook, profile: Dict[str, Any]) -> None:
+def _add_template_meta_sheet(wb: _XlsxWriter, profile: Dict[str, Any]) -> None:
     ws = wb.create_sheet("Template Meta")
     headers = ["Field", "Value"]
-    border = _apply_table_header(ws, headers)
+    ws.append(headers, style=_TABLE_HEADER_STYLE)
     rows = [
         ("Donor ID", profile.get("donor_id", "")),
         ("Template Key", profile.get("template_key", "")),
@@ -669,17 +794,14 @@ def _add_template_meta_sheet(wb: Workbook, profile: Dict[str, Any]) -> None:
             ", ".join(str(x) for x in (profile.get("missing_sections") or [])),
         ),
     ]
-    for row_idx, (field_name, value) in enumerate(rows, start=2):
-        ws.append([field_name, value])
-        ws.cell(row=row_idx, column=1).border = border
-        ws.cell(row=row_idx, column=2).border = border
-    _autosize_columns(ws)
+    for field_name, value in rows:
+        ws.append([field_name, value], style=_TABLE_CELL_STYLE)
 
 
-def _add_export_contract_sheet(wb: Workbook, contract: Dict[str, Any]) -> None:
+def _add_export_contract_sheet(wb: _XlsxWriter, contract: Dict[str, Any]) -> None:
     ws = wb.create_sheet("Export Contract")
     headers = ["Field", "Value"]
-    border = _apply_table_header(ws, headers)
+    ws.append(headers, style=_TABLE_HEADER_STYLE)
     rows = [
         ("Status", contract.get("status", "")),
         ("Warnings", ", ".join(str(x) for x in (contract.get("warnings") or [])) or "-"),
@@ -736,11 +858,8 @@ def _add_export_contract_sheet(wb: Workbook, contract: Dict[str, Any]) -> None:
                     ("Annex Status/File Mismatches", int(validation.get("status_file_mismatch_count") or 0)),
                 ]
             )
-    for row_idx, (field_name, value) in enumerate(rows, start=2):
-        ws.append([field_name, value])
-        ws.cell(row=row_idx, column=1).border = border
-        ws.cell(row=row_idx, column=2).border = border
-    _autosize_columns(ws)
+    for field_name, value in rows:
+        ws.append([field_name, value], style=_TABLE_CELL_STYLE)
 
 
 def _format_contract_counts(value: Any) -> str:
@@ -753,33 +872,8 @@ def _format_contract_counts(value: Any) -> str:
     )
 
 
-def _apply_table_header(ws, headers: list[str]) -> Border:
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center")
-    thin_border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
-    )
-    ws.append(headers)
-    for col, _ in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
-    return thin_border
-
-
-def _sheet_headers(ws) -> list[str]:
-    row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
-    return [str(value).strip() for value in row if str(value or "").strip()]
-
-
 def _add_usaid_results_sheet(
-    wb: Workbook,
+    wb: _XlsxWriter,
     toc_payload: Dict[str, Any],
     *,
     logframe_draft: Optional[Dict[str, Any]] = None,
@@ -809,9 +903,8 @@ def _add_usaid_results_sheet(
         "Suggested Result Focus",
         "Suggested Measurement Intent",
     ]
-    thin_border = _apply_table_header(ws, headers)
+    ws.append(headers, style=_TABLE_HEADER_STYLE)
 
-    row_idx = 2
     for do in toc.get("development_objectives") or []:
         if not isinstance(do, dict):
             continue
@@ -853,11 +946,9 @@ def _add_usaid_results_sheet(
                             formulas,
                             result_focus,
                             measurement_intent,
-                        ]
+                        ],
+                        style=_TABLE_CELL_STYLE,
                     )
-                    for col in range(1, len(headers) + 1):
-                        ws.cell(row=row_idx, column=col).border = thin_border
-                    row_idx += 1
                     continue
                 for ind in indicators:
                     if not isinstance(ind, dict):
@@ -886,16 +977,13 @@ def _add_usaid_results_sheet(
                             formulas,
                             result_focus,
                             measurement_intent,
-                        ]
+                        ],
+                        style=_TABLE_CELL_STYLE,
                     )
-                    for col in range(1, len(headers) + 1):
-                        ws.cell(row=row_idx, column=col).border = thin_border
-                    row_idx += 1
-    _autosize_columns(ws)
 
 
 def _add_eu_results_sheet(
-    wb: Workbook,
+    wb: _XlsxWriter,
     toc_payload: Dict[str, Any],
     *,
     logframe_draft: Optional[Dict[str, Any]] = None,
@@ -919,8 +1007,7 @@ def _add_eu_results_sheet(
         "Suggested Result Focus",
         "Suggested Measurement Intent",
     ]
-    thin_border = _apply_table_header(ws, headers)
-    row_idx = 2
+    ws.append(headers, style=_TABLE_HEADER_STYLE)
     overall = toc.get("overall_objective") if isinstance(toc, dict) else None
     if isinstance(overall, dict):
         focus_name, focus_mov, focus_owner = _indicator_focus_cells(outcome_focus)
@@ -940,11 +1027,9 @@ def _add_eu_results_sheet(
                 formulas,
                 result_focus,
                 measurement_intent,
-            ]
+            ],
+            style=_TABLE_CELL_STYLE,
         )
-        for col in range(1, len(headers) + 1):
-            ws.cell(row=row_idx, column=col).border = thin_border
-        row_idx += 1
 
     specific_objectives = toc.get("specific_objectives") if isinstance(toc, dict) else None
     if isinstance(specific_objectives, list):
@@ -968,11 +1053,9 @@ def _add_eu_results_sheet(
                     formulas,
                     result_focus,
                     measurement_intent,
-                ]
+                ],
+                style=_TABLE_CELL_STYLE,
             )
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
 
     expected_outcomes = toc.get("expected_outcomes") if isinstance(toc, dict) else None
     if isinstance(expected_outcomes, list):
@@ -996,57 +1079,36 @@ def _add_eu_results_sheet(
                     formulas,
                     result_focus,
                     measurement_intent,
-                ]
+                ],
+                style=_TABLE_CELL_STYLE,
             )
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
 
-    if row_idx == 2:
-        ws.append(["", "", "", "", "", "", "", "", "", "", "", ""])
-        for col in range(1, len(headers) + 1):
-            ws.cell(row=row_idx, column=col).border = thin_border
-        row_idx += 1
+    if ws.row_count == 1:
+        ws.append(["", "", "", "", "", "", "", "", "", "", "", ""], style=_TABLE_CELL_STYLE)
 
     aux = wb.create_sheet("EU_Assumptions_Risks")
     aux_headers = ["Type", "Item"]
-    aux_border = _apply_table_header(aux, aux_headers)
-    aux_row = 2
+    aux.append(aux_headers, style=_TABLE_HEADER_STYLE)
     assumptions = toc.get("assumptions") if isinstance(toc, dict) else None
     if isinstance(assumptions, list):
         for item in assumptions:
-            aux.append(["Assumption", str(item)])
-            for col in range(1, len(aux_headers) + 1):
-                aux.cell(row=aux_row, column=col).border = aux_border
-            aux_row += 1
+            aux.append(["Assumption", str(item)], style=_TABLE_CELL_STYLE)
     risks = toc.get("risks") if isinstance(toc, dict) else None
     if isinstance(risks, list):
         for item in risks:
-            aux.append(["Risk", str(item)])
-            for col in range(1, len(aux_headers) + 1):
-                aux.cell(row=aux_row, column=col).border = aux_border
-            aux_row += 1
+            aux.append(["Risk", str(item)], style=_TABLE_CELL_STYLE)
 
     safeguarding_annex = toc.get("safeguarding_annex") if isinstance(toc, dict) else None
     if isinstance(safeguarding_annex, list):
         for item in safeguarding_annex:
-            aux.append(["Safeguarding Annex", str(item)])
-            for col in range(1, len(aux_headers) + 1):
-                aux.cell(row=aux_row, column=col).border = aux_border
-            aux_row += 1
+            aux.append(["Safeguarding Annex", str(item)], style=_TABLE_CELL_STYLE)
 
-    if aux_row == 2:
-        aux.append(["", ""])
-        for col in range(1, len(aux_headers) + 1):
-            aux.cell(row=aux_row, column=col).border = aux_border
-    else:
-        aux_row += 1
-    _autosize_columns(ws)
-    _autosize_columns(aux)
+    if aux.row_count == 1:
+        aux.append(["", ""], style=_TABLE_CELL_STYLE)
 
 
 def _add_worldbank_results_sheet(
-    wb: Workbook,
+    wb: _XlsxWriter,
     toc_payload: Dict[str, Any],
     *,
     logframe_draft: Optional[Dict[str, Any]] = None,
@@ -1071,8 +1133,7 @@ def _add_worldbank_results_sheet(
         "Suggested Result Focus",
         "Suggested Measurement Intent",
     ]
-    thin_border = _apply_table_header(ws, headers)
-    row_idx = 2
+    ws.append(headers, style=_TABLE_HEADER_STYLE)
     pdo = _compact_export_text(toc.get("project_development_objective") or "") if isinstance(toc, dict) else ""
     if pdo:
         focus_name, focus_mov, focus_owner = _indicator_focus_cells(impact_focus or outcome_focus[:1])
@@ -1093,11 +1154,9 @@ def _add_worldbank_results_sheet(
                 formulas,
                 result_focus,
                 measurement_intent,
-            ]
+            ],
+            style=_TABLE_CELL_STYLE,
         )
-        for col in range(1, len(headers) + 1):
-            ws.cell(row=row_idx, column=col).border = thin_border
-        row_idx += 1
 
     objectives = toc.get("objectives") if isinstance(toc, dict) else None
     if isinstance(objectives, list) and objectives:
@@ -1122,11 +1181,9 @@ def _add_worldbank_results_sheet(
                     formulas,
                     result_focus,
                     measurement_intent,
-                ]
+                ],
+                style=_TABLE_CELL_STYLE,
             )
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
 
     results_chain = toc.get("results_chain") if isinstance(toc, dict) else None
     if isinstance(results_chain, list):
@@ -1151,37 +1208,26 @@ def _add_worldbank_results_sheet(
                     formulas,
                     result_focus,
                     measurement_intent,
-                ]
+                ],
+                style=_TABLE_CELL_STYLE,
             )
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
 
     assumptions = toc.get("assumptions") if isinstance(toc, dict) else None
     if isinstance(assumptions, list):
         for item in assumptions:
-            ws.append(["Assumption", "", "", str(item), "", "", "", "", "", "", "", "", ""])
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
+            ws.append(["Assumption", "", "", str(item), "", "", "", "", "", "", "", "", ""], style=_TABLE_CELL_STYLE)
 
     risks = toc.get("risks") if isinstance(toc, dict) else None
     if isinstance(risks, list):
         for item in risks:
-            ws.append(["Risk", "", "", str(item), "", "", "", "", "", "", "", "", ""])
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
+            ws.append(["Risk", "", "", str(item), "", "", "", "", "", "", "", "", ""], style=_TABLE_CELL_STYLE)
 
-    if row_idx == 2:
-        ws.append(["", "", "", "", "", "", "", "", "", "", "", "", ""])
-        for col in range(1, len(headers) + 1):
-            ws.cell(row=2, column=col).border = thin_border
-    _autosize_columns(ws)
+    if ws.row_count == 1:
+        ws.append(["", "", "", "", "", "", "", "", "", "", "", "", ""], style=_TABLE_CELL_STYLE)
 
 
 def _add_giz_results_sheet(
-    wb: Workbook,
+    wb: _XlsxWriter,
     toc_payload: Dict[str, Any],
     *,
     logframe_draft: Optional[Dict[str, Any]] = None,
@@ -1205,8 +1251,7 @@ def _add_giz_results_sheet(
         "Suggested Result Focus",
         "Suggested Measurement Intent",
     ]
-    thin_border = _apply_table_header(ws, headers)
-    row_idx = 2
+    ws.append(headers, style=_TABLE_HEADER_STYLE)
 
     programme_objective = str(toc.get("programme_objective") or "").strip() if isinstance(toc, dict) else ""
     if programme_objective:
@@ -1227,11 +1272,9 @@ def _add_giz_results_sheet(
                 formulas,
                 result_focus,
                 measurement_intent,
-            ]
+            ],
+            style=_TABLE_CELL_STYLE,
         )
-        for col in range(1, len(headers) + 1):
-            ws.cell(row=row_idx, column=col).border = thin_border
-        row_idx += 1
 
     outputs = toc.get("outputs") if isinstance(toc, dict) else None
     if isinstance(outputs, list):
@@ -1253,11 +1296,9 @@ def _add_giz_results_sheet(
                     formulas,
                     result_focus,
                     measurement_intent,
-                ]
+                ],
+                style=_TABLE_CELL_STYLE,
             )
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
 
     outcomes = toc.get("outcomes") if isinstance(toc, dict) else None
     if isinstance(outcomes, list):
@@ -1281,37 +1322,26 @@ def _add_giz_results_sheet(
                     formulas,
                     result_focus,
                     measurement_intent,
-                ]
+                ],
+                style=_TABLE_CELL_STYLE,
             )
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
 
     sustainability_factors = toc.get("sustainability_factors") if isinstance(toc, dict) else None
     if isinstance(sustainability_factors, list):
         for item in sustainability_factors:
-            ws.append(["Sustainability", str(item), "", "", "", "", "", "", "", "", "", ""])
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
+            ws.append(["Sustainability", str(item), "", "", "", "", "", "", "", "", "", ""], style=_TABLE_CELL_STYLE)
 
     assumptions_risks = toc.get("assumptions_risks") if isinstance(toc, dict) else None
     if isinstance(assumptions_risks, list):
         for item in assumptions_risks:
-            ws.append(["Assumption/Risk", str(item), "", "", "", "", "", "", "", "", "", ""])
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
+            ws.append(["Assumption/Risk", str(item), "", "", "", "", "", "", "", "", "", ""], style=_TABLE_CELL_STYLE)
 
-    if row_idx == 2:
-        ws.append(["", "", "", "", "", "", "", "", "", "", "", ""])
-        for col in range(1, len(headers) + 1):
-            ws.cell(row=2, column=col).border = thin_border
-    _autosize_columns(ws)
+    if ws.row_count == 1:
+        ws.append(["", "", "", "", "", "", "", "", "", "", "", ""], style=_TABLE_CELL_STYLE)
 
 
 def _add_un_results_sheet(
-    wb: Workbook,
+    wb: _XlsxWriter,
     toc_payload: Dict[str, Any],
     *,
     logframe_draft: Optional[Dict[str, Any]] = None,
@@ -1334,8 +1364,7 @@ def _add_un_results_sheet(
         "Suggested Result Focus",
         "Suggested Measurement Intent",
     ]
-    thin_border = _apply_table_header(ws, headers)
-    row_idx = 2
+    ws.append(headers, style=_TABLE_HEADER_STYLE)
 
     brief = str(toc.get("brief") or "").strip() if isinstance(toc, dict) else ""
     if brief:
@@ -1355,11 +1384,9 @@ def _add_un_results_sheet(
                 formulas,
                 result_focus,
                 measurement_intent,
-            ]
+            ],
+            style=_TABLE_CELL_STYLE,
         )
-        for col in range(1, len(headers) + 1):
-            ws.cell(row=row_idx, column=col).border = thin_border
-        row_idx += 1
 
     objectives = toc.get("objectives") if isinstance(toc, dict) else None
     if isinstance(objectives, list):
@@ -1382,11 +1409,9 @@ def _add_un_results_sheet(
                     formulas,
                     result_focus,
                     measurement_intent,
-                ]
+                ],
+                style=_TABLE_CELL_STYLE,
             )
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
 
     outcomes = toc.get("outcomes") if isinstance(toc, dict) else None
     if isinstance(outcomes, list):
@@ -1409,21 +1434,16 @@ def _add_un_results_sheet(
                     formulas,
                     result_focus,
                     measurement_intent,
-                ]
+                ],
+                style=_TABLE_CELL_STYLE,
             )
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
 
-    if row_idx == 2:
-        ws.append(["", "", "", "", "", "", "", "", "", "", ""])
-        for col in range(1, len(headers) + 1):
-            ws.cell(row=2, column=col).border = thin_border
-    _autosize_columns(ws)
+    if ws.row_count == 1:
+        ws.append(["", "", "", "", "", "", "", "", "", "", ""], style=_TABLE_CELL_STYLE)
 
 
 def _add_state_department_results_sheet(
-    wb: Workbook,
+    wb: _XlsxWriter,
     toc_payload: Dict[str, Any],
     *,
     logframe_draft: Optional[Dict[str, Any]] = None,
@@ -1444,15 +1464,11 @@ def _add_state_department_results_sheet(
         "Suggested Result Focus",
         "Suggested Measurement Intent",
     ]
-    thin_border = _apply_table_header(ws, headers)
-    row_idx = 2
+    ws.append(headers, style=_TABLE_HEADER_STYLE)
 
     strategic_context = str(toc.get("strategic_context") or "").strip() if isinstance(toc, dict) else ""
     if strategic_context:
-        ws.append(["Strategic Context", "Context", "", strategic_context, "", "", "", "", ""])
-        for col in range(1, len(headers) + 1):
-            ws.cell(row=row_idx, column=col).border = thin_border
-        row_idx += 1
+        ws.append(["Strategic Context", "Context", "", strategic_context, "", "", "", "", ""], style=_TABLE_CELL_STYLE)
 
     program_goal = str(toc.get("program_goal") or "").strip() if isinstance(toc, dict) else ""
     if program_goal:
@@ -1469,11 +1485,9 @@ def _add_state_department_results_sheet(
                 focus_owner,
                 result_focus,
                 measurement_intent,
-            ]
+            ],
+            style=_TABLE_CELL_STYLE,
         )
-        for col in range(1, len(headers) + 1):
-            ws.cell(row=row_idx, column=col).border = thin_border
-        row_idx += 1
 
     objectives = toc.get("objectives") if isinstance(toc, dict) else None
     if isinstance(objectives, list):
@@ -1493,49 +1507,34 @@ def _add_state_department_results_sheet(
                     focus_owner,
                     result_focus,
                     measurement_intent,
-                ]
+                ],
+                style=_TABLE_CELL_STYLE,
             )
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
 
     stakeholder_map = toc.get("stakeholder_map") if isinstance(toc, dict) else None
     if isinstance(stakeholder_map, list):
         for item in stakeholder_map:
-            ws.append(["Stakeholder", str(item), "", "", "", "", "", "", ""])
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
+            ws.append(["Stakeholder", str(item), "", "", "", "", "", "", ""], style=_TABLE_CELL_STYLE)
 
     risk_mitigation = toc.get("risk_mitigation") if isinstance(toc, dict) else None
     if isinstance(risk_mitigation, list):
         for item in risk_mitigation:
-            ws.append(["Risk Mitigation", str(item), "", "", "", "", "", "", ""])
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).border = thin_border
-            row_idx += 1
+            ws.append(["Risk Mitigation", str(item), "", "", "", "", "", "", ""], style=_TABLE_CELL_STYLE)
 
-    if row_idx == 2:
-        ws.append(["", "", "", "", "", "", "", "", ""])
-        for col in range(1, len(headers) + 1):
-            ws.cell(row=2, column=col).border = thin_border
-    _autosize_columns(ws)
+    if ws.row_count == 1:
+        ws.append(["", "", "", "", "", "", "", "", ""], style=_TABLE_CELL_STYLE)
 
 
 def _add_evaluation_plan_sheet(
-    wb: Workbook, toc_payload: Dict[str, Any], *, logframe_draft: Optional[Dict[str, Any]] = None
+    wb: _XlsxWriter, toc_payload: Dict[str, Any], *, logframe_draft: Optional[Dict[str, Any]] = None
 ) -> None:
     ws = wb.create_sheet("Evaluation_Plan")
     headers = ["Section", "ID", "Title", "Description"]
-    thin_border = _apply_table_header(ws, headers)
-    row_idx = 2
+    ws.append(headers, style=_TABLE_HEADER_STYLE)
 
     def add_row(section: str, identifier: str, title: str, description: str) -> None:
-        nonlocal row_idx
         values = [section, identifier, title, description]
-        for col_idx, value in enumerate(values, start=1):
-            ws.cell(row=row_idx, column=col_idx, value=_compact_export_text(value)).border = thin_border
-        row_idx += 1
+        ws.append([_compact_export_text(value) for value in values], style=_TABLE_CELL_STYLE)
 
     add_row("summary", "brief", "Assignment Summary", str(toc_payload.get("brief") or ""))
     add_row(
@@ -1785,8 +1784,6 @@ def _add_evaluation_plan_sheet(
         )
         add_row("indicator", f"IND{idx}", title, description)
 
-    _autosize_columns(ws)
-
 
 def _eu_annex_items_from_findings(critic_findings: Optional[List[Dict[str, Any]]]) -> list[str]:
     if not isinstance(critic_findings, list):
@@ -1868,9 +1865,29 @@ def build_xlsx_from_logframe(
     quality_summary: Optional[Dict[str, Any]] = None,
 ) -> bytes:
     """Конвертирует LogFrame draft в форматированный .xlsx."""
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "LogFrame"
+    return build_xlsx_with_manifest(
+        logframe_draft,
+        donor_id,
+        toc_draft=toc_draft,
+        citations=citations,
+        critic_findings=critic_findings,
+        review_comments=review_comments,
+        quality_summary=quality_summary,
+    ).content
+
+
+def build_xlsx_with_manifest(
+    logframe_draft: Dict[str, Any],
+    donor_id: str,
+    toc_draft: Optional[Dict[str, Any]] = None,
+    citations: Optional[List[Dict[str, Any]]] = None,
+    critic_findings: Optional[List[Dict[str, Any]]] = None,
+    review_comments: Optional[List[Dict[str, Any]]] = None,
+    quality_summary: Optional[Dict[str, Any]] = None,
+) -> XlsxBuild:
+    """Builds the .xlsx and returns it with its sheet/header/row-count manifest."""
+    wb = _XlsxWriter()
+    ws = wb.create_sheet("LogFrame")
 
     headers = [
         "Indicator ID",
@@ -1893,7 +1910,7 @@ def build_xlsx_from_logframe(
         "Owner",
         "Evidence Excerpt",
     ]
-    thin_border = _apply_table_header(ws, headers)
+    ws.append(headers, style=_TABLE_HEADER_STYLE)
 
     indicators = logframe_draft.get("indicators", []) if logframe_draft else []
 
@@ -1904,26 +1921,31 @@ def build_xlsx_from_logframe(
             return ", ".join(str(item).strip() for item in value if str(item).strip())
         return str(value)
 
-    for row, ind in enumerate(indicators, 2):
-        ws.cell(row=row, column=1, value=_cell_text(ind.get("indicator_id", ""))).border = thin_border
-        ws.cell(row=row, column=2, value=_cell_text(ind.get("name", ""))).border = thin_border
-        ws.cell(row=row, column=3, value=_cell_text(ind.get("result_level", ""))).border = thin_border
-        ws.cell(row=row, column=4, value=_cell_text(ind.get("toc_statement_path", ""))).border = thin_border
-        ws.cell(row=row, column=5, value=_cell_text(ind.get("justification", ""))).border = thin_border
-        ws.cell(row=row, column=6, value=_cell_text(ind.get("citation", ""))).border = thin_border
-        ws.cell(row=row, column=7, value=_indicator_readiness_hint(ind)).border = thin_border
-        ws.cell(row=row, column=8, value=_compact_text(ind.get("definition", ""), max_len=96)).border = thin_border
-        ws.cell(row=row, column=9, value=_compact_text(ind.get("justification", ""), max_len=96)).border = thin_border
-        ws.cell(row=row, column=10, value=_cell_text(ind.get("baseline", "TBD"))).border = thin_border
-        ws.cell(row=row, column=11, value=_cell_text(ind.get("target", "TBD"))).border = thin_border
-        ws.cell(row=row, column=12, value=_cell_text(ind.get("frequency", ""))).border = thin_border
-        ws.cell(row=row, column=13, value=_cell_text(ind.get("formula", ""))).border = thin_border
-        ws.cell(row=row, column=14, value=_cell_text(ind.get("definition", ""))).border = thin_border
-        ws.cell(row=row, column=15, value=_cell_text(ind.get("data_source", ""))).border = thin_border
-        ws.cell(row=row, column=16, value=_cell_text(ind.get("disaggregation", ""))).border = thin_border
-        ws.cell(row=row, column=17, value=_cell_text(ind.get("means_of_verification", ""))).border = thin_border
-        ws.cell(row=row, column=18, value=_cell_text(ind.get("owner", ""))).border = thin_border
-        ws.cell(row=row, column=19, value=_cell_text(ind.get("evidence_excerpt", ""))).border = thin_border
+    for ind in indicators:
+        ws.append(
+            [
+                _cell_text(ind.get("indicator_id", "")),
+                _cell_text(ind.get("name", "")),
+                _cell_text(ind.get("result_level", "")),
+                _cell_text(ind.get("toc_statement_path", "")),
+                _cell_text(ind.get("justification", "")),
+                _cell_text(ind.get("citation", "")),
+                _indicator_readiness_hint(ind),
+                _compact_text(ind.get("definition", ""), max_len=96),
+                _compact_text(ind.get("justification", ""), max_len=96),
+                _cell_text(ind.get("baseline", "TBD")),
+                _cell_text(ind.get("target", "TBD")),
+                _cell_text(ind.get("frequency", "")),
+                _cell_text(ind.get("formula", "")),
+                _cell_text(ind.get("definition", "")),
+                _cell_text(ind.get("data_source", "")),
+                _cell_text(ind.get("disaggregation", "")),
+                _cell_text(ind.get("means_of_verification", "")),
+                _cell_text(ind.get("owner", "")),
+                _cell_text(ind.get("evidence_excerpt", "")),
+            ],
+            style=_TABLE_CELL_STYLE,
+        )
 
     toc_payload_raw = toc_draft if isinstance(toc_draft, dict) else {}
     if not toc_payload_raw:
@@ -1948,10 +1970,10 @@ def build_xlsx_from_logframe(
     elif donor_key in {"state_department", "us_state_department", "u.s. department of state", "us department of state"}:
         _add_state_department_results_sheet(wb, toc_payload, logframe_draft=logframe_draft)
 
-    _autosize_columns(ws)
     _add_template_meta_sheet(wb, profile)
     primary_sheet_name = DONOR_XLSX_PRIMARY_SHEET.get(donor_key)
-    primary_sheet_headers = _sheet_headers(wb[primary_sheet_name]) if primary_sheet_name in wb.sheetnames else []
+    primary_sheet = wb.sheet(primary_sheet_name) if primary_sheet_name else None
+    primary_sheet_headers = primary_sheet.headers if primary_sheet is not None else []
     contract = evaluate_export_contract(
         donor_id=donor_id,
         toc_payload=toc_payload,
@@ -1980,10 +2002,7 @@ def build_xlsx_from_logframe(
     _add_critic_findings_sheet(wb, export_findings)
     _add_review_comments_sheet(wb, export_comments)
 
-    bio = BytesIO()
-    wb.save(bio)
-    bio.seek(0)
-    return bio.read()
+    return wb.save()
 
 
 def save_xlsx_to_file(
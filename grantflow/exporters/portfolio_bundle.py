@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Optional
+
+from grantflow.exporters.excel_builder import XlsxBuildManifest, build_xlsx_with_manifest
+from grantflow.exporters.word_builder import build_docx_from_toc
+
+PORTFOLIO_BUNDLE_DOCUMENTS = ("proposal.docx", "mel.xlsx")
+
+
+def render_job_export_documents(
+    documents: Iterable[str],
+    inputs: Dict[str, Any],
+    include_diagnostics: bool = False,
+) -> tuple[Dict[str, bytes], Optional[XlsxBuildManifest]]:
+    """Render the named per-job export documents from resolved builder inputs.
+
+    Runs in portfolio bundle pool workers, so it takes and returns picklable values only and imports nothing
+    beyond the builders. The xlsx manifest is returned for the caller's workbook contract check.
+    """
+    rendered: Dict[str, bytes] = {}
+    manifest: Optional[XlsxBuildManifest] = None
+    wanted = set(documents)
+    if "proposal.docx" in wanted:
+        rendered["proposal.docx"] = build_docx_from_toc(
+            inputs["toc_draft"],
+            inputs["donor_id"],
+            logframe_draft=inputs["logframe_draft"],
+            citations=inputs["citations"],
+            critic_findings=inputs["critic_findings"],
+            review_comments=inputs["review_comments"],
+            quality_summary=inputs["quality_summary"],
+            include_diagnostics=bool(include_diagnostics),
+        )
+    if "mel.xlsx" in wanted:
+        xlsx_build = build_xlsx_with_manifest(
+            inputs["logframe_draft"],
+            inputs["donor_id"],
+            toc_draft=inputs["toc_draft"],
+            citations=inputs["citations"],
+            critic_findings=inputs["critic_findings"],
+            review_comments=inputs["review_comments"],
+            quality_summary=inputs["quality_summary"],
+        )
+        rendered["mel.xlsx"] = xlsx_build.content
+        manifest = xlsx_build.manifest
+    return rendered, manifest
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import io
+import zipfile
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+
+EXPORT_STREAM_CHUNK_BYTES = 64 * 1024
+
+
+class _ChunkSink(io.RawIOBase):
+    """Unseekable write target; zipfile then emits data descriptors instead of seeking back to headers."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        return len(chunk)
+
+    def drain(self) -> bytes:
+        chunks, self._chunks = self._chunks, []
+        return b"".join(chunks)
+
+
+ZipEntryContent = Union[bytes, Path]
+
+
+def _iter_entry_content(content: ZipEntryContent, chunk_size: int) -> Iterator[bytes]:
+    if isinstance(content, Path):
+        with content.open("rb") as handle:
+            while chunk := handle.read(chunk_size):
+                yield chunk
+        return
+    view = memoryview(content)
+    for offset in range(0, len(view), chunk_size):
+        yield view[offset : offset + chunk_size]
+
+
+def iter_zip_stream(
+    entries: Iterable[tuple[str, ZipEntryContent]],
+    *,
+    chunk_size: int = EXPORT_STREAM_CHUNK_BYTES,
+) -> Iterator[bytes]:
+    """Deflate `(name, content)` entries into a ZIP and yield it chunk by chunk as it is written.
+
+    Only the entry being compressed and the pending output chunk are held; `entries` can be a generator that
+    renders each artifact on demand and drops it once the next one is requested. `Path` contents are copied
+    from disk in chunks.
+    """
+    step = max(1, int(chunk_size))
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in entries:
+            with archive.open(name, "w") as handle:
+                for piece in _iter_entry_content(content, step):
+                    handle.write(piece)
+                    chunk = sink.drain()
+                    if chunk:
+                        yield chunk
+            del content
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    tail = sink.drain()
+    if tail:
+        yield tail
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import re
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Protocol, Sequence
+
+import numpy as np
+
+from grantflow.core.stores import ensure_sqlite_component_schema, sqlite_connection_pool
+
+_ONNX_IMPORT_ERROR: Optional[str] = None
+_onnxruntime_value: Any = None
+_tokenizer_cls_value: Any = None
+try:
+    import onnxruntime as _onnxruntime_imported
+    from tokenizers import Tokenizer as _tokenizer_cls_imported
+except Exception as exc:  # pragma: no cover - exercised in runtime-specific environments
+    _ONNX_IMPORT_ERROR = str(exc)
+else:
+    _onnxruntime_value = _onnxruntime_imported
+    _tokenizer_cls_value = _tokenizer_cls_imported
+
+_onnxruntime: Any = _onnxruntime_value
+_Tokenizer: Any = _tokenizer_cls_value
+
+EMBEDDING_PROVIDERS = {"legacy_hash", "hashed_ngram", "local_model"}
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+class EmbeddingProvider(Protocol):
+    name: str
+    dims: int
+    cache_key: str
+    cacheable: bool
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray: ...
+
+
+class LegacyHashEmbeddingProvider:
+    """Deterministic 16-dim SHA-256 pseudo-embeddings kept for existing collections and smoke tests."""
+
+    name = "legacy_hash"
+    cacheable = False
+
+    def __init__(self, dims: int = 16) -> None:
+        self.dims = max(1, min(32, int(dims)))
+        self.cache_key = f"{self.name}:{self.dims}"
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        out: np.ndarray = np.zeros((len(texts), self.dims), dtype=np.float32)
+        for row, text in enumerate(texts):
+            digest = hashlib.sha256((text or "").encode("utf-8", errors="ignore")).digest()
+            out[row] = np.frombuffer(digest[: self.dims], dtype=np.uint8) / 255.0
+        return out
+
+
+class HashedNgramEmbeddingProvider:
+    """Signed feature hashing of word uni/bigrams and character n-grams with sublinear TF and L2 norm.
+
+    Corpus IDF is deliberately left out: vectors must not drift as namespaces grow, or every stored
+    chunk would need re-embedding after each ingest.
+    """
+
+    name = "hashed_ngram"
+    cacheable = True
+
+    def __init__(self, dims: int = 512, char_ngram_range: tuple[int, int] = (3, 5)) -> None:
+        self.dims = max(16, int(dims))
+        self.char_ngram_range = (max(1, int(char_ngram_range[0])), max(1, int(char_ngram_range[1])))
+        low, high = self.char_ngram_range
+        self.cache_key = f"{self.name}:{self.dims}:{low}-{high}"
+
+    def _features(self, text: str) -> Counter[str]:
+        words = _WORD_RE.findall((text or "").lower())
+        features: Counter[str] = Counter(f"w:{word}" for word in words)
+        features.update(f"b:{left} {right}" for left, right in zip(words, words[1:]))
+        low, high = self.char_ngram_range
+        for word in words:
+            padded = f"<{word}>"
+            for size in range(low, high + 1):
+                features.update(f"c:{padded[i : i + size]}" for i in range(max(0, len(padded) - size + 1)))
+        return features
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        out: np.ndarray = np.zeros((len(texts), self.dims), dtype=np.float32)
+        for row, text in enumerate(texts):
+            vector = out[row]
+            for feature, count in self._features(text).items():
+                # crc32 is stable across processes, unlike the salted builtin hash().
+                digest = zlib.crc32(feature.encode("utf-8"))
+                sign = 1.0 if digest & 0x80000000 else -1.0
+                vector[digest % self.dims] += sign * (1.0 + math.log(count))
+            norm = float(np.linalg.norm(vector))
+            if norm > 0:
+                vector /= norm
+        return out
+
+
+class LocalModelEmbeddingProvider:
+    """CPU-only ONNX sentence encoder loaded from a local directory (``model.onnx`` + ``tokenizer.json``)."""
+
+    name = "local_model"
+    cacheable = True
+
+    def __init__(self, model_dir: str, max_length: int = 256) -> None:
+        if _ONNX_IMPORT_ERROR or _onnxruntime is None or _Tokenizer is None:
+            raise RuntimeError(f"local embedding model requires onnxruntime and tokenizers: {_ONNX_IMPORT_ERROR}")
+        root = Path(model_dir).expanduser()
+        model_path = next(
+            (path for path in (root / "model.onnx", root / "onnx" / "model.onnx") if path.is_file()), None
+        )
+        tokenizer_path = root / "tokenizer.json"
+        if model_path is None or not tokenizer_path.is_file():
+            raise RuntimeError(f"local embedding model directory must contain model.onnx and tokenizer.json: {root}")
+
+        self.model_dir = str(root)
+        self._tokenizer = _Tokenizer.from_file(str(tokenizer_path))
+        self._tokenizer.enable_truncation(max_length=max(8, int(max_length)))
+        self._tokenizer.enable_padding()
+        options = _onnxruntime.SessionOptions()
+        options.log_severity_level = 3
+        self._session = _onnxruntime.InferenceSession(
+            str(model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {item.name for item in self._session.get_inputs()}
+        output_dims = self._session.get_outputs()[0].shape[-1]
+        self.dims = int(output_dims) if isinstance(output_dims, int) else int(self.embed(["dimension probe"]).shape[1])
+
+        fingerprint = hashlib.sha256()
+        for path in (model_path, tokenizer_path):
+            with path.open("rb") as handle:
+                for chunk in iter(lambda: handle.read(1 << 20), b""):
+                    fingerprint.update(chunk)
+        self.cache_key = f"{self.name}:{fingerprint.hexdigest()[:16]}:{max_length}"
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, getattr(self, "dims", 0)), dtype=np.float32)
+        encodings = self._tokenizer.encode_batch([str(text or "") for text in texts])
+        input_ids = np.array([item.ids for item in encodings], dtype=np.int64)
+        attention_mask = np.array([item.attention_mask for item in encodings], dtype=np.int64)
+        feeds: Dict[str, np.ndarray] = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+        output = np.asarray(self._session.run(None, {k: v for k, v in feeds.items() if k in self._input_names})[0])
+        if output.ndim == 3:
+            # Mean-pool token states over the attention mask.
+            mask = attention_mask[:, :, None].astype(np.float32)
+            output = (output * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        output = output.astype(np.float32)
+        norms = np.linalg.norm(output, axis=1, keepdims=True)
+        return output / np.clip(norms, 1e-12, None)
+
+
+class SQLiteEmbeddingCache:
+    """Content-addressed on-disk embedding cache keyed by provider fingerprint and text hash."""
+
+    SCHEMA_COMPONENT = "embedding_cache"
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._pool = sqlite_connection_pool(db_path)
+        with self._pool.writer() as conn:
+            ensure_sqlite_component_schema(conn, self.SCHEMA_COMPONENT, self.SCHEMA_VERSION)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                  cache_key TEXT PRIMARY KEY,
+                  dims INTEGER NOT NULL,
+                  vector BLOB NOT NULL
+                )
+                """)
+
+    def get_many(self, keys: Sequence[str], dims: int) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        with self._pool.reader() as conn:
+            for start in range(0, len(keys), 500):
+                chunk = list(keys[start : start + 500])
+                rows = conn.execute(
+                    "SELECT cache_key, dims, vector FROM embedding_cache WHERE cache_key IN ("
+                    + ", ".join("?" for _ in chunk)
+                    + ")",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    if int(row["dims"]) == dims:
+                        found[str(row["cache_key"])] = np.frombuffer(row["vector"], dtype=np.float32)
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        if not items:
+            return
+        with self._pool.writer() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (cache_key, dims, vector) VALUES (?, ?, ?)",
+                [
+                    (key, int(vector.shape[0]), np.asarray(vector, dtype=np.float32).tobytes())
+                    for key, vector in items.items()
+                ],
+            )
+
+
+class EmbeddingService:
+    """Batches provider calls and serves repeated texts from an LRU plus an optional disk cache."""
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        *,
+        cache: Optional[SQLiteEmbeddingCache] = None,
+        batch_size: int = 64,
+        memory_cache_size: int = 4096,
+        init_error: Optional[str] = None,
+    ) -> None:
+        self.provider = provider
+        self.cache = cache if provider.cacheable else None
+        self.batch_size = max(1, int(batch_size))
+        self.memory_cache_size = max(0, int(memory_cache_size))
+        self.init_error = init_error
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"texts": 0, "embedded": 0, "memory_hits": 0, "disk_hits": 0, "batches": 0}
+
+    @property
+    def dims(self) -> int:
+        return int(self.provider.dims)
+
+    @property
+    def collection_suffix(self) -> str:
+        # Legacy vectors keep the historical collection names; other providers get their own
+        # collections so Chroma never mixes embedding spaces or dimensions.
+        if self.provider.name == "legacy_hash":
+            return ""
+        digest = hashlib.sha1(self.provider.cache_key.encode("utf-8")).hexdigest()[:8]
+        return f"{self.provider.name}_{digest}"
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.provider.cache_key}\0{text}".encode("utf-8", errors="ignore")).hexdigest()
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        items = [str(text or "") for text in texts]
+        out: np.ndarray = np.zeros((len(items), self.dims), dtype=np.float32)
+        if not items:
+            return out
+        if not self.provider.cacheable:
+            for start in range(0, len(items), self.batch_size):
+                out[start : start + self.batch_size] = self.provider.embed(items[start : start + self.batch_size])
+            with self._lock:
+                self._counters["texts"] += len(items)
+                self._counters["embedded"] += len(items)
+                self._counters["batches"] += math.ceil(len(items) / self.batch_size)
+            return out
+
+        keys = [self._key(text) for text in items]
+        resolved: Dict[str, np.ndarray] = {}
+        with self._lock:
+            self._counters["texts"] += len(items)
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None and key not in resolved:
+                    self._memory.move_to_end(key)
+                    resolved[key] = vector
+                    self._counters["memory_hits"] += 1
+
+        pending = list(dict.fromkeys(key for key in keys if key not in resolved))
+        if pending and self.cache is not None:
+            disk = self.cache.get_many(pending, self.dims)
+            resolved.update(disk)
+            with self._lock:
+                self._counters["disk_hits"] += len(disk)
+            pending = [key for key in pending if key not in disk]
+
+        if pending:
+            text_by_key = dict(zip(keys, items))
+            fresh: Dict[str, np.ndarray] = {}
+            for start in range(0, len(pending), self.batch_size):
+                batch = pending[start : start + self.batch_size]
+                vectors = self.provider.embed([text_by_key[key] for key in batch])
+                fresh.update({key: np.asarray(vectors[i], dtype=np.float32) for i, key in enumerate(batch)})
+            resolved.update(fresh)
+            if self.cache is not None:
+                self.cache.put_many(fresh)
+            with self._lock:
+                self._counters["embedded"] += len(fresh)
+                self._counters["batches"] += math.ceil(len(pending) / self.batch_size)
+
+        with self._lock:
+            if self.memory_cache_size:
+                for key in dict.fromkeys(keys):
+                    self._memory[key] = resolved[key]
+                    self._memory.move_to_end(key)
+                while len(self._memory) > self.memory_cache_size:
+                    self._memory.popitem(last=False)
+        for row, key in enumerate(keys):
+            out[row] = resolved[key]
+        return out
+
+    def describe(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+        return {
+            "provider": self.provider.name,
+            "dims": self.dims,
+            "batch_size": self.batch_size,
+            "disk_cache_path": getattr(self.cache, "db_path", None),
+            "init_error": self.init_error,
+            "counters": counters,
+        }
+
+
+def embedding_provider_name() -> str:
+    name = str(os.getenv("GRANTFLOW_EMBEDDING_PROVIDER", "legacy_hash") or "").strip().lower()
+    return name if name in EMBEDDING_PROVIDERS else "legacy_hash"
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def create_embedding_service_from_env() -> EmbeddingService:
+    name = embedding_provider_name()
+    init_error: Optional[str] = None
+    provider: EmbeddingProvider
+    try:
+        if name == "local_model":
+            provider = LocalModelEmbeddingProvider(
+                os.getenv("GRANTFLOW_EMBEDDING_MODEL_DIR", ""),
+                max_length=_env_int("GRANTFLOW_EMBEDDING_MAX_TOKENS", 256),
+            )
+        elif name == "hashed_ngram":
+            provider = HashedNgramEmbeddingProvider(dims=_env_int("GRANTFLOW_EMBEDDING_DIMS", 512))
+        else:
+            provider = LegacyHashEmbeddingProvider()
+    except Exception as exc:
+        # Same posture as the Chroma fallback: keep the API alive and surface the error in stats.
+        init_error = f"{name} embedding provider init failed: {exc}"
+        provider = LegacyHashEmbeddingProvider()
+
+    cache: Optional[SQLiteEmbeddingCache] = None
+    cache_mode = str(os.getenv("GRANTFLOW_EMBEDDING_CACHE", "on") or "").strip().lower()
+    if provider.cacheable and cache_mode not in {"0", "false", "no", "off"}:
+        cache_path = os.getenv("GRANTFLOW_EMBEDDING_CACHE_PATH", "./grantflow_embedding_cache.db")
+        parent = os.path.dirname(os.path.abspath(cache_path))
+        os.makedirs(parent, exist_ok=True)
+        cache = SQLiteEmbeddingCache(cache_path)
+
+    return EmbeddingService(
+        provider,
+        cache=cache,
+        batch_size=_env_int("GRANTFLOW_EMBEDDING_BATCH_SIZE", 64),
+        init_error=init_error,
+    )
@@ -2,154 +2,446 @@
 
 from __future__ import annotations
 
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from grantflow.memory_bank.pdf_extract import (  # noqa: F401
+    chunk_pages,
+    chunk_text,
+    extract_page_window,
+    file_sha256,
+    iter_chunk_records,
+    iter_pdf_pages,
+    pdf_page_count,
+    text_sha256,
+)
 from grantflow.memory_bank.vector_store import vector_store
 
+logger = logging.getLogger(__name__)
 
-def load_pdf_pages(pdf_path: str) -> List[str]:
-    """Извлекает текст постранично из PDF. Требует pymupdf."""
+DEFAULT_UPSERT_BATCH_SIZE = 256
+DEFAULT_PAGE_WINDOW = 16
+# Stamped on a file's first chunk once all of its batches and stale-page deletes have landed.
+INGEST_COMPLETE_METADATA_KEY = "ingest_complete_sha256"
+
+IngestProgressFn = Callable[[Dict[str, Any]], None]
+
+
+def _env_int(name: str, default: int) -> int:
     try:
-        import fitz  # pymupdf
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
 
-        doc = fitz.open(pdf_path)
-        pages: List[str] = []
-        for page in doc:
-            pages.append(page.get_text() or "")
-        doc.close()
-        return pages
-    except ImportError as exc:
-        raise ImportError("Установите pymupdf: pip install pymupdf") from exc
+
+def ingest_upsert_batch_size() -> int:
+    return max(1, _env_int("GRANTFLOW_INGEST_BATCH_SIZE", DEFAULT_UPSERT_BATCH_SIZE))
+
+
+def ingest_worker_count() -> int:
+    return max(1, _env_int("GRANTFLOW_INGEST_WORKERS", min(4, os.cpu_count() or 1)))
+
+
+def ingest_page_window() -> int:
+    return max(1, _env_int("GRANTFLOW_INGEST_PAGE_WINDOW", DEFAULT_PAGE_WINDOW))
+
+
+def ingest_dedup_enabled() -> bool:
+    return str(os.getenv("GRANTFLOW_INGEST_DEDUP", "true")).strip().lower() not in {"0", "false", "no", "off"}
+
+
+def load_pdf_pages(pdf_path: str) -> List[str]:
+    """Извлекает текст постранично из PDF. Требует pymupdf."""
+    return list(iter_pdf_pages(pdf_path))
 
 
 def load_pdf_text(pdf_path: str) -> str:
     """Извлекает текст из PDF. Требует pymupdf."""
-    return "".join(load_pdf_pages(pdf_path))
-
-
-def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
-    """Разбивает текст на чанки с перекрытием."""
-    if chunk_size <= 0:
-        raise ValueError("chunk_size must be > 0")
-    if overlap < 0:
-        raise ValueError("overlap must be >= 0")
-    if overlap >= chunk_size:
-        raise ValueError("overlap must be < chunk_size")
-
-    chunks = []
-    start = 0
-    while start < len(text):
-        end = start + chunk_size
-        chunk = text[start:end]
-        chunks.append(chunk)
-        start = end - overlap
-    return chunks
-
-
-def chunk_pages(
-    pages: List[str],
-    chunk_size: int = 1000,
-    overlap: int = 200,
-) -> List[Dict[str, Any]]:
-    """Разбивает PDF-текст на чанки с trace metadata по страницам."""
-    records: List[Dict[str, Any]] = []
-    chunk_index = 0
+    return "".join(iter_pdf_pages(pdf_path))
+
+
+class _ChunkUpserter:
+    """Собирает чанки одного файла и пишет их в vector store ограниченными батчами.
+
+    Если известен SHA-256 файла, чанки помечаются `file_sha256`/`page_sha256`: неизменённые
+    страницы не переэмбеддятся, чанки исчезнувших страниц удаляются.
+    """
+
+    def __init__(
+        self,
+        pdf_path: str,
+        namespace: str,
+        metadata: Optional[Dict[str, Any]],
+        batch_size: int,
+        *,
+        file_hash: Optional[str] = None,
+    ) -> None:
+        namespace_trace = vector_store.namespace_trace(namespace)
+        self.pdf_path = pdf_path
+        self.namespace = namespace
+        self.namespace_normalized = namespace_trace["namespace_normalized"]
+        self.collection = namespace_trace["collection"]
+        metadata_payload = dict(metadata or {})
+        metadata_payload.setdefault("namespace", namespace_trace["namespace"])
+        metadata_payload["namespace_normalized"] = self.namespace_normalized
+        metadata_payload["collection"] = self.collection
+        source_ref = str(metadata_payload.get("uploaded_filename") or metadata_payload.get("source") or "").strip()
+        if not source_ref:
+            source_ref = Path(pdf_path).name
+        metadata_payload["source"] = source_ref
+        metadata_payload.setdefault("source_path", pdf_path)
+        if file_hash:
+            metadata_payload["file_sha256"] = file_hash
+        self.metadata_payload = metadata_payload
+        self.source_ref = source_ref
+        self.file_hash = file_hash
+        # Ids follow the source name, not the (possibly temporary) upload path, so re-uploads line up.
+        self.stem = Path(source_ref).stem or Path(pdf_path).stem
+        self.batch_size = max(1, int(batch_size))
+        self.started_at = time.perf_counter()
+        self.pages = 0
+        self.chunks = 0
+        self.chunks_seen = 0
+        self.chunks_skipped = 0
+        self.chunks_refreshed = 0
+        self.batches = 0
+        self.dedup_status = "new"
+        self.duplicate_of: Optional[str] = None
+        self._first_chunk: Optional[Tuple[str, Dict[str, Any]]] = None
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        self._metadatas: List[Dict[str, Any]] = []
+        self._refresh_ids: List[str] = []
+        self._refresh_metadatas: List[Dict[str, Any]] = []
+        self._page_hashes: Dict[int, str] = {}
+        self._current_ids: set[str] = set()
+        self._prior_pages: Dict[int, Dict[str, Any]] = self._load_prior_pages() if file_hash else {}
+
+    def _load_prior_pages(self) -> Dict[int, Dict[str, Any]]:
+        existing = vector_store.get(self.namespace, where={"source": self.source_ref})
+        pages: Dict[int, Dict[str, Any]] = {}
+        for doc_id, meta in zip(existing.get("ids") or [], existing.get("metadatas") or []):
+            meta = meta if isinstance(meta, dict) else {}
+            try:
+                page = int(meta.get("page") or 0)
+            except (TypeError, ValueError):
+                page = 0
+            entry = pages.setdefault(page, {"page_sha256": meta.get("page_sha256"), "chunks": {}})
+            if entry["page_sha256"] != meta.get("page_sha256"):
+                entry["page_sha256"] = None
+            entry["chunks"][str(doc_id)] = meta
+        return pages
+
+    def check_unchanged_file(self) -> bool:
+        """True, если такой же файл (по SHA-256) уже полностью загружен в namespace — тогда ingest пропускается.
+
+        Смотрит на маркер завершения, а не на любой чанк с этим `file_sha256`: файл, ingest которого
+        упал после первого батча, догружается при следующем запуске.
+        """
+        if not self.file_hash:
+            return False
+        hit = vector_store.get(self.namespace, where={INGEST_COMPLETE_METADATA_KEY: self.file_hash}, limit=1)
+        metadatas = hit.get("metadatas") or []
+        if not hit.get("ids"):
+            return False
+        meta = metadatas[0] if metadatas and isinstance(metadatas[0], dict) else {}
+        existing_source = str(meta.get("source") or "")
+        if existing_source and existing_source != self.source_ref:
+            self.dedup_status = "duplicate"
+            self.duplicate_of = existing_source
+        else:
+            self.dedup_status = "unchanged"
+        return True
+
+    def begin_page(self, page_number: int, text: str) -> None:
+        self.pages += 1
+        if self.file_hash:
+            self._page_hashes[page_number] = text_sha256(text)
+
+    def set_page_hashes(self, page_hashes: Dict[int, str]) -> None:
+        self.pages += len(page_hashes)
+        if self.file_hash:
+            self._page_hashes.update({int(page): str(digest) for page, digest in page_hashes.items()})
+
+    def add(self, record: Dict[str, Any]) -> None:
+        page = record.get("page")
+        page_chunk = record.get("page_chunk")
+        chunk_idx = int(record.get("chunk", self.chunks_seen))
+        if page is not None and page_chunk is not None:
+            doc_id = f"{self.namespace_normalized}_{self.stem}_p{page}_c{page_chunk}"
+        else:
+            doc_id = f"{self.namespace_normalized}_{self.stem}_{chunk_idx}"
+        page_hash = self._page_hashes.get(int(page)) if page is not None else None
+        metadata = {
+            **{
+                "source": self.source_ref,
+                "chunk": chunk_idx,
+                "doc_id": doc_id,
+                "chunk_id": doc_id,
+                **({k: v for k, v in record.items() if k != "text"}),
+            },
+            **self.metadata_payload,
+        }
+        if page_hash:
+            metadata["page_sha256"] = page_hash
+        self.chunks_seen += 1
+        self._current_ids.add(doc_id)
+        if self._first_chunk is None:
+            self._first_chunk = (doc_id, metadata)
+
+        prior = self._prior_pages.get(int(page)) if page is not None else None
+        if prior is not None and page_hash and prior["page_sha256"] == page_hash and doc_id in prior["chunks"]:
+            # Same page text as the stored chunk: keep its embedding, only refresh changed metadata.
+            self.chunks_skipped += 1
+            prior_metadata = {k: v for k, v in prior["chunks"][doc_id].items() if k != INGEST_COMPLETE_METADATA_KEY}
+            if prior_metadata != metadata:
+                self._refresh_ids.append(doc_id)
+                self._refresh_metadatas.append(metadata)
+                if len(self._refresh_ids) >= self.batch_size:
+                    self.flush()
+            return
+
+        self._ids.append(doc_id)
+        self._documents.append(str(record.get("text", "")))
+        self._metadatas.append(metadata)
+        self.chunks += 1
+        if len(self._ids) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._refresh_ids:
+            vector_store.update_metadata(self.namespace, self._refresh_ids, self._refresh_metadatas)
+            self.chunks_refreshed += len(self._refresh_ids)
+            self._refresh_ids, self._refresh_metadatas = [], []
+        if not self._ids:
+            return
+        vector_store.upsert(
+            namespace=self.namespace,
+            ids=self._ids,
+            documents=self._documents,
+            metadatas=self._metadatas,
+        )
+        self.batches += 1
+        self._ids, self._documents, self._metadatas = [], [], []
+
+    def _mark_complete(self) -> None:
+        if not self.file_hash or self._first_chunk is None:
+            return
+        doc_id, metadata = self._first_chunk
+        vector_store.update_metadata(
+            self.namespace, [doc_id], [{**metadata, INGEST_COMPLETE_METADATA_KEY: self.file_hash}]
+        )
+
+    def _dedup_report(self, stale_ids: List[str]) -> Dict[str, Any]:
+        new_pages = {page for page, digest in self._page_hashes.items()}
+        prior_pages = {page for page, entry in self._prior_pages.items() if entry["chunks"]}
+        pages_unchanged = sum(
+            1 for page in new_pages & prior_pages if self._prior_pages[page]["page_sha256"] == self._page_hashes[page]
+        )
+        return {
+            "status": self.dedup_status,
+            "file_sha256": self.file_hash,
+            "duplicate_of": self.duplicate_of,
+            "pages_added": len(new_pages - prior_pages),
+            "pages_updated": len(new_pages & prior_pages) - pages_unchanged,
+            "pages_unchanged": pages_unchanged,
+            "pages_removed": len(prior_pages - new_pages),
+            "chunks_upserted": self.chunks,
+            "chunks_skipped": self.chunks_skipped,
+            "chunks_metadata_refreshed": self.chunks_refreshed,
+            "chunks_deleted": len(stale_ids),
+        }
+
+    def finish(self, *, skipped: bool = False) -> Dict[str, Any]:
+        stale_ids: List[str] = []
+        if not skipped:
+            self.flush()
+            stale_ids = [
+                doc_id
+                for entry in self._prior_pages.values()
+                for doc_id in entry["chunks"]
+                if doc_id not in self._current_ids
+            ]
+            for start in range(0, len(stale_ids), self.batch_size):
+                vector_store.delete(self.namespace, stale_ids[start : start + self.batch_size])
+            self._mark_complete()
+            if self._prior_pages and self.dedup_status == "new":
+                self.dedup_status = "updated"
+        elapsed = max(time.perf_counter() - self.started_at, 1e-9)
+        result = {
+            "namespace": self.namespace,
+            "namespace_normalized": self.namespace_normalized,
+            "collection": self.collection,
+            "source": self.source_ref,
+            "source_path": self.pdf_path,
+            "chunks_ingested": self.chunks,
+            "pages_processed": self.pages,
+            "upsert_batches": self.batches,
+            "elapsed_seconds": round(elapsed, 4),
+            "pages_per_second": round(self.pages / elapsed, 2),
+            "chunks_per_second": round(self.chunks / elapsed, 2),
+            "stats": vector_store.get_stats(self.namespace),
+        }
+        if self.file_hash:
+            result["dedup"] = self._dedup_report(stale_ids)
+        return result
+
+
+def _hash_file_or_none(pdf_path: str) -> Optional[str]:
+    if not ingest_dedup_enabled():
+        return None
+    try:
+        return file_sha256(pdf_path)
+    except OSError:
+        return None
+
+
+def _tracked_pages(pages: Iterable[str], upserter: _ChunkUpserter) -> Iterator[str]:
     for page_number, page_text in enumerate(pages, start=1):
-        if not page_text:
-            continue
-        page_chunks = chunk_text(page_text, chunk_size=chunk_size, overlap=overlap)
-        for page_chunk_index, chunk in enumerate(page_chunks):
-            records.append(
-                {
-                    "text": chunk,
-                    "chunk": chunk_index,
-                    "page": page_number,
-                    "page_start": page_number,
-                    "page_end": page_number,
-                    "page_chunk": page_chunk_index,
-                }
-            )
-            chunk_index += 1
-    return records
+        upserter.begin_page(page_number, page_text)
+        yield page_text
 
 
 def ingest_pdf_to_namespace(
     pdf_path: str,
     namespace: str,
     metadata: Optional[Dict[str, Any]] = None,
+    *,
+    batch_size: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """Загружает PDF в указанную коллекцию (namespace) донора."""
-    namespace_trace = vector_store.namespace_trace(namespace)
-    namespace_normalized = namespace_trace["namespace_normalized"]
-    collection = namespace_trace["collection"]
-    pages = load_pdf_pages(pdf_path)
-    chunk_records = chunk_pages(pages)
-    metadata_payload = dict(metadata or {})
-    metadata_payload.setdefault("namespace", namespace_trace["namespace"])
-    metadata_payload["namespace_normalized"] = namespace_normalized
-    metadata_payload["collection"] = collection
-    source_ref = str(metadata_payload.get("uploaded_filename") or metadata_payload.get("source") or "").strip()
-    if not source_ref:
-        source_ref = Path(pdf_path).name
-    metadata_payload["source"] = source_ref
-    metadata_payload.setdefault("source_path", pdf_path)
-
-    # Fallback for unusual extractors/files that return no per-page chunks but some text.
-    if not chunk_records:
-        text = "".join(pages)
-        for idx, chunk in enumerate(chunk_text(text) if text else []):
-            chunk_records.append({"text": chunk, "chunk": idx})
-
-    ids: List[str] = []
-    chunks: List[str] = []
-    metadatas: List[Dict[str, Any]] = []
-    stem = Path(pdf_path).stem
-    for record in chunk_records:
-        page = record.get("page")
-        page_chunk = record.get("page_chunk")
-        chunk_idx = int(record.get("chunk", len(ids)))
-        if page is not None and page_chunk is not None:
-            doc_id = f"{namespace_normalized}_{stem}_p{page}_c{page_chunk}"
-        else:
-            doc_id = f"{namespace_normalized}_{stem}_{chunk_idx}"
-        ids.append(doc_id)
-        chunks.append(str(record.get("text", "")))
-        metadatas.append(
-            {
-                **{
-                    "source": source_ref,
-                    "chunk": chunk_idx,
-                    "doc_id": doc_id,
-                    "chunk_id": doc_id,
-                    **({k: v for k, v in record.items() if k != "text"}),
-                },
-                **metadata_payload,
-            }
-        )
+    """Загружает PDF в указанную коллекцию (namespace) донора постранично, батчами upsert."""
+    upserter = _ChunkUpserter(
+        pdf_path,
+        namespace,
+        metadata,
+        batch_size or ingest_upsert_batch_size(),
+        file_hash=_hash_file_or_none(pdf_path),
+    )
+    if upserter.check_unchanged_file():
+        return upserter.finish(skipped=True)
+    for record in iter_chunk_records(_tracked_pages(iter_pdf_pages(pdf_path), upserter)):
+        upserter.add(record)
+    return upserter.finish()
+
+
+def _page_windows(
+    files: List[Path],
+    namespace: str,
+    metadata: Optional[Dict[str, Any]],
+    batch_size: int,
+    page_window: int,
+) -> Iterator[Tuple[int, _ChunkUpserter, int, int, bool]]:
+    for file_index, path in enumerate(files):
+        upserter = _ChunkUpserter(str(path), namespace, metadata, batch_size, file_hash=_hash_file_or_none(str(path)))
+        if upserter.check_unchanged_file():
+            # Unchanged or duplicate bytes: never submitted for extraction.
+            yield file_index, upserter, -1, -1, True
+            continue
+        page_count = pdf_page_count(str(path))
+        if page_count <= 0:
+            yield file_index, upserter, 0, 0, True
+            continue
+        for start in range(0, page_count, page_window):
+            stop = min(start + page_window, page_count)
+            yield file_index, upserter, start, stop, stop >= page_count
 
-    vector_store.upsert(namespace=namespace, ids=ids, documents=chunks, metadatas=metadatas)
 
-    return {
-        "namespace": namespace,
-        "namespace_normalized": namespace_normalized,
-        "collection": collection,
-        "source": source_ref,
-        "source_path": pdf_path,
-        "chunks_ingested": len(chunks),
-        "stats": vector_store.get_stats(namespace),
+def _report_progress(
+    progress: Optional[IngestProgressFn],
+    result: Dict[str, Any],
+    *,
+    file_index: int,
+    file_total: int,
+) -> None:
+    report = {
+        "file_index": file_index + 1,
+        "file_total": file_total,
+        "source_path": result.get("source_path"),
+        "pages_processed": result.get("pages_processed"),
+        "chunks_ingested": result.get("chunks_ingested"),
+        "elapsed_seconds": result.get("elapsed_seconds"),
+        "pages_per_second": result.get("pages_per_second"),
+        "chunks_per_second": result.get("chunks_per_second"),
     }
+    logger.info(
+        "Ingested %s/%s %s (pages=%s chunks=%s %.2f chunks/s)",
+        report["file_index"],
+        file_total,
+        report["source_path"],
+        report["pages_processed"],
+        report["chunks_ingested"],
+        float(report["chunks_per_second"] or 0.0),
+    )
+    if progress is not None:
+        progress(report)
 
 
 def ingest_folder_to_namespace(
     folder_path: str,
     namespace: str,
     metadata: Optional[Dict[str, Any]] = None,
+    *,
+    workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    page_window: Optional[int] = None,
+    progress: Optional[IngestProgressFn] = None,
 ) -> List[Dict[str, Any]]:
-    """Загружает все PDF из папки в коллекцию донора."""
-    results = []
-    for file in Path(folder_path).glob("*.pdf"):
-        results.append(ingest_pdf_to_namespace(str(file), namespace, metadata))
+    """Загружает все PDF из папки в коллекцию донора.
+
+    Страницы извлекаются окнами в пуле процессов; окна потребляются по порядку, а число
+    незавершённых окон ограничено, чтобы извлечение не обгоняло embedding/upsert.
+    """
+    files = sorted(Path(folder_path).glob("*.pdf"))
+    worker_count = ingest_worker_count() if workers is None else max(1, int(workers))
+    upsert_batch_size = batch_size or ingest_upsert_batch_size()
+    results: List[Dict[str, Any]] = []
+    if worker_count <= 1 or not files:
+        for file_index, file in enumerate(files):
+            result = ingest_pdf_to_namespace(str(file), namespace, metadata, batch_size=upsert_batch_size)
+            _report_progress(progress, result, file_index=file_index, file_total=len(files))
+            results.append(result)
+        return results
+
+    windows = _page_windows(files, namespace, metadata, upsert_batch_size, page_window or ingest_page_window())
+    max_pending = worker_count * 2
+    pending: Deque[Tuple[int, _ChunkUpserter, bool, Optional[Future]]] = deque()
+    # Spawned workers import only pdf_extract, never the parent's Chroma client or SQLite pools.
+    with ProcessPoolExecutor(max_workers=worker_count, mp_context=multiprocessing.get_context("spawn")) as pool:
+
+        def _fill() -> None:
+            while len(pending) < max_pending:
+                item = next(windows, None)
+                if item is None:
+                    return
+                file_index, upserter, start, stop, last = item
+                future = pool.submit(extract_page_window, upserter.pdf_path, start, stop) if start >= 0 else None
+                pending.append((file_index, upserter, last, future))
+
+        _fill()
+        while pending:
+            file_index, upserter, last, future = pending.popleft()
+            if future is None:
+                result = upserter.finish(skipped=True)
+            else:
+                window = future.result()
+                _fill()
+                offset = upserter.chunks_seen
+                upserter.set_page_hashes(window.get("page_hashes") or {})
+                for record in window.get("records") or []:
+                    upserter.add({**record, "chunk": offset + int(record.get("chunk") or 0)})
+                if not last:
+                    continue
+                result = upserter.finish()
+            _fill()
+            _report_progress(progress, result, file_index=file_index, file_total=len(files))
+            results.append(result)
     return results
 
 
@@ -160,11 +452,29 @@ if __name__ == "__main__":
     parser.add_argument("path", nargs="?", help="PDF file path or folder containing PDFs")
     parser.add_argument("namespace", nargs="?", help="Target namespace/collection suffix")
     parser.add_argument("--folder", action="store_true", help="Treat path as folder and ingest all PDFs")
+    parser.add_argument("--workers", type=int, default=None, help="Extraction worker processes for --folder")
+    parser.add_argument("--batch-size", type=int, default=None, help="Chunks per vector store upsert")
     args = parser.parse_args()
 
+    def _print_progress(report: Dict[str, Any]) -> None:
+        print(
+            f"[{report['file_index']}/{report['file_total']}] {report['source_path']}: "
+            f"{report['pages_processed']} pages, {report['chunks_ingested']} chunks, "
+            f"{report['chunks_per_second']} chunks/s",
+            file=sys.stderr,
+        )
+
     if not args.path or not args.namespace:
         print("Usage: python -m grantflow.memory_bank.ingest <path> <namespace> [--folder]")
     elif args.folder:
-        print(ingest_folder_to_namespace(args.path, args.namespace))
+        print(
+            ingest_folder_to_namespace(
+                args.path,
+                args.namespace,
+                workers=args.workers,
+                batch_size=args.batch_size,
+                progress=_print_progress,
+            )
+        )
     else:
-        print(ingest_pdf_to_namespace(args.path, args.namespace))
+        print(ingest_pdf_to_namespace(args.path, args.namespace, batch_size=args.batch_size))
@@ -0,0 +1,124 @@
+# grantflow/memory_bank/pdf_extract.py
+# Lightweight extraction helpers: imported by ingest worker processes, so keep vector_store out of here.
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+def _open_pdf(pdf_path: str):
+    try:
+        import fitz  # pymupdf
+    except ImportError as exc:
+        raise ImportError("Установите pymupdf: pip install pymupdf") from exc
+    return fitz.open(pdf_path)
+
+
+def file_sha256(path: str) -> str:
+    """Считает SHA-256 содержимого файла потоково."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def text_sha256(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8", errors="ignore")).hexdigest()
+
+
+def pdf_page_count(pdf_path: str) -> int:
+    """Возвращает число страниц PDF без извлечения текста."""
+    doc = _open_pdf(pdf_path)
+    try:
+        return int(doc.page_count)
+    finally:
+        doc.close()
+
+
+def iter_pdf_pages(pdf_path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+    """Лениво отдаёт текст страниц PDF в диапазоне [start, stop)."""
+    doc = _open_pdf(pdf_path)
+    try:
+        end = doc.page_count if stop is None else min(int(stop), doc.page_count)
+        for index in range(max(0, int(start)), end):
+            yield doc.load_page(index).get_text() or ""
+    finally:
+        doc.close()
+
+
+def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
+    """Разбивает текст на чанки с перекрытием."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be > 0")
+    if overlap < 0:
+        raise ValueError("overlap must be >= 0")
+    if overlap >= chunk_size:
+        raise ValueError("overlap must be < chunk_size")
+
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + chunk_size
+        chunk = text[start:end]
+        chunks.append(chunk)
+        start = end - overlap
+    return chunks
+
+
+def iter_chunk_records(
+    pages: Iterable[str],
+    chunk_size: int = 1000,
+    overlap: int = 200,
+    *,
+    first_page: int = 1,
+    first_chunk: int = 0,
+) -> Iterator[Dict[str, Any]]:
+    """Постранично генерирует чанки с trace metadata, не держа весь документ в памяти."""
+    chunk_index = first_chunk
+    for page_number, page_text in enumerate(pages, start=first_page):
+        if not page_text:
+            continue
+        page_chunks = chunk_text(page_text, chunk_size=chunk_size, overlap=overlap)
+        for page_chunk_index, chunk in enumerate(page_chunks):
+            yield {
+                "text": chunk,
+                "chunk": chunk_index,
+                "page": page_number,
+                "page_start": page_number,
+                "page_end": page_number,
+                "page_chunk": page_chunk_index,
+            }
+            chunk_index += 1
+
+
+def chunk_pages(
+    pages: List[str],
+    chunk_size: int = 1000,
+    overlap: int = 200,
+) -> List[Dict[str, Any]]:
+    """Разбивает PDF-текст на чанки с trace metadata по страницам."""
+    return list(iter_chunk_records(pages, chunk_size=chunk_size, overlap=overlap))
+
+
+def extract_page_window(
+    pdf_path: str,
+    start: int,
+    stop: int,
+    chunk_size: int = 1000,
+    overlap: int = 200,
+) -> Dict[str, Any]:
+    """Извлекает и режет на чанки окно страниц [start, stop); выполняется в worker-процессе.
+
+    Индексы `chunk` считаются от нуля внутри окна; родительский процесс сдвигает их по файлу.
+    """
+    page_hashes: Dict[int, str] = {}
+
+    def _hashed() -> Iterator[str]:
+        for page_number, text in enumerate(iter_pdf_pages(pdf_path, start, stop), start=start + 1):
+            page_hashes[page_number] = text_sha256(text)
+            yield text
+
+    records = list(iter_chunk_records(_hashed(), chunk_size=chunk_size, overlap=overlap, first_page=start + 1))
+    return {"pages": len(page_hashes), "records": records, "page_hashes": page_hashes}
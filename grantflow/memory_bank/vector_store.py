@@ -3,8 +3,14 @@ from __future__ import annotations
 import hashlib
 import os
 import re
+import threading
 import unicodedata
-from typing import Any, Dict, Optional
+import uuid
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from grantflow.memory_bank.embeddings import EmbeddingService, create_embedding_service_from_env
 
 _CHROMADB_IMPORT_ERROR: Optional[str] = None
 _chromadb_value: Any
@@ -23,6 +29,184 @@ else:
 
 chromadb: Any = _chromadb_value
 
+# Collection metadata key holding a token that every write replaces; it versions the stored corpus.
+CORPUS_GENERATION_METADATA_KEY = "grantflow_corpus_generation"
+
+_WHERE_COMPARATORS = {
+    "$eq": lambda value, operand: value == operand,
+    "$ne": lambda value, operand: value != operand,
+    "$gt": lambda value, operand: value is not None and value > operand,
+    "$gte": lambda value, operand: value is not None and value >= operand,
+    "$lt": lambda value, operand: value is not None and value < operand,
+    "$lte": lambda value, operand: value is not None and value <= operand,
+    "$in": lambda value, operand: value in operand,
+    "$nin": lambda value, operand: value not in operand,
+}
+
+
+def metadata_matches_where(metadata: Optional[dict], where: Optional[dict]) -> bool:
+    """Evaluate a Chroma-style ``where`` filter against one metadata dict."""
+    if not where:
+        return True
+    meta = metadata if isinstance(metadata, dict) else {}
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(metadata_matches_where(meta, clause) for clause in condition or []):
+                return False
+            continue
+        if key == "$or":
+            if not any(metadata_matches_where(meta, clause) for clause in condition or []):
+                return False
+            continue
+        value = meta.get(key)
+        if isinstance(condition, dict):
+            for operator, operand in condition.items():
+                comparator = _WHERE_COMPARATORS.get(operator)
+                if comparator is None:
+                    raise ValueError(f"Unsupported where operator: {operator}")
+                try:
+                    if not comparator(value, operand):
+                        return False
+                except TypeError:
+                    return False
+        elif value != condition:
+            return False
+    return True
+
+
+class _MemoryVectorIndex:
+    """Per-namespace float32 embedding matrix with row-aligned ids, documents and metadata."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.rows: Dict[str, int] = {}
+        self.ids: list[str] = []
+        self.documents: list[str] = []
+        self.metadatas: list[Optional[dict]] = []
+        self._matrix: np.ndarray = np.zeros((0, 0), dtype=np.float32)
+        # Bumped by every write; the in-memory backend lives and dies with this process.
+        self.generation = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        return self._matrix[: len(self.ids)]
+
+    def _reserve(self, extra: int, dims: int) -> None:
+        size = len(self.ids)
+        if self._matrix.shape[1] != dims:
+            if size:
+                raise ValueError(f"Embedding dimension mismatch for {self.name}: {dims} != {self._matrix.shape[1]}")
+            self._matrix = np.zeros((0, dims), dtype=np.float32)
+        if size + extra <= self._matrix.shape[0]:
+            return
+        # Grow geometrically so bulk ingestion stays amortized O(n) in copies.
+        capacity = max(size + extra, self._matrix.shape[0] * 2, 64)
+        grown: np.ndarray = np.zeros((capacity, dims), dtype=np.float32)
+        grown[:size] = self._matrix[:size]
+        self._matrix = grown
+
+    def upsert(
+        self,
+        ids: list[str],
+        documents: list[str],
+        metadatas: Optional[list[dict]],
+        embeddings: np.ndarray,
+    ) -> None:
+        with self._lock:
+            self.generation += 1
+            self._reserve(len(ids), int(embeddings.shape[1]))
+            for i, doc_id in enumerate(ids):
+                metadata = metadatas[i] if metadatas and i < len(metadatas) else None
+                position = self.rows.get(doc_id)
+                if position is None:
+                    position = len(self.ids)
+                    self.rows[doc_id] = position
+                    self.ids.append(doc_id)
+                    self.documents.append(documents[i])
+                    self.metadatas.append(metadata)
+                else:
+                    self.documents[position] = documents[i]
+                    self.metadatas[position] = metadata
+                self._matrix[position] = embeddings[i]
+
+    def get(self, where: Optional[dict] = None, limit: Optional[int] = None) -> tuple[list[str], list[Optional[dict]]]:
+        with self._lock:
+            ids_out: list[str] = []
+            metas_out: list[Optional[dict]] = []
+            for position, meta in enumerate(self.metadatas):
+                if limit is not None and len(ids_out) >= limit:
+                    break
+                if metadata_matches_where(meta, where):
+                    ids_out.append(self.ids[position])
+                    metas_out.append(meta)
+            return ids_out, metas_out
+
+    def update_metadata(self, ids: Sequence[str], metadatas: Sequence[Optional[dict]]) -> None:
+        with self._lock:
+            self.generation += 1
+            for doc_id, metadata in zip(ids, metadatas):
+                position = self.rows.get(doc_id)
+                if position is not None:
+                    self.metadatas[position] = metadata
+
+    def delete(self, ids: list[str]) -> None:
+        with self._lock:
+            self.generation += 1
+            for doc_id in ids:
+                position = self.rows.pop(doc_id, None)
+                if position is None:
+                    continue
+                last = len(self.ids) - 1
+                if position != last:
+                    # Move the last row into the hole so the matrix stays contiguous.
+                    moved_id = self.ids[last]
+                    self.ids[position] = moved_id
+                    self.documents[position] = self.documents[last]
+                    self.metadatas[position] = self.metadatas[last]
+                    self._matrix[position] = self._matrix[last]
+                    self.rows[moved_id] = position
+                self.ids.pop()
+                self.documents.pop()
+                self.metadatas.pop()
+
+    def query(
+        self, query_embeddings: np.ndarray, n_results: int, where: Optional[dict] = None
+    ) -> tuple[list[list[str]], list[list[str]], list[list[Optional[dict]]]]:
+        with self._lock:
+            # Without a filter, score the live slice of the matrix in place; only a filter gathers (copies) rows.
+            candidates: Optional[np.ndarray] = None
+            rows = self.matrix
+            if where:
+                candidates = np.flatnonzero([metadata_matches_where(meta, where) for meta in self.metadatas])
+                rows = self._matrix[candidates]
+            ids_out: list[list[str]] = []
+            docs_out: list[list[str]] = []
+            metas_out: list[list[Optional[dict]]] = []
+            count = len(rows)
+            k = min(max(0, int(n_results)), count)
+            if k == 0:
+                empty: list[list[str]] = [[] for _ in range(len(query_embeddings))]
+                return empty, [[] for _ in empty], [[] for _ in empty]
+            # One matmul scores every query variant against every candidate row.
+            scores = query_embeddings @ rows.T
+            for row_scores in scores:
+                if k < count:
+                    kth = np.argpartition(-row_scores, k - 1)[:k]
+                    selected = np.flatnonzero(row_scores >= row_scores[kth].min())
+                else:
+                    selected = np.arange(count)
+                # Ties keep insertion order, matching the previous stable sort.
+                top = selected[np.lexsort((selected, -row_scores[selected]))][:k]
+                positions = top if candidates is None else candidates[top]
+                ids_out.append([self.ids[position] for position in positions])
+                docs_out.append([self.documents[position] for position in positions])
+                metas_out.append([self.metadatas[position] for position in positions])
+            return ids_out, docs_out, metas_out
+
 
 class VectorStore:
     """Thin stable wrapper over Chroma collections with namespace isolation."""
@@ -32,8 +216,9 @@ class VectorStore:
     def __init__(self) -> None:
         self.prefix = os.getenv("CHROMA_COLLECTION_PREFIX", "grantflow")
         self._collections: Dict[str, Any] = {}
-        self._memory_store: Dict[str, Dict[str, Any]] = {}
+        self._memory_store: Dict[str, _MemoryVectorIndex] = {}
         self._client_init_error: Optional[str] = None
+        self.embedding_service: EmbeddingService = create_embedding_service_from_env()
         forced_memory_backend = str(os.getenv("GRANTFLOW_FORCE_INMEM_VECTOR_STORE", "")).strip().lower()
         self._force_inmem = forced_memory_backend in {"1", "true", "yes", "on"}
 
@@ -96,7 +281,8 @@ class VectorStore:
 
     def _collection_name(self, namespace: str) -> str:
         ns = self.normalize_namespace(namespace)
-        return f"{self.prefix}_{ns}"
+        suffix = self.embedding_service.collection_suffix
+        return f"{self.prefix}_{ns}_{suffix}" if suffix else f"{self.prefix}_{ns}"
 
     def namespace_trace(self, namespace: str) -> Dict[str, str]:
         requested = str(namespace or "").strip() or "default"
@@ -107,25 +293,44 @@ class VectorStore:
             "collection": self._collection_name(requested),
         }
 
-    def _embed_texts(self, texts: list[str], dims: int = 16) -> list[list[float]]:
-        """Deterministic lightweight embeddings for local/offline MVP smoke tests."""
-        embeddings: list[list[float]] = []
-        for text in texts:
-            vec = [0.0] * dims
-            data = (text or "").encode("utf-8", errors="ignore")
-            digest = hashlib.sha256(data).digest()
-            for i in range(dims):
-                vec[i] = digest[i] / 255.0
-            embeddings.append(vec)
-        return embeddings
-
-    def _cosine_like(self, a: list[float], b: list[float]) -> float:
-        return sum(x * y for x, y in zip(a, b))
-
-    def _ensure_memory_namespace(self, namespace: str) -> Dict[str, Any]:
+    def _stamp_corpus_generation(self, collection: Any) -> None:
+        """Record a fresh generation token in the Chroma collection metadata after a write."""
+        current = collection.metadata if isinstance(collection.metadata, dict) else {}
+        # Index settings are fixed at creation and may not be passed back to modify().
+        metadata = {key: value for key, value in current.items() if not str(key).startswith("hnsw:")}
+        metadata[CORPUS_GENERATION_METADATA_KEY] = uuid.uuid4().hex
+        collection.modify(metadata=metadata)
+
+    def corpus_version(self, namespace: str) -> Optional[str]:
+        """Cheap corpus fingerprint for stage caches, read from the stored collection.
+
+        With Chroma it is the generation token every write stamps into the collection metadata (plus the row
+        count for collections written before tokens existed), so writes from other processes sharing the
+        store change it too. The in-memory backend is process-local and versions by its own write counter.
+        """
+        name = self._collection_name(namespace)
+        try:
+            if self.client is None:
+                index = self._memory_store.get(name)
+                if index is None:
+                    return f"{name}:0:0"
+                return f"{name}:{index.generation}:{len(index)}"
+            # A fresh handle, since cached collection objects keep the metadata they were loaded with.
+            collection = self.client.get_or_create_collection(name=name)
+            metadata = collection.metadata if isinstance(collection.metadata, dict) else {}
+            generation = str(metadata.get(CORPUS_GENERATION_METADATA_KEY) or "-")
+            return f"{name}:{generation}:{int(collection.count())}"
+        except Exception:
+            return None
+
+    def _embed_texts(self, texts: list[str]) -> np.ndarray:
+        """Embed through the configured provider; batched and served from the embedding cache."""
+        return self.embedding_service.embed(texts)
+
+    def _ensure_memory_namespace(self, namespace: str) -> _MemoryVectorIndex:
         name = self._collection_name(namespace)
         if name not in self._memory_store:
-            self._memory_store[name] = {"name": name, "rows": {}}
+            self._memory_store[name] = _MemoryVectorIndex(name)
         return self._memory_store[name]
 
     def get_collection(self, namespace: str):
@@ -146,26 +351,20 @@ class VectorStore:
         embeddings = self._embed_texts(documents)
 
         if self.client is None:
-            ns = self._ensure_memory_namespace(namespace)
-            rows = ns["rows"]
-            for i, doc_id in enumerate(ids):
-                rows[doc_id] = {
-                    "id": doc_id,
-                    "document": documents[i],
-                    "metadata": (metadatas[i] if metadatas and i < len(metadatas) else None),
-                    "embedding": embeddings[i],
-                }
+            index = self._ensure_memory_namespace(namespace)
+            index.upsert(ids, documents, metadatas, embeddings)
             return
 
         col = self.get_collection(namespace)
         kwargs: Dict[str, Any] = {
             "ids": ids,
             "documents": documents,
-            "embeddings": embeddings,
+            "embeddings": embeddings.tolist(),
         }
         if metadatas is not None:
             kwargs["metadatas"] = metadatas
         col.upsert(**kwargs)
+        self._stamp_corpus_generation(col)
 
     def query(
         self,
@@ -185,21 +384,8 @@ class VectorStore:
             query_list = [str(item or "") for item in query_texts]
 
         if self.client is None:
-            ns = self._ensure_memory_namespace(namespace)
-            rows = list(ns["rows"].values())
-            docs_out = []
-            metas_out = []
-            ids_out = []
-            for q in query_list:
-                q_emb = self._embed_texts([q])[0]
-                ranked = sorted(
-                    rows,
-                    key=lambda r: self._cosine_like(q_emb, r["embedding"]),
-                    reverse=True,
-                )[:n_results]
-                docs_out.append([r["document"] for r in ranked])
-                metas_out.append([r["metadata"] for r in ranked])
-                ids_out.append([r["id"] for r in ranked])
+            index = self._ensure_memory_namespace(namespace)
+            ids_out, docs_out, metas_out = index.query(self._embed_texts(query_list), n_results, where=where)
             result = {"ids": ids_out, "documents": docs_out, "metadatas": metas_out}
             if single_query:
                 return docs_out[0]
@@ -207,7 +393,7 @@ class VectorStore:
 
         col = self.get_collection(namespace)
         kwargs: Dict[str, Any] = {
-            "query_embeddings": self._embed_texts(query_list),
+            "query_embeddings": self._embed_texts(query_list).tolist(),
             "n_results": n_results,
         }
         if where is not None:
@@ -218,19 +404,54 @@ class VectorStore:
             return (result.get("documents") or [[]])[0]
         return result
 
+    def get(self, namespace: str, where: Optional[dict] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Return ids and metadatas matching a ``where`` filter, without documents or embeddings."""
+        if self.client is None:
+            ids, metadatas = self._ensure_memory_namespace(namespace).get(where=where, limit=limit)
+            return {"ids": ids, "metadatas": metadatas}
+
+        kwargs: Dict[str, Any] = {"include": ["metadatas"]}
+        if where is not None:
+            kwargs["where"] = where
+        if limit is not None:
+            kwargs["limit"] = limit
+        result = self.get_collection(namespace).get(**kwargs)
+        return {"ids": list(result.get("ids") or []), "metadatas": list(result.get("metadatas") or [])}
+
+    def update_metadata(self, namespace: str, ids: list[str], metadatas: list[dict]) -> None:
+        if not ids:
+            return
+        if self.client is None:
+            self._ensure_memory_namespace(namespace).update_metadata(ids, metadatas)
+            return
+        col = self.get_collection(namespace)
+        col.update(ids=ids, metadatas=metadatas)
+        self._stamp_corpus_generation(col)
+
+    def delete(self, namespace: str, ids: list[str]) -> None:
+        if not ids:
+            return
+        if self.client is None:
+            self._ensure_memory_namespace(namespace).delete(ids)
+            return
+        col = self.get_collection(namespace)
+        col.delete(ids=ids)
+        self._stamp_corpus_generation(col)
+
     def get_stats(self, namespace: str) -> dict:
         trace = self.namespace_trace(namespace)
         if self.client is None:
-            ns = self._ensure_memory_namespace(namespace)
-            count = len(ns["rows"])
+            index = self._ensure_memory_namespace(namespace)
+            count = len(index)
             return {
                 "namespace": trace["namespace"],
                 "namespace_normalized": trace["namespace_normalized"],
-                "collection": ns["name"],
+                "collection": index.name,
                 "count": count,
                 "document_count": count,
                 "backend": "memory",
                 "client_init_error": self._client_init_error,
+                "embedding": self.embedding_service.describe(),
             }
 
         col = self.get_collection(namespace)
@@ -242,6 +463,7 @@ class VectorStore:
             "count": count,
             "document_count": count,
             "backend": "chroma",
+            "embedding": self.embedding_service.describe(),
         }
 
 
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+class NodeFanoutExecutor:
+    """Shared thread pool for independent I/O-bound work inside a single graph node.
+
+    Nodes submit work such as an LLM call and keep running their deterministic steps on the calling thread,
+    then join on the future. Submissions made from a pool thread, or while fan-out is disabled, run inline so
+    nested fan-out cannot deadlock the pool and results are identical in both modes.
+    """
+
+    def __init__(self, *, max_workers: int = 4, enabled: bool = True) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.enabled = bool(enabled)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.submitted_count = 0
+        self.inline_count = 0
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="grantflow-node-fanout",
+                )
+            return self._executor
+
+    def _run_marked(self, fn: Callable[..., T], args: tuple, kwargs: Dict[str, Any]) -> T:
+        self._local.in_pool = True
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._local.in_pool = False
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        if not self.enabled or getattr(self._local, "in_pool", False):
+            self.inline_count += 1
+            future: "Future[T]" = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+            return future
+        self.submitted_count += 1
+        return self._ensure_executor().submit(self._run_marked, fn, args, kwargs)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "max_workers": self.max_workers,
+            "submitted_count": self.submitted_count,
+            "inline_count": self.inline_count,
+        }
+
+
+def create_node_fanout_executor_from_env() -> NodeFanoutExecutor:
+    mode = str(os.getenv("GRANTFLOW_NODE_FANOUT", "on") or "on").strip().lower()
+    return NodeFanoutExecutor(
+        max_workers=_env_int("GRANTFLOW_NODE_FANOUT_WORKERS", 4),
+        enabled=mode not in {"0", "off", "false", "no"},
+    )
+
+
+node_fanout_executor = create_node_fanout_executor_from_env()
@@ -38,6 +38,23 @@ class FindingEntity(TypedDict, total=False):
     time_to_due_hours: Optional[float]
 
 
+class CanonicalFindings(list):
+    """Findings as written by `write_state_critic_findings`, tagged with the draft-version map they were bound to.
+
+    `normalize_state_contract` skips re-canonicalizing a state whose findings are still this exact list, unchanged
+    in length and bound to the state's current latest versions. JSON storage drops the tag, so restored states are
+    canonicalized once and tagged again.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), *, version_map: Optional[Dict[str, str]] = None) -> None:
+        super().__init__(items)
+        self.version_map: Dict[str, str] = dict(version_map or {})
+        self.size = len(self)
+
+    def is_current(self, state: Mapping[str, Any]) -> bool:
+        return len(self) == self.size and self.version_map == latest_version_id_by_section(state)
+
+
 def finding_primary_id(item: Mapping[str, Any]) -> str:
     return str(item.get("finding_id") or item.get("id") or "").strip()
 
@@ -246,13 +263,14 @@ def canonicalize_findings(
     previous_items: Optional[Iterable[Any]] = None,
     default_source: str = "rules",
     dedupe: bool = True,
+    section_versions: Optional[Dict[str, str]] = None,
 ) -> list[FindingEntity]:
     normalized = normalize_findings(
         items,
         previous_items=previous_items,
         default_source=default_source,
     )
-    bound = bind_findings_to_latest_versions(normalized, state=state)
+    bound = bind_findings_to_latest_versions(normalized, state=state, section_versions=section_versions)
     if not dedupe:
         return bound
     deduped: list[FindingEntity] = []
@@ -322,19 +340,22 @@ def write_state_critic_findings(
     previous_items: Optional[Iterable[Any]] = None,
     default_source: str = "rules",
 ) -> list[FindingEntity]:
+    section_versions = latest_version_id_by_section(state)
     canonical = canonicalize_findings(
         findings,
         state=state,
         previous_items=previous_items,
         default_source=default_source,
         dedupe=True,
+        section_versions=section_versions,
     )
+    tagged = CanonicalFindings(canonical, version_map=section_versions)
     notes = state.get("critic_notes")
     notes_dict = dict(notes) if isinstance(notes, dict) else {}
-    notes_dict["fatal_flaws"] = canonical
+    notes_dict["fatal_flaws"] = tagged
     state["critic_notes"] = notes_dict
-    state["critic_fatal_flaws"] = canonical
-    return canonical
+    state["critic_fatal_flaws"] = tagged
+    return tagged
 
 
 def latest_version_id_by_section(state: Optional[Mapping[str, Any]]) -> Dict[str, str]:
@@ -359,8 +380,10 @@ def bind_findings_to_latest_versions(
     findings: Iterable[Any],
     *,
     state: Optional[Mapping[str, Any]] = None,
+    section_versions: Optional[Dict[str, str]] = None,
 ) -> list[FindingEntity]:
-    section_versions = latest_version_id_by_section(state)
+    if section_versions is None:
+        section_versions = latest_version_id_by_section(state)
     out: list[FindingEntity] = []
     for finding in findings:
         if not isinstance(finding, dict):
@@ -13,8 +13,8 @@ from grantflow.core.stores import (
     _env,
     default_sqlite_path,
     ensure_sqlite_component_schema,
-    open_sqlite_connection,
     prepare_state_for_storage,
+    sqlite_connection_pool,
     storage_json_dumps,
     storage_json_loads,
     storage_mode,
@@ -45,13 +45,11 @@ class HITLCheckpoint:
         self._lock = threading.Lock()
         self._sqlite_path = default_sqlite_path()
         if self._use_sqlite:
+            self._pool = sqlite_connection_pool(self._sqlite_path)
             self._init_sqlite()
 
-    def _connect(self) -> sqlite3.Connection:
-        return open_sqlite_connection(self._sqlite_path)
-
     def _init_sqlite(self) -> None:
-        with self._connect() as conn:
+        with self._pool.writer() as conn:
             ensure_sqlite_component_schema(conn, self.SCHEMA_COMPONENT, self.SCHEMA_VERSION)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS hitl_checkpoints (
@@ -85,15 +83,14 @@ class HITLCheckpoint:
         checkpoint_id = str(uuid.uuid4())
         if self._use_sqlite:
             snapshot_json = storage_json_dumps(prepare_state_for_storage(state))
-            with self._lock:
-                with self._connect() as conn:
-                    conn.execute(
-                        """
-                        INSERT INTO hitl_checkpoints (id, stage, status, donor_id, feedback, state_snapshot_json, updated_at)
-                        VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                        """,
-                        (checkpoint_id, stage, HITLStatus.PENDING.value, donor_id, None, snapshot_json),
-                    )
+            with self._pool.writer() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO hitl_checkpoints (id, stage, status, donor_id, feedback, state_snapshot_json, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    """,
+                    (checkpoint_id, stage, HITLStatus.PENDING.value, donor_id, None, snapshot_json),
+                )
             return checkpoint_id
 
         with self._lock:
@@ -109,7 +106,7 @@ class HITLCheckpoint:
 
     def get_checkpoint(self, checkpoint_id: str) -> Optional[Dict[str, Any]]:
         if self._use_sqlite:
-            with self._connect() as conn:
+            with self._pool.reader() as conn:
                 row = conn.execute("SELECT * FROM hitl_checkpoints WHERE id = ?", (checkpoint_id,)).fetchone()
             return self._row_to_checkpoint(row) if row is not None else None
 
@@ -125,23 +122,22 @@ class HITLCheckpoint:
     def _transition(self, checkpoint_id: str, *, next_status: HITLStatus, feedback: Optional[str]) -> bool:
         allowed_current = {HITLStatus.PENDING.value, next_status.value}
         if self._use_sqlite:
-            with self._lock:
-                with self._connect() as conn:
-                    cur = conn.execute(
-                        """
-                        UPDATE hitl_checkpoints
-                        SET status = ?, feedback = ?, updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ? AND status IN (?, ?)
-                        """,
-                        (
-                            next_status.value,
-                            feedback,
-                            checkpoint_id,
-                            HITLStatus.PENDING.value,
-                            next_status.value,
-                        ),
-                    )
-                    return cur.rowcount > 0
+            with self._pool.writer() as conn:
+                cur = conn.execute(
+                    """
+                    UPDATE hitl_checkpoints
+                    SET status = ?, feedback = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ? AND status IN (?, ?)
+                    """,
+                    (
+                        next_status.value,
+                        feedback,
+                        checkpoint_id,
+                        HITLStatus.PENDING.value,
+                        next_status.value,
+                    ),
+                )
+                return cur.rowcount > 0
 
         with self._lock:
             checkpoint = self._checkpoints.get(checkpoint_id)
@@ -165,7 +161,7 @@ class HITLCheckpoint:
 
     def is_approved(self, checkpoint_id: str) -> bool:
         if self._use_sqlite:
-            with self._connect() as conn:
+            with self._pool.reader() as conn:
                 row = conn.execute("SELECT status FROM hitl_checkpoints WHERE id = ?", (checkpoint_id,)).fetchone()
             return row is not None and row["status"] == HITLStatus.APPROVED.value
 
@@ -181,7 +177,7 @@ class HITLCheckpoint:
                 query += " AND donor_id = ?"
                 params.append(donor_id)
             query += " ORDER BY updated_at DESC"
-            with self._connect() as conn:
+            with self._pool.reader() as conn:
                 rows = conn.execute(query, tuple(params)).fetchall()
             return [self._row_to_checkpoint(row) for row in rows]
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any, Dict
 
 from grantflow.swarm.citations import append_citations
-from grantflow.swarm.nodes.architect_generation import generate_toc_under_contract
+from grantflow.swarm.nodes.architect_generation import generate_toc_with_stage_cache
 from grantflow.swarm.nodes.architect_retrieval import retrieve_architect_evidence
 from grantflow.swarm.state_contract import (
     normalize_state_contract,
@@ -40,7 +40,7 @@ def draft_toc(state: Dict[str, Any]) -> Dict[str, Any]:
     retrieval_summary, retrieval_hits = retrieve_architect_evidence(state, namespace)
 
     try:
-        toc, validation, generation_meta, claim_citations = generate_toc_under_contract(
+        toc, validation, generation_meta, claim_citations = generate_toc_with_stage_cache(
             state=state,
             strategy=strategy,
             evidence_hits=retrieval_hits,
@@ -90,14 +90,18 @@ def draft_toc(state: Dict[str, Any]) -> Dict[str, Any]:
     state["toc_validation"] = validation
     state["architect_retrieval"] = retrieval_summary
     state["toc_generation_meta"] = generation_meta
+    # Stage-cache provenance describes how the draft was obtained, not its content; keep it out of the
+    # snapshot so a reused draft does not register as a new draft version.
+    snapshot_meta = {k: v for k, v in generation_meta.items() if k != "stage_cache"}
+    snapshot_retrieval = {k: v for k, v in retrieval_summary.items() if k != "stage_cache"}
     state["toc_draft"] = {
         "toc": toc,
         "proposal_mode": input_context.get("proposal_mode"),
         "rfq_profile": input_context.get("rfq_profile"),
         "citation": f"Based on {namespace}",
-        "generation_meta": generation_meta,
+        "generation_meta": snapshot_meta,
         "validation": validation,
-        "architect_retrieval": retrieval_summary,
+        "architect_retrieval": snapshot_retrieval,
     }
     append_draft_version(
         state,
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import re
 import types
+from functools import lru_cache
 from typing import Any, Dict, Iterable, Optional, Tuple, Type, Union, get_args, get_origin
 
 from pydantic import BaseModel
@@ -29,6 +30,7 @@ from grantflow.swarm.nodes.architect_policy import (
     sanitize_validation_error_hint,
 )
 from grantflow.swarm.nodes.architect_retrieval import pick_best_architect_evidence_hit
+from grantflow.swarm.stage_cache import stage_cache_key, stage_result_cache
 from grantflow.swarm.state_contract import (
     normalize_state_contract,
     state_donor_id,
@@ -247,6 +249,7 @@ def _field_required(field: Any) -> bool:
     return False
 
 
+@lru_cache(maxsize=None)
 def _schema_contract_hint(schema_cls: Type[BaseModel], *, max_fields: int = 24) -> str:
     fields = getattr(schema_cls, "model_fields", None)
     if not isinstance(fields, dict):  # pydantic v1 fallback
@@ -266,6 +269,7 @@ def _schema_contract_hint(schema_cls: Type[BaseModel], *, max_fields: int = 24)
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=None)
 def _schema_json_contract_hint(schema_cls: Type[BaseModel], *, max_chars: int = 2600) -> str:
     schema_builder = getattr(schema_cls, "model_json_schema", None)
     if not callable(schema_builder):
@@ -279,6 +283,12 @@ def _schema_json_contract_hint(schema_cls: Type[BaseModel], *, max_chars: int =
     return _safe_json(payload, max_chars=max_chars)
 
 
+def warm_toc_contract_hints(contracts: Any) -> None:
+    """Donor registry warmer: precompute the ToC schema prompt hints for one donor."""
+    _schema_contract_hint(contracts.toc_schema)
+    _schema_json_contract_hint(contracts.toc_schema)
+
+
 def _text_for_field(
     *,
     field_name: str,
@@ -1628,3 +1638,41 @@ def generate_toc_under_contract(
         generation_meta["llm_quality_issue_count"] = llm_quality_issue_count
         generation_meta["llm_quality_issue_sample"] = llm_quality_issue_sample
     return toc_payload, validation, generation_meta, claim_citations
+
+
+def generate_toc_with_stage_cache(
+    *,
+    state: Dict[str, Any],
+    strategy: Any,
+    evidence_hits: Iterable[Dict[str, Any]],
+) -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], list[Dict[str, Any]]]:
+    """Deterministic drafts are pure in their inputs, so preflight and the pipeline run share one draft."""
+    normalize_state_contract(state)
+    evidence_hits = [h for h in evidence_hits if isinstance(h, dict)]
+    if state_llm_mode(state, default=False):
+        return generate_toc_under_contract(state=state, strategy=strategy, evidence_hits=evidence_hits)
+
+    input_context = state_input_context(state)
+    schema_cls = evaluation_rfq_schema() if is_evaluation_rfq_mode(input_context) else strategy.get_toc_schema()
+    cache_key = stage_cache_key(
+        "architect_toc",
+        donor_id=state_donor_id(state, default=str(getattr(strategy, "donor_id", "donor"))),
+        strategy=type(strategy).__name__,
+        schema=getattr(schema_cls, "__name__", "TOCSchema"),
+        namespace=state_rag_namespace(state, default=strategy.get_rag_collection()),
+        architect_rag_enabled=bool(state.get("architect_rag_enabled", True)),
+        input_context=input_context,
+        revision_hint=state_revision_hint(state),
+        evidence_hits=evidence_hits,
+    )
+    cached = stage_result_cache.get(cache_key)
+    if cached is not None:
+        (toc_payload, validation, generation_meta, claim_citations), source = cached
+        generation_meta["stage_cache"] = {"status": "hit", "key": cache_key[:16], "source": source}
+        return toc_payload, validation, generation_meta, claim_citations
+
+    result = generate_toc_under_contract(state=state, strategy=strategy, evidence_hits=evidence_hits)
+    source = str(state.get("stage_cache_source") or "pipeline")
+    stage_result_cache.put(cache_key, result, source=source)
+    result[2]["stage_cache"] = {"status": "miss", "key": cache_key[:16], "source": source}
+    return result
@@ -8,6 +8,7 @@ from grantflow.memory_bank.vector_store import vector_store
 from grantflow.swarm.citations import citation_traceability_status
 from grantflow.swarm.citation_source import citation_label_from_metadata, citation_source_from_metadata
 from grantflow.swarm.retrieval_query import build_stage_query_text, donor_query_preset_list
+from grantflow.swarm.stage_cache import stage_cache_key, stage_result_cache
 from grantflow.swarm.state_contract import state_donor_id, state_input_context, state_revision_hint
 
 _TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
@@ -304,7 +305,8 @@ def _distance_confidence(raw_distance: Any, *, rank_index: int, row_distances: l
     return round(max(0.0, min(1.0, confidence)), 4)
 
 
-def retrieve_architect_evidence(state: Dict[str, Any], namespace: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+def _architect_retrieval_plan(state: Dict[str, Any], namespace: str) -> Dict[str, Any]:
+    """Resolve query variants, limits, summary skeleton and stage-cache key for one architect retrieval."""
     enabled = bool(state.get("architect_rag_enabled", True))
     top_k = _bounded_int(
         getattr(config.rag, "architect_top_k", getattr(config.rag, "default_top_k", 5)),
@@ -351,164 +353,302 @@ def retrieve_architect_evidence(state: Dict[str, Any], namespace: str) -> Tuple[
         "candidate_hits_count": 0,
         "used_results": 0,
     }
+    plan: Dict[str, Any] = {
+        "enabled": enabled,
+        "namespace": namespace,
+        "namespace_normalized": namespace_normalized,
+        "collection": collection,
+        "donor_id": state_donor_id(state, default=""),
+        "query_text": query_text,
+        "query_variants": query_variants,
+        "top_k": top_k,
+        "rerank_pool_size": rerank_pool_size,
+        "min_hit_confidence": min_hit_confidence,
+        "summary": summary,
+        "cache_key": None,
+        "source": str(state.get("stage_cache_source") or "pipeline"),
+    }
     if not enabled:
-        return summary, []
+        return plan
+    corpus_version = vector_store.corpus_version(namespace)
+    if corpus_version is not None:
+        plan["cache_key"] = stage_cache_key(
+            "architect_retrieval",
+            namespace=namespace,
+            collection=collection,
+            corpus_version=corpus_version,
+            donor_id=plan["donor_id"],
+            query=query_text,
+            query_variants=query_variants,
+            input_context=state_input_context(state),
+            top_k=top_k,
+            rerank_pool_size=rerank_pool_size,
+            min_hit_confidence=round(min_hit_confidence, 3),
+        )
+    return plan
 
-    hits: List[Dict[str, Any]] = []
+
+def _cached_architect_evidence(plan: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]] | None:
+    cache_key = plan.get("cache_key")
+    if cache_key is None:
+        return None
+    cached = stage_result_cache.get(cache_key)
+    if cached is None:
+        return None
+    (cached_summary, cached_hits), source = cached
+    cached_summary["stage_cache"] = {"status": "hit", "key": cache_key[:16], "source": source}
+    return cached_summary, cached_hits
+
+
+def _store_architect_evidence(plan: Dict[str, Any], summary: Dict[str, Any], hits: List[Dict[str, Any]]) -> None:
+    cache_key = plan.get("cache_key")
+    if cache_key is None or "error" in summary:
+        return
+    source = str(plan.get("source") or "pipeline")
+    stage_result_cache.put(cache_key, (summary, hits), source=source)
+    summary["stage_cache"] = {"status": "miss", "key": cache_key[:16], "source": source}
+
+
+def retrieve_architect_evidence(state: Dict[str, Any], namespace: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    plan = _architect_retrieval_plan(state, namespace)
+    if not plan["enabled"]:
+        return plan["summary"], []
+    cached = _cached_architect_evidence(plan)
+    if cached is not None:
+        return cached
     try:
-        donor_id = state_donor_id(state, default="")
-        result = vector_store.query(namespace=namespace, query_texts=query_variants, n_results=rerank_pool_size)
-        result_payload = result if isinstance(result, dict) else {}
-        docs_rows = _rows((result_payload or {}).get("documents"))
-        metas_rows = _rows((result_payload or {}).get("metadatas"))
-        ids_rows = _rows((result_payload or {}).get("ids"))
-        distances_rows = _rows((result_payload or {}).get("distances"))
-
-        best_by_signature: dict[tuple[Any, ...], Dict[str, Any]] = {}
-        for q_idx, query_variant in enumerate(query_variants):
-            docs = docs_rows[q_idx] if q_idx < len(docs_rows) else []
-            metas = metas_rows[q_idx] if q_idx < len(metas_rows) else []
-            ids = ids_rows[q_idx] if q_idx < len(ids_rows) else []
-            distances = distances_rows[q_idx] if q_idx < len(distances_rows) else []
-            for idx, doc in enumerate(docs):
-                meta = metas[idx] if idx < len(metas) and isinstance(metas[idx], dict) else {}
-                source = citation_source_from_metadata(meta)
-                retrieval_rank = idx + 1
-                raw_doc_id = meta.get("doc_id") or meta.get("chunk_id") or (ids[idx] if idx < len(ids) else None)
-                raw_chunk_id = meta.get("chunk_id") or raw_doc_id
-                doc_id = str(raw_doc_id or "").strip()
-                chunk_id = str(raw_chunk_id or "").strip()
-                if not doc_id and chunk_id:
-                    doc_id = chunk_id
-                if not chunk_id and doc_id:
-                    chunk_id = doc_id
-                if not doc_id:
-                    doc_id = f"{namespace_normalized}#q{q_idx + 1}-hit-{retrieval_rank}"
-                if not chunk_id:
-                    chunk_id = doc_id
-
-                source = str(source or "").strip() or None
-                page = meta.get("page")
-                raw_distance = distances[idx] if idx < len(distances) else None
-                parsed_distance = _as_float(raw_distance)
-                retrieval_distance = round(parsed_distance, 6) if parsed_distance is not None else None
-                retrieval_confidence = _distance_confidence(raw_distance, rank_index=idx, row_distances=distances)
-
-                candidate: Dict[str, Any] = {
-                    "rank": retrieval_rank,
-                    "retrieval_rank": retrieval_rank,
-                    "query_variant_index": q_idx + 1,
-                    "query_variant": query_variant,
-                    "doc_id": doc_id,
-                    "chunk_id": chunk_id,
-                    "source": source,
-                    "page": page,
-                    "page_start": meta.get("page_start"),
-                    "page_end": meta.get("page_end"),
-                    "chunk": meta.get("chunk"),
-                    "label": citation_label_from_metadata(meta, namespace=namespace, rank=retrieval_rank),
-                    "excerpt": str(doc)[:320],
-                    "retrieval_confidence": retrieval_confidence,
-                    "retrieval_distance": retrieval_distance,
-                    "namespace": namespace,
-                    "namespace_normalized": namespace_normalized,
-                    "collection": collection,
-                }
-                traceability_status = citation_traceability_status(candidate)
-                candidate["traceability_status"] = traceability_status
-                candidate["traceability_complete"] = traceability_status == "complete"
-                query_tokens = _tokenize(query_variant)
-                hit_tokens = _tokenize(candidate.get("excerpt")) | _tokenize(
-                    candidate.get("label") or candidate.get("source")
-                )
-                query_overlap = len(query_tokens & hit_tokens) / max(1, len(query_tokens))
-                base_score = score_architect_evidence_hit(
-                    query_text,
-                    candidate,
-                    donor_id=donor_id,
-                    statement_path="toc",
-                )
-                rerank_score = round(max(0.0, min(1.0, (base_score * 0.75) + (query_overlap * 0.25))), 4)
-                candidate["rerank_score"] = rerank_score
-
-                signature = (doc_id, chunk_id, source, page)
-                current = best_by_signature.get(signature)
-                if current is None:
-                    best_by_signature[signature] = candidate
-                    continue
-                current_key = (
-                    float(current.get("rerank_score") or 0.0),
-                    float(current.get("retrieval_confidence") or 0.0),
-                    -int(current.get("retrieval_rank") or 999),
-                )
-                candidate_key = (
-                    float(candidate.get("rerank_score") or 0.0),
-                    float(candidate.get("retrieval_confidence") or 0.0),
-                    -int(candidate.get("retrieval_rank") or 999),
-                )
-                if candidate_key > current_key:
-                    best_by_signature[signature] = candidate
-
-        ranked_candidates = sorted(
-            best_by_signature.values(),
-            key=lambda hit: (
-                float(hit.get("rerank_score") or 0.0),
-                float(hit.get("retrieval_confidence") or 0.0),
-                -int(hit.get("retrieval_rank") or 999),
-                -int(hit.get("query_variant_index") or 999),
-            ),
-            reverse=True,
+        result = vector_store.query(
+            namespace=namespace, query_texts=plan["query_variants"], n_results=plan["rerank_pool_size"]
         )
-        summary["candidate_hits_count"] = len(ranked_candidates)
-
-        filtered = [
-            hit
-            for hit in ranked_candidates
-            if float(hit.get("retrieval_confidence") or 0.0) >= min_hit_confidence
-            or float(hit.get("rerank_score") or 0.0) >= min_hit_confidence
-        ]
-        if not filtered and ranked_candidates:
-            filtered = ranked_candidates[:1]
-        summary["filtered_out_low_confidence"] = max(0, len(ranked_candidates) - len(filtered))
-        hits = filtered[:top_k]
-
-        traceability_counts = {"complete": 0, "partial": 0, "missing": 0}
-        for idx, hit in enumerate(hits):
-            hit["rank"] = idx + 1
-            traceability_status = citation_traceability_status(hit)
-            hit["traceability_status"] = traceability_status
-            hit["traceability_complete"] = traceability_status == "complete"
-            traceability_counts[traceability_status] = int(traceability_counts.get(traceability_status, 0)) + 1
-
-        summary["hits_count"] = len(hits)
-        summary["used_results"] = len(hits)
-        summary["traceability_counts"] = traceability_counts
-        if hits:
-            summary["hit_labels"] = [str(h.get("label") or "") for h in hits[:3]]
-            summary["avg_retrieval_confidence"] = round(
-                sum(float(h.get("retrieval_confidence") or 0.0) for h in hits) / len(hits),
-                4,
-            )
-            summary["avg_rerank_score"] = round(sum(float(h.get("rerank_score") or 0.0) for h in hits) / len(hits), 4)
-            summary["hits"] = [
-                {
-                    "retrieval_rank": int(h.get("retrieval_rank") or 0),
-                    "query_variant_index": int(h.get("query_variant_index") or 0),
-                    "doc_id": h.get("doc_id"),
-                    "source": h.get("source"),
-                    "page": h.get("page"),
-                    "chunk_id": h.get("chunk_id"),
-                    "retrieval_confidence": h.get("retrieval_confidence"),
-                    "retrieval_distance": h.get("retrieval_distance"),
-                    "rerank_score": h.get("rerank_score"),
-                    "traceability_status": h.get("traceability_status"),
-                    "traceability_complete": h.get("traceability_complete"),
-                    "namespace": h.get("namespace"),
-                    "namespace_normalized": h.get("namespace_normalized"),
-                    "collection": h.get("collection"),
-                }
-                for h in hits[:5]
-            ]
+        summary, hits = _rank_architect_hits(plan, result if isinstance(result, dict) else {})
     except Exception as exc:
+        summary, hits = plan["summary"], []
         summary["error"] = str(exc)
+    _store_architect_evidence(plan, summary, hits)
+    return summary, hits
+
+
+def prefetch_architect_evidence(requests: List[Tuple[Dict[str, Any], str]]) -> Dict[str, Any]:
+    """Warm the stage cache for many architect retrievals with one multi-query call per namespace.
+
+    Each (state, namespace) pair is planned exactly as `retrieve_architect_evidence` would plan it, so the
+    later preflight and pipeline calls for the same inputs are cache hits. Query variants shared by several
+    requests are sent once. Returns counters describing the warm-up.
+    """
+    stats: Dict[str, Any] = {
+        "requested": len(requests),
+        "cache_hits": 0,
+        "prefetched": 0,
+        "skipped": 0,
+        "query_calls": 0,
+        "query_texts": 0,
+        "errors": 0,
+    }
+    pending: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+    for state, namespace in requests:
+        plan = _architect_retrieval_plan(state, namespace)
+        if not plan["enabled"] or plan["cache_key"] is None:
+            stats["skipped"] += 1
+            continue
+        if stage_result_cache.get(plan["cache_key"]) is not None:
+            stats["cache_hits"] += 1
+            continue
+        pending.setdefault((namespace, int(plan["rerank_pool_size"])), []).append(plan)
+
+    for (namespace, pool_size), plans in pending.items():
+        unique_texts: List[str] = []
+        positions: Dict[str, int] = {}
+        for plan in plans:
+            for text in plan["query_variants"]:
+                if text not in positions:
+                    positions[text] = len(unique_texts)
+                    unique_texts.append(text)
+        try:
+            result = vector_store.query(namespace=namespace, query_texts=unique_texts, n_results=pool_size)
+            stats["query_calls"] += 1
+            stats["query_texts"] += len(unique_texts)
+        except Exception:
+            # Leave these retrievals to the per-job path, which records the error on the job.
+            stats["errors"] += len(plans)
+            continue
+        payload = result if isinstance(result, dict) else {}
+        for plan in plans:
+            rows = [positions[text] for text in plan["query_variants"]]
+            sliced = {
+                key: [_rows(payload.get(key))[row] if row < len(_rows(payload.get(key))) else [] for row in rows]
+                for key in ("documents", "metadatas", "ids", "distances")
+            }
+            try:
+                summary, hits = _rank_architect_hits(plan, sliced)
+            except Exception:
+                stats["errors"] += 1
+                continue
+            _store_architect_evidence(plan, summary, hits)
+            stats["prefetched"] += 1
+    return stats
+
+
+def _rank_architect_hits(
+    plan: Dict[str, Any], result_payload: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    summary = plan["summary"]
+    namespace = plan["namespace"]
+    namespace_normalized = plan["namespace_normalized"]
+    collection = plan["collection"]
+    donor_id = plan["donor_id"]
+    query_text = plan["query_text"]
+    query_variants = plan["query_variants"]
+    top_k = plan["top_k"]
+    min_hit_confidence = plan["min_hit_confidence"]
+    hits: List[Dict[str, Any]] = []
+    docs_rows = _rows((result_payload or {}).get("documents"))
+    metas_rows = _rows((result_payload or {}).get("metadatas"))
+    ids_rows = _rows((result_payload or {}).get("ids"))
+    distances_rows = _rows((result_payload or {}).get("distances"))
+
+    best_by_signature: dict[tuple[Any, ...], Dict[str, Any]] = {}
+    for q_idx, query_variant in enumerate(query_variants):
+        docs = docs_rows[q_idx] if q_idx < len(docs_rows) else []
+        metas = metas_rows[q_idx] if q_idx < len(metas_rows) else []
+        ids = ids_rows[q_idx] if q_idx < len(ids_rows) else []
+        distances = distances_rows[q_idx] if q_idx < len(distances_rows) else []
+        for idx, doc in enumerate(docs):
+            meta = metas[idx] if idx < len(metas) and isinstance(metas[idx], dict) else {}
+            source = citation_source_from_metadata(meta)
+            retrieval_rank = idx + 1
+            raw_doc_id = meta.get("doc_id") or meta.get("chunk_id") or (ids[idx] if idx < len(ids) else None)
+            raw_chunk_id = meta.get("chunk_id") or raw_doc_id
+            doc_id = str(raw_doc_id or "").strip()
+            chunk_id = str(raw_chunk_id or "").strip()
+            if not doc_id and chunk_id:
+                doc_id = chunk_id
+            if not chunk_id and doc_id:
+                chunk_id = doc_id
+            if not doc_id:
+                doc_id = f"{namespace_normalized}#q{q_idx + 1}-hit-{retrieval_rank}"
+            if not chunk_id:
+                chunk_id = doc_id
+
+            source = str(source or "").strip() or None
+            page = meta.get("page")
+            raw_distance = distances[idx] if idx < len(distances) else None
+            parsed_distance = _as_float(raw_distance)
+            retrieval_distance = round(parsed_distance, 6) if parsed_distance is not None else None
+            retrieval_confidence = _distance_confidence(raw_distance, rank_index=idx, row_distances=distances)
+
+            candidate: Dict[str, Any] = {
+                "rank": retrieval_rank,
+                "retrieval_rank": retrieval_rank,
+                "query_variant_index": q_idx + 1,
+                "query_variant": query_variant,
+                "doc_id": doc_id,
+                "chunk_id": chunk_id,
+                "source": source,
+                "page": page,
+                "page_start": meta.get("page_start"),
+                "page_end": meta.get("page_end"),
+                "chunk": meta.get("chunk"),
+                "label": citation_label_from_metadata(meta, namespace=namespace, rank=retrieval_rank),
+                "excerpt": str(doc)[:320],
+                "retrieval_confidence": retrieval_confidence,
+                "retrieval_distance": retrieval_distance,
+                "namespace": namespace,
+                "namespace_normalized": namespace_normalized,
+                "collection": collection,
+            }
+            traceability_status = citation_traceability_status(candidate)
+            candidate["traceability_status"] = traceability_status
+            candidate["traceability_complete"] = traceability_status == "complete"
+            query_tokens = _tokenize(query_variant)
+            hit_tokens = _tokenize(candidate.get("excerpt")) | _tokenize(
+                candidate.get("label") or candidate.get("source")
+            )
+            query_overlap = len(query_tokens & hit_tokens) / max(1, len(query_tokens))
+            base_score = score_architect_evidence_hit(
+                query_text,
+                candidate,
+                donor_id=donor_id,
+                statement_path="toc",
+            )
+            rerank_score = round(max(0.0, min(1.0, (base_score * 0.75) + (query_overlap * 0.25))), 4)
+            candidate["rerank_score"] = rerank_score
+
+            signature = (doc_id, chunk_id, source, page)
+            current = best_by_signature.get(signature)
+            if current is None:
+                best_by_signature[signature] = candidate
+                continue
+            current_key = (
+                float(current.get("rerank_score") or 0.0),
+                float(current.get("retrieval_confidence") or 0.0),
+                -int(current.get("retrieval_rank") or 999),
+            )
+            candidate_key = (
+                float(candidate.get("rerank_score") or 0.0),
+                float(candidate.get("retrieval_confidence") or 0.0),
+                -int(candidate.get("retrieval_rank") or 999),
+            )
+            if candidate_key > current_key:
+                best_by_signature[signature] = candidate
+
+    ranked_candidates = sorted(
+        best_by_signature.values(),
+        key=lambda hit: (
+            float(hit.get("rerank_score") or 0.0),
+            float(hit.get("retrieval_confidence") or 0.0),
+            -int(hit.get("retrieval_rank") or 999),
+            -int(hit.get("query_variant_index") or 999),
+        ),
+        reverse=True,
+    )
+    summary["candidate_hits_count"] = len(ranked_candidates)
+
+    filtered = [
+        hit
+        for hit in ranked_candidates
+        if float(hit.get("retrieval_confidence") or 0.0) >= min_hit_confidence
+        or float(hit.get("rerank_score") or 0.0) >= min_hit_confidence
+    ]
+    if not filtered and ranked_candidates:
+        filtered = ranked_candidates[:1]
+    summary["filtered_out_low_confidence"] = max(0, len(ranked_candidates) - len(filtered))
+    hits = filtered[:top_k]
+
+    traceability_counts = {"complete": 0, "partial": 0, "missing": 0}
+    for idx, hit in enumerate(hits):
+        hit["rank"] = idx + 1
+        traceability_status = citation_traceability_status(hit)
+        hit["traceability_status"] = traceability_status
+        hit["traceability_complete"] = traceability_status == "complete"
+        traceability_counts[traceability_status] = int(traceability_counts.get(traceability_status, 0)) + 1
+
+    summary["hits_count"] = len(hits)
+    summary["used_results"] = len(hits)
+    summary["traceability_counts"] = traceability_counts
+    if hits:
+        summary["hit_labels"] = [str(h.get("label") or "") for h in hits[:3]]
+        summary["avg_retrieval_confidence"] = round(
+            sum(float(h.get("retrieval_confidence") or 0.0) for h in hits) / len(hits),
+            4,
+        )
+        summary["avg_rerank_score"] = round(sum(float(h.get("rerank_score") or 0.0) for h in hits) / len(hits), 4)
+        summary["hits"] = [
+            {
+                "retrieval_rank": int(h.get("retrieval_rank") or 0),
+                "query_variant_index": int(h.get("query_variant_index") or 0),
+                "doc_id": h.get("doc_id"),
+                "source": h.get("source"),
+                "page": h.get("page"),
+                "chunk_id": h.get("chunk_id"),
+                "retrieval_confidence": h.get("retrieval_confidence"),
+                "retrieval_distance": h.get("retrieval_distance"),
+                "rerank_score": h.get("rerank_score"),
+                "traceability_status": h.get("traceability_status"),
+                "traceability_complete": h.get("traceability_complete"),
+                "namespace": h.get("namespace"),
+                "namespace_normalized": h.get("namespace_normalized"),
+                "collection": h.get("collection"),
+            }
+            for h in hits[:5]
+        ]
     return summary, hits
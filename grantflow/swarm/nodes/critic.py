@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
@@ -19,6 +20,7 @@ from grantflow.swarm.citations import (
     is_retrieval_grounded_citation_type,
     is_strategy_reference_citation_type,
 )
+from grantflow.swarm.fanout import node_fanout_executor
 from grantflow.swarm.findings import canonicalize_findings, finding_messages, write_state_critic_findings
 from grantflow.swarm.grounding_gate import evaluate_grounding_gate
 from grantflow.swarm.llm_provider import (
@@ -443,6 +445,54 @@ def _combine_critic_scores(
     }
 
 
+def _llm_red_team_evaluation(system_prompt: str, human_prompt: str) -> Dict[str, Any]:
+    """Try the configured critic models in order; never raises, failures are reported in `reason`."""
+    evaluation: Optional[RedTeamEvaluation] = None
+    reason: Optional[str] = None
+    models_tried: list[str] = []
+    selected_model: Optional[str] = None
+    failure_reasons: list[str] = []
+    try:
+        from langchain_core.messages import HumanMessage, SystemMessage
+        from langchain_openai import ChatOpenAI
+
+        model_candidates = llm_model_candidates(
+            str(getattr(config.llm, "critic_model", "") or ""),
+            str(getattr(config.llm, "reasoning_model", "") or ""),
+            str(getattr(config.llm, "cheap_model", "") or ""),
+        )
+        for model_name in model_candidates:
+            models_tried.append(model_name)
+            llm_kwargs = chat_openai_init_kwargs(model=model_name, temperature=0.1)
+            if llm_kwargs is None:
+                failure_reasons.append(f"{model_name}: {openai_compatible_missing_reason()}")
+                continue
+            try:
+                llm = ChatOpenAI(**llm_kwargs)
+                evaluator_llm = llm.with_structured_output(RedTeamEvaluation)
+                evaluation = evaluator_llm.invoke(
+                    [SystemMessage(content=system_prompt), HumanMessage(content=human_prompt)]
+                )
+                selected_model = model_name
+                break
+            except Exception as model_exc:
+                failure_reasons.append(f"{model_name}: {model_exc}")
+        if evaluation is None:
+            if failure_reasons:
+                reason = f"LLM unavailable: {'; '.join(failure_reasons[:3])}"
+            else:
+                reason = "LLM unavailable: no configured model candidates"
+    except Exception as exc:
+        reason = f"LLM unavailable: {exc}"
+    return {
+        "evaluation": evaluation,
+        "reason": reason,
+        "models_tried": models_tried,
+        "selected_model": selected_model,
+        "failure_reasons": failure_reasons,
+    }
+
+
 def red_team_critic(state: Dict[str, Any]) -> Dict[str, Any]:
     """Evaluates the drafted ToC and LogFrame and updates loop-control fields."""
     normalize_state_contract(state)
@@ -457,54 +507,34 @@ def red_team_critic(state: Dict[str, Any]) -> Dict[str, Any]:
     llm_models_tried: list[str] = []
     llm_selected_model: Optional[str] = None
     llm_failure_reasons: list[str] = []
-    rule_report = evaluate_rule_based_critic(state)
+    llm_future: Optional["Future[Dict[str, Any]]"] = None
 
     if llm_mode and openai_compatible_llm_available():
-        try:
-            from langchain_core.messages import HumanMessage, SystemMessage
-            from langchain_openai import ChatOpenAI
-
-            system_prompt = donor_strategy.get_system_prompts().get(
-                "Red_Team_Critic", "Evaluate quality and compliance strictly."
-            )
-            human_prompt = (
-                "Evaluate the following grant proposal artifacts:\n\n"
-                f"Theory of Change:\n{state.get('toc_draft', {})}\n\n"
-                f"Logical Framework / Indicators:\n{state.get('logframe_draft', {})}\n\n"
-                "Be strict and return the structured schema only."
-            )
-            model_candidates = llm_model_candidates(
-                str(getattr(config.llm, "critic_model", "") or ""),
-                str(getattr(config.llm, "reasoning_model", "") or ""),
-                str(getattr(config.llm, "cheap_model", "") or ""),
-            )
-            for model_name in model_candidates:
-                llm_models_tried.append(model_name)
-                llm_kwargs = chat_openai_init_kwargs(model=model_name, temperature=0.1)
-                if llm_kwargs is None:
-                    llm_failure_reasons.append(f"{model_name}: {openai_compatible_missing_reason()}")
-                    continue
-                try:
-                    llm = ChatOpenAI(**llm_kwargs)
-                    evaluator_llm = llm.with_structured_output(RedTeamEvaluation)
-                    evaluation = evaluator_llm.invoke(
-                        [SystemMessage(content=system_prompt), HumanMessage(content=human_prompt)]
-                    )
-                    critic_engine = f"rules+llm:{model_name}"
-                    llm_selected_model = model_name
-                    break
-                except Exception as model_exc:
-                    llm_failure_reasons.append(f"{model_name}: {model_exc}")
-            if evaluation is None:
-                if llm_failure_reasons:
-                    llm_reason = f"LLM unavailable: {'; '.join(llm_failure_reasons[:3])}"
-                else:
-                    llm_reason = "LLM unavailable: no configured model candidates"
-        except Exception as exc:
-            llm_reason = f"LLM unavailable: {exc}"
+        system_prompt = donor_strategy.get_system_prompts().get(
+            "Red_Team_Critic", "Evaluate quality and compliance strictly."
+        )
+        human_prompt = (
+            "Evaluate the following grant proposal artifacts:\n\n"
+            f"Theory of Change:\n{state.get('toc_draft', {})}\n\n"
+            f"Logical Framework / Indicators:\n{state.get('logframe_draft', {})}\n\n"
+            "Be strict and return the structured schema only."
+        )
+        # The LLM review only sees the prompt snapshot, so it runs while the rule checks evaluate the state.
+        llm_future = node_fanout_executor.submit(_llm_red_team_evaluation, system_prompt, human_prompt)
     else:
         llm_reason = "llm_mode=false" if not llm_mode else openai_compatible_missing_reason()
 
+    rule_report = evaluate_rule_based_critic(state)
+    if llm_future is not None:
+        llm_result = llm_future.result()
+        evaluation = llm_result["evaluation"]
+        llm_reason = llm_result["reason"]
+        llm_models_tried = llm_result["models_tried"]
+        llm_selected_model = llm_result["selected_model"]
+        llm_failure_reasons = llm_result["failure_reasons"]
+        if llm_selected_model:
+            critic_engine = f"rules+llm:{llm_selected_model}"
+
     iteration = state_iteration(state) + 1
     max_iters = state_max_iterations(state, default=3)
     llm_score = float(evaluation.score) if evaluation is not None else None
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from typing import Any, Dict, Iterable, Optional, Tuple, Type, Union, get_args, get_origin
 
 from pydantic import BaseModel, Field
@@ -153,6 +154,7 @@ def _field_required(field: Any) -> bool:
     return False
 
 
+@lru_cache(maxsize=None)
 def _schema_contract_hint(schema_cls: Type[BaseModel], *, max_fields: int = 24) -> str:
     fields = getattr(schema_cls, "model_fields", None)
     if not isinstance(fields, dict):  # pydantic v1 fallback
@@ -184,6 +186,11 @@ def _resolve_mel_schema_cls(strategy: Any) -> Type[BaseModel]:
     return MELDraftOutput
 
 
+def warm_mel_contract_hints(contracts: Any) -> None:
+    """Donor registry warmer: precompute the MEL schema prompt hint for one donor."""
+    _schema_contract_hint(_resolve_mel_schema_cls(contracts.strategy))  # type: ignore[arg-type]
+
+
 def _extract_mel_indicators(payload: Dict[str, Any]) -> Any:
     if not isinstance(payload, dict):
         return []
@@ -2398,7 +2405,7 @@ def mel_assign_indicators(state: Dict[str, Any]) -> Dict[str, Any]:
     query_variants = _query_variants(state, query_text, max_variants=query_variants_limit)
     input_context = state_input_context(state)
     schema_cls = _resolve_mel_schema_cls(strategy)
-    schema_contract_hint = _schema_contract_hint(schema_cls)
+    schema_contract_hint = _schema_contract_hint(schema_cls)  # type: ignore[arg-type]
     project = str(input_context.get("project") or "TBD project")
     country = str(input_context.get("country") or "TBD")
     toc = state.get("toc_draft", {}) or {}
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def stage_cache_key(stage: str, **parts: Any) -> str:
+    """Stable key for a pipeline stage result: sha256 over canonical JSON of the stage inputs."""
+    payload = json.dumps({"stage": stage, **parts}, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class StageResultCache:
+    """Process-local LRU for deterministic stage results shared by preflight and the pipeline run.
+
+    Nothing is shared between processes: a preflight in an API process only helps a pipeline run that executes
+    in the same process. Keys include the corpus version read from the vector store, so corpus writes made by
+    any process invalidate entries here. Values are deep-copied on the way in and out so callers can mutate what they get back without
+    touching the cached copy. Each entry remembers which caller produced it (``source``) so reuse is
+    visible in job metadata.
+    """
+
+    def __init__(self, *, max_entries: int = 256, ttl_seconds: float = 900.0, enabled: bool = True) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.enabled = bool(enabled) and self.max_entries > 0
+        self._entries: "OrderedDict[str, Tuple[float, str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+
+    def get(self, key: str) -> Optional[Tuple[Any, str]]:
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.miss_count += 1
+                return None
+            stored_at, source, value = entry
+            if self.ttl_seconds and now - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.miss_count += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hit_count += 1
+        return copy.deepcopy(value), source
+
+    def put(self, key: str, value: Any, *, source: str) -> None:
+        if not self.enabled:
+            return
+        stored = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), str(source or "unknown"), stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.eviction_count += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hit_count": self.hit_count,
+                "miss_count": self.miss_count,
+                "eviction_count": self.eviction_count,
+            }
+
+
+def create_stage_result_cache_from_env() -> StageResultCache:
+    mode = str(os.getenv("GRANTFLOW_STAGE_CACHE", "on") or "on").strip().lower()
+    return StageResultCache(
+        max_entries=_env_int("GRANTFLOW_STAGE_CACHE_MAX_ENTRIES", 256),
+        ttl_seconds=float(_env_int("GRANTFLOW_STAGE_CACHE_TTL_SECONDS", 900)),
+        enabled=mode not in {"0", "off", "false", "no"},
+    )
+
+
+stage_result_cache = create_stage_result_cache_from_env()
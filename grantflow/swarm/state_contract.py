@@ -60,6 +60,9 @@ class GrantFlowStateModel(BaseModel):
     errors: list[str] = Field(default_factory=list)
 
 
+_CONTRACT_KEYS = tuple(GrantFlowStateModel.model_fields)
+
+
 def _as_bool(value: Any, default: bool = False) -> bool:
     if isinstance(value, bool):
         return value
@@ -325,17 +328,22 @@ def normalize_state_contract(
 
     state["critic_feedback_history"] = _as_str_list(state.get("critic_feedback_history"))
     state["errors"] = _as_str_list(state.get("errors"))
-    # Validate typed state contract (including permissive extra runtime keys).
-    GrantFlowStateModel.model_validate(state)
+    # Validate the typed contract keys only; extras are `Any`, so validating the whole state just copies it.
+    GrantFlowStateModel.model_validate({key: state[key] for key in _CONTRACT_KEYS if key in state})
 
     return cast(GrantFlowState, state)
 
 
 def _normalize_state_findings_aliases(state: MutableMapping[str, Any]) -> None:
+    # Local import prevents broad module-level coupling for state-only helpers.
+    from grantflow.swarm.findings import CanonicalFindings, write_state_critic_findings
+
     notes = state.get("critic_notes")
     notes_dict = notes if isinstance(notes, dict) else {}
     notes_flaws = notes_dict.get("fatal_flaws")
     alias_flaws = state.get("critic_fatal_flaws")
+    if alias_flaws is notes_flaws and isinstance(notes_flaws, CanonicalFindings) and notes_flaws.is_current(state):
+        return
     raw_findings: list[Any] = []
     if isinstance(notes_flaws, list):
         raw_findings = list(notes_flaws)
@@ -343,14 +351,11 @@ def _normalize_state_findings_aliases(state: MutableMapping[str, Any]) -> None:
         raw_findings = list(alias_flaws)
 
     if not raw_findings:
-        notes_dict["fatal_flaws"] = []
-        state["critic_notes"] = notes_dict
+        # Copy rather than edit the caller's notes dict, so a shallow copy of a state can be normalized safely.
+        state["critic_notes"] = {**notes_dict, "fatal_flaws": []}
         state["critic_fatal_flaws"] = []
         return
 
-    # Local import prevents broad module-level coupling for state-only helpers.
-    from grantflow.swarm.findings import write_state_critic_findings
-
     write_state_critic_findings(
         state,
         raw_findings,
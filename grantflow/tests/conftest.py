@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import pytest
+
+from grantflow.exporters.artifact_cache import export_artifact_cache
+from grantflow.swarm.stage_cache import stage_result_cache
+
+
+@pytest.fixture(autouse=True)
+def _isolated_process_caches():
+    # Tests swap vector_store.query and the export builders in place, which cache keys cannot see;
+    # never share stage results or rendered export artifacts between tests.
+    stage_result_cache.clear()
+    export_artifact_cache.clear()
+    yield
+    stage_result_cache.clear()
+    export_artifact_cache.clear()
@@ -17,9 +17,11 @@ from grantflow.swarm.nodes.architect_generation import (
 from grantflow.swarm.nodes.architect_policy import architect_claim_confidence_threshold
 from grantflow.swarm.nodes.architect_retrieval import (
     pick_best_architect_evidence_hit,
+    prefetch_architect_evidence,
     retrieve_architect_evidence,
     score_architect_evidence_hit,
 )
+from grantflow.swarm.stage_cache import stage_result_cache
 
 
 def test_architect_generates_contract_validated_toc_with_optional_retrieval_disabled():
@@ -210,6 +212,114 @@ def test_architect_query_variants_prioritize_compact_donor_shaped_queries(monkey
     assert "results framework" in variants[0].lower() or "project development objective" in variants[0].lower()
 
 
+def test_architect_retrieval_and_draft_reuse_preflight_stage_results(monkeypatch):
+    calls = {"query": 0}
+    corpus = {"version": "v1"}
+
+    def fake_query(*, namespace, query_texts, n_results):  # noqa: ARG001
+        calls["query"] += 1
+        return {
+            "documents": [["Water access indicator guidance"]],
+            "metadatas": [[{"source": "guide.pdf", "chunk_id": "ch_1", "page": 4}]],
+            "ids": [["id_1"]],
+            "distances": [[0.1]],
+        }
+
+    monkeypatch.setattr(architect_retrieval_module.vector_store, "query", fake_query)
+    monkeypatch.setattr(
+        architect_retrieval_module.vector_store, "corpus_version", lambda namespace: f"{namespace}:{corpus['version']}"
+    )
+    strategy = DonorFactory.get_strategy("usaid")
+
+    def _state(**extras):
+        return {
+            "donor_id": "usaid",
+            "donor_strategy": strategy,
+            "input_context": {"project": "Water Sanitation", "country": "Kenya"},
+            "llm_mode": False,
+            "iteration": 0,
+            "errors": [],
+            **extras,
+        }
+
+    preflight_state = _state(stage_cache_source="preflight")
+    summary, hits = retrieve_architect_evidence(preflight_state, "usaid_ads201")
+    architect_generation_module.generate_toc_with_stage_cache(
+        state=preflight_state, strategy=strategy, evidence_hits=hits
+    )
+    assert summary["stage_cache"]["status"] == "miss"
+    assert calls["query"] == 1
+
+    out = draft_toc(_state())
+    assert calls["query"] == 1
+    assert out["architect_retrieval"]["stage_cache"] == {
+        "status": "hit",
+        "key": summary["stage_cache"]["key"],
+        "source": "preflight",
+    }
+    assert out["architect_retrieval"]["hits_count"] == summary["hits_count"]
+    assert out["toc_generation_meta"]["stage_cache"]["status"] == "hit"
+    assert out["toc_generation_meta"]["stage_cache"]["source"] == "preflight"
+
+    corpus["version"] = "v2"
+    refreshed = draft_toc(_state())
+    assert calls["query"] == 2
+    assert refreshed["architect_retrieval"]["stage_cache"]["status"] == "miss"
+
+
+def test_prefetch_architect_evidence_batches_one_query_per_namespace(monkeypatch):
+    calls: list[list[str]] = []
+
+    def fake_query(*, namespace, query_texts, n_results):  # noqa: ARG001
+        calls.append(list(query_texts))
+        # Rows depend only on the query text, like a real store, so batched and single calls agree.
+        keys = [sum(map(ord, text)) % 97 for text in query_texts]
+        return {
+            "documents": [[f"Guidance for {text[:40]}", "Indicator reference sheet"] for text in query_texts],
+            "metadatas": [
+                [
+                    {"source": f"{namespace}.pdf", "chunk_id": f"ch_{key}", "page": key},
+                    {"source": "pirs.pdf", "page": 2},
+                ]
+                for key in keys
+            ],
+            "ids": [[f"id_{key}", f"id_{key}_b"] for key in keys],
+            "distances": [[0.1 + 0.001 * key, 0.4] for key in keys],
+        }
+
+    monkeypatch.setattr(architect_retrieval_module.vector_store, "query", fake_query)
+    monkeypatch.setattr(architect_retrieval_module.vector_store, "corpus_version", lambda namespace: f"{namespace}:v1")
+    strategy = DonorFactory.get_strategy("usaid")
+
+    def _state(country: str):
+        return {
+            "donor_id": "usaid",
+            "donor_strategy": strategy,
+            "input_context": {"project": "Water Sanitation", "country": country},
+            "llm_mode": False,
+            "iteration": 0,
+            "errors": [],
+        }
+
+    countries = ["Kenya", "Uganda", "Kenya"]
+    stats = prefetch_architect_evidence([(_state(country), "usaid_ads201") for country in countries])
+    assert len(calls) == 1
+    assert stats["query_calls"] == 1
+    assert stats["prefetched"] == 3
+    assert stats["query_texts"] == len(set(calls[0]))
+
+    warmed = [retrieve_architect_evidence(_state(country), "usaid_ads201") for country in countries]
+    assert len(calls) == 1
+    assert all(summary["stage_cache"]["status"] == "hit" for summary, _hits in warmed)
+
+    stage_result_cache.clear()
+    for country, (warm_summary, warm_hits) in zip(countries, warmed):
+        cold_summary, cold_hits = retrieve_architect_evidence(_state(country), "usaid_ads201")
+        assert cold_hits == warm_hits
+        assert cold_summary["hits_count"] == warm_summary["hits_count"]
+        assert cold_summary.get("hits") == warm_summary.get("hits")
+
+
 def test_architect_claim_citation_policy_marks_low_confidence_hits():
     toc_payload = {"project_goal": "Improve water sanitation outcomes", "objectives": []}
     citations = build_architect_claim_citations(
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import grantflow.api.app as api_app_module
+from grantflow.api.app import app
+from grantflow.api.blocking_executor import BlockingPoolSaturated, BlockingWorkExecutor
+
+client = TestClient(app)
+
+_REQUEST_MARKER: contextvars.ContextVar[str] = contextvars.ContextVar("request_marker", default="")
+
+
+def test_blocking_executor_bounds_pool_and_reports_queue_depth():
+    executor = BlockingWorkExecutor({"generate": 1}, queue_limit=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def _blocking() -> str:
+        started.set()
+        release.wait(timeout=5.0)
+        return "done"
+
+    first = executor.submit("generate", _blocking)
+    assert started.wait(timeout=5.0)
+    second = executor.submit("generate", lambda: "queued")
+    queued_at = time.perf_counter()
+    pools = executor.stats()["pools"]
+    assert pools["generate"]["active"] == 1
+    assert pools["generate"]["queue_depth"] == 1
+    with pytest.raises(BlockingPoolSaturated):
+        executor.submit("generate", lambda: None)
+
+    # The queued call cannot start before release, so its recorded wait covers at least this window.
+    queued_ms = (time.perf_counter() - queued_at) * 1000.0
+    release.set()
+    assert first.result(timeout=5.0) == "done"
+    assert second.result(timeout=5.0) == "queued"
+    stats = executor.stats()["pools"]["generate"]
+    assert stats["completed_count"] == 2
+    assert stats["rejected_count"] == 1
+    assert stats["queue_depth"] == 0
+    assert stats["wait_ms_max"] >= queued_ms - 0.001
+    executor.shutdown(wait=True)
+    # Pools are rebuilt lazily after shutdown so a restarted lifespan keeps working.
+    assert executor.submit("generate", lambda: 3).result(timeout=5.0) == 3
+    executor.shutdown(wait=True)
+
+
+def test_blocking_executor_keeps_event_loop_responsive_and_copies_context():
+    executor = BlockingWorkExecutor({"ingest": 1}, queue_limit=4)
+
+    loop_ran = threading.Event()
+
+    def _slow_parse() -> tuple[str, bool]:
+        # Only an event loop that keeps running while this call blocks can set the event.
+        return _REQUEST_MARKER.get(), loop_ran.wait(timeout=5.0)
+
+    async def _mark_loop_ran() -> None:
+        loop_ran.set()
+
+    async def _scenario() -> tuple[str, bool]:
+        _REQUEST_MARKER.set("req-42")
+        marker_task = asyncio.create_task(_mark_loop_ran())
+        result = await executor.run("ingest", _slow_parse)
+        await marker_task
+        return result
+
+    marker, loop_ran_during_call = asyncio.run(_scenario())
+    assert marker == "req-42"
+    assert loop_ran_during_call is True
+    assert executor.stats()["pools"]["ingest"]["completed_count"] == 1
+    executor.shutdown(wait=True)
+
+
+def test_generate_endpoints_run_on_blocking_pool_and_shed_load(monkeypatch):
+    executor = BlockingWorkExecutor({"generate": 1, "ingest": 1}, queue_limit=0)
+    monkeypatch.setattr(api_app_module, "BLOCKING_EXECUTOR", executor)
+
+    response = client.post("/generate/preflight", json={"donor_id": "usaid"})
+    assert response.status_code == 200
+    pools = client.get("/health").json()["diagnostics"]["blocking_executor"]["pools"]
+    assert pools["generate"]["completed_count"] == 1
+    assert pools["generate"]["max_workers"] == 1
+
+    release = threading.Event()
+    started = threading.Event()
+
+    def _hold() -> None:
+        started.set()
+        release.wait(timeout=5.0)
+
+    held = executor.submit("generate", _hold)
+    try:
+        assert started.wait(timeout=5.0)
+        busy = client.post(
+            "/generate",
+            json={"donor_id": "usaid", "input_context": {"project": "Busy"}, "llm_mode": False},
+        )
+        assert busy.status_code == 503
+        assert "Retry shortly" in str(busy.json()["detail"])
+        # Read endpoints are served while the generate pool is saturated.
+        assert client.get("/health").status_code == 200
+    finally:
+        release.set()
+        held.result(timeout=5.0)
+        executor.shutdown(wait=True)
+    assert executor.stats()["pools"]["generate"]["rejected_count"] == 1
+
+
+def test_ingest_audit_write_is_not_shed_after_upload_succeeds(monkeypatch):
+    executor = BlockingWorkExecutor({"generate": 1, "ingest": 1}, queue_limit=0)
+    monkeypatch.setattr(api_app_module, "BLOCKING_EXECUTOR", executor)
+    api_app_module.INGEST_AUDIT_STORE.clear()
+    real_submit = executor.submit
+    submitted: list[str] = []
+
+    def _saturate_after_first(pool, fn, *args, **kwargs):
+        submitted.append(pool)
+        if len(submitted) > 1:
+            raise BlockingPoolSaturated(pool, 0)
+        return real_submit(pool, fn, *args, **kwargs)
+
+    monkeypatch.setattr(executor, "submit", _saturate_after_first)
+    monkeypatch.setattr(
+        api_app_module,
+        "ingest_pdf_to_namespace",
+        lambda pdf_path, namespace, metadata=None: {"namespace": namespace, "chunks_ingested": 1},
+    )
+
+    response = client.post(
+        "/ingest",
+        data={"donor_id": "usaid"},
+        files={"file": ("busy.pdf", b"%PDF-1.4 fake content", "application/pdf")},
+    )
+    assert response.status_code == 200
+    assert submitted == ["ingest"]
+    assert [row["filename"] for row in api_app_module.INGEST_AUDIT_STORE.list_recent(donor_id="usaid")] == ["busy.pdf"]
+    executor.shutdown(wait=True)
@@ -1169,3 +1169,64 @@ def test_llm_flaw_normalization_binds_to_latest_section_versions():
     assert by_code["L1"]["version_id"] == "toc_v2"
     assert by_code["L2"]["version_id"] == "logframe_v1"
     assert by_code["L3"]["version_id"] is None
+
+
+def test_red_team_critic_overlaps_llm_review_with_rule_checks(monkeypatch):
+    import threading
+
+    import grantflow.swarm.nodes.critic as critic_module
+    from grantflow.swarm.fanout import NodeFanoutExecutor
+
+    class _Strategy:
+        def get_system_prompts(self):
+            return {"Red_Team_Critic": "Be strict."}
+
+    real_rules = critic_module.evaluate_rule_based_critic
+    rules_started = threading.Event()
+    # Inline, the LLM call returns before the rules start, so the sequential wait can only time out.
+    wait_timeouts = {"sequential": 0.05, "fanout": 5.0}
+    rules_seen_by_llm = {}
+
+    def _rules(state):
+        rules_started.set()
+        return real_rules(state)
+
+    def _llm(system_prompt, human_prompt):
+        assert "Theory of Change" in human_prompt
+        rules_seen_by_llm[label] = rules_started.wait(timeout=wait_timeouts[label])
+        return {
+            "evaluation": RedTeamEvaluation(score=8.0, fatal_flaws=[], revision_instructions="None."),
+            "reason": None,
+            "models_tried": ["critic-model"],
+            "selected_model": "critic-model",
+            "failure_reasons": [],
+        }
+
+    def _state():
+        return {
+            "donor_strategy": _Strategy(),
+            "strategy": _Strategy(),
+            "llm_mode": True,
+            "max_iterations": 3,
+            "iteration": 0,
+            "toc_draft": {"toc": {"project_goal": "Improve access"}},
+            "logframe_draft": {"indicators": [{"indicator_id": "IND_001"}]},
+            "citations": [],
+            "toc_validation": {"valid": True, "errors": [], "schema_name": "GenericTOC"},
+        }
+
+    monkeypatch.setattr(critic_module, "openai_compatible_llm_available", lambda: True)
+    monkeypatch.setattr(critic_module, "evaluate_rule_based_critic", _rules)
+    monkeypatch.setattr(critic_module, "_llm_red_team_evaluation", _llm)
+
+    engines = {}
+    for label, enabled in (("sequential", False), ("fanout", True)):
+        rules_started.clear()
+        executor = NodeFanoutExecutor(max_workers=2, enabled=enabled)
+        monkeypatch.setattr(critic_module, "node_fanout_executor", executor)
+        out = red_team_critic(_state())
+        engines[label] = (out.get("critic_notes") or {}).get("engine")
+        executor.shutdown()
+
+    assert engines == {"sequential": "rules+llm:critic-model", "fanout": "rules+llm:critic-model"}
+    assert rules_seen_by_llm == {"sequential": False, "fanout": True}
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import numpy as np
+
+from grantflow.memory_bank.embeddings import (
+    EmbeddingService,
+    HashedNgramEmbeddingProvider,
+    LegacyHashEmbeddingProvider,
+    SQLiteEmbeddingCache,
+    create_embedding_service_from_env,
+)
+from grantflow.memory_bank.vector_store import VectorStore
+
+
+class _CountingProvider(HashedNgramEmbeddingProvider):
+    def __init__(self) -> None:
+        super().__init__(dims=64)
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        return super().embed(texts)
+
+
+def test_hashed_ngram_provider_is_normalized_deterministic_and_lexically_ranked():
+    provider = HashedNgramEmbeddingProvider(dims=256)
+    docs = [
+        "Water, sanitation and hygiene outcomes for rural households",
+        "Budget narrative for equipment procurement",
+        "Monitoring indicators for sanitation facilities",
+    ]
+    vectors = provider.embed(docs)
+    assert vectors.shape == (3, 256)
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0, atol=1e-5)
+    assert np.array_equal(vectors, HashedNgramEmbeddingProvider(dims=256).embed(docs))
+
+    scores = vectors @ provider.embed(["rural sanitation hygiene"])[0]
+    assert scores[0] > scores[1]
+    assert scores[2] > scores[1]
+
+
+def test_embedding_service_batches_dedupes_and_reuses_disk_cache(tmp_path):
+    cache_path = str(tmp_path / "embeddings.db")
+    provider = _CountingProvider()
+    service = EmbeddingService(provider, cache=SQLiteEmbeddingCache(cache_path), batch_size=2)
+
+    texts = ["alpha", "beta", "alpha", "gamma", "delta"]
+    first = service.embed(texts)
+    assert [len(batch) for batch in provider.calls] == [2, 2]
+    assert np.array_equal(first[0], first[2])
+    assert service.describe()["counters"]["embedded"] == 4
+
+    again = service.embed(["gamma", "alpha"])
+    assert len(provider.calls) == 2
+    assert np.array_equal(again[0], first[3])
+
+    reloaded_provider = _CountingProvider()
+    reloaded = EmbeddingService(reloaded_provider, cache=SQLiteEmbeddingCache(cache_path), batch_size=2)
+    assert np.array_equal(reloaded.embed(texts), first)
+    assert reloaded_provider.calls == []
+    assert reloaded.describe()["counters"]["disk_hits"] == 4
+
+
+def test_create_embedding_service_falls_back_when_local_model_is_missing(monkeypatch, tmp_path):
+    monkeypatch.setenv("GRANTFLOW_EMBEDDING_PROVIDER", "local_model")
+    monkeypatch.setenv("GRANTFLOW_EMBEDDING_MODEL_DIR", str(tmp_path / "missing-model"))
+    service = create_embedding_service_from_env()
+    assert isinstance(service.provider, LegacyHashEmbeddingProvider)
+    assert service.cache is None
+    assert "local_model embedding provider init failed" in str(service.init_error)
+
+
+def test_vector_store_uses_configured_provider_and_separate_collections(monkeypatch, tmp_path):
+    monkeypatch.setenv("GRANTFLOW_FORCE_INMEM_VECTOR_STORE", "1")
+    monkeypatch.setenv("GRANTFLOW_EMBEDDING_PROVIDER", "hashed_ngram")
+    monkeypatch.setenv("GRANTFLOW_EMBEDDING_CACHE_PATH", str(tmp_path / "cache.db"))
+    store = VectorStore()
+    store.prefix = "grantflow"
+    assert store._collection_name("usaid").startswith("grantflow_usaid_hashed_ngram_")
+
+    store.upsert(
+        namespace="usaid",
+        ids=["toc", "budget"],
+        documents=["Theory of change assumptions and outcome pathways", "Budget for vehicles and travel"],
+    )
+    assert store.query("usaid", "outcome pathways assumptions", top_k=1) == [
+        "Theory of change assumptions and outcome pathways"
+    ]
+    stats = store.get_stats("usaid")
+    assert stats["embedding"]["provider"] == "hashed_ngram"
+    assert stats["embedding"]["dims"] == 512
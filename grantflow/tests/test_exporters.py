@@ -1,13 +1,16 @@
 import json
+import zipfile
 from io import BytesIO
 from pathlib import Path
 
 from docx import Document
 from openpyxl import load_workbook
 
+from grantflow.exporters.artifact_cache import ExportArtifact, ExportArtifactCache
 from grantflow.exporters.donor_contracts import evaluate_export_contract
-from grantflow.exporters.excel_builder import build_xlsx_from_logframe
+from grantflow.exporters.excel_builder import build_xlsx_from_logframe, build_xlsx_with_manifest
 from grantflow.exporters.word_builder import build_docx_from_toc
+from grantflow.exporters.zip_stream import iter_zip_stream
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -695,6 +698,71 @@ def test_excel_export_logframe_sheet_includes_smart_indicator_columns():
     assert "validated implementation records" in str(rows[1][18])
 
 
+def test_excel_build_manifest_matches_saved_workbook():
+    logframe_draft = {
+        "indicators": [
+            {"indicator_id": f"IND_{idx:03d}", "name": f"Indicator {idx}", "baseline": "0", "target": "10"}
+            for idx in range(5)
+        ]
+    }
+    build = build_xlsx_with_manifest(
+        logframe_draft,
+        "usaid",
+        toc_draft={
+            "toc": {
+                "project_goal": "Improve digital service delivery",
+                "development_objectives": [
+                    {"do_id": "DO1", "description": "Improved service access", "intermediate_results": []}
+                ],
+            }
+        },
+        citations=_sample_citations(),
+        critic_findings=_sample_critic_findings(),
+    )
+    wb = load_workbook(BytesIO(build.content), read_only=True)
+    try:
+        assert build.manifest.sheetnames == wb.sheetnames
+        for sheet in build.manifest.sheets:
+            ws = wb[sheet.name]
+            rows = list(ws.iter_rows(values_only=True))
+            header_row = rows[0] if rows else ()
+            assert list(sheet.headers) == [str(v).strip() for v in header_row if str(v or "").strip()]
+            assert sheet.row_count == len(rows)
+    finally:
+        wb.close()
+    assert build.manifest.sheet("LogFrame").row_count == 6
+    assert build.manifest.sheet("Missing") is None
+
+
+def test_xlsx_writer_streams_rows_past_width_sample_with_shared_styles():
+    from grantflow.exporters.excel_builder import (
+        _TABLE_CELL_STYLE,
+        _TABLE_HEADER_STYLE,
+        _WIDTH_SAMPLE_ROWS,
+        _XlsxWriter,
+    )
+
+    writer = _XlsxWriter()
+    sheet = writer.create_sheet("Rows")
+    sheet.append(["Key", None, "Value"], style=_TABLE_HEADER_STYLE)
+    for idx in range(_WIDTH_SAMPLE_ROWS - 1):
+        sheet.append([f"k{idx}", None, "short"], style=_TABLE_CELL_STYLE)
+    assert sheet._pending is None
+    sheet.append(["late", None, "x" * 40], style=_TABLE_CELL_STYLE)
+    build = writer.save()
+
+    assert build.manifest.sheet("Rows").row_count == _WIDTH_SAMPLE_ROWS + 1
+    assert list(build.manifest.sheet("Rows").headers) == ["Key", "Value"]
+    wb = load_workbook(BytesIO(build.content))
+    ws = wb["Rows"]
+    assert ws.column_dimensions["B"].width == 2
+    assert ws.column_dimensions["C"].width == 7
+    assert ws.max_row == _WIDTH_SAMPLE_ROWS + 1
+    assert ws["A1"].style == _TABLE_HEADER_STYLE and ws["A1"].font.bold
+    assert ws.cell(row=_WIDTH_SAMPLE_ROWS + 1, column=3).style == _TABLE_CELL_STYLE
+    assert ws.cell(row=_WIDTH_SAMPLE_ROWS + 1, column=3).value == "x" * 40
+
+
 def test_excel_export_includes_template_meta_sheet():
     eu_toc_incomplete = {
         "toc": {
@@ -1520,3 +1588,90 @@ def test_export_contract_resolves_evaluation_rfq_from_wrapped_state_payload():
     contract = evaluate_export_contract(donor_id="un_agencies", toc_payload=wrapped)
     assert contract["template_key"] == "evaluation_rfq"
     assert "brief" in contract["present_sections"]
+
+
+def test_export_artifact_cache_evicts_by_size_and_reloads_from_disk(tmp_path):
+    cache = ExportArtifactCache(max_entries=10, max_bytes=10, directory=str(tmp_path))
+    cache.put("a", ExportArtifact(content=b"12345", media_type="application/zip", headers={"X-Test": "a"}))
+    cache.put("b", ExportArtifact(content=b"67890", media_type="application/zip"))
+    assert cache.get("a") is not None
+    cache.put("c", ExportArtifact(content=b"abc", media_type="application/zip"))
+
+    # "b" was least recently used once "a" was read back.
+    assert cache.get("b") is None
+    assert not (tmp_path / "b.bin").exists()
+    assert cache.stats()["bytes"] == 8
+    cache.put("too-big", ExportArtifact(content=b"x" * 11, media_type="application/zip"))
+    assert cache.get("too-big") is None
+
+    reloaded = ExportArtifactCache(max_entries=10, max_bytes=10, directory=str(tmp_path))
+    artifact = reloaded.get("a")
+    assert artifact is not None
+    assert artifact.read_bytes() == b"12345"
+    assert artifact.headers == {"X-Test": "a"}
+    assert reloaded.stats()["entries"] == 2
+
+
+def test_iter_zip_stream_writes_entries_incrementally():
+    rendered: list[str] = []
+
+    def entries():
+        for name in ("proposal.docx", "mel.xlsx"):
+            rendered.append(name)
+            yield name, (name.encode("utf-8") + bytes(range(256))) * 2000
+
+    stream = iter_zip_stream(entries(), chunk_size=4096)
+    first_chunk = next(stream)
+    assert first_chunk[:2] == b"PK"
+    assert rendered == ["proposal.docx"]
+    body = first_chunk + b"".join(stream)
+
+    with zipfile.ZipFile(BytesIO(body)) as archive:
+        assert archive.namelist() == ["proposal.docx", "mel.xlsx"]
+        assert archive.read("mel.xlsx") == (b"mel.xlsx" + bytes(range(256))) * 2000
+
+
+def test_export_artifact_cache_tee_stores_completed_streams_only(tmp_path):
+    cache = ExportArtifactCache(max_entries=10, max_bytes=1024, directory=str(tmp_path))
+
+    assert b"".join(cache.tee("full", iter([b"ab", b"cd"]), media_type="application/zip")) == b"abcd"
+    cached = cache.get("full")
+    assert cached is not None
+    assert cached.read_bytes() == b"abcd"
+
+    partial = cache.tee("partial", iter([b"ab", b"cd"]), media_type="application/zip")
+    assert next(partial) == b"ab"
+    partial.close()
+    assert cache.get("partial") is None
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["full.bin", "full.json"]
+
+    list(cache.tee("oversized", iter([b"x" * 1000, b"y" * 1000]), media_type="application/zip"))
+    assert cache.get("oversized") is None
+
+
+def test_export_artifact_cache_interleaved_writers_use_separate_temp_files(tmp_path):
+    cache = ExportArtifactCache(max_entries=10, max_bytes=1024, directory=str(tmp_path))
+
+    first = cache.tee("same", iter([b"ab", b"cd"]), media_type="application/zip")
+    second = cache.tee("same", iter([b"ab", b"cd"]), media_type="application/zip")
+    assert next(first) == b"ab"
+    assert next(second) == b"ab"
+    assert len([path for path in tmp_path.iterdir() if path.name.endswith(".tmp")]) == 2
+    first.close()
+    assert b"".join(second) == b"cd"
+
+    cached = cache.get("same")
+    assert cached is not None
+    assert cached.read_bytes() == b"abcd"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["same.bin", "same.json"]
+
+
+def test_export_artifact_cache_discards_short_temp_blob(tmp_path):
+    cache = ExportArtifactCache(max_entries=10, max_bytes=1024, directory=str(tmp_path))
+    handle, tmp_blob = cache._open_tmp(tmp_path / "short.bin")
+    with handle:
+        handle.write(b"ab")
+
+    artifact = ExportArtifact(content=b"", media_type="application/zip")
+    assert cache._publish_blob("short", tmp_blob, artifact, 4) is False
+    assert list(tmp_path.iterdir()) == []
@@ -40,7 +40,7 @@ def test_chunk_pages_includes_page_and_chunk_trace_metadata():
 
 
 def test_ingest_pdf_prefers_uploaded_filename_as_source(monkeypatch):
-    monkeypatch.setattr(ingest_module, "load_pdf_pages", lambda _: ["example page"])
+    monkeypatch.setattr(ingest_module, "iter_pdf_pages", lambda _: iter(["example page"]))
 
     calls = {}
 
@@ -75,7 +75,7 @@ def test_ingest_pdf_prefers_uploaded_filename_as_source(monkeypatch):
 
 
 def test_ingest_pdf_normalizes_namespace_for_chunk_ids(monkeypatch):
-    monkeypatch.setattr(ingest_module, "load_pdf_pages", lambda _: ["example page"])
+    monkeypatch.setattr(ingest_module, "iter_pdf_pages", lambda _: iter(["example page"]))
     captured = {}
 
     def fake_upsert(namespace, ids, documents, metadatas=None):  # noqa: ARG001
@@ -92,3 +92,197 @@ def test_ingest_pdf_normalizes_namespace_for_chunk_ids(monkeypatch):
     assert result["namespace_normalized"] == "tenant_a_usaid_ads_201"
     assert captured["ids"]
     assert captured["ids"][0].startswith("tenant_a_usaid_ads_201_")
+
+
+def _write_pdf(path, pages):
+    import fitz
+
+    doc = fitz.open()
+    for text in pages:
+        page = doc.new_page()
+        page.insert_text((72, 72), text)
+    doc.save(str(path))
+    doc.close()
+
+
+def test_ingest_pdf_streams_pages_into_bounded_upsert_batches(monkeypatch):
+    monkeypatch.setattr(ingest_module, "iter_pdf_pages", lambda _: iter(["a" * 2500, "", "b" * 900]))
+    batches = []
+
+    def fake_upsert(namespace, ids, documents, metadatas=None):  # noqa: ARG001
+        batches.append(list(ids))
+
+    monkeypatch.setattr(ingest_module.vector_store, "upsert", fake_upsert)
+    monkeypatch.setattr(ingest_module.vector_store, "get_stats", lambda namespace: {"namespace": namespace})
+
+    result = ingest_module.ingest_pdf_to_namespace("/tmp/streamed.pdf", "usaid_ads201", batch_size=2)
+
+    assert [len(batch) for batch in batches] == [2, 2, 2]
+    assert batches[-1] == ["usaid_ads201_streamed_p3_c0", "usaid_ads201_streamed_p3_c1"]
+    assert result["chunks_ingested"] == 6
+    assert result["pages_processed"] == 3
+    assert result["upsert_batches"] == 3
+    assert result["chunks_per_second"] >= 0
+
+
+def test_ingest_folder_parallel_matches_sequential_ids_and_reports_progress(monkeypatch, tmp_path):
+    _write_pdf(tmp_path / "alpha.pdf", [f"Alpha page {i} outcome indicators" for i in range(5)])
+    _write_pdf(tmp_path / "beta.pdf", ["Beta baseline survey"])
+    _write_pdf(tmp_path / "gamma.pdf", [""])
+
+    upserts = []
+
+    def fake_upsert(namespace, ids, documents, metadatas=None):  # noqa: ARG001
+        upserts.append([(doc_id, meta["chunk"], meta["page"]) for doc_id, meta in zip(ids, metadatas or [])])
+
+    monkeypatch.setattr(ingest_module.vector_store, "upsert", fake_upsert)
+    monkeypatch.setattr(ingest_module.vector_store, "get_stats", lambda namespace: {"namespace": namespace})
+
+    sequential = ingest_module.ingest_folder_to_namespace(str(tmp_path), "usaid", workers=1, batch_size=3)
+    sequential_rows = [row for batch in upserts for row in batch]
+    upserts.clear()
+
+    reports = []
+    parallel = ingest_module.ingest_folder_to_namespace(
+        str(tmp_path), "usaid", workers=2, batch_size=3, page_window=2, progress=reports.append
+    )
+    parallel_rows = [row for batch in upserts for row in batch]
+
+    assert parallel_rows == sequential_rows
+    assert all(len(batch) <= 3 for batch in upserts)
+    assert [item["source"] for item in parallel] == ["alpha.pdf", "beta.pdf", "gamma.pdf"]
+    assert [item["chunks_ingested"] for item in parallel] == [item["chunks_ingested"] for item in sequential]
+    assert [item["pages_processed"] for item in parallel] == [5, 1, 1]
+    assert [(item["file_index"], item["file_total"]) for item in reports] == [(1, 3), (2, 3), (3, 3)]
+    assert sequential_rows[0] == ("usaid_alpha_p1_c0", 0, 1)
+
+
+def _memory_store(monkeypatch):
+    from grantflow.memory_bank.vector_store import VectorStore
+
+    monkeypatch.setenv("GRANTFLOW_FORCE_INMEM_VECTOR_STORE", "1")
+    store = VectorStore()
+    upserted = []
+    original_upsert = store.upsert
+
+    def tracking_upsert(namespace, ids, documents, metadatas=None):
+        upserted.extend(ids)
+        original_upsert(namespace=namespace, ids=ids, documents=documents, metadatas=metadatas)
+
+    store.upsert = tracking_upsert
+    monkeypatch.setattr(ingest_module, "vector_store", store)
+    return store, upserted
+
+
+def test_reingest_skips_unchanged_files_and_pages_and_deletes_removed_pages(monkeypatch, tmp_path):
+    store, upserted = _memory_store(monkeypatch)
+    original = tmp_path / "guidance.pdf"
+    _write_pdf(original, ["Page one results framework", "Page two indicators", "Page three annex"])
+
+    first = ingest_module.ingest_pdf_to_namespace(str(original), "usaid")
+    assert first["dedup"]["status"] == "new"
+    assert first["dedup"]["pages_added"] == 3
+    assert len(upserted) == 3
+
+    upserted.clear()
+    again = ingest_module.ingest_pdf_to_namespace(str(original), "usaid")
+    assert again["dedup"]["status"] == "unchanged"
+    assert again["chunks_ingested"] == 0
+    assert upserted == []
+
+    renamed = ingest_module.ingest_pdf_to_namespace(
+        str(original), "usaid", metadata={"uploaded_filename": "guidance-copy.pdf"}
+    )
+    assert renamed["dedup"]["status"] == "duplicate"
+    assert renamed["dedup"]["duplicate_of"] == "guidance.pdf"
+    assert upserted == []
+
+    revised = tmp_path / "revised" / "guidance.pdf"
+    revised.parent.mkdir()
+    _write_pdf(revised, ["Page one results framework", "Page two indicators, revised"])
+    updated = ingest_module.ingest_pdf_to_namespace(str(revised), "usaid")
+    dedup = updated["dedup"]
+    assert dedup["status"] == "updated"
+    assert (dedup["pages_unchanged"], dedup["pages_updated"], dedup["pages_removed"]) == (1, 1, 1)
+    assert (dedup["chunks_upserted"], dedup["chunks_skipped"], dedup["chunks_deleted"]) == (1, 1, 1)
+    assert dedup["chunks_metadata_refreshed"] == 1
+    assert upserted == ["usaid_guidance_p2_c0"]
+
+    remaining = store.get("usaid", where={"source": "guidance.pdf"})
+    assert sorted(remaining["ids"]) == ["usaid_guidance_p1_c0", "usaid_guidance_p2_c0"]
+    assert {meta["file_sha256"] for meta in remaining["metadatas"]} == {dedup["file_sha256"]}
+    assert store.get_stats("usaid")["document_count"] == 2
+    assert store.query("usaid", "anything", top_k=5)
+
+
+def test_reingest_finishes_a_file_whose_previous_ingest_failed_after_a_flush(monkeypatch, tmp_path):
+    store, upserted = _memory_store(monkeypatch)
+    path = tmp_path / "guidance.pdf"
+    _write_pdf(path, ["Page one results framework", "Page two indicators", "Page three annex"])
+    flushing_upsert = store.upsert
+
+    def failing_upsert(namespace, ids, documents, metadatas=None):
+        if upserted:
+            raise RuntimeError("vector store unavailable")
+        flushing_upsert(namespace, ids, documents, metadatas)
+
+    store.upsert = failing_upsert
+    with pytest.raises(RuntimeError, match="vector store unavailable"):
+        ingest_module.ingest_pdf_to_namespace(str(path), "usaid", batch_size=1)
+    assert store.get("usaid", where={"source": "guidance.pdf"})["ids"] == ["usaid_guidance_p1_c0"]
+
+    store.upsert = flushing_upsert
+    upserted.clear()
+    resumed = ingest_module.ingest_pdf_to_namespace(str(path), "usaid", batch_size=1)
+    assert resumed["dedup"]["status"] == "updated"
+    assert resumed["dedup"]["chunks_skipped"] == 1
+    assert upserted == ["usaid_guidance_p2_c0", "usaid_guidance_p3_c0"]
+    assert store.get_stats("usaid")["document_count"] == 3
+
+    upserted.clear()
+    again = ingest_module.ingest_pdf_to_namespace(str(path), "usaid", batch_size=1)
+    assert again["dedup"]["status"] == "unchanged"
+    assert upserted == []
+
+
+def test_parallel_folder_reingest_skips_unchanged_files(monkeypatch, tmp_path):
+    _store, upserted = _memory_store(monkeypatch)
+    _write_pdf(tmp_path / "alpha.pdf", [f"Alpha page {i}" for i in range(3)])
+    _write_pdf(tmp_path / "beta.pdf", ["Beta page"])
+
+    first = ingest_module.ingest_folder_to_namespace(str(tmp_path), "eu", workers=2, page_window=1)
+    assert [item["dedup"]["status"] for item in first] == ["new", "new"]
+    assert len(upserted) == 4
+
+    upserted.clear()
+    _write_pdf(tmp_path / "beta.pdf", ["Beta page", "Beta appendix"])
+    second = ingest_module.ingest_folder_to_namespace(str(tmp_path), "eu", workers=2, page_window=1)
+    assert [item["dedup"]["status"] for item in second] == ["unchanged", "updated"]
+    assert second[0]["pages_processed"] == 0
+    assert second[1]["dedup"]["pages_added"] == 1
+    assert upserted == ["eu_beta_p2_c0"]
+
+
+def test_ingest_route_records_dedup_outcome_in_audit(monkeypatch, tmp_path):
+    from fastapi.testclient import TestClient
+
+    import grantflow.api.app as api_app_module
+
+    _memory_store(monkeypatch)
+    monkeypatch.setattr(api_app_module, "ingest_pdf_to_namespace", ingest_module.ingest_pdf_to_namespace)
+    api_app_module.INGEST_AUDIT_STORE.clear()
+    pdf_path = tmp_path / "ads.pdf"
+    _write_pdf(pdf_path, ["ADS 201 guidance"])
+    client = TestClient(api_app_module.app)
+
+    for _ in range(2):
+        response = client.post(
+            "/ingest",
+            data={"donor_id": "usaid"},
+            files={"file": ("ads.pdf", pdf_path.read_bytes(), "application/pdf")},
+        )
+        assert response.status_code == 200
+
+    recent = client.get("/ingest/recent", params={"donor_id": "usaid"}).json()["records"]
+    assert [row["result"]["dedup"]["status"] for row in recent] == ["unchanged", "new"]
+    assert recent[1]["result"]["chunks_ingested"] == 1
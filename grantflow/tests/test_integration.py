@@ -5,6 +5,7 @@ import gzip
 import io
 import json
 import time
+import uuid
 import zipfile
 from pathlib import Path
 
@@ -2052,6 +2053,70 @@ def test_generate_from_preset_batch_stops_when_continue_on_error_false():
     assert results[1]["status"] == "error"
 
 
+def test_generate_from_preset_batch_returns_handle_with_aggregate_status():
+    item = {
+        "preset_type": "legacy",
+        "llm_mode": False,
+        "hitl_enabled": False,
+        "architect_rag_enabled": False,
+        "strict_preflight": False,
+    }
+    response = client.post(
+        "/generate/from-preset/batch",
+        json={
+            "items": [
+                {**item, "preset_key": "usaid_gov_ai_kazakhstan"},
+                {**item, "preset_key": "usaid_gov_ai_kazakhstan", "input_context_patch": {"country": "Kyrgyzstan"}},
+                {**item, "preset_key": "rbm-eu-youth-employment-jordan", "preset_type": "rbm"},
+            ],
+        },
+    )
+    assert response.status_code == 200
+    body = response.json()
+    batch_id = body["batch_id"]
+    assert body["accepted_count"] == 3
+    assert [row["index"] for row in body["results"]] == [0, 1, 2]
+    assert body["warmup"]["groups"] == 2
+    for row in body["results"]:
+        assert _wait_for_terminal_status(row["job_id"])["status"] == "done"
+
+    status = client.get(f"/generate/batches/{batch_id}")
+    assert status.status_code == 200
+    summary = status.json()
+    assert summary["total"] == 3
+    assert summary["job_count"] == 3
+    assert summary["complete"] is True
+    assert summary["progress"] == 1.0
+    assert summary["status_counts"] == {"done": 3}
+    assert [row["index"] for row in summary["jobs"]] == [0, 1, 2]
+    assert {row["job_id"] for row in summary["jobs"]} == {row["job_id"] for row in body["results"]}
+    assert client.get("/generate/batches/missing-batch").status_code == 404
+
+
+def test_generate_batch_status_is_a_read_endpoint(monkeypatch):
+    monkeypatch.setenv("GRANTFLOW_API_KEY", "test-secret")
+    monkeypatch.delenv("GRANTFLOW_REQUIRE_AUTH_FOR_READS", raising=False)
+    assert client.get("/generate/batches/missing-batch").status_code == 404
+
+    monkeypatch.setenv("GRANTFLOW_REQUIRE_AUTH_FOR_READS", "true")
+    assert client.get("/generate/batches/missing-batch").status_code == 401
+    assert client.get("/generate/batches/missing-batch", headers={"X-API-Key": "test-secret"}).status_code == 404
+
+
+def test_generate_batch_dispatch_order_round_robins_groups():
+    from grantflow.api.batch_service import _fair_dispatch_order
+
+    prepared = [
+        {"index": 0, "group": ("usaid", "usaid_ads201")},
+        {"index": 1, "group": ("usaid", "usaid_ads201")},
+        {"index": 2, "group": ("usaid", "usaid_ads201")},
+        {"index": 3, "group": ("eu", "eu_intpa")},
+        {"index": 4, "group": ("worldbank", "worldbank_ads301")},
+        {"index": 5, "group": ("eu", "eu_intpa")},
+    ]
+    assert [row["index"] for row in _fair_dispatch_order(prepared)] == [0, 3, 4, 1, 5, 2]
+
+
 def test_generate_preflight_reports_high_risk_when_namespace_empty():
     api_app_module.INGEST_AUDIT_STORE.clear()
 
@@ -3444,22 +3509,33 @@ def test_export_endpoint_blocks_production_export_when_contract_policy_strict_an
 def test_export_endpoint_blocks_production_xlsx_when_primary_headers_missing(monkeypatch):
     from openpyxl import Workbook
 
+    from grantflow.exporters.excel_builder import XlsxBuild, XlsxBuildManifest, XlsxSheetManifest
+
     monkeypatch.setattr(api_app_module.config.graph, "export_contract_policy_mode", "strict")
 
-    def _stub_build_xlsx_from_logframe(*_args, **_kwargs):
+    def _stub_build_xlsx_with_manifest(*_args, **_kwargs):
         wb = Workbook()
         ws = wb.active
         ws.title = "LogFrame"
-        ws.append(["Indicator ID", "Name", "Justification", "Citation", "Baseline", "Target"])
+        logframe_headers = ("Indicator ID", "Name", "Justification", "Citation", "Baseline", "Target")
+        usaid_headers = ("DO ID", "DO Description")
+        ws.append(list(logframe_headers))
         usaid_sheet = wb.create_sheet("USAID_RF")
-        usaid_sheet.append(["DO ID", "DO Description"])
+        usaid_sheet.append(list(usaid_headers))
         wb.create_sheet("Template Meta")
         bio = io.BytesIO()
         wb.save(bio)
         bio.seek(0)
-        return bio.read()
+        manifest = XlsxBuildManifest(
+            sheets=(
+                XlsxSheetManifest(name="LogFrame", headers=logframe_headers, row_count=1),
+                XlsxSheetManifest(name="USAID_RF", headers=usaid_headers, row_count=1),
+                XlsxSheetManifest(name="Template Meta", headers=(), row_count=1),
+            )
+        )
+        return XlsxBuild(content=bio.read(), manifest=manifest)
 
-    monkeypatch.setattr(api_app_module, "build_xlsx_from_logframe", _stub_build_xlsx_from_logframe)
+    monkeypatch.setattr(api_app_module, "build_xlsx_with_manifest", _stub_build_xlsx_with_manifest)
 
     payload = {
         "state": {
@@ -13800,6 +13876,57 @@ def test_generate_uses_redis_queue_dispatch_when_enabled(monkeypatch):
     assert status_resp.json()["status"] == "accepted"
 
 
+def test_generate_uses_job_id_dispatch_for_process_pool_runner(monkeypatch):
+    captured: dict = {}
+
+    def _submit_stub(fn, *args, **kwargs):
+        captured["fn"] = fn
+        captured["args"] = args
+        return True
+
+    monkeypatch.setattr(api_app_module.config.job_runner, "mode", "process_pool")
+    monkeypatch.setattr(api_app_module.JOB_RUNNER, "submit", _submit_stub)
+
+    response = client.post(
+        "/generate",
+        json={
+            "donor_id": "usaid",
+            "input_context": {"project": "Process pool dispatch", "country": "Kenya"},
+            "llm_mode": False,
+            "hitl_enabled": False,
+        },
+    )
+    assert response.status_code == 200
+    job_id = response.json()["job_id"]
+    assert captured["fn"] == api_app_module._run_pipeline_to_completion_by_job_id
+    assert captured["args"] == (job_id,)
+    assert api_app_module._uses_queue_runner() is True
+
+
+def test_process_pool_runner_requires_sqlite_stores_and_marks_crashed_jobs(monkeypatch):
+    from grantflow.api.runtime_service import _settle_process_pool_task, _validate_job_runner_store_alignment
+
+    monkeypatch.setattr(api_app_module.config.job_runner, "mode", "process_pool")
+    with pytest.raises(RuntimeError, match="process_pool requires shared persistent stores"):
+        _validate_job_runner_store_alignment()
+
+    job_id = "process-pool-crash-job"
+    api_app_module._set_job(job_id, {"status": "running", "state": {"donor_id": "usaid"}, "hitl_enabled": False})
+    _settle_process_pool_task(
+        {"job_id": job_id, "task_name": "grantflow.api.pipeline_jobs:_run_pipeline_to_completion_by_job_id"},
+        RuntimeError("worker died"),
+        True,
+    )
+    job = api_app_module._get_job(job_id)
+    assert job["status"] == "error"
+    assert "crashed" in job["error"]
+    assert job["state"]["donor_id"] == "usaid"
+    assert any(event.get("type") == "job_runner_worker_crashed" for event in job["job_events"])
+
+    _settle_process_pool_task({"job_id": job_id}, RuntimeError("late duplicate"), True)
+    assert "worker died" in api_app_module._get_job(job_id)["error"]
+
+
 def test_generate_hitl_uses_redis_queue_dispatch_by_job_id(monkeypatch):
     captured: dict = {}
 
@@ -14143,6 +14270,353 @@ def test_export_both_zip():
     assert b"PK" == export.content[:2]
 
 
+def test_export_reuses_cached_artifact_and_honors_if_none_match(monkeypatch):
+    build_calls: list[str] = []
+    original_build_docx = api_app_module.build_docx_from_toc
+
+    def counting_build_docx(*args, **kwargs):
+        build_calls.append("docx")
+        return original_build_docx(*args, **kwargs)
+
+    monkeypatch.setattr(api_app_module, "build_docx_from_toc", counting_build_docx)
+    payload = {
+        "donor_id": "usaid",
+        "toc_draft": {"toc": {"project_goal": "Improve water access", "development_objectives": []}},
+        "review_comments": [{"comment_id": "c1", "section": "toc", "status": "open", "message": "Tighten goal"}],
+    }
+
+    first = client.post("/export", json={"payload": payload, "format": "docx"})
+    assert first.status_code == 200
+    assert first.headers["x-grantflow-export-cache"] == "miss"
+    etag = first.headers["etag"]
+
+    second = client.post("/export", json={"payload": payload, "format": "docx"})
+    assert second.status_code == 200
+    assert second.headers["x-grantflow-export-cache"] == "hit"
+    assert second.headers["etag"] == etag
+    assert second.content == first.content
+    assert second.headers["x-grantflow-export-contract-status"] == first.headers["x-grantflow-export-contract-status"]
+
+    not_modified = client.post("/export", json={"payload": payload, "format": "docx"}, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert build_calls == ["docx"]
+
+    resolved_payload = {**payload, "review_comments": [{**payload["review_comments"][0], "status": "resolved"}]}
+    changed = client.post(
+        "/export", json={"payload": resolved_payload, "format": "docx"}, headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["x-grantflow-export-cache"] == "miss"
+    assert changed.headers["etag"] != etag
+    with_diagnostics = client.post("/export", json={"payload": payload, "format": "docx", "include_diagnostics": True})
+    assert with_diagnostics.headers["etag"] not in {etag, changed.headers["etag"]}
+    assert build_calls == ["docx", "docx", "docx"]
+
+
+def test_prerendered_export_bundle_serves_first_download_from_cache(monkeypatch, tmp_path):
+    import grantflow.api.routes.exports as exports_module
+    from grantflow.exporters.artifact_cache import ExportArtifactCache
+
+    export_artifact_cache = ExportArtifactCache(directory=str(tmp_path))
+    monkeypatch.setattr(exports_module, "export_artifact_cache", export_artifact_cache)
+    monkeypatch.setenv("GRANTFLOW_PRERENDER_EXPORTS", "true")
+    gen = client.post(
+        "/generate",
+        json={
+            "donor_id": "usaid",
+            "input_context": {"project": "Health", "country": "Kenya"},
+            "llm_mode": False,
+            "hitl_enabled": False,
+        },
+    )
+    job_id = gen.json()["job_id"]
+    assert _wait_for_terminal_status(job_id)["status"] == "done"
+    for _ in range(50):
+        if export_artifact_cache.stats()["entries"]:
+            break
+        time.sleep(0.05)
+
+    export_payload = client.get(f"/status/{job_id}/export-payload").json()
+    export = client.post("/export", json={"payload": export_payload["payload"], "format": "both"})
+    assert export.status_code == 200
+    assert export.headers["x-grantflow-export-cache"] == "hit"
+    with zipfile.ZipFile(io.BytesIO(export.content)) as archive:
+        assert {"proposal.docx", "mel.xlsx"} <= set(archive.namelist())
+
+
+def test_export_prerender_skips_process_local_cache_and_reads_job_without_writing(monkeypatch):
+    import grantflow.api.routes.exports as exports_module
+    from grantflow.api.pipeline_jobs import _prerender_job_exports
+    from grantflow.exporters.artifact_cache import ExportArtifactCache
+
+    memory_cache = ExportArtifactCache()
+    monkeypatch.setattr(exports_module, "export_artifact_cache", memory_cache)
+    monkeypatch.setenv("GRANTFLOW_PRERENDER_EXPORTS", "true")
+    gen = client.post(
+        "/generate",
+        json={
+            "donor_id": "usaid",
+            "input_context": {"project": "Health", "country": "Kenya"},
+            "llm_mode": False,
+            "hitl_enabled": False,
+        },
+    )
+    job_id = gen.json()["job_id"]
+    assert _wait_for_terminal_status(job_id)["status"] == "done"
+    _prerender_job_exports(job_id)
+    assert memory_cache.stats()["entries"] == 0
+
+    job = api_app_module.JOB_STORE.get(job_id)
+    state = dict(job["state"])
+    state["critic_notes"] = {"fatal_flaws": [{"code": "GAP", "severity": "high", "message": "Missing baseline"}]}
+    state["critic_fatal_flaws"] = list(state["critic_notes"]["fatal_flaws"])
+    api_app_module.JOB_STORE.update(job_id, state=state)
+    _, revision = api_app_module.JOB_STORE.get_with_revision(job_id)
+
+    req = exports_module._job_export_request(job_id, read_only=True)
+    assert req is not None
+    assert api_app_module.JOB_STORE.get_with_revision(job_id)[1] == revision
+    exports_module._job_export_request(job_id)
+    assert api_app_module.JOB_STORE.get_with_revision(job_id)[1] == revision + 1
+
+
+def test_update_job_returns_state_shaped_like_a_read():
+    job_id = "update-shape-job"
+    api_app_module._set_job(job_id, {"status": "done", "state": {"donor_id": "usaid", "input_context": {"a": 1}}})
+
+    returned = api_app_module._update_job(job_id, state={"donor_id": "usaid", "input_context": {"a": 2}})
+    stored = api_app_module.JOB_STORE.get(job_id)
+
+    assert set(returned["state"]) == set(stored["state"])
+    assert returned["state"]["input"] == stored["state"]["input"] == {"a": 2}
+
+
+def test_set_job_retry_reapplies_transition_over_concurrent_write(monkeypatch):
+    from grantflow.core.stores import JobRevisionConflict
+
+    store = api_app_module.JOB_STORE
+    job_id = "set-job-race"
+    api_app_module._set_job(job_id, {"status": "accepted", "state": {"donor_id": "usaid"}})
+    real_set = store.set
+    raced: list[str] = []
+
+    def _racing_set(target_id, payload, **kwargs):
+        if not raced:
+            raced.append(target_id)
+            store.update(target_id, review_comments=[{"comment_id": "c-1", "message": "Check budget"}])
+        return real_set(target_id, payload, **kwargs)
+
+    monkeypatch.setattr(store, "set", _racing_set)
+    api_app_module._set_job(job_id, {"status": "running", "state": {"donor_id": "usaid"}})
+
+    job = store.get(job_id)
+    assert job["status"] == "running"
+    assert [row["comment_id"] for row in job["review_comments"]] == ["c-1"]
+    assert [row["to_status"] for row in job["job_events"] if row.get("type") == "status_changed"] == [
+        "accepted",
+        "running",
+    ]
+
+    _, revision = store.get_with_revision(job_id)
+    store.update(job_id, client_metadata={"note": "moved"})
+    with pytest.raises(JobRevisionConflict):
+        api_app_module._set_job(job_id, {"status": "done"}, expected_revision=revision)
+    assert store.get(job_id)["status"] == "running"
+
+
+def test_record_job_event_lands_while_job_keeps_changing(monkeypatch):
+    store = api_app_module.JOB_STORE
+    job_id = "event-race"
+    api_app_module._set_job(job_id, {"status": "running", "state": {"donor_id": "usaid"}})
+    real_get_index = store.get_index
+
+    def _racing_get_index(target_id):
+        row = real_get_index(target_id)
+        store.update(target_id, client_metadata={"touched": True})
+        return row
+
+    monkeypatch.setattr(store, "get_index", _racing_get_index)
+    api_app_module._record_job_event(job_id, "review_note_added", request_id="rid-1")
+    api_app_module._record_job_event(job_id, "review_note_added", request_id="rid-1")
+
+    job = store.get(job_id)
+    assert job["client_metadata"] == {"touched": True}
+    assert [row["type"] for row in job["job_events"]].count("review_note_added") == 1
+
+
+def _generate_done_jobs_for_tenant(tenant_id: str, count: int) -> list[str]:
+    job_ids = []
+    for idx in range(count):
+        gen = client.post(
+            "/generate",
+            json={
+                "donor_id": "usaid",
+                "tenant_id": tenant_id,
+                "input_context": {"project": f"Water {idx}", "country": "Kenya"},
+                "llm_mode": False,
+                "hitl_enabled": False,
+            },
+        )
+        job_id = gen.json()["job_id"]
+        assert _wait_for_terminal_status(job_id)["status"] == "done"
+        job_ids.append(job_id)
+    return job_ids
+
+
+def test_portfolio_export_bundle_renders_filtered_jobs_and_reuses_cached_exports(monkeypatch, tmp_path):
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_EXPORT_DIR", str(tmp_path))
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_EXPORT_WORKERS", "0")
+    tenant_id = f"bundle-{uuid.uuid4().hex[:8]}"
+    job_ids = _generate_done_jobs_for_tenant(tenant_id, 2)
+
+    # An earlier download of the first job's default bundle is reused instead of re-rendered.
+    export_payload = client.get(f"/status/{job_ids[0]}/export-payload").json()
+    assert client.post("/export", json={"payload": export_payload["payload"], "format": "both"}).status_code == 200
+
+    created = client.post("/portfolio/export/bundle", json={"tenant_id": tenant_id, "donor_id": "usaid"})
+    assert created.status_code == 200
+    bundle_id = created.json()["bundle_id"]
+    assert created.json()["total"] == 2
+
+    status = client.get(f"/portfolio/export/bundle/{bundle_id}")
+    assert status.status_code == 200
+    body = status.json()
+    assert body["status"] == "done"
+    assert body["progress"] == 1.0
+    assert body["exported_count"] == 2
+    assert body["cached_document_count"] == 2
+    assert body["rendered_document_count"] == 2
+    assert body["download_url"] == f"/portfolio/export/bundle/{bundle_id}/download"
+    rows = {row["job_id"]: row for row in body["jobs"]}
+    assert rows[job_ids[0]]["cached_document_count"] == 2
+    assert rows[job_ids[1]]["documents"] == ["mel.xlsx", "proposal.docx"]
+
+    download = client.get(body["download_url"])
+    assert download.status_code == 200
+    assert download.headers["content-type"] == "application/zip"
+    assert f"grantflow_portfolio_bundle_{bundle_id}.zip" in download.headers["content-disposition"]
+    with zipfile.ZipFile(io.BytesIO(download.content)) as archive:
+        names = set(archive.namelist())
+        manifest = json.loads(archive.read("manifest.json"))
+    for job_id in job_ids:
+        assert {f"usaid/{job_id}/proposal.docx", f"usaid/{job_id}/mel.xlsx"} <= names
+    assert manifest["bundle_id"] == bundle_id
+    assert manifest["exported_count"] == 2
+
+    # Documents rendered for the bundle are cached under their per-format /export keys.
+    second_payload = client.get(f"/status/{job_ids[1]}/export-payload").json()
+    docx = client.post("/export", json={"payload": second_payload["payload"], "format": "docx"})
+    assert docx.headers["x-grantflow-export-cache"] == "hit"
+
+
+def test_portfolio_export_bundle_renders_in_process_pool(monkeypatch, tmp_path):
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_EXPORT_DIR", str(tmp_path))
+    import grantflow.api.portfolio_export_service as portfolio_export_service
+
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_EXPORT_WORKERS", "1")
+    pool = portfolio_export_service.PortfolioRenderPool()
+    monkeypatch.setattr(portfolio_export_service, "portfolio_render_pool", pool)
+    tenant_id = f"bundle-{uuid.uuid4().hex[:8]}"
+    (job_id,) = _generate_done_jobs_for_tenant(tenant_id, 1)
+
+    try:
+        created = client.post("/portfolio/export/bundle", json={"tenant_id": tenant_id, "format": "xlsx"})
+        assert created.status_code == 200
+        first_executor = pool._executor
+        again = client.post("/portfolio/export/bundle", json={"tenant_id": tenant_id, "format": "xlsx"})
+        assert again.status_code == 200
+        # Both bundles rendered on the same process-wide pool.
+        assert pool._executor is first_executor and pool.max_workers == 1
+    finally:
+        pool.shutdown()
+    body = client.get(f"/portfolio/export/bundle/{created.json()['bundle_id']}").json()
+    assert body["status"] == "done"
+    assert body["rendered_document_count"] == 1
+
+    download = client.get(body["download_url"])
+    with zipfile.ZipFile(io.BytesIO(download.content)) as archive:
+        assert set(archive.namelist()) == {f"usaid/{job_id}/mel.xlsx", "manifest.json"}
+
+
+def test_portfolio_export_bundle_reads_jobs_without_writing_and_writes_rows_once(monkeypatch, tmp_path):
+    import grantflow.api.portfolio_export_service as portfolio_export_service
+
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_EXPORT_DIR", str(tmp_path))
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_EXPORT_WORKERS", "0")
+    tenant_id = f"bundle-{uuid.uuid4().hex[:8]}"
+    job_ids = _generate_done_jobs_for_tenant(tenant_id, 3)
+    store = api_app_module.JOB_STORE
+    revisions = {job_id: store.get_with_revision(job_id)[1] for job_id in job_ids}
+    writes: list[dict] = []
+    real_write = portfolio_export_service._write_bundle_status
+
+    def _recording_write(bundle, *, include_jobs=True):
+        writes.append({"status": bundle["status"], "processed": bundle["processed_count"], "jobs": include_jobs})
+        real_write(bundle, include_jobs=include_jobs)
+
+    monkeypatch.setattr(portfolio_export_service, "_write_bundle_status", _recording_write)
+    created = client.post("/portfolio/export/bundle", json={"tenant_id": tenant_id, "format": "xlsx"})
+    assert created.status_code == 200
+
+    assert {job_id: store.get_with_revision(job_id)[1] for job_id in job_ids} == revisions
+    progress = [row for row in writes if row["status"] == "running" and row["processed"]]
+    assert [row["processed"] for row in progress] == [1, 2, 3]
+    assert not any(row["jobs"] for row in progress)
+    assert writes[-1] == {"status": "done", "processed": 3, "jobs": True}
+    body = client.get(f"/portfolio/export/bundle/{created.json()['bundle_id']}").json()
+    assert body["exported_count"] == 3
+    assert sorted(row["job_id"] for row in body["jobs"]) == sorted(job_ids)
+
+
+def test_portfolio_export_bundle_prunes_expired_and_excess_finished_bundles(monkeypatch, tmp_path):
+    import os
+
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_EXPORT_DIR", str(tmp_path))
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_EXPORT_WORKERS", "0")
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_EXPORT_TTL_SECONDS", "3600")
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_EXPORT_MAX_BUNDLES", "1")
+    now = time.time()
+
+    def _old_bundle(status: str, age_seconds: float) -> str:
+        bundle_id = str(uuid.uuid4())
+        status_path = tmp_path / f"{bundle_id}.json"
+        status_path.write_text(json.dumps({"bundle_id": bundle_id, "status": status}), encoding="utf-8")
+        (tmp_path / f"{bundle_id}.zip").write_bytes(b"PK")
+        os.utime(status_path, (now - age_seconds, now - age_seconds))
+        return bundle_id
+
+    expired = _old_bundle("done", 7200)
+    stuck = _old_bundle("running", 7200)
+    oldest_done = _old_bundle("done", 300)
+    kept_done = _old_bundle("error", 200)
+    running = _old_bundle("running", 100)
+    (tmp_path / "notes.json").write_text("{}", encoding="utf-8")
+    os.utime(tmp_path / "notes.json", (now - 7200, now - 7200))
+
+    tenant_id = f"bundle-{uuid.uuid4().hex[:8]}"
+    _generate_done_jobs_for_tenant(tenant_id, 1)
+    created = client.post("/portfolio/export/bundle", json={"tenant_id": tenant_id, "format": "xlsx"})
+    assert created.status_code == 200
+
+    remaining = {path.name for path in tmp_path.iterdir()}
+    for bundle_id in (expired, stuck, oldest_done):
+        assert f"{bundle_id}.json" not in remaining and f"{bundle_id}.zip" not in remaining
+    for bundle_id in (kept_done, running):
+        assert {f"{bundle_id}.json", f"{bundle_id}.zip"} <= remaining
+    assert "notes.json" in remaining
+    assert f"{created.json()['bundle_id']}.zip" in remaining
+
+
+def test_portfolio_export_bundle_rejects_empty_selection_and_unknown_ids(monkeypatch, tmp_path):
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_EXPORT_DIR", str(tmp_path))
+    empty = client.post("/portfolio/export/bundle", json={"tenant_id": f"bundle-{uuid.uuid4().hex[:8]}"})
+    assert empty.status_code == 400
+    assert client.post("/portfolio/export/bundle", json={"format": "pdf"}).status_code == 422
+    assert client.get("/portfolio/export/bundle/not-a-bundle").status_code == 404
+    assert client.get(f"/portfolio/export/bundle/{uuid.uuid4()}/download").status_code == 404
+
+
 def test_export_both_zip_includes_evaluation_rfq_annex_packer_artifacts():
     toc_draft = {
         "proposal_mode": "evaluation_rfq",
@@ -15020,3 +15494,118 @@ def test_hitl_approve_records_audit_event_and_exposes_in_history():
     assert latest["feedback"] == "approved by reviewer"
     assert latest["actor"] == "reviewer_a"
     assert latest["request_id"] == "rid-hitl-audit-1"
+
+
+def test_review_comment_append_recomputes_after_concurrent_job_write(monkeypatch):
+    import grantflow.api.review_mutations as review_mutations_module
+
+    job_id = "review-comment-revision-race-1"
+    api_app_module.JOB_STORE.set(job_id, {"status": "done", "state": {}, "review_comments": []})
+    real_get_with_revision = review_mutations_module._get_job_with_revision
+    calls = {"count": 0}
+
+    def _racing_get_with_revision(target_job_id):
+        job, revision = real_get_with_revision(target_job_id)
+        calls["count"] += 1
+        if calls["count"] == 1:
+            api_app_module.JOB_STORE.update(
+                target_job_id,
+                review_comments=[{"comment_id": "concurrent-1", "section": "general", "message": "Other reviewer"}],
+            )
+        return job, revision
+
+    monkeypatch.setattr(review_mutations_module, "_get_job_with_revision", _racing_get_with_revision)
+    created = review_mutations_module._append_review_comment(job_id, section="toc", message="Tighten outcomes")
+
+    assert calls["count"] == 2
+    comments = (api_app_module.JOB_STORE.get(job_id) or {}).get("review_comments") or []
+    assert [c.get("comment_id") for c in comments] == ["concurrent-1", created["comment_id"]]
+    events = [e.get("type") for e in (api_app_module.JOB_STORE.get(job_id) or {}).get("job_events") or []]
+    assert events.count("review_comment_added") == 1
+
+
+def test_review_comment_append_returns_409_when_job_keeps_changing(monkeypatch):
+    from fastapi import HTTPException
+
+    import grantflow.api.job_store_service as job_store_service_module
+    import grantflow.api.review_mutations as review_mutations_module
+
+    job_id = "review-comment-revision-race-2"
+    api_app_module.JOB_STORE.set(job_id, {"status": "done", "state": {}, "review_comments": []})
+    real_get_with_revision = review_mutations_module._get_job_with_revision
+
+    def _always_stale(target_job_id):
+        job, revision = real_get_with_revision(target_job_id)
+        api_app_module.JOB_STORE.update(target_job_id, client_metadata={"touched_at": time.time()})
+        return job, revision
+
+    monkeypatch.setattr(review_mutations_module, "_get_job_with_revision", _always_stale)
+    monkeypatch.setattr(job_store_service_module, "JOB_REVISION_RETRY_ATTEMPTS", 3)
+    monkeypatch.setattr(job_store_service_module.time, "sleep", lambda _seconds: None)
+    with pytest.raises(HTTPException) as exc_info:
+        review_mutations_module._append_review_comment(job_id, section="toc", message="Never lands")
+
+    assert exc_info.value.status_code == 409
+    assert (api_app_module.JOB_STORE.get(job_id) or {}).get("review_comments") == []
+
+
+def test_status_long_poll_returns_when_job_changes():
+    import threading
+
+    job_id = "status-long-poll-1"
+    api_app_module.JOB_STORE.set(job_id, {"status": "running", "state": {}})
+    first = client.get(f"/status/{job_id}")
+    assert first.status_code == 200
+    revision = int(first.headers["X-Job-Revision"])
+
+    timed_out = client.get(f"/status/{job_id}", params={"wait_for_change": revision, "timeout": 0.2})
+    assert timed_out.status_code == 200
+    assert timed_out.headers["X-Job-Revision"] == str(revision)
+    assert timed_out.json()["status"] == "running"
+
+    timer = threading.Timer(0.3, lambda: api_app_module._update_job(job_id, status="done"))
+    timer.start()
+    started = time.monotonic()
+    changed = client.get(f"/status/{job_id}", params={"wait_for_change": revision, "timeout": 20})
+    timer.join()
+    assert changed.status_code == 200
+    assert changed.json()["status"] == "done"
+    assert int(changed.headers["X-Job-Revision"]) > revision
+    assert time.monotonic() - started < 10
+
+    stale = client.get(f"/status/{job_id}", params={"wait_for_change": revision, "timeout": 20})
+    assert stale.json()["status"] == "done"
+
+
+def test_status_stream_emits_events_until_terminal_status():
+    import threading
+
+    job_id = "status-stream-1"
+    api_app_module.JOB_STORE.set(job_id, {"status": "running", "state": {}})
+
+    def _advance():
+        api_app_module._update_job(job_id, status="pending_hitl")
+        time.sleep(0.1)
+        api_app_module._update_job(job_id, status="done")
+
+    timer = threading.Timer(0.3, _advance)
+    timer.start()
+    with client.stream("GET", f"/status/{job_id}/stream") as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = "".join(response.iter_text())
+    timer.join()
+
+    events = [block for block in body.split("\n\n") if block.startswith("id: ")]
+    statuses = [json.loads(block.split("data: ", 1)[1])["status"] for block in events]
+    assert statuses[0] == "running"
+    assert statuses[-1] == "done"
+    revisions = [int(block.split("\n", 1)[0][4:]) for block in events]
+    assert revisions == sorted(revisions)
+
+    with client.stream("GET", f"/status/{job_id}/stream", headers={"Last-Event-ID": str(revisions[-1])}) as response:
+        resumed = "".join(response.iter_text())
+    assert "event: status" not in resumed
+
+    missing = client.get("/status/missing-stream-job/stream")
+    assert missing.status_code == 404
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+
+from grantflow.core.job_changes import JobChangeNotifier, RedisJobChangeBridge
+
+
+class _FakePubSub:
+    def __init__(self, channel_queue: "queue.Queue[bytes]") -> None:
+        self._queue = channel_queue
+
+    def subscribe(self, _channel: str) -> None:
+        return None
+
+    def get_message(self, timeout: float = 0.0):
+        try:
+            data = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        return {"type": "message", "data": data}
+
+    def close(self) -> None:
+        return None
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.channel_queue: "queue.Queue[bytes]" = queue.Queue()
+
+    def publish(self, _channel: str, message: str) -> int:
+        self.channel_queue.put(message.encode("utf-8"))
+        return 1
+
+    def pubsub(self, ignore_subscribe_messages: bool = True) -> _FakePubSub:
+        return _FakePubSub(self.channel_queue)
+
+
+def test_job_change_subscription_keeps_signal_raised_before_wait():
+    notifier = JobChangeNotifier(recheck_seconds=5.0)
+
+    async def _run():
+        with notifier.subscribe("job-1") as subscription:
+            threading.Thread(target=notifier.publish, args=("job-1",)).start()
+            await asyncio.sleep(0.05)
+            assert await subscription.wait(1.0) is True
+            assert await subscription.wait(0.05) is False
+            notifier.publish("job-2")
+            assert await subscription.wait(0.05) is False
+        assert notifier.stats()["waiting_count"] == 0
+
+    asyncio.run(_run())
+
+
+def test_redis_job_change_bridge_relays_foreign_signals_only():
+    fake = _FakeRedis()
+    api_bridge = RedisJobChangeBridge(redis_url="redis://fake", redis_client_factory=lambda _url: fake)
+    worker_bridge = RedisJobChangeBridge(redis_url="redis://fake", redis_client_factory=lambda _url: fake)
+    received: list[str] = []
+    api_bridge.start(received.append)
+    try:
+        api_bridge.publish("own-job")
+        worker_bridge.publish("worker-job")
+        deadline = time.monotonic() + 5.0
+        while not received and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        api_bridge.stop()
+
+    assert received == ["worker-job"]
+    stats = api_bridge.stats()
+    assert stats["published_count"] == 1
+    assert stats["received_count"] == 1
+    assert stats["listening"] is False
@@ -1,8 +1,13 @@
 import json
+import os
 import threading
 import time
+from pathlib import Path
 
-from grantflow.core.job_runner import InMemoryJobRunner, RedisJobRunner
+import pytest
+
+from grantflow.core import job_runner as job_runner_module
+from grantflow.core.job_runner import InMemoryJobRunner, ProcessPoolJobRunner, RedisJobRunner
 
 _REDIS_TEST_OBSERVED: list[int] = []
 _REDIS_OBSERVED_LOCK = threading.Lock()
@@ -13,6 +18,23 @@ def _redis_test_task(value: int) -> None:
         _REDIS_TEST_OBSERVED.append(int(value))
 
 
+def _process_pool_record_pid(output_path: str, value: int) -> None:
+    with open(output_path, "a", encoding="utf-8") as handle:
+        handle.write(f"{value}:{os.getpid()}\n")
+
+
+def _process_pool_crash(job_id: str) -> None:
+    _ = job_id
+    os._exit(13)
+
+
+def _process_pool_records(output_path: Path) -> list[tuple[int, int]]:
+    if not output_path.exists():
+        return []
+    rows = [line.split(":") for line in output_path.read_text(encoding="utf-8").splitlines() if line]
+    return [(int(value), int(pid)) for value, pid in rows]
+
+
 class _FakeRedisClient:
     def __init__(self) -> None:
         self._queues: dict[str, list[bytes]] = {}
@@ -79,6 +101,140 @@ class _FakeRedisClient:
         return [item.decode("utf-8", errors="replace") for item in raw]
 
 
+class _ReliableFakeRedisClient(_FakeRedisClient):
+    """Adds the list/set/hash/lease commands and Lua scripts used by the reliable queue mode."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._sets: dict[str, set[str]] = {}
+        self._hashes: dict[str, dict[str, int]] = {}
+        self._expiry: dict[str, float] = {}
+        self.script_calls: dict[str, int] = {"enqueue": 0, "reap": 0}
+
+    def _alive(self, key: str) -> bool:
+        expires_at = self._expiry.get(key)
+        if expires_at is not None and expires_at <= time.time():
+            self._kv.pop(key, None)
+            self._expiry.pop(key, None)
+        return key in self._kv
+
+    def set(self, key: str, value: str, px: int | None = None) -> bool:
+        with self._lock:
+            self._kv[str(key)] = str(value).encode("utf-8")
+            if px is not None:
+                self._expiry[str(key)] = time.time() + int(px) / 1000.0
+        return True
+
+    def exists(self, key: str) -> int:
+        with self._lock:
+            return 1 if self._alive(str(key)) else 0
+
+    def delete(self, key: str) -> int:
+        with self._lock:
+            self._expiry.pop(str(key), None)
+            return 1 if self._kv.pop(str(key), None) is not None else 0
+
+    def sadd(self, key: str, member: str) -> int:
+        with self._lock:
+            members = self._sets.setdefault(key, set())
+            added = member not in members
+            members.add(member)
+            return int(added)
+
+    def srem(self, key: str, member: str) -> int:
+        with self._lock:
+            members = self._sets.setdefault(key, set())
+            removed = member in members
+            members.discard(member)
+            return int(removed)
+
+    def smembers(self, key: str) -> "set[bytes]":
+        with self._lock:
+            return {member.encode("utf-8") for member in self._sets.get(key, set())}
+
+    def hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        with self._lock:
+            values = self._hashes.setdefault(key, {})
+            values[field] = values.get(field, 0) + int(amount)
+            return values[field]
+
+    def hdel(self, key: str, field: str) -> int:
+        with self._lock:
+            return 1 if self._hashes.setdefault(key, {}).pop(field, None) is not None else 0
+
+    def hash_snapshot(self, key: str) -> dict[str, int]:
+        with self._lock:
+            return dict(self._hashes.get(key, {}))
+
+    def blmove(self, source: str, destination: str, timeout: int = 1, src: str = "LEFT", dest: str = "RIGHT"):
+        assert (src, dest) == ("LEFT", "RIGHT")
+        deadline = time.time() + max(0, int(timeout))
+        while True:
+            with self._lock:
+                queue = self._queues.setdefault(source, [])
+                if queue:
+                    payload = queue.pop(0)
+                    self._queues.setdefault(destination, []).append(payload)
+                    return payload
+            if time.time() >= deadline:
+                return None
+            time.sleep(0.01)
+
+    def lrem(self, queue_name: str, count: int, payload) -> int:
+        raw = payload if isinstance(payload, bytes) else str(payload).encode("utf-8")
+        with self._lock:
+            queue = self._queues.setdefault(queue_name, [])
+            if raw in queue:
+                queue.remove(raw)
+                return 1
+            return 0
+
+    def register_script(self, source: str):
+        if source == job_runner_module._CAPPED_ENQUEUE_LUA:
+            return self._enqueue_script
+        if source == job_runner_module._REAP_PROCESSING_LIST_LUA:
+            return self._reap_script
+        raise AssertionError("unexpected Lua script")
+
+    def _enqueue_script(self, keys: list[str], args: list):
+        self.script_calls["enqueue"] += 1
+        with self._lock:
+            queue = self._queues.setdefault(keys[0], [])
+            if len(queue) >= int(args[1]):
+                return 0
+            queue.append(str(args[0]).encode("utf-8"))
+            return 1
+
+    def _reap_script(self, keys: list[str], args: list):
+        self.script_calls["reap"] += 1
+        processing_list, lease_key, queue_name, registry_key = keys
+        with self._lock:
+            if self._alive(lease_key):
+                return -1
+            processing = self._queues.setdefault(processing_list, [])
+            queue = self._queues.setdefault(queue_name, [])
+            moved = 0
+            while processing:
+                queue.insert(0, processing.pop())
+                moved += 1
+            self._sets.setdefault(registry_key, set()).discard(str(args[0]))
+            return moved
+
+
+def _reliable_payload(value: int, *, dispatch_id: str, attempt: int = 0) -> str:
+    return json.dumps(
+        {
+            "dispatch_id": dispatch_id,
+            "task_name": f"{_redis_test_task.__module__}:_redis_test_task",
+            "args": [value],
+            "kwargs": {},
+            "attempt": attempt,
+            "max_attempts": 3,
+            "queued_at": time.time(),
+        }
+    )
+
+
 class _AlwaysFullRedisClient(_FakeRedisClient):
     def llen(self, queue_name: str) -> int:
         _ = queue_name
@@ -425,3 +581,175 @@ def test_redis_job_runner_worker_heartbeat_status_for_dispatcher_mode():
         assert diag["worker_heartbeat"]["healthy"] is True
     finally:
         runner.stop()
+
+
+def _process_pool_runner(**kwargs) -> ProcessPoolJobRunner:
+    kwargs.setdefault("preload_modules", ())
+    kwargs.setdefault("prewarm", False)
+    # pytest may import this module outside the `grantflow.` package prefix.
+    kwargs.setdefault("allowed_import_prefixes", ())
+    return ProcessPoolJobRunner(**kwargs)
+
+
+def test_process_pool_job_runner_executes_tasks_in_worker_processes(tmp_path):
+    output_path = tmp_path / "pids.txt"
+    runner = _process_pool_runner(worker_count=1, queue_maxsize=8, max_tasks_per_child=1)
+    try:
+        for value in range(3):
+            assert runner.submit(_process_pool_record_pid, str(output_path), value) is True
+        assert _wait_until(lambda: runner.diagnostics()["completed_count"] == 3, timeout_s=60.0)
+        records = _process_pool_records(output_path)
+        assert sorted(value for value, _ in records) == [0, 1, 2]
+        pids = {pid for _, pid in records}
+        assert os.getpid() not in pids
+        # One task per child: every job ran in a freshly recycled worker.
+        assert len(pids) == 3
+        diag = runner.diagnostics()
+        assert diag["backend"] == "process_pool"
+        assert diag["running"] is True
+        assert diag["submitted_count"] == 3
+        assert diag["failed_count"] == 0
+        assert diag["max_tasks_per_child"] == 1
+    finally:
+        runner.stop()
+    assert runner.is_running() is False
+
+
+def test_process_pool_job_runner_rejects_closures_and_non_json_args(tmp_path):
+    runner = _process_pool_runner(worker_count=1, queue_maxsize=8)
+
+    def _local_task() -> None:
+        return None
+
+    with pytest.raises(TypeError, match="module-level"):
+        runner.submit(_local_task)
+    with pytest.raises(TypeError, match="JSON-serializable"):
+        runner.submit(_process_pool_record_pid, str(tmp_path / "pids.txt"), object())
+    assert runner.diagnostics()["submitted_count"] == 0
+    runner.stop()
+
+
+def test_process_pool_job_runner_recovers_from_worker_crash(tmp_path):
+    settled: list[tuple[dict, bool]] = []
+    runner = _process_pool_runner(
+        worker_count=1,
+        queue_maxsize=8,
+        crash_retry_limit=1,
+        on_task_settled=lambda metadata, error, crashed: settled.append((metadata, crashed)),
+    )
+    output_path = tmp_path / "pids.txt"
+    try:
+        assert runner.submit(_process_pool_crash, "job-crash-1") is True
+        assert _wait_until(lambda: len(settled) == 1, timeout_s=60.0)
+        metadata, crashed = settled[0]
+        assert crashed is True
+        assert metadata["job_id"] == "job-crash-1"
+        assert metadata["task_name"].endswith(":_process_pool_crash")
+        diag = runner.diagnostics()
+        assert diag["crashed_count"] == 1
+        assert diag["crash_retry_count"] == 1
+        assert diag["pool_restart_count"] >= 2
+        assert diag["failed_count"] == 1
+
+        assert runner.submit(_process_pool_record_pid, str(output_path), 7) is True
+        assert _wait_until(lambda: runner.diagnostics()["completed_count"] == 1, timeout_s=60.0)
+        assert [value for value, _ in _process_pool_records(output_path)] == [7]
+        assert settled[-1][1] is False
+    finally:
+        runner.stop()
+
+
+def _reliable_runner(fake_client, queue_name: str, **kwargs) -> RedisJobRunner:
+    kwargs.setdefault("worker_count", 1)
+    kwargs.setdefault("queue_maxsize", 8)
+    return RedisJobRunner(
+        redis_url="redis://local-test/0",
+        queue_name=queue_name,
+        pop_timeout_seconds=0.1,
+        reliable_queue=True,
+        visibility_timeout_seconds=0.3,
+        reaper_interval_seconds=0.05,
+        allowed_import_prefixes=(),
+        redis_client_factory=lambda _url: fake_client,
+        **kwargs,
+    )
+
+
+def test_redis_job_runner_reliable_queue_acks_processing_list():
+    fake_client = _ReliableFakeRedisClient()
+    with _REDIS_OBSERVED_LOCK:
+        _REDIS_TEST_OBSERVED.clear()
+    runner = _reliable_runner(fake_client, "grantflow:test:jobs:reliable")
+    try:
+        assert runner.submit(_redis_test_task, 11) is True
+        assert _wait_until(lambda: _REDIS_TEST_OBSERVED == [11])
+        assert _wait_until(lambda: runner.diagnostics()["in_flight_count"] == 0)
+        diag = runner.diagnostics()
+        assert diag["reliable_queue"] is True
+        assert diag["completed_count"] == 1
+        assert diag["processing_worker_count"] == 1
+        assert diag["reaped_count"] == 0
+        assert fake_client.script_calls["enqueue"] == 1
+        assert fake_client.hash_snapshot(runner.deliveries_key) == {}
+    finally:
+        runner.stop()
+    # A cleanly drained worker deregisters so peers have nothing to reap.
+    assert fake_client.smembers(runner.processing_registry_key) == set()
+
+
+def test_redis_job_runner_capacity_checked_enqueue_is_atomic():
+    fake_client = _ReliableFakeRedisClient()
+    runner = _reliable_runner(fake_client, "grantflow:test:jobs:capped", queue_maxsize=1, consumer_enabled=False)
+    assert runner.submit(_redis_test_task, 1) is True
+    assert runner.submit(_redis_test_task, 2) is False
+    assert fake_client.llen("grantflow:test:jobs:capped") == 1
+    assert fake_client.script_calls["enqueue"] == 2
+    runner.stop()
+
+
+def test_redis_job_runner_reaper_requeues_tasks_from_expired_leases():
+    fake_client = _ReliableFakeRedisClient()
+    queue_name = "grantflow:test:jobs:reaper"
+    with _REDIS_OBSERVED_LOCK:
+        _REDIS_TEST_OBSERVED.clear()
+    runner = _reliable_runner(fake_client, queue_name)
+    # A worker that died mid-task: payload parked in its processing list, lease already gone.
+    fake_client.sadd(runner.processing_registry_key, "dead-worker")
+    fake_client.rpush(runner.processing_list_name("dead-worker"), _reliable_payload(21, dispatch_id="d-21"))
+    # A live peer keeps renewing its lease, so its in-flight task must stay put.
+    fake_client.sadd(runner.processing_registry_key, "busy-worker")
+    fake_client.set(runner.lease_key_name("busy-worker"), "1", px=60_000)
+    fake_client.rpush(runner.processing_list_name("busy-worker"), _reliable_payload(22, dispatch_id="d-22"))
+    try:
+        runner.start()
+        assert _wait_until(lambda: _REDIS_TEST_OBSERVED == [21])
+        diag = runner.diagnostics()
+        assert diag["reaped_count"] == 1
+        assert diag["in_flight_count"] == 1
+        members = fake_client.smembers(runner.processing_registry_key)
+        assert b"dead-worker" not in members
+        assert b"busy-worker" in members
+        assert fake_client.llen(runner.processing_list_name("busy-worker")) == 1
+    finally:
+        runner.stop()
+
+
+def test_redis_job_runner_dead_letters_task_redelivered_past_max_attempts():
+    fake_client = _ReliableFakeRedisClient()
+    queue_name = "grantflow:test:jobs:poison"
+    with _REDIS_OBSERVED_LOCK:
+        _REDIS_TEST_OBSERVED.clear()
+    runner = _reliable_runner(fake_client, queue_name)
+    # Three earlier deliveries each ended with the worker dying before ack.
+    fake_client.hincrby(runner.deliveries_key, "d-poison", 3)
+    fake_client.rpush(queue_name, _reliable_payload(31, dispatch_id="d-poison"))
+    try:
+        runner.start()
+        assert _wait_until(lambda: runner.diagnostics()["dead_lettered_count"] == 1)
+        assert _REDIS_TEST_OBSERVED == []
+        dead_letters = runner.list_dead_letters()["items"]
+        assert dead_letters[0]["reason"] == "visibility_timeout_exceeded"
+        assert dead_letters[0]["dispatch_id"] == "d-poison"
+        assert fake_client.hash_snapshot(runner.deliveries_key) == {}
+    finally:
+        runner.stop()
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+import grantflow.api.app as api_app_module
+from grantflow.api.app import app
+from grantflow.api.job_index import job_index_fields
+from grantflow.api.portfolio_aggregates import PortfolioMetricsAggregate, portfolio_metrics_mismatches
+from grantflow.api.public_views import public_portfolio_metrics_payload, public_portfolio_quality_payload
+from grantflow.core.stores import SQLiteJobStore
+
+client = TestClient(app)
+
+
+def _events(prefix: str, *statuses: str) -> list[dict]:
+    return [
+        {
+            "event_id": f"{prefix}-{index}",
+            "ts": f"2026-02-24T10:{index:02d}:00+00:00",
+            "type": "status_changed",
+            "to_status": status,
+            "status": status,
+        }
+        for index, status in enumerate(statuses)
+    ]
+
+
+def _portfolio_jobs() -> dict[str, dict]:
+    return {
+        "agg-job-1": {
+            "status": "done",
+            "hitl_enabled": True,
+            "client_metadata": {"tenant_id": "tenant_a"},
+            "generate_preflight": {"warning_level": "medium", "risk_level": "medium"},
+            "state": {
+                "donor_id": "usaid",
+                "needs_revision": True,
+                "citations": [{"citation_type": "fallback_namespace"}, {"citation_type": "rag_low_confidence"}],
+                "critic_notes": {
+                    "fatal_flaws": [
+                        {"finding_id": "f-1", "section": "toc", "severity": "high", "message": "Weak causal chain"},
+                        {"finding_id": "f-2", "section": "logframe", "severity": "low", "message": "Missing baseline"},
+                    ]
+                },
+            },
+            "review_comments": [
+                {
+                    "comment_id": "c-1",
+                    "section": "toc",
+                    "status": "open",
+                    "ts": "2026-01-01T00:00:00+00:00",
+                    "due_at": "2026-01-02T00:00:00+00:00",
+                    "linked_finding_id": "f-1",
+                }
+            ],
+            "job_events": _events("a", "accepted", "running", "pending_hitl", "running", "done"),
+        },
+        "agg-job-2": {
+            "status": "error",
+            "hitl_enabled": False,
+            "client_metadata": {"tenant_id": "tenant_b"},
+            "generate_preflight": {"warning_level": "high", "risk_level": "high"},
+            "state": {
+                "donor_id": "eu",
+                "citations": [{"citation_type": "rag_claim_support"}, {"citation_type": "rag_support"}],
+                "critic_notes": {
+                    "fatal_flaws": [
+                        {"finding_id": "f-3", "section": "toc", "severity": "medium", "message": "Vague outcome"}
+                    ]
+                },
+            },
+            "job_events": _events("b", "accepted", "running", "error"),
+        },
+        "agg-job-3": {
+            "status": "running",
+            "hitl_enabled": False,
+            "state": {"donor_id": "usaid"},
+            "job_events": _events("c", "accepted", "running"),
+        },
+    }
+
+
+def _assert_matches_full_scan(aggregate: PortfolioMetricsAggregate, jobs: dict[str, dict], **filters) -> None:
+    expected = public_portfolio_metrics_payload(jobs, **filters)
+    assert portfolio_metrics_mismatches(aggregate.metrics_payload(**filters), expected) == []
+
+
+def test_portfolio_metrics_aggregate_matches_full_scan_across_filters_and_writes():
+    jobs = _portfolio_jobs()
+    aggregate = PortfolioMetricsAggregate()
+    aggregate.apply("agg-job-1", jobs["agg-job-1"])
+    assert aggregate.stats()["job_count"] == 0
+
+    assert aggregate.rebuild(jobs) == 3
+    stats = aggregate.stats()
+    assert stats["ready"] is True
+    assert stats["group_count"] == 3
+
+    payload = aggregate.metrics_payload()
+    assert payload["job_count"] == 3
+    assert payload["review_readiness_summary"]["overdue_review_comments"] == 1
+    assert payload["review_readiness_summary"]["triage_summary"]["top_priority_finding_ids"]
+    _assert_matches_full_scan(aggregate, jobs)
+    _assert_matches_full_scan(aggregate, jobs, donor_id="usaid")
+    _assert_matches_full_scan(aggregate, jobs, status="done", hitl_enabled=True)
+    _assert_matches_full_scan(aggregate, jobs, warning_level="high")
+    _assert_matches_full_scan(aggregate, jobs, grounding_risk_level="high")
+    _assert_matches_full_scan(aggregate, jobs, mel_risk_level="unknown")
+
+    jobs["agg-job-3"] = {**jobs["agg-job-3"], "status": "done", "hitl_enabled": True}
+    aggregate.apply("agg-job-3", jobs["agg-job-3"])
+    jobs["agg-job-1"] = {**jobs["agg-job-1"], "review_comments": []}
+    aggregate.apply("agg-job-1", jobs["agg-job-1"])
+    _assert_matches_full_scan(aggregate, jobs)
+    _assert_matches_full_scan(aggregate, jobs, status="done")
+
+    jobs.pop("agg-job-2")
+    aggregate.apply("agg-job-2", None)
+    _assert_matches_full_scan(aggregate, jobs)
+    assert aggregate.metrics_payload(donor_id="eu")["job_count"] == 0
+
+    scoped_jobs = {"agg-job-1": jobs["agg-job-1"]}
+    scoped = aggregate.metrics_payload(tenant_id="tenant_a")
+    assert portfolio_metrics_mismatches(scoped, public_portfolio_metrics_payload(scoped_jobs)) == []
+
+
+def _assert_quality_matches_full_scan(aggregate: PortfolioMetricsAggregate, jobs: dict[str, dict], **filters) -> None:
+    expected = public_portfolio_quality_payload(jobs, **filters)
+    assert portfolio_metrics_mismatches(aggregate.quality_payload(**filters), expected) == []
+
+
+def test_portfolio_quality_aggregate_matches_full_scan_across_filters_and_writes():
+    jobs = _portfolio_jobs()
+    aggregate = PortfolioMetricsAggregate()
+    aggregate.rebuild(jobs)
+
+    payload = aggregate.quality_payload()
+    assert payload["job_count"] == 3
+    assert payload["review_readiness_summary"]["overdue_review_comments"] == 1
+    assert payload["donor_review_readiness_breakdown"]["usaid"]["stale_comment_bucket_counts"]
+    _assert_quality_matches_full_scan(aggregate, jobs)
+    _assert_quality_matches_full_scan(aggregate, jobs, donor_id="usaid")
+    _assert_quality_matches_full_scan(aggregate, jobs, status="done", hitl_enabled=True)
+    _assert_quality_matches_full_scan(aggregate, jobs, warning_level="high")
+    _assert_quality_matches_full_scan(aggregate, jobs, toc_text_risk_level="low")
+
+    jobs["agg-job-3"] = {**jobs["agg-job-3"], "status": "done", "hitl_enabled": True}
+    aggregate.apply("agg-job-3", jobs["agg-job-3"])
+    jobs["agg-job-1"] = {**jobs["agg-job-1"], "review_comments": []}
+    aggregate.apply("agg-job-1", jobs["agg-job-1"])
+    jobs.pop("agg-job-2")
+    aggregate.apply("agg-job-2", None)
+    _assert_quality_matches_full_scan(aggregate, jobs)
+    _assert_quality_matches_full_scan(aggregate, jobs, status="done")
+    assert aggregate.quality_payload(donor_id="eu")["job_count"] == 0
+
+
+def test_portfolio_metrics_mismatches_reports_paths():
+    assert portfolio_metrics_mismatches({"a": 1.0, "b": [1]}, {"a": 1.0004, "b": [1]}) == []
+    assert portfolio_metrics_mismatches({"a": {"x": 1}, "b": [1]}, {"a": {"x": 2}, "b": [1, 2], "c": 0}) == [
+        "a.x",
+        "b",
+        "c",
+    ]
+
+
+def test_portfolio_metrics_endpoint_serves_aggregate_and_check_mode(monkeypatch):
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_AGGREGATES", "on")
+    monkeypatch.setattr(api_app_module, "PORTFOLIO_METRICS_AGGREGATE", PortfolioMetricsAggregate())
+    for job_id, payload in _portfolio_jobs().items():
+        api_app_module._set_job(job_id, payload)
+
+    rebuilt = client.post("/portfolio/metrics/aggregates/rebuild")
+    assert rebuilt.status_code == 200
+    assert rebuilt.json()["ready"] is True
+    assert rebuilt.json()["rebuilt_job_count"] >= 3
+
+    api_app_module._update_job("agg-job-3", status="done")
+    api_app_module._record_job_event("agg-job-3", "resume_requested")
+
+    response = client.get("/portfolio/metrics", params={"donor_id": "usaid"})
+    assert response.status_code == 200
+    assert response.json()["job_count"] >= 2
+    assert api_app_module.PORTFOLIO_METRICS_AGGREGATE.stats()["apply_count"] >= 1
+
+    check = client.get("/portfolio/metrics/aggregates/check", params={"donor_id": "usaid"})
+    assert check.status_code == 200
+    body = check.json()
+    assert body["consistent"] is True, body["mismatches"]
+    assert body["cached_job_count"] == body["full_scan_job_count"]
+
+    quality = client.get("/portfolio/quality", params={"donor_id": "usaid"})
+    assert quality.status_code == 200
+    assert quality.json()["job_count"] == response.json()["job_count"]
+    by_finding = client.get("/portfolio/quality", params={"finding_severity": "high"})
+    assert by_finding.status_code == 200
+    assert by_finding.json()["filters"]["finding_severity"] == "high"
+
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_AGGREGATES", "check")
+    checked = client.get("/portfolio/metrics")
+    assert checked.status_code == 200
+    assert client.get("/portfolio/quality").status_code == 200
+    assert api_app_module.PORTFOLIO_METRICS_AGGREGATE.stats()["check_mismatch_count"] == 0
+
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_AGGREGATES", "off")
+    api_app_module._update_job("agg-job-3", status="error")
+    assert api_app_module.PORTFOLIO_METRICS_AGGREGATE.stats()["ready"] is False
+
+
+def _triage_job(section: str) -> dict:
+    finding = {"finding_id": f"f-{section}", "code": f"{section}_gap", "severity": "high", "message": "Needs work"}
+    return {"status": "done", "state": {"donor_id": "usaid", "critic_notes": {"fatal_flaws": [finding]}}}
+
+
+def _top_action_sections(payload: dict) -> list[str]:
+    actions = payload["review_readiness_summary"]["triage_summary"]["top_reviewer_actions"]
+    return [action.split(" Gap:")[0] for action in actions]
+
+
+def test_portfolio_aggregate_orders_like_store_and_catches_up_on_foreign_writes(monkeypatch, tmp_path):
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_AGGREGATES", "on")
+    store = SQLiteJobStore(str(tmp_path / "jobs.db"), index_fields_fn=job_index_fields)
+    monkeypatch.setattr(api_app_module, "JOB_STORE", store)
+    monkeypatch.setattr(api_app_module, "PORTFOLIO_METRICS_AGGREGATE", PortfolioMetricsAggregate())
+    for section in ("toc", "logframe", "mel", "budget"):
+        api_app_module._set_job(f"order-job-{section}", _triage_job(section))
+
+    # The triage summary stops after three reviewer actions, so it only spans the newest jobs.
+    assert _top_action_sections(client.get("/portfolio/metrics").json()) == ["Budget", "Mel", "Logframe"]
+
+    # Writes straight to the shared store stand in for another API or runner process.
+    store.set("order-job-toc", {**_triage_job("toc"), "hitl_enabled": True})
+    other_process = SQLiteJobStore(str(tmp_path / "jobs.db"), index_fields_fn=job_index_fields)
+    other_process.set("order-job-narrative", _triage_job("narrative"))
+
+    body = client.get("/portfolio/metrics").json()
+    assert body["job_count"] == 5
+    assert body["hitl_job_count"] == 1
+    assert _top_action_sections(body) == ["Narrative", "Toc", "Budget"]
+    check = client.get("/portfolio/metrics/aggregates/check").json()
+    assert check["consistent"] is True, check["mismatches"]
+    assert check["aggregate"]["watermark"] == store.change_watermark()
+
+
+@pytest.mark.parametrize("runner_mode", ["redis_queue", "process_pool"])
+def test_portfolio_aggregate_sees_out_of_process_runner_writes(monkeypatch, tmp_path, runner_mode):
+    monkeypatch.setenv("GRANTFLOW_PORTFOLIO_AGGREGATES", "on")
+    monkeypatch.setattr(api_app_module.config.job_runner, "mode", runner_mode)
+    store = SQLiteJobStore(str(tmp_path / "jobs.db"), index_fields_fn=job_index_fields)
+    monkeypatch.setattr(api_app_module, "JOB_STORE", store)
+    monkeypatch.setattr(api_app_module, "PORTFOLIO_METRICS_AGGREGATE", PortfolioMetricsAggregate())
+    api_app_module._set_job("runner-job", {"status": "accepted", "state": {"donor_id": "usaid"}})
+    assert client.get("/portfolio/metrics").json()["status_counts"] == {"accepted": 1}
+
+    # The worker process writes through its own store handle; nothing is settled in the API process.
+    worker_store = SQLiteJobStore(str(tmp_path / "jobs.db"), index_fields_fn=job_index_fields)
+    worker_store.update("runner-job", status="running")
+    worker_store.update("runner-job", status="done")
+
+    body = client.get("/portfolio/metrics").json()
+    assert body["status_counts"] == {"done": 1}
+    assert body["job_count"] == 1
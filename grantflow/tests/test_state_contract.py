@@ -254,3 +254,58 @@ def test_normalize_state_contract_canonicalizes_legacy_critic_findings_aliases()
     assert state.get("critic_fatal_flaws") == flaws
     assert flaws[0]["code"] == "LEGACY_UNSTRUCTURED_FINDING"
     assert flaws[1]["code"] == "TOC_CHAIN_GAP"
+
+
+def test_normalize_state_contract_skips_current_canonical_findings_and_rebinds_on_new_version(monkeypatch):
+    from grantflow.swarm import findings as findings_module
+
+    state = normalize_state_contract(
+        {
+            "donor_id": "usaid",
+            "critic_fatal_flaws": [
+                {"code": "TOC_CHAIN_GAP", "severity": "high", "section": "toc", "message": "Gap in causal chain."}
+            ],
+        }
+    )
+    canonical = state["critic_fatal_flaws"]
+    assert isinstance(canonical, findings_module.CanonicalFindings)
+    assert canonical[0]["version_id"] is None
+
+    calls = {"count": 0}
+    original = findings_module.canonicalize_findings
+
+    def counting_canonicalize(*args, **kwargs):
+        calls["count"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(findings_module, "canonicalize_findings", counting_canonicalize)
+    normalize_state_contract(state)
+    assert calls["count"] == 0
+    assert state["critic_fatal_flaws"] is canonical
+
+    state["draft_versions"] = [{"version_id": "toc_v1", "section": "toc", "sequence": 1}]
+    normalize_state_contract(state)
+    assert calls["count"] == 1
+    assert state["critic_fatal_flaws"][0]["version_id"] == "toc_v1"
+    assert state["critic_notes"]["fatal_flaws"] is state["critic_fatal_flaws"]
+
+
+def test_prepare_and_restore_state_for_storage_leave_input_untouched():
+    from grantflow.core.stores import prepare_state_for_storage, restore_state_from_storage
+
+    original = {
+        "donor": "USAID",
+        "input": {"project": "Water"},
+        "critic_notes": {"revision_instructions": "Tighten indicators."},
+        "toc_draft": {"toc": {"project_goal": "Improve access"}},
+    }
+    snapshot = {key: (dict(value) if isinstance(value, dict) else value) for key, value in original.items()}
+    stored = prepare_state_for_storage(original)
+    assert original == snapshot
+    assert stored["critic_notes"]["fatal_flaws"] == []
+    assert stored["toc_draft"] is not original["toc_draft"]
+
+    restored = restore_state_from_storage(stored)
+    assert "fatal_flaws" in stored["critic_notes"]
+    assert restored["donor_id"] == "usaid"
+    assert restored is not stored
@@ -1,7 +1,21 @@
 import json
 import sqlite3
-
-from grantflow.core.stores import InMemoryJobStore, SQLiteIngestAuditStore, SQLiteJobStore, open_sqlite_connection
+import threading
+
+import pytest
+
+from grantflow.core.stores import (
+    InMemoryJobStore,
+    JobRevisionConflict,
+    SQLiteConnectionPool,
+    SQLiteIngestAuditStore,
+    SQLiteJobStore,
+    SQLiteWebhookOutboxStore,
+    default_job_index_fields,
+    open_sqlite_connection,
+    sqlite_connection_pool,
+    sqlite_pool_stats,
+)
 from grantflow.core.strategies.factory import DonorFactory
 from grantflow.swarm.hitl import HITLCheckpoint, HITLStatus
 
@@ -29,16 +43,48 @@ def test_inmemory_job_store_normalizes_state_contract_on_set_and_update():
     assert restored["state"]["llm_mode"] is True
     assert restored["state"]["max_iterations"] == 1
 
-    updated = store.update(
+    store.update(
         "job-inmem-1",
         state={"donor": "EU", "input": {"project": "Digital governance", "country": "Moldova"}},
     )
+    updated = store.get("job-inmem-1")
+    assert updated is not None
     assert updated["state"]["donor_id"] == "eu"
     assert updated["state"]["donor"] == "eu"
     assert updated["state"]["input_context"]["project"] == "Digital governance"
     assert updated["state"]["input"]["country"] == "Moldova"
 
 
+def test_inmemory_job_store_copies_written_branches_and_shares_untouched_ones():
+    store = InMemoryJobStore()
+    citations = [{"doc_id": "doc-1", "page": 1}]
+    payload = {"status": "running", "job_events": [], "state": {"donor_id": "usaid", "citations": citations}}
+    store.set("job-cow", payload)
+
+    citations.append({"doc_id": "doc-2"})
+    payload["state"]["donor_id"] = "eu"
+    first = store.get("job-cow")
+    assert first is not None
+    assert first["state"]["citations"] == [{"doc_id": "doc-1", "page": 1}]
+    assert first["state"]["donor_id"] == "usaid"
+
+    first["status"] = "mutated"
+    first["state"]["donor_id"] = "mutated"
+    second = store.get("job-cow")
+    assert second is not None
+    assert second["status"] == "running"
+    assert second["state"]["donor_id"] == "usaid"
+    assert second["state"]["citations"] is first["state"]["citations"]
+
+    events = [{"type": "status_changed"}]
+    store.update("job-cow", status="done", job_events=events)
+    events.append({"type": "leaked"})
+    updated = store.get("job-cow")
+    assert updated is not None
+    assert updated["state"]["citations"] is second["state"]["citations"]
+    assert store.get("job-cow")["job_events"] == [{"type": "status_changed"}]
+
+
 def test_sqlite_job_store_persists_json_and_rehydrates_strategy(tmp_path):
     db_path = tmp_path / "grantflow_state.db"
     store = SQLiteJobStore(str(db_path))
@@ -112,7 +158,10 @@ def test_sqlite_job_store_update_merges_and_restores(tmp_path):
     store = SQLiteJobStore(str(db_path))
     store.set("job-2", {"status": "accepted", "state": {"donor_id": "eu"}})
 
-    updated = store.update("job-2", status="running", state={"donor_id": "eu", "progress": 50})
+    write_seq = store.update("job-2", status="running", state={"donor_id": "eu", "progress": 50})
+    assert write_seq == store.change_watermark() == 2
+    updated = store.get("job-2")
+    assert updated is not None
     assert updated["status"] == "running"
     assert updated["state"]["progress"] == 50
     assert updated["state"]["strategy"].get_rag_collection() == "eu_intpa"
@@ -246,7 +295,7 @@ def test_sqlite_stores_initialize_pragmas_and_schema_meta(monkeypatch, tmp_path)
     assert int(busy_timeout) == 7000
     assert ("hitl_checkpoints", 1) in rows
     assert ("ingest_audit", 1) in rows
-    assert ("jobs", 1) in rows
+    assert ("jobs", 3) in rows
 
 
 def test_sqlite_job_store_upgrades_schema_meta_version_on_reinit(tmp_path):
@@ -273,4 +322,405 @@ def test_sqlite_job_store_upgrades_schema_meta_version_on_reinit(tmp_path):
             ("jobs",),
         ).fetchone()[0]
 
-    assert int(version) == 1
+    assert int(version) == 3
+
+
+def test_sqlite_stores_share_long_lived_pooled_connections(monkeypatch, tmp_path):
+    db_path = tmp_path / "grantflow_state.db"
+    monkeypatch.setenv("GRANTFLOW_SQLITE_PATH", str(db_path))
+    monkeypatch.setenv("GRANTFLOW_HITL_STORE", "sqlite")
+
+    job_store = SQLiteJobStore(str(db_path))
+    audit_store = SQLiteIngestAuditStore(str(db_path))
+    manager = HITLCheckpoint()
+    pool = sqlite_connection_pool(str(db_path))
+    assert job_store._pool is pool
+    assert audit_store._pool is pool
+    assert manager._pool is pool
+
+    job_store.set("job-pool", {"status": "accepted", "state": {"donor_id": "usaid"}})
+    for _ in range(20):
+        assert job_store.get("job-pool") is not None
+    job_store.update("job-pool", status="running")
+    audit_store.list_recent(limit=5)
+    manager.list_pending()
+
+    stats = pool.stats()
+    assert stats["open_readers"] == 1
+    assert stats["writer_open"] is True
+    assert stats["open_connections"] == 2
+    assert stats["borrowed_readers"] == 0
+    assert stats["reader_borrow_count"] >= 22
+    assert stats["writer_borrow_count"] >= 4
+    assert any(item["path"] == str(db_path) for item in sqlite_pool_stats())
+
+
+def test_sqlite_connection_pool_bounds_readers_and_times_out(tmp_path):
+    pool = SQLiteConnectionPool(str(tmp_path / "pool.db"), max_readers=1, timeout_seconds=0.05)
+    borrowed = threading.Event()
+    release = threading.Event()
+
+    def _hold_reader() -> None:
+        with pool.reader():
+            borrowed.set()
+            release.wait(timeout=2)
+
+    holder = threading.Thread(target=_hold_reader)
+    holder.start()
+    assert borrowed.wait(timeout=2)
+    try:
+        with pytest.raises(RuntimeError, match="pool exhausted"):
+            with pool.reader():
+                pass
+    finally:
+        release.set()
+        holder.join(timeout=2)
+
+    with pool.reader() as conn:
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+        with pool.reader() as nested:
+            assert nested is conn
+    stats = pool.stats()
+    assert stats["timeout_count"] == 1
+    assert stats["open_readers"] == 1
+    pool.close()
+    assert pool.stats()["open_connections"] == 0
+
+
+def test_sqlite_job_store_maintains_job_index_and_prefilters(tmp_path):
+    db_path = tmp_path / "grantflow_state.db"
+
+    def _index_fields(payload):
+        fields = default_job_index_fields(payload)
+        fields["donor_id"] = str((payload.get("state") or {}).get("donor_id") or "")
+        fields["tenant_id"] = str((payload.get("client_metadata") or {}).get("tenant_id") or "")
+        return fields
+
+    store = SQLiteJobStore(str(db_path), index_fields_fn=_index_fields)
+    store.set(
+        "job-a",
+        {
+            "status": "done",
+            "hitl_enabled": True,
+            "client_metadata": {"tenant_id": "tenant_a"},
+            "job_events": [{"ts": "2026-02-25T10:00:00+00:00", "type": "status_changed"}],
+            "state": {"donor_id": "usaid", "citations": [{"citation_type": "rag_result"}]},
+        },
+    )
+    store.set(
+        "job-b", {"status": "accepted", "client_metadata": {"tenant_id": "tenant_b"}, "state": {"donor_id": "eu"}}
+    )
+    store.update("job-b", status="done")
+
+    rows = {row["job_id"]: row for row in store.list_index()}
+    assert rows["job-a"]["donor_id"] == "usaid"
+    assert rows["job-a"]["hitl_enabled"] is True
+    assert rows["job-a"]["citation_count"] == 1
+    assert rows["job-a"]["created_at"] == "2026-02-25T10:00:00+00:00"
+    assert rows["job-b"]["status"] == "done"
+
+    assert set(store.list_filtered(status="done")) == {"job-a", "job-b"}
+    assert set(store.list_filtered(donor_id="eu", status="done")) == {"job-b"}
+    assert set(store.list_filtered(tenant_id="tenant_a", hitl_enabled=True)) == {"job-a"}
+    assert store.list_filtered(tenant_id="tenant_a", donor_id="eu") == {}
+
+    # Rows written behind the store's back have no index entry and must still be hydrated.
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute(
+            "INSERT INTO jobs (job_id, payload_json, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)",
+            ("job-raw", json.dumps({"status": "done", "state": {"donor_id": "eu"}})),
+        )
+    assert "job-raw" in store.list_filtered(donor_id="eu")
+    assert store.rebuild_index() == 3
+    assert "job-raw" not in store.list_filtered(donor_id="usaid")
+
+
+def test_sqlite_job_store_keeps_collections_in_append_only_tables(tmp_path):
+    db_path = tmp_path / "grantflow_state.db"
+    store = SQLiteJobStore(str(db_path))
+    events = [{"event_id": f"e{i}", "type": "status_changed"} for i in range(3)]
+    store.set(
+        "job-c",
+        {
+            "status": "running",
+            "job_events": events,
+            "review_comments": [{"comment_id": "c1", "status": "open"}],
+            "state": {"donor_id": "usaid", "draft_versions": [{"sequence": 1}], "citations": [{"label": "a"}]},
+        },
+    )
+
+    def _raw():
+        with sqlite3.connect(str(db_path)) as conn:
+            header = conn.execute("SELECT payload_json FROM jobs WHERE job_id = 'job-c'").fetchone()[0]
+            event_rows = conn.execute("SELECT seq, row_json FROM job_events WHERE job_id = 'job-c' ORDER BY seq")
+            return header, [(seq, json.loads(row)["event_id"]) for seq, row in event_rows.fetchall()]
+
+    header, event_rows = _raw()
+    assert json.loads(header)["job_events"] == {"$rows": "job_events"}
+    assert json.loads(header)["state"]["draft_versions"] == {"$rows": "job_draft_versions"}
+    assert event_rows == [(0, "e0"), (1, "e1"), (2, "e2")]
+
+    # Appending with a trimmed head only deletes the dropped row and inserts the new one; the header is untouched.
+    store.update("job-c", job_events=[*events[1:], {"event_id": "e3", "type": "note"}])
+    updated = store.get("job-c")
+    header_after, event_rows = _raw()
+    assert header_after == header
+    assert event_rows == [(1, "e1"), (2, "e2"), (3, "e3")]
+    assert [row["event_id"] for row in updated["job_events"]] == ["e1", "e2", "e3"]
+    assert updated["state"]["citations"] == [{"label": "a"}]
+
+    store.update("job-c", review_comments=[{"comment_id": "c1", "status": "resolved"}])
+    store.update("job-c", state={"donor_id": "usaid", "draft_versions": [{"sequence": 1}, {"sequence": 2}]})
+    restored = store.get("job-c")
+    assert restored is not None
+    assert restored["review_comments"] == [{"comment_id": "c1", "status": "resolved"}]
+    assert restored["state"]["draft_versions"] == [{"sequence": 1}, {"sequence": 2}]
+    assert "citations" not in restored["state"]
+    with sqlite3.connect(str(db_path)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM job_citations").fetchone()[0] == 0
+    index_row = store.list_index()[0]
+    assert index_row["job_event_count"] == 3
+    assert index_row["draft_version_count"] == 2
+    assert index_row["citation_count"] == 0
+
+
+@pytest.mark.parametrize("backend", ["inmem", "sqlite"])
+def test_job_store_append_rows_appends_trims_and_skips_duplicates(tmp_path, backend):
+    store = InMemoryJobStore() if backend == "inmem" else SQLiteJobStore(str(tmp_path / "grantflow_state.db"))
+    assert store.append_rows("job-missing", "job_events", [{"event_id": "e0"}]) is None
+    store.set("job-a", {"status": "running", "job_events": [{"event_id": "e0", "type": "a"}], "state": {}})
+
+    write_seq = store.append_rows(
+        "job-a", "job_events", [{"event_id": "e1", "type": "b", "request_id": "r1"}], keep_last=2
+    )
+    assert write_seq == store.change_watermark()
+    duplicate = {"event_id": "e2", "type": "b", "request_id": "r1"}
+    assert store.append_rows("job-a", "job_events", [duplicate], unique_fields=("type", "request_id")) is None
+    store.append_rows("job-a", "job_events", [{"event_id": "e3", "type": "c"}], keep_last=2, status="done")
+    _, revision = store.get_with_revision("job-a")
+    with pytest.raises(JobRevisionConflict):
+        store.append_rows("job-a", "review_comments", [{"comment_id": "c1"}], expected_revision=revision - 1)
+    store.append_rows("job-a", "review_comments", [{"comment_id": "c1"}], expected_revision=revision)
+
+    job = store.get("job-a")
+    assert job is not None
+    assert [row["event_id"] for row in job["job_events"]] == ["e1", "e3"]
+    assert job["review_comments"] == [{"comment_id": "c1"}]
+    assert job["status"] == "done"
+    index_row = store.get_index("job-a")
+    assert index_row is not None
+    assert index_row["status"] == "done"
+    assert index_row["job_event_count"] == 2
+    assert index_row["review_comment_count"] == 1
+
+
+def test_sqlite_job_store_append_rows_leaves_stored_rows_alone(tmp_path):
+    db_path = tmp_path / "grantflow_state.db"
+    store = SQLiteJobStore(str(db_path))
+    citations = [{"label": "a", "citation_type": "fallback_namespace"}]
+    store.set("job-a", {"status": "running", "job_events": [{"event_id": "e0"}], "state": {"citations": citations}})
+    index_before = store.get_index("job-a")
+
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute("UPDATE job_events SET row_hash = 'untouched' WHERE job_id = 'job-a'")
+    store.append_rows("job-a", "job_events", [{"event_id": "e1"}])
+    store.update("job-a", progress=50)
+
+    with sqlite3.connect(str(db_path)) as conn:
+        hashes = [row[0] for row in conn.execute("SELECT row_hash FROM job_events ORDER BY seq").fetchall()]
+    assert hashes[0] == "untouched"
+    index_after = store.get_index("job-a")
+    assert index_after is not None and index_before is not None
+    assert index_after["job_event_count"] == 2
+    assert index_after["citation_count"] == index_before["citation_count"] == 1
+
+
+def test_sqlite_job_store_moves_legacy_inline_collections_on_next_write(tmp_path):
+    db_path = tmp_path / "grantflow_state.db"
+    store = SQLiteJobStore(str(db_path))
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute(
+            "INSERT INTO jobs (job_id, payload_json, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)",
+            ("job-old", json.dumps({"status": "done", "job_events": [{"event_id": "e0"}], "state": {}})),
+        )
+
+    assert store.get("job-old")["job_events"] == [{"event_id": "e0"}]
+    store.update("job-old", job_events=[{"event_id": "e0"}, {"event_id": "e1"}])
+    updated = store.get("job-old")
+    assert [row["event_id"] for row in updated["job_events"]] == ["e0", "e1"]
+    assert [row["event_id"] for row in store.list()["job-old"]["job_events"]] == ["e0", "e1"]
+    with sqlite3.connect(str(db_path)) as conn:
+        header = json.loads(conn.execute("SELECT payload_json FROM jobs").fetchone()[0])
+        assert conn.execute("SELECT COUNT(*) FROM job_events").fetchone()[0] == 2
+    assert header["job_events"] == {"$rows": "job_events"}
+
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute(
+            "INSERT INTO jobs (job_id, payload_json, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)",
+            ("job-older", json.dumps({"status": "done", "review_comments": [{"comment_id": "c0"}]})),
+        )
+    store.append_rows("job-older", "review_comments", [{"comment_id": "c1"}])
+    assert [row["comment_id"] for row in store.get("job-older")["review_comments"]] == ["c0", "c1"]
+
+
+@pytest.mark.parametrize("backend", ["inmem", "sqlite"])
+def test_job_store_conditional_updates_compare_revisions(tmp_path, backend):
+    store = InMemoryJobStore() if backend == "inmem" else SQLiteJobStore(str(tmp_path / "grantflow_state.db"))
+    assert store.get_with_revision("job-r") == (None, 0)
+    with pytest.raises(JobRevisionConflict):
+        store.update("job-r", expected_revision=3, status="accepted")
+
+    store.set("job-r", {"status": "accepted", "state": {"donor_id": "usaid"}}, expected_revision=0)
+    payload, revision = store.get_with_revision("job-r")
+    assert payload is not None and payload["status"] == "accepted"
+    assert revision == 1
+
+    store.update("job-r", expected_revision=revision, status="running")
+    # A second writer still holding the old revision loses instead of overwriting.
+    with pytest.raises(JobRevisionConflict) as excinfo:
+        store.update("job-r", expected_revision=revision, status="canceled")
+    assert excinfo.value.actual_revision == 2
+    # Unconditional writes keep working and still advance the revision.
+    store.update("job-r", progress=10)
+    payload, revision = store.get_with_revision("job-r")
+    assert payload["status"] == "running"
+    assert payload["progress"] == 10
+    assert revision == 3
+
+
+def test_sqlite_job_store_adds_revision_column_to_v1_jobs_table(tmp_path):
+    db_path = tmp_path / "grantflow_state.db"
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute(
+            "CREATE TABLE jobs (job_id TEXT PRIMARY KEY, payload_json TEXT NOT NULL, "
+            "updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        )
+        conn.execute("INSERT INTO jobs (job_id, payload_json) VALUES ('job-v1', '{\"status\": \"done\"}')")
+
+    store = SQLiteJobStore(str(db_path))
+    assert store.get_with_revision("job-v1")[1] == 0
+    store.update("job-v1", expected_revision=0, status="archived")
+    # Another process writing to the same file is seen by the next compare-and-swap.
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute("UPDATE jobs SET revision = revision + 1 WHERE job_id = 'job-v1'")
+    with pytest.raises(JobRevisionConflict):
+        store.update("job-v1", expected_revision=1, status="done")
+    assert store.get_with_revision("job-v1") == ({"status": "archived"}, 2)
+
+
+def test_sqlite_job_store_numbers_v2_jobs_by_update_time_and_lists_newest_write_first(tmp_path):
+    db_path = tmp_path / "grantflow_state.db"
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute(
+            "CREATE TABLE jobs (job_id TEXT PRIMARY KEY, payload_json TEXT NOT NULL, "
+            "updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP, revision INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.execute(
+            "INSERT INTO jobs (job_id, payload_json, updated_at, revision) VALUES "
+            "('job-old', '{\"status\": \"done\"}', '2026-01-01 00:00:00', 1), "
+            "('job-new', '{\"status\": \"done\"}', '2026-01-02 00:00:00', 1)"
+        )
+
+    store = SQLiteJobStore(str(db_path))
+    assert store.list_changes(0) == [("job-old", 1), ("job-new", 2)]
+    assert list(store.list()) == ["job-new", "job-old"]
+
+    store.update("job-old", status="archived")
+    assert store.change_watermark() == 3
+    assert store.list_changes(2) == [("job-old", 3)]
+    assert list(store.list()) == ["job-old", "job-new"]
+    assert [row["job_id"] for row in store.list_index()] == ["job-old", "job-new"]
+    assert list(store.list_filtered(status="archived")) == ["job-old"]
+
+
+def test_inmemory_job_store_lists_newest_write_first_and_reports_changes():
+    store = InMemoryJobStore()
+    store.set("job-a", {"status": "accepted"})
+    store.set("job-b", {"status": "accepted"})
+    store.update("job-a", status="running")
+
+    assert list(store.list()) == ["job-a", "job-b"]
+    assert [row["job_id"] for row in store.list_index()] == ["job-a", "job-b"]
+    assert store.change_watermark() == 3
+    assert store.list_changes(0) == [("job-b", 2), ("job-a", 3)]
+    assert store.list_changes(2) == [("job-a", 3)]
+
+
+def test_inmemory_job_store_list_filtered_uses_index():
+    store = InMemoryJobStore()
+    store.set("job-a", {"status": "done", "hitl_enabled": False, "state": {"donor_id": "usaid"}})
+    store.set("job-b", {"status": "running", "hitl_enabled": True, "state": {"donor_id": "eu"}})
+
+    assert set(store.list_filtered(status="done")) == {"job-a"}
+    assert set(store.list_filtered(hitl_enabled=True)) == {"job-b"}
+    # donor_id is not part of the payload-only index, so it never excludes jobs.
+    assert set(store.list_filtered(donor_id="usaid")) == {"job-a", "job-b"}
+
+
+def test_sqlite_job_store_adds_batch_id_index_column_to_v1_index(tmp_path):
+    db_path = tmp_path / "grantflow_state.db"
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute(
+            "CREATE TABLE job_index (job_id TEXT PRIMARY KEY, tenant_id TEXT, donor_id TEXT, status TEXT, "
+            "hitl_enabled INTEGER, warning_level TEXT, grounding_risk_level TEXT, created_at TEXT, "
+            "updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP, citation_count INTEGER NOT NULL DEFAULT 0, "
+            "draft_version_count INTEGER NOT NULL DEFAULT 0, review_comment_count INTEGER NOT NULL DEFAULT 0, "
+            "job_event_count INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.execute(
+            "CREATE TABLE jobs (job_id TEXT PRIMARY KEY, payload_json TEXT NOT NULL, "
+            "updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        )
+        for job_id, payload in (
+            ("job-old-1", {"status": "done", "batch": {"batch_id": "batch-1", "index": 1}}),
+            ("job-old-2", {"status": "done"}),
+        ):
+            conn.execute("INSERT INTO jobs (job_id, payload_json) VALUES (?, ?)", (job_id, json.dumps(payload)))
+            conn.execute("INSERT INTO job_index (job_id, status) VALUES (?, 'done')", (job_id,))
+
+    store = SQLiteJobStore(str(db_path))
+    store.set("job-a", {"status": "accepted", "batch": {"batch_id": "batch-1", "index": 0}})
+    store.set("job-b", {"status": "accepted", "batch": {"batch_id": "batch-2", "index": 0}})
+    store.set("job-c", {"status": "accepted"})
+
+    rows = {row["job_id"]: row for row in store.list_index()}
+    assert rows["job-a"]["batch_id"] == "batch-1"
+    assert rows["job-c"]["batch_id"] == ""
+    assert rows["job-old-1"]["batch_id"] == "batch-1"
+    assert rows["job-old-2"]["batch_id"] == ""
+    assert set(store.list_filtered(batch_id="batch-1")) == {"job-a", "job-old-1"}
+    assert set(InMemoryJobStore().list_filtered(batch_id="batch-1")) == set()
+
+
+def test_sqlite_webhook_outbox_store_claims_leases_and_updates(tmp_path):
+    store = SQLiteWebhookOutboxStore(str(tmp_path / "outbox.db"))
+    for index in range(3):
+        store.enqueue(
+            {
+                "delivery_id": f"d-{index}",
+                "job_id": "job-1" if index < 2 else "job-2",
+                "event": "job.completed",
+                "url": "https://93.184.216.34/hook",
+                "body": "{}",
+                "status": "pending",
+                "max_attempts": 3,
+                "next_attempt_at": 100.0 + index,
+                "created_at": f"2026-02-24T10:0{index}:00+00:00",
+                "updated_at": f"2026-02-24T10:0{index}:00+00:00",
+            }
+        )
+
+    claimed = store.claim_due(now=101.5, limit=10, lease_seconds=30)
+    assert [row["delivery_id"] for row in claimed] == ["d-0", "d-1"]
+    assert all(row["status"] == "in_flight" and row["next_attempt_at"] == 131.5 for row in claimed)
+    assert [row["delivery_id"] for row in store.claim_due(now=102.0, limit=10, lease_seconds=30)] == ["d-2"]
+
+    # An expired lease makes an abandoned in-flight row claimable again.
+    assert [row["delivery_id"] for row in store.claim_due(now=200.0, limit=1, lease_seconds=30)] == ["d-0"]
+
+    updated = store.update("d-1", status="delivered", attempts=1, last_status_code=200, url="ignored")
+    assert updated["status"] == "delivered"
+    assert updated["url"] == "https://93.184.216.34/hook"
+    assert [row["delivery_id"] for row in store.list_for_job("job-1")] == ["d-0", "d-1"]
+    assert store.status_counts() == {"pending": 0, "in_flight": 2, "delivered": 1, "failed": 0}
+    assert SQLiteWebhookOutboxStore(store.db_path).status_counts()["delivered"] == 1
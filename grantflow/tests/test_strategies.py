@@ -92,3 +92,31 @@ def test_all_catalog_donors_supported():
 def test_unknown_donor():
     with pytest.raises(ValueError):
         strategy_factory("UnknownDonor")
+
+
+def test_donor_registry_builds_each_strategy_once_and_warms_contracts():
+    from grantflow.core.strategies.registry import DonorRegistry
+
+    built: list[str] = []
+
+    def counting_factory(donor_id: str):
+        built.append(donor_id)
+        return strategy_factory(donor_id)
+
+    registry = DonorRegistry(counting_factory)
+    assert registry.get_strategy("usaid") is registry.get_strategy("USAID")
+    assert built == ["usaid"]
+    with pytest.raises(ValueError):
+        registry.get_strategy("UnknownDonor")
+
+    warmed: list[str] = []
+    stats = registry.warm_up(warmers=[lambda contracts: warmed.append(contracts.donor_key)])
+    assert stats["donor_count"] == len(list_supported_donors())
+    assert stats["warmup_errors"] == {}
+    assert stats["warmup_seconds"] is not None
+    assert len(warmed) == stats["donor_count"]
+    contracts = registry.contracts("usaid")
+    assert contracts.rag_collection == "usaid_ads201"
+    with pytest.raises(TypeError):
+        contracts.system_prompts["Architect"] = "changed"
+    assert DonorFactory.get_strategy("eu") is DonorFactory.get_strategy("EU")
@@ -1,5 +1,7 @@
 # grantflow/tests/test_vector_store.py
 
+import pytest
+
 import grantflow.memory_bank.vector_store as vector_store_module
 from grantflow.memory_bank.vector_store import VectorStore, vector_store
 
@@ -111,3 +113,130 @@ def test_vector_store_uses_non_api_default_chroma_port_when_host_set(monkeypatch
         assert store.client is not None
         assert captured["host"] == "127.0.0.1"
         assert captured["port"] == 8001
+
+
+def test_memory_vector_index_topk_matches_reference_ranking_and_upserts_in_place(monkeypatch):
+    monkeypatch.setenv("GRANTFLOW_FORCE_INMEM_VECTOR_STORE", "1")
+    store = VectorStore()
+    ids = [f"chunk_{i}" for i in range(300)]
+    documents = [f"indicator guidance paragraph {i}" for i in range(300)]
+    store.upsert(namespace="topk_ns", ids=ids, documents=documents, metadatas=[{"page": i} for i in range(300)])
+    store.upsert(namespace="topk_ns", ids=["chunk_7"], documents=["replaced chunk"], metadatas=[{"page": -1}])
+    documents[7] = "replaced chunk"
+
+    queries = ["baseline targets", "theory of change", "replaced chunk"]
+    result = store.query("topk_ns", queries, n_results=5)
+
+    embeddings = store._embed_texts(documents)
+    for q_idx, query in enumerate(queries):
+        q_emb = store._embed_texts([query])[0]
+        expected = sorted(
+            range(len(ids)),
+            key=lambda i: sum(x * y for x, y in zip(q_emb, embeddings[i])),
+            reverse=True,
+        )[:5]
+        assert result["ids"][q_idx] == [ids[i] for i in expected]
+        assert result["documents"][q_idx] == [documents[i] for i in expected]
+    assert store.get_stats("topk_ns")["document_count"] == 300
+    replaced = store.query("topk_ns", ["anything"], n_results=5, where={"page": -1})
+    assert replaced["ids"] == [["chunk_7"]]
+    assert replaced["documents"] == [["replaced chunk"]]
+
+
+def test_memory_vector_index_scores_unfiltered_queries_without_copying_the_matrix(monkeypatch):
+    import numpy as np
+
+    class _GatherTrackingArray(np.ndarray):
+        gathers = 0
+
+        def __getitem__(self, key):
+            if isinstance(key, np.ndarray) and self.ndim == 2:
+                type(self).gathers += 1
+            return super().__getitem__(key)
+
+    monkeypatch.setenv("GRANTFLOW_FORCE_INMEM_VECTOR_STORE", "1")
+    store = VectorStore()
+    store.upsert(
+        namespace="view_ns",
+        ids=["a", "b", "c"],
+        documents=["alpha", "beta", "gamma"],
+        metadatas=[{"page": 1}, {"page": 2}, {"page": 1}],
+    )
+    index = store._ensure_memory_namespace("view_ns")
+    index._matrix = index._matrix.view(_GatherTrackingArray)
+
+    unfiltered = store.query("view_ns", ["alpha"], n_results=2)
+    assert unfiltered["ids"][0][0] == "a"
+    assert _GatherTrackingArray.gathers == 0
+
+    filtered = store.query("view_ns", ["alpha"], n_results=5, where={"page": 1})
+    assert sorted(filtered["ids"][0]) == ["a", "c"]
+    assert _GatherTrackingArray.gathers == 1
+
+
+def test_memory_vector_store_applies_where_filters(monkeypatch):
+    monkeypatch.setenv("GRANTFLOW_FORCE_INMEM_VECTOR_STORE", "1")
+    store = VectorStore()
+    store.upsert(
+        namespace="where_ns",
+        ids=["a", "b", "c", "d"],
+        documents=["alpha", "beta", "gamma", "delta"],
+        metadatas=[
+            {"donor_id": "usaid", "page": 1},
+            {"donor_id": "eu", "page": 2},
+            {"donor_id": "usaid", "page": 9},
+            None,
+        ],
+    )
+
+    result = store.query("where_ns", ["alpha", "beta"], n_results=10, where={"donor_id": "usaid"})
+    assert [sorted(row) for row in result["ids"]] == [["a", "c"], ["a", "c"]]
+
+    ranged = store.query(
+        "where_ns",
+        ["alpha"],
+        n_results=10,
+        where={"$and": [{"donor_id": {"$in": ["usaid", "eu"]}}, {"page": {"$lt": 5}}]},
+    )
+    assert sorted(ranged["ids"][0]) == ["a", "b"]
+
+    assert store.query("where_ns", ["alpha"], n_results=3, where={"donor_id": "worldbank"})["ids"] == [[]]
+    assert store.query("where_ns", "alpha", top_k=2, where={"$or": [{"page": 9}, {"page": 2}]})
+
+
+def test_memory_vector_store_corpus_version_changes_on_every_write(monkeypatch):
+    monkeypatch.setenv("GRANTFLOW_FORCE_INMEM_VECTOR_STORE", "1")
+    store = VectorStore()
+    empty = store.corpus_version("version_ns")
+    assert empty == store.corpus_version("version_ns")
+
+    store.upsert(namespace="version_ns", ids=["a"], documents=["alpha"], metadatas=[{"page": 1}])
+    added = store.corpus_version("version_ns")
+    store.update_metadata("version_ns", ["a"], [{"page": 2}])
+    updated = store.corpus_version("version_ns")
+    store.delete("version_ns", ["a"])
+    deleted = store.corpus_version("version_ns")
+
+    assert len({empty, added, updated, deleted}) == 4
+    assert store.corpus_version("other_ns") != deleted
+
+
+def test_chroma_corpus_version_sees_writes_from_another_store(monkeypatch, tmp_path):
+    if vector_store_module._CHROMADB_IMPORT_ERROR:
+        pytest.skip("chromadb is not installed")
+    monkeypatch.delenv("GRANTFLOW_FORCE_INMEM_VECTOR_STORE", raising=False)
+    monkeypatch.delenv("CHROMA_HOST", raising=False)
+    monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(tmp_path))
+    reader = VectorStore()
+    writer = VectorStore()
+    assert reader.client is not None
+
+    writer.upsert(namespace="shared_ns", ids=["a"], documents=["alpha"], metadatas=[{"page": 1}])
+    first = reader.corpus_version("shared_ns")
+    assert first == reader.corpus_version("shared_ns")
+    writer.update_metadata("shared_ns", ["a"], [{"page": 2}])
+    updated = reader.corpus_version("shared_ns")
+
+    assert first is not None and updated is not None
+    assert updated != first
+    assert updated.endswith(":1")
@@ -1,9 +1,12 @@
 import logging
+import threading
+import time
 
 import httpx
 import pytest
 
 from grantflow.api import webhooks
+from grantflow.core.stores import InMemoryWebhookOutboxStore
 
 
 def test_send_job_webhook_event_retries_on_request_error_and_logs(monkeypatch, caplog):
@@ -122,3 +125,147 @@ def test_send_job_webhook_event_does_not_retry_on_http_400(monkeypatch):
         )
 
     assert attempts["count"] == 1
+
+
+def _outbox_row(delivery_id: str, *, url: str = "https://93.184.216.34/webhook", max_attempts: int = 2) -> dict:
+    return {
+        "delivery_id": delivery_id,
+        "job_id": "job-outbox",
+        "event": "job.completed",
+        "url": url,
+        "secret": "secret123",
+        "body": '{"event":"job.completed"}',
+        "status": "pending",
+        "attempts": 0,
+        "max_attempts": max_attempts,
+        "next_attempt_at": 0.0,
+        "created_at": "2026-02-24T10:00:00+00:00",
+        "updated_at": "2026-02-24T10:00:00+00:00",
+    }
+
+
+def test_webhook_delivery_worker_reschedules_retries_in_outbox(monkeypatch):
+    monkeypatch.setenv("GRANTFLOW_WEBHOOK_BACKOFF_BASE_MS", "1000")
+    codes = [503, 200]
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("X-GrantFlow-Signature"))
+        return httpx.Response(codes.pop(0), request=request)
+
+    outbox = InMemoryWebhookOutboxStore()
+    worker = webhooks.WebhookDeliveryWorker(
+        outbox,
+        client_factory=lambda: httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    outbox.enqueue(_outbox_row("d-1"))
+
+    claimed = outbox.claim_due(now=time.time(), limit=10, lease_seconds=30)
+    assert [row["status"] for row in claimed] == ["in_flight"]
+    assert outbox.claim_due(now=time.time(), limit=10, lease_seconds=30) == []
+
+    retried = worker.deliver(claimed[0])
+    assert retried["status"] == "pending"
+    assert retried["attempts"] == 1
+    assert retried["last_status_code"] == 503
+    assert retried["next_attempt_at"] > time.time()
+    assert outbox.claim_due(now=time.time(), limit=10, lease_seconds=30) == []
+
+    delivered = worker.deliver(outbox.claim_due(now=time.time() + 5, limit=10, lease_seconds=30)[0])
+    assert delivered["status"] == "delivered"
+    assert delivered["attempts"] == 2
+    assert delivered["delivered_at"]
+    assert all(header and header.startswith("sha256=") for header in seen_headers)
+    assert worker.diagnostics()["counters"]["delivered"] == 1
+    assert outbox.status_counts()["delivered"] == 1
+
+
+def test_webhook_delivery_worker_fails_unsafe_url_without_request():
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        return httpx.Response(200, request=request)
+
+    outbox = InMemoryWebhookOutboxStore()
+    worker = webhooks.WebhookDeliveryWorker(
+        outbox,
+        client_factory=lambda: httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    outbox.enqueue(_outbox_row("d-unsafe", url="http://127.0.0.1:8080/hook", max_attempts=3))
+    row = worker.deliver(outbox.claim_due(now=time.time(), limit=1, lease_seconds=30)[0])
+
+    assert row["status"] == "failed"
+    assert "SSRF policy" in row["last_error"]
+    assert calls["count"] == 0
+
+
+def test_status_change_enqueues_outbox_delivery_in_outbox_mode(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import grantflow.api.app as api_app_module
+
+    delivered = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        delivered.set()
+        return httpx.Response(204, request=request)
+
+    def unexpected_sync_sender(**kwargs):
+        raise AssertionError("sync sender must not run in outbox mode")
+
+    outbox = InMemoryWebhookOutboxStore()
+    worker = webhooks.WebhookDeliveryWorker(
+        outbox,
+        poll_interval_seconds=0.05,
+        client_factory=lambda: httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setenv("GRANTFLOW_WEBHOOK_DELIVERY_MODE", "outbox")
+    monkeypatch.setattr(api_app_module, "WEBHOOK_OUTBOX", outbox)
+    monkeypatch.setattr(api_app_module, "WEBHOOK_DELIVERY_WORKER", worker)
+    monkeypatch.setattr(api_app_module, "send_job_webhook_event", unexpected_sync_sender)
+
+    try:
+        api_app_module._set_job(
+            "outbox-job-1",
+            {"status": "running", "webhook_url": "https://93.184.216.34/webhook", "webhook_secret": "s3cret"},
+        )
+        api_app_module._update_job("outbox-job-1", status="done")
+        assert delivered.wait(5.0)
+        deadline = time.time() + 5.0
+        while outbox.status_counts()["delivered"] < 2 and time.time() < deadline:
+            time.sleep(0.02)
+
+        response = TestClient(api_app_module.app).get("/status/outbox-job-1/events")
+        assert response.status_code == 200
+        deliveries = response.json()["webhook_deliveries"]
+        assert [item["status"] for item in deliveries] == ["delivered", "delivered"]
+        assert sorted(item["event"] for item in deliveries) == ["job.completed", "job.started"]
+        assert all("url" not in item and "secret" not in item for item in deliveries)
+    finally:
+        worker.stop()
+    assert worker.running is False
+
+
+def test_status_change_falls_back_to_sync_sender_when_outbox_enqueue_fails(monkeypatch, caplog):
+    import grantflow.api.app as api_app_module
+
+    class _LockedOutbox(InMemoryWebhookOutboxStore):
+        def enqueue(self, row):
+            raise RuntimeError("database is locked")
+
+    sent = []
+    worker = webhooks.WebhookDeliveryWorker(_LockedOutbox())
+    monkeypatch.setenv("GRANTFLOW_WEBHOOK_DELIVERY_MODE", "outbox")
+    monkeypatch.setattr(api_app_module, "WEBHOOK_DELIVERY_WORKER", worker)
+    monkeypatch.setattr(api_app_module, "send_job_webhook_event", lambda **kwargs: sent.append(kwargs["event"]))
+
+    with caplog.at_level(logging.ERROR):
+        api_app_module._set_job(
+            "outbox-locked-1",
+            {"status": "running", "webhook_url": "https://93.184.216.34/webhook", "webhook_secret": "s3cret"},
+        )
+    assert sent == ["job.started"]
+    assert worker.diagnostics()["counters"]["enqueue_failed"] == 1
+    assert worker.running is False
+    assert "Webhook outbox enqueue failed for job outbox-locked-1" in caplog.text
@@ -21,6 +21,9 @@ def _build_redis_worker_runner() -> RedisJobRunner:
         worker_heartbeat_ttl_seconds=float(
             getattr(config.job_runner, "redis_worker_heartbeat_ttl_seconds", 45.0) or 45.0
         ),
+        reliable_queue=bool(getattr(config.job_runner, "redis_reliable_queue", False)),
+        visibility_timeout_seconds=float(getattr(config.job_runner, "redis_visibility_timeout_seconds", 60.0) or 60.0),
+        reaper_interval_seconds=float(getattr(config.job_runner, "redis_reaper_interval_seconds", 5.0) or 5.0),
         consumer_enabled=True,
     )
 
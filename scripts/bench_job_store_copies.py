@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from grantflow.core.stores import InMemoryJobStore
+from grantflow.core.strategies.factory import DonorFactory
+from grantflow.swarm.state_contract import build_graph_state
+
+
+def _job_payload(*, versions: int, citations: int, events: int) -> dict[str, Any]:
+    """A finished job payload: ToC/logframe draft versions, citations and job events."""
+    state = build_graph_state(
+        donor_id="usaid",
+        input_context={"project": "Water Sanitation", "country": "Kenya", "sector": "WASH"},
+        donor_strategy=DonorFactory.get_strategy("usaid"),
+        rag_namespace="usaid_ads201",
+        hitl_checkpoints=["toc", "logframe"],
+    )
+    toc = {
+        "project_goal": "Improve sustainable access to safe water",
+        "development_objectives": [
+            {
+                "do_id": f"DO{i}",
+                "description": f"Objective {i} " * 12,
+                "intermediate_results": [{"ir_id": f"IR{i}.{j}", "description": "Result " * 10} for j in range(4)],
+            }
+            for i in range(6)
+        ],
+    }
+    state["toc_draft"] = {"toc": toc, "citations": []}
+    state["draft_versions"] = [
+        # Each stored version owns its content, as `versioning` snapshots it.
+        {"version_id": f"v{i}", "section": "toc" if i % 2 else "logframe", "sequence": i, "content": copy.deepcopy(toc)}
+        for i in range(1, versions + 1)
+    ]
+    state["citations"] = [
+        {
+            "stage": "architect",
+            "citation_type": "rag_claim_support",
+            "namespace": "usaid_ads201",
+            "doc_id": f"usaid_ads201_p{i}_c0",
+            "chunk_id": f"usaid_ads201_p{i}_c0",
+            "page": i,
+            "excerpt": "Guidance excerpt " * 20,
+            "citation_confidence": 0.7,
+        }
+        for i in range(citations)
+    ]
+    return {
+        "status": "done",
+        "hitl_enabled": False,
+        "state": state,
+        "job_events": [
+            {"event_id": f"e{i}", "ts": "2026-01-01T00:00:00Z", "type": "status_changed", "status": "running"}
+            for i in range(events)
+        ],
+    }
+
+
+def _measure(fn: Callable[[], Any], iterations: int) -> dict[str, float]:
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed_us = (time.perf_counter() - started) / iterations * 1e6
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"us_per_call": round(elapsed_us, 1), "peak_kib": round(peak / 1024, 1)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Per-call time and peak allocation of InMemoryJobStore operations.")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--versions", type=int, default=100)
+    parser.add_argument("--citations", type=int, default=200)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--jobs", type=int, default=20, help="Jobs in the store for list().")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    payload = _job_payload(versions=args.versions, citations=args.citations, events=args.events)
+    iterations = max(1, args.iterations)
+    store = InMemoryJobStore()
+    for idx in range(max(1, args.jobs)):
+        store.set(f"job-{idx}", payload)
+
+    results = {
+        "payload_bytes": len(json.dumps({**payload, "state": {**payload["state"], "donor_strategy": None}})),
+        "set": _measure(lambda: store.set("job-0", payload), iterations),
+        "update_status": _measure(lambda: store.update("job-0", status="running"), iterations),
+        "get": _measure(lambda: store.get("job-0"), iterations),
+        "list": _measure(lambda: store.list(), iterations),
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'payload_bytes':16s} {results['payload_bytes']:>12d}")
+    print(f"{'operation':16s} {'us/call':>12s} {'peak KiB':>12s}")
+    for key in ("set", "update_status", "get", "list"):
+        row = results[key]
+        print(f"{key:16s} {row['us_per_call']:12.1f} {row['peak_kib']:12.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
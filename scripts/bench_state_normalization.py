@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+from grantflow.core.stores import prepare_state_for_storage, restore_job_payload_from_storage
+from grantflow.core.strategies.factory import DonorFactory
+from grantflow.swarm.findings import write_state_critic_findings
+from grantflow.swarm.state_contract import build_graph_state, normalize_state_contract
+
+
+def _synthetic_state(*, citations: int, versions: int, findings: int) -> dict[str, Any]:
+    """A state shaped like a finished job: ToC draft, citations, draft versions and critic findings."""
+    state = build_graph_state(
+        donor_id="usaid",
+        input_context={"project": "Water Sanitation", "country": "Kenya", "sector": "WASH"},
+        donor_strategy=DonorFactory.get_strategy("usaid"),
+        rag_namespace="usaid_ads201",
+        hitl_checkpoints=["toc", "logframe"],
+    )
+    toc = {
+        "project_goal": "Improve sustainable access to safe water",
+        "development_objectives": [
+            {
+                "do_id": f"DO{i}",
+                "description": f"Objective {i} " * 12,
+                "intermediate_results": [f"IR{i}.{j}" for j in range(4)],
+            }
+            for i in range(6)
+        ],
+    }
+    state["toc_draft"] = {"toc": toc, "citations": []}
+    state["citations"] = [
+        {
+            "stage": "architect",
+            "citation_type": "rag_claim_support",
+            "namespace": "usaid_ads201",
+            "doc_id": f"usaid_ads201_p{i}_c0",
+            "chunk_id": f"usaid_ads201_p{i}_c0",
+            "page": i,
+            "excerpt": "Guidance excerpt " * 20,
+            "citation_confidence": 0.7,
+        }
+        for i in range(citations)
+    ]
+    state["draft_versions"] = [
+        {"version_id": f"toc_v{i}", "section": "toc" if i % 2 else "logframe", "sequence": i, "content": toc}
+        for i in range(1, versions + 1)
+    ]
+    write_state_critic_findings(
+        state,
+        [
+            {"code": f"FINDING_{i}", "severity": "medium", "section": "toc", "message": f"Finding {i} needs work."}
+            for i in range(findings)
+        ],
+    )
+    return state
+
+
+def _per_call_us(fn: Callable[[], Any], iterations: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Per-call cost of state normalization and job store (de)serialization."
+    )
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--citations", type=int, default=60)
+    parser.add_argument("--versions", type=int, default=8)
+    parser.add_argument("--findings", type=int, default=12)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    state = _synthetic_state(citations=args.citations, versions=args.versions, findings=args.findings)
+    stored = prepare_state_for_storage(state)
+    stored_payload_json = json.dumps({"status": "done", "state": stored})
+    iterations = max(1, args.iterations)
+
+    results = {
+        "state_bytes": len(json.dumps(stored)),
+        "normalize_state_contract_us": _per_call_us(lambda: normalize_state_contract(state), iterations),
+        "normalize_restored_state_us": _per_call_us(lambda: normalize_state_contract(dict(stored)), iterations),
+        "prepare_state_for_storage_us": _per_call_us(lambda: prepare_state_for_storage(state), iterations),
+        "restore_job_payload_from_storage_us": _per_call_us(
+            lambda: restore_job_payload_from_storage(json.loads(stored_payload_json)), iterations
+        ),
+        "json_decode_only_us": _per_call_us(lambda: json.loads(stored_payload_json), iterations),
+    }
+    if args.json:
+        print(json.dumps({key: round(value, 1) for key, value in results.items()}, indent=2))
+        return 0
+    for key, value in results.items():
+        print(f"{key:40s} {value:10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
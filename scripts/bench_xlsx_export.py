@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any
+
+from grantflow.exporters.excel_builder import build_xlsx_from_logframe
+
+
+def _logframe(indicators: int) -> dict[str, Any]:
+    return {
+        "indicators": [
+            {
+                "indicator_id": f"IND_{idx:05d}",
+                "name": f"Share of households with reliable water access, cohort {idx}",
+                "result_level": "outcome" if idx % 3 else "output",
+                "toc_statement_path": f"toc.development_objectives[{idx % 6}].intermediate_results[{idx % 4}]",
+                "justification": "Tracks outcome-level service adoption across target districts. " * 2,
+                "citation": f"USAID ADS 201 p.{idx % 90}",
+                "baseline": "0%",
+                "target": "30%",
+                "frequency": "quarterly",
+                "formula": "(Numerator / Denominator) * 100",
+                "definition": "Share of target beneficiaries receiving the service in the reporting period.",
+                "data_source": "PMP indicator tracking dataset",
+                "disaggregation": ["sex", "age", "location"],
+                "means_of_verification": "Verified PMP records and spot-check files",
+                "owner": "MEL lead",
+                "evidence_excerpt": "Service uptake evidence extracted from validated implementation records.",
+            }
+            for idx in range(indicators)
+        ]
+    }
+
+
+def _toc() -> dict[str, Any]:
+    return {
+        "toc": {
+            "project_goal": "Improve sustainable access to safe water",
+            "development_objectives": [
+                {
+                    "do_id": f"DO{i}",
+                    "description": f"Objective {i} " * 8,
+                    "intermediate_results": [
+                        {
+                            "ir_id": f"IR{i}.{j}",
+                            "description": "Result " * 6,
+                            "outputs": [{"output_id": f"O{i}.{j}.{k}", "description": "Output " * 4} for k in range(3)],
+                        }
+                        for j in range(4)
+                    ],
+                }
+                for i in range(6)
+            ],
+        }
+    }
+
+
+def _citations(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "stage": "architect",
+            "citation_type": "rag_claim_support",
+            "label": f"USAID ADS 201 p.{idx % 90}",
+            "citation_confidence": 0.7,
+            "namespace": "usaid_ads201",
+            "page": idx % 90,
+            "chunk_id": f"usaid_ads201_p{idx}_c0",
+            "excerpt": "Guidance excerpt " * 20,
+        }
+        for idx in range(count)
+    ]
+
+
+def _measure(indicators: int, citations: int) -> dict[str, float]:
+    logframe = _logframe(indicators)
+    toc = _toc()
+    citation_rows = _citations(citations)
+    started = time.perf_counter()
+    content = build_xlsx_from_logframe(logframe, "usaid", toc_draft=toc, citations=citation_rows)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    try:
+        build_xlsx_from_logframe(logframe, "usaid", toc_draft=toc, citations=citation_rows)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "indicators": indicators,
+        "citations": citations,
+        "seconds": round(elapsed, 2),
+        "peak_mib": round(peak / (1024 * 1024), 1),
+        "xlsx_kib": round(len(content) / 1024, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build time and peak traced memory of the MEL .xlsx export.")
+    parser.add_argument("--indicators", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--portfolio-rows", type=int, default=20000, help="Citation rows for the large-sheet case.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    cases = [(max(0, count), 0) for count in args.indicators]
+    if args.portfolio_rows > 0:
+        cases.append((max(args.indicators), args.portfolio_rows))
+    results = [_measure(indicators, citations) for indicators, citations in cases]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'indicators':>10s} {'citations':>10s} {'seconds':>9s} {'peak MiB':>9s} {'xlsx KiB':>9s}")
+    for row in results:
+        print(
+            f"{row['indicators']:10d} {row['citations']:10d} {row['seconds']:9.2f} "
+            f"{row['peak_mib']:9.1f} {row['xlsx_kib']:9.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
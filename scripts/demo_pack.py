@@ -78,6 +78,23 @@ def _slugify(value: str) -> str:
     return token.strip("-") or "case"
 
 
+def _status_request(url: str, *, api_key: str | None) -> tuple[dict[str, Any], int | None]:
+    headers = {"Accept": "application/json"}
+    if api_key:
+        headers["X-API-Key"] = api_key
+    req = urllib.request.Request(url, headers=headers, method="GET")
+    try:
+        with urllib.request.urlopen(req, timeout=300) as resp:
+            raw = resp.read().decode("utf-8")
+            revision = resp.headers.get("X-Job-Revision")
+            return (json.loads(raw) if raw else {}), (int(revision) if str(revision or "").isdigit() else None)
+    except urllib.error.HTTPError as exc:
+        detail = exc.read().decode("utf-8", errors="replace")
+        raise RuntimeError(f"GET {url} failed with HTTP {exc.code}: {detail}") from exc
+    except urllib.error.URLError as exc:
+        raise RuntimeError(f"GET {url} failed: {exc.reason}") from exc
+
+
 def _wait_for_terminal_status(
     base_url: str,
     job_id: str,
@@ -87,12 +104,20 @@ def _wait_for_terminal_status(
     poll_interval_s: float,
 ) -> dict[str, Any]:
     deadline = time.time() + timeout_s
+    revision: int | None = None
     while time.time() < deadline:
-        status = _json_request("GET", f"{base_url}/status/{job_id}", api_key=api_key)
+        url = f"{base_url}/status/{job_id}"
+        if revision is not None:
+            # Long-poll: the server answers as soon as the job changes instead of on our poll interval.
+            wait_s = max(1, min(30, int(deadline - time.time())))
+            url += "?" + urlencode({"wait_for_change": revision, "timeout": wait_s})
+        status, next_revision = _status_request(url, api_key=api_key)
         token = str(status.get("status") or "").strip().lower()
         if token in {"done", "error", "pending_hitl"}:
             return status
-        time.sleep(poll_interval_s)
+        if next_revision is None:
+            time.sleep(poll_interval_s)
+        revision = next_revision
     raise RuntimeError(f"Timed out waiting for terminal status for job {job_id}")
 
 